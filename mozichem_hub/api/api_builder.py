@@ -3,10 +3,12 @@ import uvicorn
 from typing import (
     Dict
 )
-from fastapi import FastAPI
+from fastapi import FastAPI, HTTPException
 from fastmcp import FastMCP
 from contextlib import asynccontextmanager, AsyncExitStack
 # local
+from ..models import CustomReferenceRequest
+from ..resources.reference_registry import reference_registry
 
 
 class MoziChemAPI:
@@ -66,6 +68,9 @@ class MoziChemAPI:
         # Mount MCP apps dynamically
         self._mount_mcp_apps()
 
+        # SECTION: custom reference registry routes
+        self._add_reference_routes()
+
         # SECTION: Async context manager for cleanup
         # Set combined lifespan
         # self.app.router.lifespan_context = self._combined_lifespan
@@ -77,6 +82,42 @@ class MoziChemAPI:
         for name, mcp_app in self.mcp_apps.items():
             self.app.mount(f"/{name}", mcp_app)
 
+    def _add_reference_routes(self):
+        """
+        Add the custom reference registry routes, a reference is registered
+        once and then passed to the tools by its id (`custom_reference_id`).
+        """
+        @self.app.post("/references")
+        def register_reference(request: CustomReferenceRequest):
+            try:
+                registered_reference = reference_registry.register(
+                    content=request.content,
+                    config=request.config
+                )
+            except Exception as e:
+                raise HTTPException(status_code=400, detail=str(e))
+
+            return {
+                "reference_id": registered_reference.reference_id,
+                "config": registered_reference.config is not None,
+            }
+
+        @self.app.get("/references")
+        def list_references():
+            return {
+                "references": reference_registry.list_references(),
+                "stats": reference_registry.stats(),
+            }
+
+        @self.app.delete("/references/{reference_id}")
+        def remove_reference(reference_id: str):
+            if not reference_registry.remove(reference_id):
+                raise HTTPException(
+                    status_code=404,
+                    detail=f"Reference '{reference_id}' not found."
+                )
+            return {"reference_id": reference_id, "removed": True}
+
     @asynccontextmanager
     async def _combined_lifespan(self, app: FastAPI):
         """
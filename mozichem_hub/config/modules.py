@@ -11,18 +11,34 @@ MCP_MODULES = [
         'package': 'PyThermoModels',
         'id': 'PTMCore',
         'class': 'MCP_PTMCore',
+        'module': 'mozichem_hub.resources.ptmcore',
         'descriptor': 'ptmcore.yml',
         'resources': [],
         'prompts': [],
+        # NOTE: fixed components built by the tool worker processes at start
+        'warm_up': {
+            'components': [
+                {'name': 'carbon dioxide', 'formula': 'CO2', 'state': 'g'},
+                {'name': 'methane', 'formula': 'CH4', 'state': 'g'},
+            ],
+        },
         'tools': [
             {
                 'name': 'get_method_reference_inputs',
                 'description': 'Retrieves the reference inputs required for a specific method, including data and equations.'
             },
+            {
+                'name': 'register_custom_reference',
+                'description': 'Registers a custom reference once and returns its id to be used in the calculation tools.'
+            },
             {
                 'name': 'calc_gas_component_fugacity',
                 'description': 'Calculates the fugacity of a gas-phase component at given temperature and pressure.',
             },
+            {
+                'name': 'calc_gas_component_fugacity_batch',
+                'description': 'Calculates the fugacity of a gas-phase component at a batch (pairs or grid) of temperatures and pressures in one vectorized evaluation, results are returned as one column per quantity.'
+            },
             {
                 'name': 'calc_liquid_component_fugacity',
                 'description': 'Calculates the fugacity of a liquid-phase component at given temperature and pressure.'
@@ -49,9 +65,17 @@ MCP_MODULES = [
         'package': 'PyThermoFlash',
         'id': 'PTFCore',
         'class': 'MCP_PTFCore',
+        'module': 'mozichem_hub.resources.ptfcore',
         'descriptor': 'ptfcore.yml',
         'resources': [],
         'prompts': [],
+        # NOTE: fixed components built by the tool worker processes at start
+        'warm_up': {
+            'components': [
+                {'name': 'benzene', 'formula': 'C6H6', 'state': 'l'},
+                {'name': 'toluene', 'formula': 'C7H8', 'state': 'l'},
+            ],
+        },
         'tools': [
             {
                 'name': 'calc_bubble_pressure_ideal_vapor_ideal_liquid',
@@ -72,6 +96,26 @@ MCP_MODULES = [
             {
                 'name': 'calc_flash_isothermal_ideal_vapor_ideal_liquid',
                 'description': 'Calculates the flash calculation for a liquid mixture at a specified temperature, determining the vapor and liquid phase compositions using Raoult\'s law for ideal vapor and ideal liquid.'
+            },
+            {
+                'name': 'calc_bubble_pressure_ideal_vapor_ideal_liquid_batch',
+                'description': 'Calculates the bubble pressure of many feeds and/or temperatures of a mixture using raoult`s law (ideal vapor and ideal liquid), results are returned as columns.'
+            },
+            {
+                'name': 'calc_dew_pressure_ideal_vapor_ideal_liquid_batch',
+                'description': 'Calculates the dew pressure of many feeds and/or temperatures of a mixture using raoult`s law (ideal vapor and ideal liquid), results are returned as columns.'
+            },
+            {
+                'name': 'calc_bubble_temperature_ideal_vapor_ideal_liquid_batch',
+                'description': 'Calculates the bubble temperature of many feeds and/or pressures of a mixture using raoult`s law (ideal vapor and ideal liquid), results are returned as columns.'
+            },
+            {
+                'name': 'calc_dew_temperature_ideal_vapor_ideal_liquid_batch',
+                'description': 'Calculates the dew temperature of many feeds and/or pressures of a mixture using raoult`s law (ideal vapor and ideal liquid), results are returned as columns.'
+            },
+            {
+                'name': 'calc_flash_isothermal_ideal_vapor_ideal_liquid_batch',
+                'description': 'Calculates the isothermal flash of many feeds and/or (temperature, pressure) points of a mixture using raoult`s law (ideal vapor and ideal liquid), results are returned as columns.'
             }
         ],
     },
@@ -83,6 +127,7 @@ MCP_MODULES = [
         'package': 'PyThermoDB',
         'id': 'PTDBCore',
         'class': 'MCP_PTDBCore',
+        'module': 'mozichem_hub.resources.ptdbcore',
         'descriptor': 'ptdbcore.yml',
         'resources': [],
         'prompts': [],
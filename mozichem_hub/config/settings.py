@@ -2,6 +2,7 @@
 # --------------------
 # import libs
 from pathlib import Path
+from typing import Dict, Literal, Optional
 from pydantic import Field
 from pydantic_settings import BaseSettings
 
@@ -26,6 +27,7 @@ class Settings(BaseSettings):
             "pydantic",
             "pydantic-settings",
             "fastmcp",
+            "numpy",
             "pyyaml",
             "pythermodb",
             "pythermolinkdb",
@@ -58,6 +60,153 @@ class Settings(BaseSettings):
         description="Source file name for symbols."
     )
 
+    # NOTE: component thermodb cache
+    thermodb_cache_max_entries: int = Field(
+        default=256,
+        description="Maximum number of cached component thermodbs (0 disables the cache)."
+    )
+
+    thermodb_cache_max_bytes: int = Field(
+        default=64 * 1024 * 1024,
+        description="Maximum size of cached component thermodbs in bytes."
+    )
+
+    # NOTE: model source cache (per hub)
+    model_source_cache_max_entries: int = Field(
+        default=128,
+        description="Maximum number of cached model sources per hub (0 disables the cache)."
+    )
+
+    model_source_cache_max_bytes: int = Field(
+        default=32 * 1024 * 1024,
+        description="Maximum size of cached model sources per hub in bytes."
+    )
+
+    # NOTE: custom reference overlays (per hub)
+    custom_reference_cache_max_entries: int = Field(
+        default=32,
+        description="Maximum number of cached custom reference overlays per hub (0 disables the cache)."
+    )
+
+    custom_reference_cache_max_bytes: int = Field(
+        default=32 * 1024 * 1024,
+        description="Maximum size of cached custom reference overlays per hub in bytes."
+    )
+
+    # NOTE: custom reference registry (process-wide)
+    reference_registry_max_entries: int = Field(
+        default=64,
+        description="Maximum number of registered custom references."
+    )
+
+    reference_registry_max_bytes: int = Field(
+        default=64 * 1024 * 1024,
+        description="Maximum size of registered custom references in bytes."
+    )
+
+    # NOTE: parsed references (process-wide)
+    parsed_reference_cache_max_entries: int = Field(
+        default=32,
+        description="Maximum number of cached parsed references (0 disables the cache)."
+    )
+
+    parsed_reference_cache_max_bytes: int = Field(
+        default=64 * 1024 * 1024,
+        description="Maximum size of cached parsed references in bytes (estimated from the content size)."
+    )
+
+    parsed_reference_memo_max_entries: int = Field(
+        default=64,
+        description="Maximum number of derived values (component index, component reference thermodbs) kept per parsed reference, least recently used are dropped."
+    )
+
+    # NOTE: compiled (binary) references
+    compiled_reference: bool = Field(
+        default=True,
+        description="Use the compiled (binary) form of a custom reference once compiled (in the background when registered)."
+    )
+
+    compiled_reference_dir: Optional[Path] = Field(
+        default=None,
+        description="Folder of the compiled custom references, owned by the user (default: <user cache>/mozichem_hub/references, 0700)."
+    )
+
+    # NOTE: tool execution (async tools)
+    tool_executor: Literal['inline', 'thread', 'process'] = Field(
+        default='thread',
+        description="Where the tool bodies run: 'inline' (event loop), 'thread' or 'process' pool."
+    )
+
+    tool_executor_workers: Optional[int] = Field(
+        default=None,
+        description="Number of pool workers (default: the number of cores)."
+    )
+
+    tool_max_concurrency: int = Field(
+        default=0,
+        description="Maximum concurrent calls per MCP (0: the number of pool workers)."
+    )
+
+    tool_mcp_concurrency: Dict[str, int] = Field(
+        default_factory=dict,
+        description="Maximum concurrent calls of specific MCPs by name, e.g. {\"eos-models-mcp\": 2}."
+    )
+
+    # NOTE: tool worker processes ('process' executor)
+    tool_process_start_method: Optional[Literal['fork', 'spawn', 'forkserver']] = Field(
+        default=None,
+        description="Start method of the tool worker processes (default: the platform default)."
+    )
+
+    tool_process_warm_up: bool = Field(
+        default=True,
+        description="Start and initialize (hub, mcp cores, fixed warm-up components of each mcp) the tool worker processes when the pool is created."
+    )
+
+    tool_process_max_tasks: int = Field(
+        default=0,
+        description="Recycle the tool worker processes after a worker has run this many tasks (0 disables)."
+    )
+
+    tool_process_max_memory: int = Field(
+        default=0,
+        description="Recycle the tool worker processes when a worker resident memory exceeds this many bytes (0 disables)."
+    )
+
+    # NOTE: batch calculations
+    batch_chunk_size: int = Field(
+        default=32,
+        description="Number of points of a batch calculation evaluated together (chunk)."
+    )
+
+    batch_workers: int = Field(
+        default=0,
+        description="Threads evaluating the chunks of a batch calculation (0: the number of cores, 1: sequential)."
+    )
+
+    # NOTE: ideal vle (raoult's law)
+    raoult_fast_path: bool = Field(
+        default=True,
+        description="Evaluate the ideal vapor ideal liquid bubble/dew pressure and isothermal flash calculations with the closed-form (numpy) Raoult's law engine."
+    )
+
+    # NOTE: pure component fugacity batch (cubic eos)
+    eos_fast_path: bool = Field(
+        default=True,
+        description="Evaluate the batch pure component fugacity with the vectorized (numpy) cubic eos engine instead of pyThermoModels point by point, the points where the single point tool stops at a bound of its root search are marked (matches_single_point)."
+    )
+
+    # NOTE: mcp descriptors
+    descriptor_reload: bool = Field(
+        default=False,
+        description="Reload a descriptor file when its modification time changes (development)."
+    )
+
+    descriptor_artifact: bool = Field(
+        default=True,
+        description="Load the precompiled descriptors (descriptors.json) instead of parsing the yml files."
+    )
+
     class Config:
         """Pydantic configuration."""
         env_prefix = "mozichem_hub_"
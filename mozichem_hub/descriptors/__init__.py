@@ -1,7 +1,10 @@
 from .mcp_descriptor import MCPDescriptor
 from .main import get_mcp_ignore_state_props
+from .descriptor_index import DescriptorIndex, descriptor_index
 
 __all__ = [
     'MCPDescriptor',
-    'get_mcp_ignore_state_props'
+    'get_mcp_ignore_state_props',
+    'DescriptorIndex',
+    'descriptor_index'
 ]
@@ -0,0 +1,155 @@
+# import libs
+import os
+import json
+import hashlib
+import logging
+from typing import Dict, Any, Optional
+# locals
+from ..utils import Loader
+from ..config import MCP_MODULES, app_settings
+from ..models import DescriptorMethod, DescriptorArtifact
+from ..errors import (
+    DescriptorCompileError,
+    DESCRIPTOR_COMPILE_ERROR_MSG
+)
+
+# NOTE: logger
+logger = logging.getLogger(__name__)
+
+# NOTE: precompiled descriptors (shipped as package data)
+ARTIFACT_FILE = 'descriptors.json'
+
+
+def descriptors_folder() -> str:
+    """
+    Get the descriptors folder path.
+    """
+    return os.path.dirname(__file__)
+
+
+def file_sha256(file_path: str) -> Optional[str]:
+    """
+    Get the sha256 of a file (None if the file does not exist).
+    """
+    try:
+        with open(file_path, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
+
+
+def compile_descriptors(
+    output_file: Optional[str] = None
+) -> str:
+    """
+    Compile the descriptor yml files into a validated json artifact.
+
+    Parameters
+    ----------
+    output_file : str, optional
+        The artifact path, default is `descriptors/descriptors.json`.
+
+    Returns
+    -------
+    str
+        The artifact path.
+    """
+    try:
+        # NOTE: loader
+        Loader_ = Loader()
+
+        sources: Dict[str, str] = {}
+        descriptors: Dict[str, Dict[str, Any]] = {}
+
+        # SECTION: load and validate each descriptor file
+        for mcp_module in MCP_MODULES:
+            descriptor_file = mcp_module.get('descriptor', None)
+            if not descriptor_file:
+                continue
+
+            descriptor = Loader_.load_yml_references(
+                target_file=descriptor_file,
+                target_folder='descriptors'
+            )
+
+            # NOTE: validate methods (INSTRUCTIONS is a text)
+            for method_name, method in descriptor.items():
+                if method_name == 'INSTRUCTIONS':
+                    if not isinstance(method, str):
+                        raise ValueError(
+                            f"INSTRUCTIONS in '{descriptor_file}' must be a text."
+                        )
+                    continue
+                DescriptorMethod.model_validate(method)
+
+            # NOTE: the artifact must reproduce the yml content
+            if json.loads(json.dumps(descriptor)) != descriptor:
+                raise ValueError(
+                    f"'{descriptor_file}' contains values not supported by json."
+                )
+
+            sources[descriptor_file] = file_sha256(
+                os.path.join(descriptors_folder(), descriptor_file)
+            ) or ''
+            descriptors[descriptor_file] = descriptor
+
+        # SECTION: build the artifact
+        artifact = DescriptorArtifact(
+            version=app_settings.version,
+            sources=sources,
+            descriptors=descriptors
+        )
+
+        # SECTION: write
+        output_file = output_file or os.path.join(
+            descriptors_folder(), ARTIFACT_FILE
+        )
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(
+                artifact.model_dump(mode='json'),
+                f,
+                ensure_ascii=False,
+                separators=(',', ':')
+            )
+
+        logger.info(f"Descriptors compiled: {output_file}")
+        return output_file
+    except Exception as e:
+        raise DescriptorCompileError(
+            f"{DESCRIPTOR_COMPILE_ERROR_MSG} {e}"
+        ) from e
+
+
+def load_descriptor_artifact(
+    artifact_file: Optional[str] = None
+) -> Optional[DescriptorArtifact]:
+    """
+    Load the precompiled descriptors artifact.
+
+    Parameters
+    ----------
+    artifact_file : str, optional
+        The artifact path, default is `descriptors/descriptors.json`.
+
+    Returns
+    -------
+    DescriptorArtifact | None
+        The artifact, None if it does not exist or is not valid.
+    """
+    artifact_file = artifact_file or os.path.join(
+        descriptors_folder(), ARTIFACT_FILE
+    )
+    if not os.path.exists(artifact_file):
+        return None
+
+    try:
+        with open(artifact_file, 'r', encoding='utf-8') as f:
+            return DescriptorArtifact.model_validate_json(f.read())
+    except Exception as e:
+        logger.warning(f"Invalid descriptors artifact, using yml files: {e}")
+        return None
+
+
+if __name__ == '__main__':
+    # NOTE: python -m mozichem_hub.descriptors.compiler
+    print(compile_descriptors())
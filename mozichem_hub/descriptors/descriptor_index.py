@@ -0,0 +1,274 @@
+# import libs
+import os
+import logging
+import threading
+from types import MappingProxyType
+from typing import (
+    Any,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Tuple
+)
+# locals
+from ..utils import Loader
+from ..config import MCP_MODULES, app_settings
+from .compiler import load_descriptor_artifact, file_sha256
+
+# NOTE: logger
+logger = logging.getLogger(__name__)
+
+
+def freeze(value: Any) -> Any:
+    """
+    Convert a parsed yml value to a read-only value (dict -> mappingproxy,
+    list -> tuple).
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({k: freeze(v) for k, v in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(v) for v in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """
+    Convert a frozen value back to a (new) mutable value
+    (mappingproxy -> dict, tuple -> list).
+    """
+    if isinstance(value, Mapping):
+        return {k: thaw(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return [thaw(v) for v in value]
+    return value
+
+
+class DescriptorIndex:
+    """
+    Process-wide, read-only index of the mcp descriptors.
+
+    Each descriptor yml file is parsed once (lazily, on the first lookup) and
+    stored as a frozen mapping, lookups by mcp name, mcp id and
+    (mcp id, method name) are dictionary lookups.
+
+    Notes
+    -----
+    - The precompiled artifact (`descriptors.json`) is preferred if
+      `use_artifact` is enabled and it matches the yml file (sha256),
+      otherwise the yml file is parsed.
+    - If `reload` is enabled (development), the descriptor file modification
+      time is checked on every lookup and a changed file is parsed again.
+    - The returned values are read-only, use `thaw` to get a mutable copy.
+    """
+
+    def __init__(
+        self,
+        target_folder: str = 'descriptors',
+        reload: bool = False,
+        use_artifact: bool = True
+    ) -> None:
+        """
+        Initialize the DescriptorIndex.
+
+        Parameters
+        ----------
+        target_folder : str, optional
+            The package folder of the descriptor files, default is
+            'descriptors'.
+        reload : bool, optional
+            Check the descriptor files modification time on every lookup,
+            default is False.
+        use_artifact : bool, optional
+            Prefer the precompiled descriptors artifact, default is True
+            (not used in the reload mode).
+        """
+        self.target_folder = target_folder
+        self.reload = reload
+        self.use_artifact = use_artifact and not reload
+
+        # SECTION: loader
+        self.Loader_ = Loader()
+
+        # SECTION: mcp modules
+        # NOTE: mcp name -> descriptor file
+        self._files: Dict[str, str] = {}
+        # NOTE: mcp id -> mcp name
+        self._names: Dict[str, str] = {}
+        for mcp_module in MCP_MODULES:
+            mcp_name = mcp_module.get('name', None)
+            if not mcp_name:
+                continue
+            descriptor_file = mcp_module.get('descriptor', None)
+            if descriptor_file:
+                self._files[mcp_name] = descriptor_file
+            mcp_id = mcp_module.get('id', None)
+            if mcp_id:
+                self._names[mcp_id] = mcp_name
+
+        # SECTION: index
+        # NOTE: mcp name -> (frozen descriptor, mtime)
+        self._descriptors: Dict[str, Tuple[Mapping[str, Any], int]] = {}
+        self._lock = threading.RLock()
+
+        # NOTE: precompiled artifact (loaded on first use)
+        self._artifact: Optional[Dict[str, Any]] = None
+
+    def _descriptor_path(self, descriptor_file: str) -> str:
+        # NOTE: same location used by the Loader
+        return os.path.join(
+            os.path.dirname(os.path.dirname(__file__)),
+            self.target_folder,
+            descriptor_file
+        )
+
+    def _mtime(self, descriptor_file: str) -> int:
+        try:
+            return os.stat(self._descriptor_path(descriptor_file)).st_mtime_ns
+        except OSError:
+            return -1
+
+    def _load(self, mcp_name: str) -> Mapping[str, Any]:
+        # NOTE: check mcp module
+        descriptor_file = self._files.get(mcp_name, None)
+        if not descriptor_file:
+            raise ValueError(
+                f"MCP module '{mcp_name}' not found or does not have a descriptor file defined."
+            )
+
+        with self._lock:
+            mtime = self._mtime(descriptor_file)
+
+            # NOTE: precompiled artifact, otherwise parse the descriptor file
+            descriptor = self._from_artifact(descriptor_file)
+            if descriptor is None:
+                descriptor = self.Loader_.load_yml_references(
+                    target_file=descriptor_file,
+                    target_folder=self.target_folder
+                )
+            frozen_descriptor = freeze(descriptor or {})
+
+            self._descriptors[mcp_name] = (frozen_descriptor, mtime)
+            logger.debug(f"MCP descriptor indexed: {descriptor_file}")
+
+            return frozen_descriptor
+
+    def _from_artifact(
+        self,
+        descriptor_file: str
+    ) -> Optional[Dict[str, Any]]:
+        if not self.use_artifact:
+            return None
+
+        # NOTE: load once (an empty dict if not available)
+        if self._artifact is None:
+            artifact = load_descriptor_artifact()
+            self._artifact = {} if artifact is None else {
+                file_name: (artifact.sources.get(file_name), descriptor)
+                for file_name, descriptor in artifact.descriptors.items()
+            }
+
+        item = self._artifact.get(descriptor_file, None)
+        if item is None:
+            return None
+
+        # NOTE: the yml file has been changed after compiling
+        sha = file_sha256(self._descriptor_path(descriptor_file))
+        if sha is not None and sha != item[0]:
+            logger.warning(
+                f"Descriptors artifact is outdated for '{descriptor_file}', "
+                "using the yml file."
+            )
+            return None
+
+        return item[1]
+
+    def mcp_name(self, mcp_id: str) -> Optional[str]:
+        """
+        Get the mcp name of an mcp id (None if not found).
+        """
+        return self._names.get(mcp_id, None)
+
+    def descriptor(self, mcp_name: str) -> Mapping[str, Any]:
+        """
+        Get the (read-only) descriptor of an mcp.
+
+        Parameters
+        ----------
+        mcp_name : str
+            The name of the mcp.
+
+        Returns
+        -------
+        Mapping[str, Any]
+            The mcp descriptor (REFERENCES section).
+        """
+        item = self._descriptors.get(mcp_name, None)
+        if item is None:
+            return self._load(mcp_name)
+
+        # NOTE: reload mode
+        if self.reload and self._mtime(self._files[mcp_name]) != item[1]:
+            logger.info(f"MCP descriptor changed, reloading: {mcp_name}")
+            return self._load(mcp_name)
+
+        return item[0]
+
+    def descriptor_by_id(self, mcp_id: str) -> Mapping[str, Any]:
+        """
+        Get the (read-only) descriptor of an mcp by its id.
+        """
+        mcp_name = self.mcp_name(mcp_id)
+        if not mcp_name:
+            raise ValueError(f"MCP with id '{mcp_id}' not found.")
+        return self.descriptor(mcp_name)
+
+    def method(
+        self,
+        mcp_id: str,
+        method_name: str
+    ) -> Optional[Mapping[str, Any]]:
+        """
+        Get the (read-only) descriptor of an mcp method.
+
+        Parameters
+        ----------
+        mcp_id : str
+            The id of the mcp.
+        method_name : str
+            The name of the method.
+
+        Returns
+        -------
+        Mapping[str, Any] | None
+            The method descriptor, None if the method is not defined.
+        """
+        return self.descriptor_by_id(mcp_id).get(method_name, None)
+
+    def load_all(self) -> List[str]:
+        """
+        Index all mcp descriptors (e.g. at startup).
+
+        Returns
+        -------
+        List[str]
+            The indexed mcp names.
+        """
+        for mcp_name in self._files:
+            self.descriptor(mcp_name)
+        return list(self._descriptors.keys())
+
+    def clear(self) -> None:
+        """
+        Drop the indexed descriptors (parsed again on the next lookup).
+        """
+        with self._lock:
+            self._descriptors.clear()
+            self._artifact = None
+
+
+# NOTE: process-wide descriptor index
+descriptor_index = DescriptorIndex(
+    reload=app_settings.descriptor_reload,
+    use_artifact=app_settings.descriptor_artifact
+)
@@ -2,8 +2,7 @@
 import logging
 from typing import List
 # locals
-from .mcp_descriptor import MCPDescriptor
-from ..config import MCP_MODULES
+from .descriptor_index import descriptor_index, thaw
 
 # NOTE: logger
 logger = logging.getLogger(__name__)
@@ -35,7 +34,7 @@ def get_mcp_ignore_state_props(
             return []
 
         # NOTE: load the mcp descriptor
-        mcp_descriptor = MCPDescriptor().mcp_descriptor(mcp_name)
+        mcp_descriptor = descriptor_index.descriptor(mcp_name)
 
         # NOTE: check if method exists
         if method_name not in mcp_descriptor:
@@ -44,8 +43,8 @@ def get_mcp_ignore_state_props(
             return []
 
         # NOTE:reference inputs
-        ignore_state_props: List[str] = mcp_descriptor[method_name].get(
-            'IGNORE_STATE_PROPS', []
+        ignore_state_props: List[str] = thaw(
+            mcp_descriptor[method_name].get('IGNORE_STATE_PROPS', ())
         )
 
         return ignore_state_props
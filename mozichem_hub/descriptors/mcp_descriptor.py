@@ -4,6 +4,7 @@ from typing import List, Dict, Optional
 # locals
 from ..utils import Loader
 from ..config import MCP_MODULES
+from .descriptor_index import descriptor_index, thaw
 
 # NOTE: get logger
 logger = logging.getLogger(__name__)
@@ -24,8 +25,12 @@ class MCPDescriptor:
         # used to load app references
         self.Loader_ = Loader()
 
-        # SECTION: Load tools references
-        self.tool_descriptors_info = self.Loader_.list_yml_references(
+    @property
+    def tool_descriptors_info(self) -> Dict[str, str]:
+        """
+        List the descriptor yml files.
+        """
+        return self.Loader_.list_yml_references(
             target_folder='descriptors'
         )
 
@@ -86,27 +91,8 @@ class MCPDescriptor:
             A dictionary containing the tool descriptor.
         """
         try:
-            # NOTE: get mcp module
-            mcp_module = next((
-                module for module in MCP_MODULES if module['name'] == mcp_name
-            ), None)
-
-            # check if mcp module exists
-            if not mcp_module:
-                raise ValueError(f"MCP module '{mcp_name}' not found.")
-
-            # set descriptor file
-            mcp_descriptor = mcp_module.get('descriptor', None)
-            if not mcp_descriptor:
-                raise ValueError(
-                    f"MCP module '{mcp_name}' does not have a descriptor file defined."
-                )
-
-            # NOTE: Load tools logic here
-            descriptor = self.Loader_.load_yml_references(
-                target_file=mcp_descriptor,
-                target_folder='descriptors'
-            )
+            # NOTE: parsed once (process-wide index)
+            descriptor = thaw(descriptor_index.descriptor(mcp_name))
 
             return descriptor
         except Exception as e:
@@ -129,7 +115,7 @@ class MCPDescriptor:
         """
         try:
             # NOTE: load the mcp descriptor
-            mcp_descriptor = MCPDescriptor().mcp_descriptor(mcp_name)
+            mcp_descriptor = descriptor_index.descriptor(mcp_name)
 
             # NOTE: check if instructions exist
             instructions = mcp_descriptor.get('INSTRUCTIONS', None)
@@ -172,22 +158,16 @@ class MCPDescriptor:
         """
         try:
             # NOTE: find mcp name
-            mcp_name = next(
-                (
-                    module['name'] for module in MCP_MODULES
-                    if module['id'] == mcp_id
-                ),
-                None
-            )
+            mcp_name = descriptor_index.mcp_name(mcp_id)
 
             # check if mcp name exists
             if not mcp_name:
                 raise ValueError(f"MCP with id '{mcp_id}' not found.")
 
             # NOTE: load the mcp descriptor
-            mcp_descriptor = MCPDescriptor().mcp_descriptor(mcp_name)
+            mcp_descriptor = descriptor_index.descriptor(mcp_name)
 
-            return mcp_descriptor[method_name]
+            return thaw(mcp_descriptor[method_name])
         except Exception as e:
             raise ValueError(f"Failed to load MCP method: {e}") from e
 
@@ -213,20 +193,14 @@ class MCPDescriptor:
         """
         try:
             # NOTE: find mcp name
-            mcp_name = next(
-                (
-                    module['name'] for module in MCP_MODULES
-                    if module['id'] == mcp_id
-                ),
-                None
-            )
+            mcp_name = descriptor_index.mcp_name(mcp_id)
 
             # check if mcp name exists
             if not mcp_name:
                 raise ValueError(f"MCP with id '{mcp_id}' not found.")
 
             # NOTE: load the mcp descriptor
-            mcp_descriptor = MCPDescriptor().mcp_descriptor(mcp_name)
+            mcp_descriptor = descriptor_index.descriptor(mcp_name)
 
             # NOTE: check if method exists
             if method_name not in mcp_descriptor:
@@ -243,7 +217,7 @@ class MCPDescriptor:
 
             # ! build config for all components
             reference_config = {
-                "ALL": config
+                "ALL": thaw(config)
             }
 
             # return the reference config
@@ -273,20 +247,14 @@ class MCPDescriptor:
         """
         try:
             # NOTE: find mcp name
-            mcp_name = next(
-                (
-                    module['name'] for module in MCP_MODULES
-                    if module['id'] == mcp_id
-                ),
-                None
-            )
+            mcp_name = descriptor_index.mcp_name(mcp_id)
 
             # check if mcp name exists
             if not mcp_name:
                 raise ValueError(f"MCP with id '{mcp_id}' not found.")
 
             # NOTE: load the mcp descriptor
-            mcp_descriptor = MCPDescriptor().mcp_descriptor(mcp_name)
+            mcp_descriptor = descriptor_index.descriptor(mcp_name)
 
             # NOTE: check if method exists
             if method_name not in mcp_descriptor:
@@ -295,8 +263,8 @@ class MCPDescriptor:
                 )
 
             # NOTE:reference inputs
-            reference_inputs = mcp_descriptor[method_name].get(
-                'REFERENCE_INPUTS', {})
+            reference_inputs = thaw(mcp_descriptor[method_name].get(
+                'REFERENCE_INPUTS', {}))
 
             return reference_inputs
         except Exception as e:
@@ -325,13 +293,7 @@ class MCPDescriptor:
         """
         try:
             # NOTE: find mcp name
-            mcp_name = next(
-                (
-                    module['name'] for module in MCP_MODULES
-                    if module['id'] == mcp_id
-                ),
-                None
-            )
+            mcp_name = descriptor_index.mcp_name(mcp_id)
 
             # check if mcp name exists
             if not mcp_name:
@@ -339,7 +301,7 @@ class MCPDescriptor:
                 return []
 
             # NOTE: load the mcp descriptor
-            mcp_descriptor = MCPDescriptor().mcp_descriptor(mcp_name)
+            mcp_descriptor = descriptor_index.descriptor(mcp_name)
 
             # NOTE: check if method exists
             if method_name not in mcp_descriptor:
@@ -348,11 +310,52 @@ class MCPDescriptor:
                 return []
 
             # NOTE:reference inputs
-            ignore_state_props: List[str] = mcp_descriptor[method_name].get(
-                'IGNORE_STATE_PROPS', []
+            ignore_state_props: List[str] = thaw(
+                mcp_descriptor[method_name].get('IGNORE_STATE_PROPS', ())
             )
 
             return ignore_state_props
         except Exception as e:
             logger.error(f"Error loading ignore state props: {e}")
             return []
+
+    @staticmethod
+    def mcp_method_required_props(
+        mcp_id: str,
+        method_name: str
+    ) -> Optional[List[str]]:
+        """
+        Get the property symbols required by a specific mcp method, the
+        symbols of its reference inputs (data and equations).
+
+        Parameters
+        ----------
+        mcp_id : str
+            The id of the mcp to get the method for.
+        method_name : str
+            The name of the method to get the required properties for.
+
+        Returns
+        -------
+        List[str], optional
+            The required property symbols (e.g. Tc, Pc, AcFa, VaPr), None if
+            the method does not declare its reference inputs.
+        """
+        try:
+            reference_inputs = MCPDescriptor.mcp_method_reference_inputs(
+                mcp_id=mcp_id,
+                method_name=method_name
+            )
+        except Exception as e:
+            logger.error(f"Error loading required props: {e}")
+            return None
+
+        # NOTE: symbols of DATA and EQUATIONS
+        required_props: List[str] = [
+            item['symbol']
+            for section in ('DATA', 'EQUATIONS')
+            for item in (reference_inputs or {}).get(section, None) or []
+            if isinstance(item, dict) and item.get('symbol')
+        ]
+
+        return required_props or None
@@ -126,6 +126,9 @@ class MoziChemMCP(RegistryMixin, ReferenceMapper):
         # local mcp is True, the mcp name is set to the name of the hub
         self.local_mcp = local_mcp
 
+        # NOTE: revision of the tools (changed on each update)
+        self._revision = 0
+
         # ! check
         if local_mcp is True:
             # if local_mcp is True, set the mcp name to the name of the hub
@@ -160,6 +163,7 @@ class MoziChemMCP(RegistryMixin, ReferenceMapper):
         # NOTE: create the ToolManager instance
         self.ToolManager_ = ToolManager(
             references_thermodb=_references_thermodb,
+            mcp_name=name if local_mcp else None
         )
 
         # SECTION: configure the MCP server
@@ -182,6 +186,14 @@ class MoziChemMCP(RegistryMixin, ReferenceMapper):
         """
         return self._description
 
+    @property
+    def revision(self) -> int:
+        """
+        Get the revision of the mcp tools, it changes whenever the tools or
+        the references are updated.
+        """
+        return self._revision
+
     def tools_info(self):
         '''
         Give information about the tools available in the MoziChem MCP.
@@ -202,6 +214,9 @@ class MoziChemMCP(RegistryMixin, ReferenceMapper):
         adding tools, resources, prompts, and other configurations.
         """
         try:
+            # NOTE: tools (or references) are changed
+            self._revision += 1
+
             # SECTION: manage tools
             # LINK: collect the registered functions
             custom_functions: Dict[
@@ -349,10 +364,12 @@ class MoziChemMCP(RegistryMixin, ReferenceMapper):
                     reference_config=reference_config
                 )
 
-            # SECTION: reinitialize the ToolManager with new references
-            self.ToolManager_ = ToolManager(
-                references_thermodb=_references_thermodb,
+            # SECTION: rebuild the hub and the mcp core instances
+            # NOTE: the model sources of the old references are invalidated
+            self.ToolManager_.update_references(
+                references_thermodb=_references_thermodb
             )
+            self._revision += 1
 
             # SECTION: update the MCP server with new references
             # ! update the mcp server with local tools
@@ -7,6 +7,9 @@ from .reference_exceptions import (
     EmptyReferenceConfigError,
     InvalidReferenceContentTypeError,
     InvalidReferenceConfigTypeError,
+    CustomReferenceNotFoundError,
+    CustomReferenceRegistrationError,
+    ReferenceCompileError,
     NO_DATABOOK_FOUND_MSG,
     REFERENCE_CONFIG_GEN_ERROR_MSG,
     COMPONENT_REFERENCE_CONFIG_ERROR_MSG,
@@ -15,7 +18,10 @@ from .reference_exceptions import (
     EMPTY_REFERENCE_CONTENT_ERROR_MSG,
     EMPTY_REFERENCE_CONFIG_ERROR_MSG,
     INVALID_REFERENCE_CONTENT_TYPE_MSG,
-    INVALID_REFERENCE_CONFIG_TYPE_MSG
+    INVALID_REFERENCE_CONFIG_TYPE_MSG,
+    CUSTOM_REFERENCE_NOT_FOUND_MSG,
+    CUSTOM_REFERENCE_REGISTRATION_ERROR_MSG,
+    REFERENCE_COMPILE_ERROR_MSG
 )
 
 from .utils_exceptions import (
@@ -26,13 +32,15 @@ from .utils_exceptions import (
     LoadingReferenceError,
     ListingReferenceError,
     InvalidFolderPathError,
+    DescriptorCompileError,
     LOADER_ERROR_MSG,
     FILE_NOT_FOUND_ERROR_MSG,
     INVALID_FILE_FORMAT_ERROR_MSG,
     LOADING_YML_ERROR_MSG,
     LOADING_REFERENCE_ERROR_MSG,
     LISTING_REFERENCE_ERROR_MSG,
-    INVALID_FOLDER_PATH_ERROR_MSG
+    INVALID_FOLDER_PATH_ERROR_MSG,
+    DESCRIPTOR_COMPILE_ERROR_MSG
 )
 
 from .tool_exceptions import (
@@ -46,6 +54,7 @@ from .tool_exceptions import (
     ToolNotFoundError,
     MoziToolBuildingError,
     FunctionToolBuildingError,
+    ToolPoolError,
     MOZI_TOOL_BUILDING_ERROR_MSG,
     TOOL_BUILDING_ERROR_MSG,
     TOOL_EXECUTION_ERROR_MSG,
@@ -55,6 +64,7 @@ from .tool_exceptions import (
     TOOL_REGISTRATION_ERROR_MSG,
     TOOL_NOT_FOUND_ERROR_MSG,
     FUNCTION_TOOL_BUILDING_ERROR_MSG,
+    TOOL_POOL_ERROR_MSG,
 )
 
 from .mcp_exceptions import (
@@ -167,6 +177,9 @@ __all__ = [
     "EmptyReferenceConfigError",
     "InvalidReferenceContentTypeError",
     "InvalidReferenceConfigTypeError",
+    "CustomReferenceNotFoundError",
+    "CustomReferenceRegistrationError",
+    "ReferenceCompileError",
     "NO_DATABOOK_FOUND_MSG",
     "REFERENCE_CONFIG_GEN_ERROR_MSG",
     "COMPONENT_REFERENCE_CONFIG_ERROR_MSG",
@@ -176,6 +189,9 @@ __all__ = [
     "EMPTY_REFERENCE_CONFIG_ERROR_MSG",
     "INVALID_REFERENCE_CONTENT_TYPE_MSG",
     "INVALID_REFERENCE_CONFIG_TYPE_MSG",
+    "CUSTOM_REFERENCE_NOT_FOUND_MSG",
+    "CUSTOM_REFERENCE_REGISTRATION_ERROR_MSG",
+    "REFERENCE_COMPILE_ERROR_MSG",
 
     # Utils exceptions
     "LoaderError",
@@ -185,6 +201,7 @@ __all__ = [
     "LoadingReferenceError",
     "ListingReferenceError",
     "InvalidFolderPathError",
+    "DescriptorCompileError",
     "LOADER_ERROR_MSG",
     "FILE_NOT_FOUND_ERROR_MSG",
     "INVALID_FILE_FORMAT_ERROR_MSG",
@@ -192,6 +209,7 @@ __all__ = [
     "LOADING_REFERENCE_ERROR_MSG",
     "LISTING_REFERENCE_ERROR_MSG",
     "INVALID_FOLDER_PATH_ERROR_MSG",
+    "DESCRIPTOR_COMPILE_ERROR_MSG",
 
     # Tool exceptions
     "ToolError",
@@ -211,8 +229,10 @@ __all__ = [
     "TOOL_NOT_FOUND_ERROR_MSG",
     "MoziToolBuildingError",
     "FunctionToolBuildingError",
+    "ToolPoolError",
     "MOZI_TOOL_BUILDING_ERROR_MSG",
     "FUNCTION_TOOL_BUILDING_ERROR_MSG",
+    "TOOL_POOL_ERROR_MSG",
 
     # MCP exceptions
     "MCPError",
@@ -11,6 +11,9 @@ EMPTY_REFERENCE_CONTENT_ERROR_MSG = "Custom reference content cannot be empty. T
 EMPTY_REFERENCE_CONFIG_ERROR_MSG = "Custom reference config cannot be empty. Thus, set it to None."
 INVALID_REFERENCE_CONTENT_TYPE_MSG = "Custom reference content must be a string."
 INVALID_REFERENCE_CONFIG_TYPE_MSG = "Custom reference config must be a string."
+CUSTOM_REFERENCE_NOT_FOUND_MSG = "Custom reference id not found in the registry, register the reference again."
+CUSTOM_REFERENCE_REGISTRATION_ERROR_MSG = "Failed to register custom reference."
+REFERENCE_COMPILE_ERROR_MSG = "Failed to compile the reference."
 
 
 class NoDatabookFoundError(Exception):
@@ -51,3 +54,18 @@ class InvalidReferenceContentTypeError(TypeError):
 class InvalidReferenceConfigTypeError(TypeError):
     """Raised when reference config is not a string."""
     pass
+
+
+class CustomReferenceNotFoundError(KeyError):
+    """Raised when a custom reference id is not found in the registry."""
+    pass
+
+
+class CustomReferenceRegistrationError(Exception):
+    """Raised when registering a custom reference fails."""
+    pass
+
+
+class ReferenceCompileError(Exception):
+    """Raised when compiling a reference to its binary form fails."""
+    pass
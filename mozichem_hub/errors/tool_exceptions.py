@@ -10,6 +10,7 @@ TOOL_REGISTRATION_ERROR_MSG = "Error registering tool."
 TOOL_NOT_FOUND_ERROR_MSG = "Tool not found."
 MOZI_TOOL_BUILDING_ERROR_MSG = "Error building tools from MoziTool instances."
 FUNCTION_TOOL_BUILDING_ERROR_MSG = "Error building tools from function dictionary."
+TOOL_POOL_ERROR_MSG = "Error in the tool worker pool."
 
 
 class ToolError(Exception):
@@ -60,3 +61,8 @@ class ToolRegistrationError(ToolError):
 class ToolNotFoundError(ToolError):
     """Raised when a tool is not found."""
     pass
+
+
+class ToolPoolError(ToolError):
+    """Raised when the tool worker pool cannot be created or used."""
+    pass
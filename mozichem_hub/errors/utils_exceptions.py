@@ -8,6 +8,7 @@ LOADING_YML_ERROR_MSG = "Error loading YAML file."
 LOADING_REFERENCE_ERROR_MSG = "Error loading reference."
 LISTING_REFERENCE_ERROR_MSG = "Error listing references."
 INVALID_FOLDER_PATH_ERROR_MSG = "Invalid folder path."
+DESCRIPTOR_COMPILE_ERROR_MSG = "Error compiling descriptors."
 
 
 class LoaderError(Exception):
@@ -43,3 +44,8 @@ class ListingReferenceError(LoaderError):
 class InvalidFolderPathError(LoaderError):
     """Raised when a folder path is invalid."""
     pass
+
+
+class DescriptorCompileError(LoaderError):
+    """Raised when the descriptors cannot be compiled."""
+    pass
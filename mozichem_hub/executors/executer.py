@@ -1,5 +1,13 @@
 # import libs
-from typing import Dict, Callable, Any
+import threading
+from typing import (
+    Dict,
+    Callable,
+    Any,
+    List,
+    Tuple,
+    Optional
+)
 # locals
 from ..docs import MoziChemMCP
 from ..models import MoziTool
@@ -17,6 +25,11 @@ from ..errors import (
 class ToolExecuter:
     """
     ToolExecuter class for executing tools in the MoziChem Hub.
+
+    Notes
+    -----
+    The tool name -> function dispatch table is built once and rebuilt only
+    when the MCP revision changes (tools or references updated).
     """
 
     def __init__(self, mozichem_mcp: MoziChemMCP):
@@ -26,14 +39,54 @@ class ToolExecuter:
         # NOTE: store the MoziChemMCP instance
         self.mcp = mozichem_mcp
 
+        # NOTE: dispatch table (built on first use)
+        self._tools: Optional[Dict[str, Callable[..., Any]]] = None
+        self._revision: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def refresh(self) -> None:
+        """
+        Drop the dispatch table, it is built again on the next execution.
+        """
+        with self._lock:
+            self._tools = None
+            self._revision = None
+
+    def _dispatch_table(self) -> Dict[str, Callable[..., Any]]:
+        """
+        Get the dispatch table, rebuilt if the MCP revision has changed.
+        """
+        revision = getattr(self.mcp, 'revision', None)
+        tools = self._tools
+        if tools is not None and revision == self._revision:
+            return tools
+
+        with self._lock:
+            if self._tools is None or revision != self._revision:
+                self._tools = self._build_tools()
+                self._revision = revision
+            return self._tools
+
     def get_tools(self) -> Dict[str, Callable[..., Any]]:
         """
         List all available tools in the MoziChem MCP.
 
         Returns
         -------
-        list
-            A list of tool names available in the MCP.
+        dict
+            A dictionary of tool names and their functions.
+        """
+        try:
+            return dict(self._dispatch_table())
+        except ToolError:
+            raise
+        except Exception as e:
+            raise FunctionRetrievalError(
+                f"{FUNCTION_RETRIEVAL_ERROR_MSG} {str(e)}")
+
+    def _build_tools(self) -> Dict[str, Callable[..., Any]]:
+        """
+        Build the tool name -> function dispatch table from the MCP.
         """
         try:
             # SECTION: Retrieve the tools information from the MCP
@@ -86,7 +139,7 @@ class ToolExecuter:
         """
         try:
             # Retrieve the tool information from the MCP
-            tools = self.get_tools()
+            tools = self._dispatch_table()
 
             # check if the tool exists
             if tool_name not in tools.keys():
@@ -133,3 +186,52 @@ class ToolExecuter:
         except Exception as e:
             raise ToolExecutionError(
                 f"{TOOL_EXECUTION_ERROR_MSG} Failed to execute tool '{tool_name}': {str(e)}")
+
+    def execute_many(
+        self,
+        calls: List[Tuple[str, Dict[str, Any]]],
+        return_exceptions: bool = False
+    ) -> List[Any]:
+        """
+        Execute several tools, the dispatch table is resolved once.
+
+        Parameters
+        ----------
+        calls : List[Tuple[str, Dict[str, Any]]]
+            List of (tool name, keyword arguments).
+        return_exceptions : bool, optional
+            If True, a failed call puts its exception in the results instead
+            of raising it, default is False.
+
+        Returns
+        -------
+        List[Any]
+            The results of the tool executions (in the same order).
+        """
+        # NOTE: resolve the tools once
+        try:
+            tools = self._dispatch_table()
+        except ToolError:
+            raise
+        except Exception as e:
+            raise FunctionRetrievalError(
+                f"{FUNCTION_RETRIEVAL_ERROR_MSG} {str(e)}")
+
+        results: List[Any] = []
+        for tool_name, kwargs in calls:
+            try:
+                tool_function = tools.get(tool_name, None)
+                if tool_function is None:
+                    raise ToolNotFoundError(
+                        f"{TOOL_NOT_FOUND_ERROR_MSG} Tool '{tool_name}' not found in the MoziChem MCP.")
+
+                results.append(tool_function(**(kwargs or {})))
+            except Exception as e:
+                if not isinstance(e, ToolError):
+                    e = ToolExecutionError(
+                        f"{TOOL_EXECUTION_ERROR_MSG} Failed to execute tool '{tool_name}': {str(e)}")
+                if not return_exceptions:
+                    raise e
+                results.append(e)
+
+        return results
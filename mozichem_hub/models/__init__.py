@@ -12,9 +12,19 @@ from .references_models import (
     ReferenceThermoDB,
     ComponentPropertySource,
     ComponentReferenceThermoDB,
-    ReferencesThermoDB
+    ReferencesThermoDB,
+    ComponentsReference,
+    ComponentReferenceView,
+    RegisteredReference,
+    CustomReferenceRequest
 )
 from .uni_models import ComponentIdentity
+# descriptors
+from .descriptor_models import (
+    DescriptorArg,
+    DescriptorMethod,
+    DescriptorArtifact
+)
 
 __all__ = [
     "MCPConfig",
@@ -27,5 +37,12 @@ __all__ = [
     "ComponentPropertySource",
     "ComponentReferenceThermoDB",
     "ReferencesThermoDB",
-    "ComponentIdentity"
+    "ComponentsReference",
+    "ComponentReferenceView",
+    "RegisteredReference",
+    "CustomReferenceRequest",
+    "ComponentIdentity",
+    "DescriptorArg",
+    "DescriptorMethod",
+    "DescriptorArtifact"
 ]
@@ -0,0 +1,95 @@
+# import libs
+from typing import Any, Dict, List, Optional
+from pydantic import BaseModel, ConfigDict, Field
+# local
+
+
+class DescriptorArg(BaseModel):
+    """
+    Model for a tool argument defined in a descriptor file.
+
+    Attributes
+    ----------
+    name : str
+        Name of the argument.
+    type : str
+        Type of the argument.
+    description : str
+        Description of the argument.
+    """
+    model_config = ConfigDict(extra='allow')
+
+    name: str = Field(..., description="Name of the argument")
+    type: str = Field("str", description="Type of the argument")
+    description: str = Field("", description="Description of the argument")
+
+
+class DescriptorMethod(BaseModel):
+    """
+    Model for a tool (method) defined in a descriptor file.
+
+    Attributes
+    ----------
+    NAME : str
+        Name of the tool.
+    DESCRIPTION : str
+        Description of the tool.
+    TAGS : List[str]
+        Tags of the tool.
+    ARGS : List[DescriptorArg]
+        Arguments of the tool.
+    CONFIG : Dict[str, Any], optional
+        Reference configuration of the tool.
+    REFERENCE_INPUTS : Dict[str, Any], optional
+        Reference inputs (data and equations) of the tool.
+    IGNORE_STATE_PROPS : List[str], optional
+        Properties for which the component state is ignored.
+    """
+    model_config = ConfigDict(extra='allow')
+
+    NAME: str = Field(..., description="Name of the tool")
+    DESCRIPTION: str = Field(..., description="Description of the tool")
+    TAGS: List[str] = Field(
+        default_factory=list,
+        description="Tags of the tool"
+    )
+    ARGS: List[DescriptorArg] = Field(
+        default_factory=list,
+        description="Arguments of the tool"
+    )
+    CONFIG: Optional[Dict[str, Any]] = Field(
+        None,
+        description="Reference configuration of the tool"
+    )
+    REFERENCE_INPUTS: Optional[Dict[str, Any]] = Field(
+        None,
+        description="Reference inputs (data and equations) of the tool"
+    )
+    IGNORE_STATE_PROPS: Optional[List[str]] = Field(
+        None,
+        description="Properties for which the component state is ignored"
+    )
+
+
+class DescriptorArtifact(BaseModel):
+    """
+    Model for the precompiled descriptors artifact.
+
+    Attributes
+    ----------
+    version : str
+        Package version used to compile the artifact.
+    sources : Dict[str, str]
+        Descriptor file name -> sha256 of the yml file.
+    descriptors : Dict[str, Dict[str, Any]]
+        Descriptor file name -> REFERENCES section of the yml file.
+    """
+    version: str = Field(..., description="Package version")
+    sources: Dict[str, str] = Field(
+        ...,
+        description="Descriptor file name -> sha256 of the yml file"
+    )
+    descriptors: Dict[str, Dict[str, Any]] = Field(
+        ...,
+        description="Descriptor file name -> REFERENCES section"
+    )
@@ -1,4 +1,5 @@
 # import libs
+import yaml
 from typing import (
     Any,
     List,
@@ -14,6 +15,9 @@ from pydantic import (
     model_validator
 )
 from pythermodb_settings.models import ComponentConfig, ComponentRule
+from pythermodb_settings.models import (
+    ReferencesThermoDB as PTDBReferencesThermoDB
+)
 # local
 from .resources_models import Component
 
@@ -119,8 +123,9 @@ class References(BaseModel):
         List of reference contents provided by the user.
     config : Optional[Dict[str, Dict[str, ComponentConfig]]]
         Configuration for the thermodynamic database, which properties should be included.
-    link : Optional[str]
-        Link to the reference thermodynamic database.
+    link : Optional[Dict[str, Dict[str, ComponentRule]]]
+        Link to the reference thermodynamic database (a yaml string is
+        converted to a dictionary).
 
     Notes
     -----
@@ -130,7 +135,7 @@ class References(BaseModel):
     """
     contents: Optional[List[str]] = None
     config: Optional[Dict[str, Dict[str, ComponentPropertySource]]] = None
-    link: Optional[str] = None
+    link: Optional[Dict[str, Dict[str, Optional[ComponentRule]]]] = None
 
     @field_validator("contents", mode="before")
     @classmethod
@@ -149,6 +154,13 @@ class References(BaseModel):
         if isinstance(v, dict):
             return v
 
+    @field_validator("link", mode="before")
+    @classmethod
+    def convert_link_str_to_dict(cls, v):
+        if isinstance(v, str):
+            return yaml.safe_load(v) if v.strip() else None
+        return v
+
 
 class ReferenceThermoDB(BaseModel):
     """
@@ -271,3 +283,131 @@ class ReferencesThermoDB(BaseModel):
     model_config = ConfigDict(
         arbitrary_types_allowed=True,
     )
+
+
+# NOTE: ComponentsReference
+class ComponentsReference(BaseModel):
+    """
+    Model for the reference configs and rules of a batch of components,
+    built once and shared (read-only) by the component reference thermodbs.
+
+    Attributes
+    ----------
+    reference : Dict[str, List[str]]
+        The reference ({'reference': [contents]}).
+    contents : List[str]
+        The reference contents.
+    configs : Dict[str, Dict[str, ComponentConfig]]
+        Reference configs by component id (name-state and formula-state).
+    rules : Dict[str, Dict[str, ComponentRule]]
+        Reference rules by component id (name-state and formula-state).
+    """
+    reference: Dict[str, List[str]] = Field(
+        ...,
+        description="Dictionary of references with their associated contents."
+    )
+    contents: List[str] = Field(
+        ...,
+        description="List of reference contents used for building the thermodynamic database."
+    )
+    configs: Dict[str, Dict[str, ComponentConfig]] = Field(
+        default_factory=dict,
+        description="Reference configs by component id."
+    )
+    rules: Dict[str, Dict[str, ComponentRule]] = Field(
+        default_factory=dict,
+        description="Reference rules by component id."
+    )
+    model_config = ConfigDict(
+        arbitrary_types_allowed=True,
+        frozen=True
+    )
+
+
+# NOTE: ComponentReferenceView
+class ComponentReferenceView(BaseModel):
+    """
+    Model for the resolved (read-only) reference state of a component id in
+    a hub, the component entries or otherwise the 'ALL' entries.
+
+    Attributes
+    ----------
+    component_id : str
+        The component id (name-state or formula-state).
+    reference : Dict[str, List[str]], optional
+        The component reference, None if not found.
+    config : Dict[str, ComponentConfig], optional
+        The component reference config, None if not found.
+    rule : Dict[str, ComponentRule], optional
+        The component reference rule, None if not found.
+    ignore_labels : List[str]
+        The component ignore labels (empty if not found).
+    """
+    component_id: str = Field(
+        ...,
+        description="Component id (name-state or formula-state)."
+    )
+    reference: Optional[Dict[str, List[str]]] = Field(
+        default=None,
+        description="Resolved component reference."
+    )
+    config: Optional[Dict[str, ComponentConfig]] = Field(
+        default=None,
+        description="Resolved component reference config."
+    )
+    rule: Optional[Dict[str, ComponentRule]] = Field(
+        default=None,
+        description="Resolved component reference rule."
+    )
+    ignore_labels: List[str] = Field(
+        default_factory=list,
+        description="Resolved component ignore labels."
+    )
+    model_config = ConfigDict(
+        arbitrary_types_allowed=True,
+        frozen=True
+    )
+
+
+# NOTE: RegisteredReference
+class RegisteredReference(BaseModel):
+    """
+    Model for a custom reference registered once and used by its id.
+    """
+    reference_id: str = Field(
+        ...,
+        description="Content hash id of the custom reference."
+    )
+    content: str = Field(
+        ...,
+        description="Validated custom reference content (PyThermoDB yaml)."
+    )
+    config: Optional[str] = Field(
+        default=None,
+        description="Custom reference configuration, if provided."
+    )
+    references_thermodb: Optional[PTDBReferencesThermoDB] = Field(
+        default=None,
+        description=(
+            "Parsed references thermodb, only available if the config is "
+            "provided (otherwise it depends on the components of the call)."
+        )
+    )
+    model_config = ConfigDict(
+        arbitrary_types_allowed=True,
+    )
+
+
+# NOTE: CustomReferenceRequest
+class CustomReferenceRequest(BaseModel):
+    """
+    Model for the custom reference registration request (api).
+    """
+    content: str = Field(
+        ...,
+        description="Custom reference content provided by PyThermoDB."
+    )
+    config: Optional[str] = Field(
+        default=None,
+        description="Custom reference configuration provided by PyThermoDB."
+    )
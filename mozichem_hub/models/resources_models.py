@@ -72,6 +72,9 @@ class ComponentThermoDB(BaseModel):
         'Name-State', 'Formula-State', 'Name', 'Formula', 'Name-Formula-State'
     ]
         Key to identify the component in the reference content.
+    source_size: int
+        Estimated size (bytes) of the reference content the thermodb is built
+        from, 0 if unknown (sizes the caches).
     """
     component: Component
     thermodb: CompBuilder
@@ -81,6 +84,10 @@ class ComponentThermoDB(BaseModel):
         default='Name-State',
         description="Key to identify the component in the reference content."
     )
+    source_size: int = Field(
+        default=0,
+        description="Estimated size (bytes) of the reference content the thermodb is built from, 0 if unknown."
+    )
 
     model_config = ConfigDict(
         arbitrary_types_allowed=True,
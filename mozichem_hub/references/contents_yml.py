@@ -0,0 +1,10515 @@
+# SECTION: custom reference content (yml format, loaded on demand)
+REFERENCE_CONTENT_0 = """
+REFERENCES:
+    CUSTOM-REF-1:
+        DATABOOK-ID: 1
+        DESCRIPTION: ''
+        TABLES:
+            general-data:
+                TABLE-ID: 1
+                DESCRIPTION:
+                    General data for mozichem-hub.
+                STRUCTURE:
+                    COLUMNS:
+                    - No.
+                    - Name
+                    - Formula
+                    - State
+                    - CAS no.
+                    - molecular-weight
+                    - critical-temperature
+                    - critical-pressure
+                    - critical-molar-volume
+                    - critical-compressibility-factor
+                    - acentric-factor
+                    - enthalpy-of-formation
+                    - gibbs-energy-of-formation
+                    - standard-entropy
+                    - standard-net-enthalpy-of-combustion
+                    SYMBOL:
+                    - '-'
+                    - '-'
+                    - '-'
+                    - '-'
+                    - '-'
+                    - MW
+                    - Tc
+                    - Pc
+                    - Vc
+                    - Zc
+                    - AcFa
+                    - EnFo_IG
+                    - GiEnFo_IG
+                    - Ent_IG
+                    - EnCo_STD
+                    UNIT:
+                    - '-'
+                    - '-'
+                    - '-'
+                    - '-'
+                    - '-'
+                    - g/mol
+                    - K
+                    - MPa
+                    - m3/kmol
+                    - '-'
+                    - '-'
+                    - kJ/mol
+                    - kJ/mol
+                    - J/mol.K
+                    - kJ/mol
+                    CONVERSION:
+                    - 1.0
+                    - 1.0
+                    - 1.0
+                    - 1.0
+                    - 1.0
+                    - 1.0
+                    - 1.0
+                    - 1.0
+                    - 1.0
+                    - 1.0
+                    - 1.0
+                    - 1.0
+                    - 1.0
+                    - 1.0
+                    - 1.0
+                VALUES:
+                -   - '1'
+                    - Acetaldehyde
+                    - C2H4O
+                    - g
+                    - 75-07-0
+                    - '44.053'
+                    - '466'
+                    - '5.55'
+                    - '0.154'
+                    - '0.221'
+                    - '0.2907'
+                    - '-166.4'
+                    - '-133.3'
+                    - '264.2'
+                    - '-11.045'
+                -   - '2'
+                    - Acetamide
+                    - C2H5NO
+                    - g
+                    - 60-35-5
+                    - '59.067'
+                    - '761'
+                    - '6.6'
+                    - '0.215'
+                    - '0.224'
+                    - '0.421'
+                    - '-238.3'
+                    - '-159.6'
+                    - '272.2'
+                    - '-10.741'
+                -   - '3'
+                    - Acetic acid
+                    - C2H4O2
+                    - g
+                    - 64-19-7
+                    - '60.052'
+                    - '591.95'
+                    - '5.786'
+                    - '0.177'
+                    - '0.208'
+                    - '0.4665'
+                    - '-461.1'
+                    - '-403'
+                    - '282.5'
+                    - '-7.866'
+                -   - '4'
+                    - Acetic anhydride
+                    - C4H6O3
+                    - g
+                    - 108-24-7
+                    - '102.089'
+                    - '606'
+                    - '4'
+                    - '0.29'
+                    - '0.23'
+                    - '0.4535'
+                    - '-572.5'
+                    - '-473.4'
+                    - '389.9'
+                    - '-16.75'
+                -   - '5'
+                    - Acetone
+                    - C3H6O
+                    - g
+                    - 67-64-1
+                    - '58.079'
+                    - '508.2'
+                    - '4.701'
+                    - '0.209'
+                    - '0.233'
+                    - '0.3065'
+                    - '-215.7'
+                    - '-151.3'
+                    - '295.4'
+                    - '-16.59'
+                -   - '6'
+                    - Acetonitrile
+                    - C2H3N
+                    - g
+                    - '1975-05-08'
+                    - '41.052'
+                    - '545.5'
+                    - '4.83'
+                    - '0.173'
+                    - '0.184'
+                    - '0.3379'
+                    - '74.04'
+                    - '91.868'
+                    - '243.29'
+                    - '-11.9043'
+                -   - '7'
+                    - Acetylene
+                    - C2H2
+                    - g
+                    - 74-86-2
+                    - '26.037'
+                    - '308.3'
+                    - '6.138'
+                    - '0.112'
+                    - '0.268'
+                    - '0.1912'
+                    - '228.2'
+                    - '210.68'
+                    - '200.81'
+                    - '-12.57'
+                -   - '8'
+                    - Acrolein
+                    - C3H4O
+                    - g
+                    - 107-02-8
+                    - '56.063'
+                    - '506'
+                    - '5'
+                    - '0.197'
+                    - '0.234'
+                    - '0.3198'
+                    - '-81.8'
+                    - '-56.8'
+                    - '297'
+                    - '-15.468'
+                -   - '9'
+                    - Acrylic acid
+                    - C3H4O2
+                    - g
+                    - '1979-10-07'
+                    - '72.063'
+                    - '615'
+                    - '5.66'
+                    - '0.208'
+                    - '0.23'
+                    - '0.5383'
+                    - '-355.91'
+                    - '-306'
+                    - '315'
+                    - '-13.2717'
+                -   - '10'
+                    - Acrylonitrile
+                    - C3H3N
+                    - g
+                    - 107-13-1
+                    - '53.063'
+                    - '535'
+                    - '4.48'
+                    - '0.212'
+                    - '0.214'
+                    - '0.3498'
+                    - '183.7'
+                    - '193.7'
+                    - '275.3'
+                    - '-16.9'
+                -   - '11'
+                    - Air
+                    - Mixture
+                    - g
+                    - 132259-10-0
+                    - '28.96'
+                    - '132.45'
+                    - '3.774'
+                    - '0.09147'
+                    - '0.313'
+                    - '0'
+                    - '0'
+                    - '0'
+                    - '199'
+                    - '0'
+                -   - '12'
+                    - Ammonia
+                    - H3N
+                    - g
+                    - 7664-41-7
+                    - '17.031'
+                    - '405.65'
+                    - '11.28'
+                    - '0.07247'
+                    - '0.242'
+                    - '0.2526'
+                    - '-45.898'
+                    - '-16.4'
+                    - '192.66'
+                    - '-3.1683'
+                -   - '13'
+                    - Anisole
+                    - C7H8O
+                    - g
+                    - 100-66-3
+                    - '108.138'
+                    - '645.6'
+                    - '4.25'
+                    - '0.337'
+                    - '0.267'
+                    - '0.3502'
+                    - '-67.9'
+                    - '22.7'
+                    - '361'
+                    - '-36.072'
+                -   - '14'
+                    - Argon
+                    - Ar
+                    - g
+                    - 7440-37-1
+                    - '39.948'
+                    - '150.86'
+                    - '4.898'
+                    - '0.07459'
+                    - '0.291'
+                    - '0'
+                    - '0'
+                    - '0'
+                    - '154.737'
+                    - '0'
+                -   - '15'
+                    - Benzamide
+                    - C7H7NO
+                    - g
+                    - 55-21-0
+                    - '121.137'
+                    - '824'
+                    - '5.05'
+                    - '0.346'
+                    - '0.255'
+                    - '0.5585'
+                    - '-100.9'
+                    - '-2.11'
+                    - '364.1'
+                    - '-33.9877'
+                -   - '16'
+                    - Benzene
+                    - C6H6
+                    - g
+                    - 71-43-2
+                    - '78.112'
+                    - '562.05'
+                    - '4.895'
+                    - '0.256'
+                    - '0.268'
+                    - '0.2103'
+                    - '82.88'
+                    - '129.6'
+                    - '269.3'
+                    - '-31.36'
+                -   - '17'
+                    - Benzenethiol
+                    - C6H6S
+                    - g
+                    - 108-98-5
+                    - '110.177'
+                    - '689'
+                    - '4.74'
+                    - '0.315'
+                    - '0.261'
+                    - '0.2628'
+                    - '111.5'
+                    - '147.6'
+                    - '336.9'
+                    - '-34.474'
+                -   - '18'
+                    - Benzoic acid
+                    - C7H6O2
+                    - g
+                    - 65-85-0
+                    - '122.121'
+                    - '751'
+                    - '4.47'
+                    - '0.344'
+                    - '0.246'
+                    - '0.6028'
+                    - '-294.1'
+                    - '-214.2'
+                    - '369'
+                    - '-30.951'
+                -   - '19'
+                    - Benzonitrile
+                    - C7H5N
+                    - g
+                    - 100-47-0
+                    - '103.121'
+                    - '699.35'
+                    - '4.215'
+                    - '0.3132'
+                    - '0.227'
+                    - '0.3662'
+                    - '215.7'
+                    - '257.8'
+                    - '321'
+                    - '-35.238'
+                -   - '20'
+                    - Benzophenone
+                    - C13H10O
+                    - g
+                    - 119-61-9
+                    - '182.218'
+                    - '830'
+                    - '3.352'
+                    - '0.5677'
+                    - '0.276'
+                    - '0.5019'
+                    - '56.8'
+                    - '173'
+                    - '440'
+                    - '-62.876'
+                -   - '21'
+                    - Benzyl alcohol
+                    - C7H8O
+                    - g
+                    - 100-51-6
+                    - '108.138'
+                    - '720.15'
+                    - '4.374'
+                    - '0.382'
+                    - '0.279'
+                    - '0.3631'
+                    - '-90.25'
+                    - '-2.54'
+                    - '371.3'
+                    - '-35.6'
+                -   - '22'
+                    - Benzyl ethyl ether
+                    - C9H12O
+                    - g
+                    - 539-30-0
+                    - '136.191'
+                    - '662'
+                    - '3.11'
+                    - '0.442'
+                    - '0.25'
+                    - '0.4332'
+                    - '-115'
+                    - '33.7'
+                    - '439'
+                    - '-48.3'
+                -   - '23'
+                    - Benzyl mercaptan
+                    - C7H8S
+                    - g
+                    - 100-53-8
+                    - '124.203'
+                    - '718'
+                    - '4.06'
+                    - '0.367'
+                    - '0.25'
+                    - '0.3126'
+                    - '93.3'
+                    - '163'
+                    - '360.7'
+                    - '-40.6'
+                -   - '24'
+                    - Biphenyl
+                    - C12H10
+                    - g
+                    - 92-52-4
+                    - '154.208'
+                    - '773'
+                    - '3.38'
+                    - '0.497'
+                    - '0.261'
+                    - '0.4029'
+                    - '178.49'
+                    - '276.3'
+                    - '393.67'
+                    - '-62.48'
+                -   - '25'
+                    - Bromine
+                    - Br2
+                    - g
+                    - 7726-95-6
+                    - '159.808'
+                    - '584.15'
+                    - '10.3'
+                    - '0.135'
+                    - '0.286'
+                    - '0.129'
+                    - '30.91'
+                    - '3.14'
+                    - '245.35'
+                    - '0'
+                -   - '26'
+                    - Bromobenzene
+                    - C6H5Br
+                    - g
+                    - 108-86-1
+                    - '157.008'
+                    - '670.15'
+                    - '4.519'
+                    - '0.324'
+                    - '0.263'
+                    - '0.2506'
+                    - '105.018'
+                    - '138.532'
+                    - '324.386'
+                    - '-30.1917'
+                -   - '27'
+                    - Bromoethane
+                    - C2H5Br
+                    - g
+                    - 74-96-4
+                    - '108.965'
+                    - '503.8'
+                    - '6.23'
+                    - '0.215'
+                    - '0.32'
+                    - '0.2548'
+                    - '-63.6'
+                    - '-25.82'
+                    - '287.3'
+                    - '-12.85'
+                -   - '28'
+                    - Bromomethane
+                    - CH3Br
+                    - g
+                    - 74-83-9
+                    - '94.939'
+                    - '467'
+                    - '8'
+                    - '0.156'
+                    - '0.321'
+                    - '0.1922'
+                    - '-37.7'
+                    - '-28.19'
+                    - '245.8'
+                    - '-7.0542'
+                -   - '29'
+                    - 1,2-Butadiene
+                    - C4H6
+                    - g
+                    - 590-19-2
+                    - '54.09'
+                    - '452'
+                    - '4.36'
+                    - '0.22'
+                    - '0.255'
+                    - '0.1659'
+                    - '162.3'
+                    - '198.6'
+                    - '293'
+                    - '-24.617'
+                -   - '30'
+                    - 1,3-Butadiene
+                    - C4H6
+                    - g
+                    - 106-99-0
+                    - '54.09'
+                    - '425'
+                    - '4.32'
+                    - '0.221'
+                    - '0.27'
+                    - '0.195'
+                    - '109.24'
+                    - '149.72'
+                    - '278.89'
+                    - '-24.09'
+                -   - '31'
+                    - Butane
+                    - C4H10
+                    - g
+                    - 106-97-8
+                    - '58.122'
+                    - '425.12'
+                    - '3.796'
+                    - '0.255'
+                    - '0.274'
+                    - '0.2002'
+                    - '-125.79'
+                    - '-16.7'
+                    - '309.91'
+                    - '-26.5732'
+                -   - '32'
+                    - 1,2-Butanediol
+                    - C4H10O2
+                    - g
+                    - 584-03-2
+                    - '90.121'
+                    - '680'
+                    - '5.21'
+                    - '0.303'
+                    - '0.279'
+                    - '0.6305'
+                    - '-445.8'
+                    - '-304.4'
+                    - '406.5'
+                    - '-22.678'
+                -   - '33'
+                    - 1,3-Butanediol
+                    - C4H10O2
+                    - g
+                    - 107-88-0
+                    - '90.121'
+                    - '676'
+                    - '4.02'
+                    - '0.305'
+                    - '0.218'
+                    - '0.7043'
+                    - '-433.2'
+                    - '-291.8'
+                    - '406.5'
+                    - '-22.824'
+                -   - '34'
+                    - 1-Butanol
+                    - C4H10O
+                    - g
+                    - 71-36-3
+                    - '74.122'
+                    - '563.1'
+                    - '4.414'
+                    - '0.273'
+                    - '0.258'
+                    - '0.5883'
+                    - '-275.1'
+                    - '-150.7'
+                    - '361.8'
+                    - '-24.54'
+                -   - '35'
+                    - 2-Butanol
+                    - C4H10O
+                    - g
+                    - 78-92-2
+                    - '74.122'
+                    - '535.9'
+                    - '4.188'
+                    - '0.27'
+                    - '0.254'
+                    - '0.5692'
+                    - '-292.9'
+                    - '-167'
+                    - '356.6'
+                    - '-24.46'
+                -   - '36'
+                    - 1-Butene
+                    - C4H8
+                    - g
+                    - 106-98-9
+                    - '56.106'
+                    - '419.5'
+                    - '4.02'
+                    - '0.241'
+                    - '0.278'
+                    - '0.1845'
+                    - '-0.5'
+                    - '70.41'
+                    - '307.4'
+                    - '-25.408'
+                -   - '37'
+                    - cis-2-Butene
+                    - C4H8
+                    - g
+                    - 590-18-1
+                    - '56.106'
+                    - '435.5'
+                    - '4.21'
+                    - '0.234'
+                    - '0.272'
+                    - '0.2019'
+                    - '-7.4'
+                    - '65.36'
+                    - '301.2'
+                    - '-25.339'
+                -   - '38'
+                    - trans-2-Butene
+                    - C4H8
+                    - g
+                    - 624-64-6
+                    - '56.106'
+                    - '428.6'
+                    - '4.1'
+                    - '0.238'
+                    - '0.274'
+                    - '0.2176'
+                    - '-11'
+                    - '63.2'
+                    - '296.5'
+                    - '-25.3'
+                -   - '39'
+                    - Butyl acetate
+                    - C6H12O2
+                    - g
+                    - 123-86-4
+                    - '116.158'
+                    - '575.4'
+                    - '3.09'
+                    - '0.389'
+                    - '0.251'
+                    - '0.4394'
+                    - '-485.6'
+                    - '-312.6'
+                    - '442.5'
+                    - '-32.8'
+                -   - '40'
+                    - Butylbenzene
+                    - C10H14
+                    - g
+                    - 104-51-8
+                    - '134.218'
+                    - '660.5'
+                    - '2.89'
+                    - '0.497'
+                    - '0.262'
+                    - '0.3941'
+                    - '-13.14'
+                    - '145.4'
+                    - '439.49'
+                    - '-55.644'
+                -   - '41'
+                    - Butyl mercaptan
+                    - C4H10S
+                    - g
+                    - 109-79-5
+                    - '90.187'
+                    - '570.1'
+                    - '3.97'
+                    - '0.307'
+                    - '0.257'
+                    - '0.2714'
+                    - '-87.8'
+                    - '11.39'
+                    - '375.2'
+                    - '-29.554'
+                -   - '42'
+                    - sec-Butyl mercaptan
+                    - C4H10S
+                    - g
+                    - 513-53-1
+                    - '90.187'
+                    - '554'
+                    - '4.06'
+                    - '0.307'
+                    - '0.271'
+                    - '0.2506'
+                    - '-96.6'
+                    - '5.12'
+                    - '366.7'
+                    - '-29.49'
+                -   - '43'
+                    - 1-Butyne
+                    - C4H6
+                    - g
+                    - 107-00-6
+                    - '54.09'
+                    - '440'
+                    - '4.6'
+                    - '0.208'
+                    - '0.262'
+                    - '0.247'
+                    - '165.2'
+                    - '202.25'
+                    - '290.39'
+                    - '-24.647'
+                -   - '44'
+                    - Butyraldehyde
+                    - C4H8O
+                    - g
+                    - 123-72-8
+                    - '72.106'
+                    - '537.2'
+                    - '4.32'
+                    - '0.258'
+                    - '0.25'
+                    - '0.2774'
+                    - '-207'
+                    - '-116.3'
+                    - '343.65'
+                    - '-23.035'
+                -   - '45'
+                    - Butyric acid
+                    - C4H8O2
+                    - g
+                    - 107-92-6
+                    - '88.105'
+                    - '615.7'
+                    - '4.06'
+                    - '0.293'
+                    - '0.232'
+                    - '0.6805'
+                    - '-475.8'
+                    - '-360'
+                    - '360.1'
+                    - '-20.08'
+                -   - '46'
+                    - Butyronitrile
+                    - C4H7N
+                    - g
+                    - 109-74-0
+                    - '69.105'
+                    - '582.25'
+                    - '3.79'
+                    - '0.278'
+                    - '0.218'
+                    - '0.3714'
+                    - '34.0578'
+                    - '108.658'
+                    - '325.432'
+                    - '-24.148'
+                -   - '47'
+                    - Carbon dioxide
+                    - CO2
+                    - g
+                    - 124-38-9
+                    - '44.01'
+                    - '304.21'
+                    - '7.383'
+                    - '0.094'
+                    - '0.274'
+                    - '0.2236'
+                    - '-393.51'
+                    - '-394.37'
+                    - '213.677'
+                    - '0'
+                -   - '48'
+                    - Carbon disulfide
+                    - CS2
+                    - g
+                    - 75-15-0
+                    - '76.141'
+                    - '552'
+                    - '7.9'
+                    - '0.16'
+                    - '0.275'
+                    - '0.1107'
+                    - '116.9'
+                    - '66.8'
+                    - '237.9'
+                    - '-10.769'
+                -   - '49'
+                    - Carbon monoxide
+                    - CO
+                    - g
+                    - 630-08-0
+                    - '28.01'
+                    - '132.92'
+                    - '3.499'
+                    - '0.0944'
+                    - '0.299'
+                    - '0.0482'
+                    - '-110.53'
+                    - '-137.15'
+                    - '197.556'
+                    - '-2.83'
+                -   - '50'
+                    - Carbon tetrachloride
+                    - CCl4
+                    - g
+                    - 56-23-5
+                    - '153.823'
+                    - '556.35'
+                    - '4.56'
+                    - '0.276'
+                    - '0.272'
+                    - '0.1926'
+                    - '-95.81'
+                    - '-53.54'
+                    - '309.91'
+                    - '-2.653'
+                -   - '51'
+                    - Carbon tetrafluoride
+                    - CF4
+                    - g
+                    - 75-73-0
+                    - '88.004'
+                    - '227.51'
+                    - '3.745'
+                    - '0.143'
+                    - '0.283'
+                    - '0.179'
+                    - '-922.1'
+                    - '-877.6'
+                    - '262'
+                    - '5.286'
+                -   - '52'
+                    - Chlorine
+                    - Cl2
+                    - g
+                    - 7782-50-5
+                    - '70.906'
+                    - '417.15'
+                    - '7.71'
+                    - '0.124'
+                    - '0.276'
+                    - '0.0688'
+                    - '0'
+                    - '0'
+                    - '222.972'
+                    - '0'
+                -   - '53'
+                    - Chlorobenzene
+                    - C6H5Cl
+                    - g
+                    - 108-90-7
+                    - '112.557'
+                    - '632.35'
+                    - '4.519'
+                    - '0.308'
+                    - '0.265'
+                    - '0.2499'
+                    - '51.09'
+                    - '98.29'
+                    - '314.03'
+                    - '-29.76'
+                -   - '54'
+                    - Chloroethane
+                    - C2H5Cl
+                    - g
+                    - 75-00-3
+                    - '64.514'
+                    - '460.35'
+                    - '5.27'
+                    - '0.2'
+                    - '0.275'
+                    - '0.1902'
+                    - '-112.26'
+                    - '-60.499'
+                    - '275.78'
+                    - '-12.849'
+                -   - '55'
+                    - Chloroform
+                    - CHCl3
+                    - g
+                    - 67-66-3
+                    - '119.378'
+                    - '536.4'
+                    - '5.472'
+                    - '0.239'
+                    - '0.293'
+                    - '0.2219'
+                    - '-102.9'
+                    - '-70.1'
+                    - '295.6'
+                    - '-3.8'
+                -   - '56'
+                    - Chloromethane
+                    - CH3Cl
+                    - g
+                    - 74-87-3
+                    - '50.488'
+                    - '416.25'
+                    - '6.68'
+                    - '0.143'
+                    - '0.276'
+                    - '0.1531'
+                    - '-81.96'
+                    - '-58.44'
+                    - '234.18'
+                    - '-6.7538'
+                -   - '57'
+                    - 1-Chloropropane
+                    - C3H7Cl
+                    - g
+                    - 540-54-5
+                    - '78.541'
+                    - '503.15'
+                    - '4.58'
+                    - '0.247'
+                    - '0.27'
+                    - '0.2277'
+                    - '-133.18'
+                    - '-52.61'
+                    - '315.47'
+                    - '-18.67'
+                -   - '58'
+                    - 2-Chloropropane
+                    - C3H7Cl
+                    - g
+                    - 75-29-6
+                    - '78.541'
+                    - '489'
+                    - '4.54'
+                    - '0.247'
+                    - '0.276'
+                    - '0.1986'
+                    - '-144.77'
+                    - '-61.36'
+                    - '305.94'
+                    - '-18.63'
+                -   - '59'
+                    - m-Cresol
+                    - C7H8O
+                    - g
+                    - 108-39-4
+                    - '108.138'
+                    - '705.85'
+                    - '4.56'
+                    - '0.312'
+                    - '0.242'
+                    - '0.448'
+                    - '-132.3'
+                    - '-40.19'
+                    - '356.04'
+                    - '-35.2783'
+                -   - '60'
+                    - o-Cresol
+                    - C7H8O
+                    - g
+                    - 95-48-7
+                    - '108.138'
+                    - '697.55'
+                    - '5.01'
+                    - '0.282'
+                    - '0.244'
+                    - '0.4339'
+                    - '-128.57'
+                    - '-35.43'
+                    - '352.59'
+                    - '-35.28'
+                -   - '61'
+                    - p-Cresol
+                    - C7H8O
+                    - g
+                    - 106-44-5
+                    - '108.138'
+                    - '704.65'
+                    - '5.15'
+                    - '0.277'
+                    - '0.244'
+                    - '0.5072'
+                    - '-125.35'
+                    - '-31.66'
+                    - '350.75'
+                    - '-35.2256'
+                -   - '62'
+                    - Cumene
+                    - C9H12
+                    - g
+                    - 98-82-8
+                    - '120.192'
+                    - '631'
+                    - '3.209'
+                    - '0.434'
+                    - '0.265'
+                    - '0.3274'
+                    - '4'
+                    - '137.9'
+                    - '386'
+                    - '-49.51'
+                -   - '63'
+                    - Cyanogen
+                    - C2N2
+                    - g
+                    - 460-19-5
+                    - '52.035'
+                    - '400.15'
+                    - '5.98'
+                    - '0.195'
+                    - '0.351'
+                    - '0.279'
+                    - '309.072'
+                    - '297.598'
+                    - '241.463'
+                    - '-10.961'
+                -   - '64'
+                    - Cyclobutane
+                    - C4H8
+                    - g
+                    - 287-23-0
+                    - '56.106'
+                    - '459.93'
+                    - '4.98'
+                    - '0.21'
+                    - '0.273'
+                    - '0.1847'
+                    - '28.5'
+                    - '112.2'
+                    - '264.396'
+                    - '-25.678'
+                -   - '65'
+                    - Cyclohexane
+                    - C6H12
+                    - g
+                    - 110-82-7
+                    - '84.159'
+                    - '553.8'
+                    - '4.08'
+                    - '0.308'
+                    - '0.273'
+                    - '0.2081'
+                    - '-123.3'
+                    - '31.91'
+                    - '297.276'
+                    - '-36.56'
+                -   - '66'
+                    - Cyclohexanol
+                    - C6H12O
+                    - g
+                    - 108-93-0
+                    - '100.159'
+                    - '650.1'
+                    - '4.26'
+                    - '0.322'
+                    - '0.254'
+                    - '0.369'
+                    - '-286.2'
+                    - '-109.5'
+                    - '327.7'
+                    - '-34.639'
+                -   - '67'
+                    - Cyclohexanone
+                    - C6H10O
+                    - g
+                    - 108-94-1
+                    - '98.143'
+                    - '653'
+                    - '4'
+                    - '0.311'
+                    - '0.229'
+                    - '0.299'
+                    - '-226.1'
+                    - '-90.28'
+                    - '334.26'
+                    - '-32.99'
+                -   - '68'
+                    - Cyclohexene
+                    - C6H10
+                    - g
+                    - 110-83-8
+                    - '82.144'
+                    - '560.4'
+                    - '4.35'
+                    - '0.291'
+                    - '0.272'
+                    - '0.2123'
+                    - '-4.6'
+                    - '107.7'
+                    - '310.518'
+                    - '-35.32'
+                -   - '69'
+                    - Cyclopentane
+                    - C5H10
+                    - g
+                    - 287-92-3
+                    - '70.133'
+                    - '511.7'
+                    - '4.51'
+                    - '0.26'
+                    - '0.276'
+                    - '0.1949'
+                    - '-77.03'
+                    - '38.85'
+                    - '292.9'
+                    - '-30.709'
+                -   - '70'
+                    - Cyclopentene
+                    - C5H8
+                    - g
+                    - 142-29-0
+                    - '68.117'
+                    - '507'
+                    - '4.8'
+                    - '0.245'
+                    - '0.279'
+                    - '0.1961'
+                    - '32.3'
+                    - '110.5'
+                    - '291.267'
+                    - '-29.393'
+                -   - '71'
+                    - Cyclopropane
+                    - C3H6
+                    - g
+                    - 75-19-4
+                    - '42.08'
+                    - '398'
+                    - '5.54'
+                    - '0.162'
+                    - '0.271'
+                    - '0.1278'
+                    - '53.3'
+                    - '104.4'
+                    - '237.378'
+                    - '-19.593'
+                -   - '72'
+                    - Cyclohexyl mercaptan
+                    - C6H12S
+                    - g
+                    - 1569-69-3
+                    - '116.224'
+                    - '664'
+                    - '3.97'
+                    - '0.355'
+                    - '0.255'
+                    - '0.2641'
+                    - '-96.02'
+                    - '48.86'
+                    - '364.6'
+                    - '-39.68'
+                -   - '73'
+                    - Decanal
+                    - C10H20O
+                    - g
+                    - 112-31-2
+                    - '156.265'
+                    - '674.2'
+                    - '2.6'
+                    - '0.58'
+                    - '0.269'
+                    - '0.582'
+                    - '-331.7'
+                    - '-67.39'
+                    - '579.12'
+                    - '-59.59'
+                -   - '74'
+                    - Decane
+                    - C10H22
+                    - g
+                    - 124-18-5
+                    - '142.282'
+                    - '617.7'
+                    - '2.11'
+                    - '0.617'
+                    - '0.254'
+                    - '0.4923'
+                    - '-249.46'
+                    - '33.18'
+                    - '545.7'
+                    - '-62.9422'
+                -   - '75'
+                    - Decanoic acid
+                    - C10H20O2
+                    - g
+                    - 334-48-5
+                    - '172.265'
+                    - '722.1'
+                    - '2.28'
+                    - '0.639'
+                    - '0.243'
+                    - '0.8126'
+                    - '-594.3'
+                    - '-305'
+                    - '599'
+                    - '-57.2'
+                -   - '76'
+                    - 1-Decanol
+                    - C10H22O
+                    - g
+                    - 112-30-1
+                    - '158.281'
+                    - '688'
+                    - '2.308'
+                    - '0.645'
+                    - '0.26'
+                    - '0.607'
+                    - '-398.5'
+                    - '-100.2'
+                    - '597.1'
+                    - '-61.16'
+                -   - '77'
+                    - 1-Decene
+                    - C10H20
+                    - g
+                    - 872-05-9
+                    - '140.266'
+                    - '616.6'
+                    - '2.223'
+                    - '0.584'
+                    - '0.253'
+                    - '0.4805'
+                    - '-122.1'
+                    - '122.7'
+                    - '543.3'
+                    - '-61.809'
+                -   - '78'
+                    - Decyl mercaptan
+                    - C10H22S
+                    - g
+                    - 143-10-2
+                    - '174.347'
+                    - '696'
+                    - '2.13'
+                    - '0.624'
+                    - '0.23'
+                    - '0.5874'
+                    - '-210.9'
+                    - '61.65'
+                    - '611.6'
+                    - '-66.161'
+                -   - '79'
+                    - 1-Decyne
+                    - C10H18
+                    - g
+                    - 764-93-2
+                    - '138.25'
+                    - '619.85'
+                    - '2.37'
+                    - '0.552'
+                    - '0.254'
+                    - '0.5178'
+                    - '41'
+                    - '251.6'
+                    - '526.3'
+                    - '-61.037'
+                -   - '80'
+                    - Deuterium
+                    - D2
+                    - g
+                    - 7782-39-0
+                    - '4.032'
+                    - '38.35'
+                    - '1.6617'
+                    - '0.060263'
+                    - '0.314'
+                    - '-0.1449'
+                    - '0'
+                    - '0'
+                    - '144.86'
+                    - '-2.4625'
+                -   - '81'
+                    - 1,1-Dibromoethane
+                    - C2H4Br2
+                    - g
+                    - 557-91-5
+                    - '187.861'
+                    - '628'
+                    - '6.03'
+                    - '0.276'
+                    - '0.319'
+                    - '0.125'
+                    - '-40.8'
+                    - '-11.81'
+                    - '327.6'
+                    - '-11.6'
+                -   - '82'
+                    - 1,2-Dibromoethane
+                    - C2H4Br2
+                    - g
+                    - 106-93-4
+                    - '187.861'
+                    - '650.15'
+                    - '5.477'
+                    - '0.2616'
+                    - '0.265'
+                    - '0.2067'
+                    - '-38.9'
+                    - '-10.54'
+                    - '329.7'
+                    - '-11.769'
+                -   - '83'
+                    - Dibromomethane
+                    - CH2Br2
+                    - g
+                    - 74-95-3
+                    - '173.835'
+                    - '611'
+                    - '7.17'
+                    - '0.223'
+                    - '0.315'
+                    - '0.2095'
+                    - '0'
+                    - '0'
+                    - '292.964'
+                    - '0'
+                -   - '84'
+                    - Dibutyl ether
+                    - C8H18O
+                    - g
+                    - 142-96-1
+                    - '130.228'
+                    - '584.1'
+                    - '2.46'
+                    - '0.487'
+                    - '0.247'
+                    - '0.4476'
+                    - '-333.4'
+                    - '-88.27'
+                    - '501.4'
+                    - '-49.4691'
+                -   - '85'
+                    - m-Dichlorobenzene
+                    - C6H4Cl2
+                    - g
+                    - 541-73-1
+                    - '147.002'
+                    - '683.95'
+                    - '4.07'
+                    - '0.351'
+                    - '0.251'
+                    - '0.279'
+                    - '25.7'
+                    - '77.9'
+                    - '343.53'
+                    - '-28.25'
+                -   - '86'
+                    - o-Dichlorobenzene
+                    - C6H4Cl2
+                    - g
+                    - 95-50-1
+                    - '147.002'
+                    - '705'
+                    - '4.07'
+                    - '0.351'
+                    - '0.244'
+                    - '0.2192'
+                    - '30.2'
+                    - '82.9'
+                    - '341.85'
+                    - '-28.26'
+                -   - '87'
+                    - p-Dichlorobenzene
+                    - C6H4Cl2
+                    - g
+                    - 106-46-7
+                    - '147.002'
+                    - '684.75'
+                    - '4.07'
+                    - '0.351'
+                    - '0.251'
+                    - '0.2846'
+                    - '22.5'
+                    - '76.7'
+                    - '336.74'
+                    - '-28.02'
+                -   - '88'
+                    - 1,1-Dichloroethane
+                    - C2H4Cl2
+                    - g
+                    - 75-34-3
+                    - '98.959'
+                    - '523'
+                    - '5.07'
+                    - '0.24'
+                    - '0.28'
+                    - '0.2339'
+                    - '-129.41'
+                    - '-72.59'
+                    - '305.01'
+                    - '-11.104'
+                -   - '89'
+                    - 1,2-Dichloroethane
+                    - C2H4Cl2
+                    - g
+                    - 107-06-2
+                    - '98.959'
+                    - '561.6'
+                    - '5.37'
+                    - '0.22'
+                    - '0.253'
+                    - '0.2866'
+                    - '-129.79'
+                    - '-73.945'
+                    - '308.28'
+                    - '-11.05'
+                -   - '90'
+                    - Dichloromethane
+                    - CH2Cl2
+                    - g
+                    - '1975-09-02'
+                    - '84.933'
+                    - '510'
+                    - '6.08'
+                    - '0.185'
+                    - '0.265'
+                    - '0.1986'
+                    - '-95.52'
+                    - '-68.96'
+                    - '270.18'
+                    - '-5.1388'
+                -   - '91'
+                    - 1,1-Dichloropropane
+                    - C3H6Cl2
+                    - g
+                    - 78-99-9
+                    - '112.986'
+                    - '560'
+                    - '4.24'
+                    - '0.291'
+                    - '0.265'
+                    - '0.2529'
+                    - '-150.8'
+                    - '-65.2'
+                    - '344.8'
+                    - '-17.2'
+                -   - '92'
+                    - 1,2-Dichloropropane
+                    - C3H6Cl2
+                    - g
+                    - 78-87-5
+                    - '112.986'
+                    - '572'
+                    - '4.24'
+                    - '0.291'
+                    - '0.259'
+                    - '0.2564'
+                    - '-162.8'
+                    - '-80.18'
+                    - '354.8'
+                    - '-17.07'
+                -   - '93'
+                    - Diethanol amine
+                    - C4H11NO2
+                    - g
+                    - 111-42-2
+                    - '105.136'
+                    - '736.6'
+                    - '4.27'
+                    - '0.349'
+                    - '0.243'
+                    - '0.9529'
+                    - '-408.47'
+                    - '-225.74'
+                    - '429'
+                    - '-24.105'
+                -   - '94'
+                    - Diethyl amine
+                    - C4H11N
+                    - g
+                    - 109-89-7
+                    - '73.137'
+                    - '496.6'
+                    - '3.71'
+                    - '0.301'
+                    - '0.27'
+                    - '0.3039'
+                    - '-71.42'
+                    - '73.08'
+                    - '352.2'
+                    - '-28.003'
+                -   - '95'
+                    - Diethyl ether
+                    - C4H10O
+                    - g
+                    - 60-29-7
+                    - '74.122'
+                    - '466.7'
+                    - '3.64'
+                    - '0.28'
+                    - '0.263'
+                    - '0.2811'
+                    - '-252.1'
+                    - '-122.1'
+                    - '342.3'
+                    - '-25.035'
+                -   - '96'
+                    - Diethyl sulfide
+                    - C4H10S
+                    - g
+                    - 352-93-2
+                    - '90.187'
+                    - '557.15'
+                    - '3.96'
+                    - '0.318'
+                    - '0.272'
+                    - '0.29'
+                    - '-83.56'
+                    - '17.74'
+                    - '368.1'
+                    - '-29.607'
+                -   - '97'
+                    - 1,1-Difluoroethane
+                    - C2H4F2
+                    - g
+                    - 75-37-6
+                    - '66.05'
+                    - '386.44'
+                    - '4.52'
+                    - '0.179'
+                    - '0.252'
+                    - '0.2751'
+                    - '-497'
+                    - '-439.485'
+                    - '282.4'
+                    - '-7.73662'
+                -   - '98'
+                    - 1,2-Difluoroethane
+                    - C2H4F2
+                    - g
+                    - 624-72-6
+                    - '66.05'
+                    - '445'
+                    - '4.34'
+                    - '0.195'
+                    - '0.229'
+                    - '0.2224'
+                    - '-447.7'
+                    - '-391.9'
+                    - '288.194'
+                    - '-8.23'
+                -   - '99'
+                    - Difluoromethane
+                    - CH2F2
+                    - g
+                    - '1975-10-05'
+                    - '52.023'
+                    - '351.255'
+                    - '5.784'
+                    - '0.123'
+                    - '0.244'
+                    - '0.2771'
+                    - '-452.3'
+                    - '-424.747'
+                    - '246.58'
+                    - '-1.83031'
+                -   - '100'
+                    - Di-isopropyl amine
+                    - C6H15N
+                    - g
+                    - 108-18-9
+                    - '101.19'
+                    - '523.1'
+                    - '3.2'
+                    - '0.418'
+                    - '0.308'
+                    - '0.3883'
+                    - '-143.8'
+                    - '64.2'
+                    - '412'
+                    - '-39.9'
+                -   - '101'
+                    - Di-isopropyl ether
+                    - C6H14O
+                    - g
+                    - 108-20-3
+                    - '102.175'
+                    - '500.05'
+                    - '2.88'
+                    - '0.386'
+                    - '0.267'
+                    - '0.3387'
+                    - '-319.2'
+                    - '-124.8'
+                    - '398.9'
+                    - '-37.0261'
+                -   - '102'
+                    - Di-isopropyl ketone
+                    - C7H14O
+                    - g
+                    - 565-80-0
+                    - '114.185'
+                    - '576'
+                    - '3.02'
+                    - '0.416'
+                    - '0.262'
+                    - '0.4044'
+                    - '-311.4'
+                    - '-123.7'
+                    - '427'
+                    - '-40.95'
+                -   - '103'
+                    - 1,1-Dimethoxyethane
+                    - C4H10O2
+                    - g
+                    - 534-15-6
+                    - '90.121'
+                    - '507.8'
+                    - '3.773'
+                    - '0.297'
+                    - '0.265'
+                    - '0.3277'
+                    - '-389.7'
+                    - '-238'
+                    - '372.6'
+                    - '-23.94'
+                -   - '104'
+                    - 1,2-Dimethoxypropane
+                    - C5H12O2
+                    - g
+                    - 7778-85-0
+                    - '104.148'
+                    - '543'
+                    - '3.446'
+                    - '0.35'
+                    - '0.267'
+                    - '0.3522'
+                    - '-384.2'
+                    - '-201.1'
+                    - '403.8'
+                    - '-29.96'
+                -   - '105'
+                    - Dimethyl acetylene
+                    - C4H6
+                    - g
+                    - 503-17-3
+                    - '54.09'
+                    - '473.2'
+                    - '4.87'
+                    - '0.221'
+                    - '0.274'
+                    - '0.2385'
+                    - '145.7'
+                    - '184.9'
+                    - '283.3'
+                    - '-24.189'
+                -   - '106'
+                    - Dimethyl amine
+                    - C2H7N
+                    - g
+                    - 124-40-3
+                    - '45.084'
+                    - '437.2'
+                    - '5.34'
+                    - '0.18'
+                    - '0.264'
+                    - '0.2999'
+                    - '-18.45'
+                    - '68.39'
+                    - '272.96'
+                    - '-16.146'
+                -   - '107'
+                    - 2,3-Dimethylbutane
+                    - C6H14
+                    - g
+                    - 79-29-8
+                    - '86.175'
+                    - '500'
+                    - '3.15'
+                    - '0.361'
+                    - '0.274'
+                    - '0.2493'
+                    - '-176.8'
+                    - '-3.125'
+                    - '365.92'
+                    - '-38.4761'
+                -   - '108'
+                    - 1,1-Dimethylcyclohexane
+                    - C8H16
+                    - g
+                    - 590-66-9
+                    - '112.213'
+                    - '591.15'
+                    - '2.938'
+                    - '0.45'
+                    - '0.269'
+                    - '0.2326'
+                    - '-181'
+                    - '35.2293'
+                    - '365.012'
+                    - '-48.639'
+                -   - '109'
+                    - cis-1,2-Dimethylcyclohexane
+                    - C8H16
+                    - g
+                    - '2207-01-04'
+                    - '112.213'
+                    - '606.15'
+                    - '2.938'
+                    - '0.46'
+                    - '0.268'
+                    - '0.2324'
+                    - '-172.172'
+                    - '41.2124'
+                    - '374.51'
+                    - '-48.7084'
+                -   - '110'
+                    - trans-1,2-Dimethylcyclohexane
+                    - C8H16
+                    - g
+                    - 6876-23-9
+                    - '112.213'
+                    - '596.15'
+                    - '2.938'
+                    - '0.46'
+                    - '0.273'
+                    - '0.2379'
+                    - '-179.996'
+                    - '34.4761'
+                    - '370.912'
+                    - '-48.6436'
+                -   - '111'
+                    - Dimethyl disulfide
+                    - C2H6S2
+                    - g
+                    - 624-92-0
+                    - '94.199'
+                    - '615'
+                    - '5.36'
+                    - '0.252'
+                    - '0.264'
+                    - '0.2059'
+                    - '-24.2'
+                    - '15.16'
+                    - '335.291'
+                    - '-20.441'
+                -   - '112'
+                    - Dimethyl ether
+                    - C2H6O
+                    - g
+                    - 115-10-6
+                    - '46.068'
+                    - '400.1'
+                    - '5.37'
+                    - '0.17'
+                    - '0.2744'
+                    - '0.2002'
+                    - '-184.1'
+                    - '-112.8'
+                    - '266.7'
+                    - '-13.284'
+                -   - '113'
+                    - N,N-Dimethyl formamide
+                    - C3H7NO
+                    - g
+                    - '1968-12-02'
+                    - '73.094'
+                    - '649.6'
+                    - '4.42'
+                    - '0.26199'
+                    - '0.214'
+                    - '0.3177'
+                    - '-191.7'
+                    - '-88.4'
+                    - '326'
+                    - '-17.8871'
+                -   - '114'
+                    - 2,3-Dimethylpentane
+                    - C7H16
+                    - g
+                    - 565-59-3
+                    - '100.202'
+                    - '537.3'
+                    - '2.91'
+                    - '0.393'
+                    - '0.256'
+                    - '0.2964'
+                    - '-194.1'
+                    - '5.717'
+                    - '414.55'
+                    - '-44.6075'
+                -   - '115'
+                    - Dimethyl phthalate
+                    - C10H10O4
+                    - g
+                    - 131-11-3
+                    - '194.184'
+                    - '766'
+                    - '2.78'
+                    - '0.53'
+                    - '0.231'
+                    - '0.6568'
+                    - '-605'
+                    - '-467.749'
+                    - '660'
+                    - '-44.662'
+                -   - '116'
+                    - Dimethylsilane
+                    - C2H8Si
+                    - g
+                    - 1111-74-6
+                    - '60.17'
+                    - '402'
+                    - '3.56'
+                    - '0.258'
+                    - '0.275'
+                    - '0.13'
+                    - '-94.7'
+                    - '-19.25'
+                    - '299.53'
+                    - '-25.69'
+                -   - '117'
+                    - Dimethyl sulfide
+                    - C2H6S
+                    - g
+                    - 75-18-3
+                    - '62.134'
+                    - '503.04'
+                    - '5.53'
+                    - '0.201'
+                    - '0.266'
+                    - '0.1943'
+                    - '-37.24'
+                    - '7.302'
+                    - '285.85'
+                    - '-17.443'
+                -   - '118'
+                    - Dimethyl sulfoxide
+                    - C2H6OS
+                    - g
+                    - 67-68-5
+                    - '78.133'
+                    - '729'
+                    - '5.65'
+                    - '0.227'
+                    - '0.212'
+                    - '0.2806'
+                    - '-150.46'
+                    - '-81.441'
+                    - '306.27'
+                    - '-16.054'
+                -   - '119'
+                    - Dimethyl terephthalate
+                    - C10H10O4
+                    - g
+                    - 120-61-6
+                    - '194.184'
+                    - '772'
+                    - '2.78'
+                    - '0.529'
+                    - '0.229'
+                    - '0.6371'
+                    - '-644'
+                    - '-474'
+                    - '550'
+                    - '-44.115'
+                -   - '120'
+                    - 1,4-Dioxane
+                    - C4H8O2
+                    - g
+                    - 123-91-1
+                    - '88.105'
+                    - '587'
+                    - '5.208'
+                    - '0.238'
+                    - '0.254'
+                    - '0.2793'
+                    - '-315.8'
+                    - '-181.6'
+                    - '300.12'
+                    - '-21.863'
+                -   - '121'
+                    - Diphenyl ether
+                    - C12H10O
+                    - g
+                    - 101-84-8
+                    - '170.207'
+                    - '766.8'
+                    - '3.08'
+                    - '0.503'
+                    - '0.243'
+                    - '0.4389'
+                    - '52'
+                    - '175'
+                    - '413'
+                    - '-58.939'
+                -   - '122'
+                    - Dipropyl amine
+                    - C6H15N
+                    - g
+                    - 142-84-7
+                    - '101.19'
+                    - '550'
+                    - '3.14'
+                    - '0.402'
+                    - '0.276'
+                    - '0.4497'
+                    - '-116'
+                    - '86.8'
+                    - '429'
+                    - '-40.189'
+                -   - '123'
+                    - Dodecane
+                    - C12H26
+                    - g
+                    - 112-40-3
+                    - '170.335'
+                    - '658'
+                    - '1.82'
+                    - '0.755'
+                    - '0.251'
+                    - '0.5764'
+                    - '-290.72'
+                    - '49.81'
+                    - '624.15'
+                    - '-75.1368'
+                -   - '124'
+                    - Eicosane
+                    - C20H42
+                    - g
+                    - 112-95-8
+                    - '282.547'
+                    - '768'
+                    - '1.16'
+                    - '1.34'
+                    - '0.243'
+                    - '0.9069'
+                    - '-456.46'
+                    - '115.7'
+                    - '937.87'
+                    - '-123.908'
+                -   - '125'
+                    - Ethane
+                    - C2H6
+                    - g
+                    - 74-84-0
+                    - '30.069'
+                    - '305.32'
+                    - '4.872'
+                    - '0.1455'
+                    - '0.279'
+                    - '0.0995'
+                    - '-83.82'
+                    - '-31.92'
+                    - '229.12'
+                    - '-14.2864'
+                -   - '126'
+                    - Ethanol
+                    - C2H6O
+                    - g
+                    - 64-17-5
+                    - '46.068'
+                    - '514'
+                    - '6.137'
+                    - '0.168'
+                    - '0.241'
+                    - '0.6436'
+                    - '-234.95'
+                    - '-167.85'
+                    - '280.64'
+                    - '-12.35'
+                -   - '127'
+                    - Ethyl acetate
+                    - C4H8O2
+                    - g
+                    - 141-78-6
+                    - '88.105'
+                    - '523.3'
+                    - '3.88'
+                    - '0.286'
+                    - '0.255'
+                    - '0.3664'
+                    - '-444.5'
+                    - '-328'
+                    - '359.7'
+                    - '-20.61'
+                -   - '128'
+                    - Ethyl amine
+                    - C2H7N
+                    - g
+                    - '1975-04-07'
+                    - '45.084'
+                    - '456.15'
+                    - '5.62'
+                    - '0.207'
+                    - '0.307'
+                    - '0.2848'
+                    - '-47.15'
+                    - '36.16'
+                    - '284.8'
+                    - '-15.874'
+                -   - '129'
+                    - Ethylbenzene
+                    - C8H10
+                    - g
+                    - 100-41-4
+                    - '106.165'
+                    - '617.15'
+                    - '3.609'
+                    - '0.374'
+                    - '0.263'
+                    - '0.3035'
+                    - '29.92'
+                    - '130.73'
+                    - '360.63'
+                    - '-43.448'
+                -   - '130'
+                    - Ethyl benzoate
+                    - C9H10O2
+                    - g
+                    - 93-89-0
+                    - '150.175'
+                    - '698'
+                    - '3.18'
+                    - '0.489'
+                    - '0.268'
+                    - '0.4771'
+                    - '-326'
+                    - '-190.5'
+                    - '455'
+                    - '-44.1'
+                -   - '131'
+                    - 2-Ethyl butanoic acid
+                    - C6H12O2
+                    - g
+                    - '1988-09-05'
+                    - '116.158'
+                    - '655'
+                    - '3.41'
+                    - '0.389'
+                    - '0.244'
+                    - '0.6326'
+                    - '-537.8'
+                    - '-359'
+                    - '423'
+                    - '-32.1203'
+                -   - '132'
+                    - Ethyl butyrate
+                    - C6H12O2
+                    - g
+                    - 105-54-4
+                    - '116.158'
+                    - '571'
+                    - '2.95'
+                    - '0.403'
+                    - '0.25'
+                    - '0.4011'
+                    - '-485.5'
+                    - '-312.2'
+                    - '441.7'
+                    - '-32.84'
+                -   - '133'
+                    - Ethylcyclohexane
+                    - C8H16
+                    - g
+                    - 1678-91-7
+                    - '112.213'
+                    - '609.15'
+                    - '3.04'
+                    - '0.43'
+                    - '0.258'
+                    - '0.2455'
+                    - '-171.5'
+                    - '39.55'
+                    - '382.6'
+                    - '-48.7051'
+                -   - '134'
+                    - Ethylcyclopentane
+                    - C7H14
+                    - g
+                    - 1640-89-7
+                    - '98.186'
+                    - '569.5'
+                    - '3.4'
+                    - '0.375'
+                    - '0.269'
+                    - '0.2701'
+                    - '-126.9'
+                    - '44.8'
+                    - '378.3'
+                    - '-42.839'
+                -   - '135'
+                    - Ethylene
+                    - C2H4
+                    - g
+                    - 74-85-1
+                    - '28.053'
+                    - '282.34'
+                    - '5.041'
+                    - '0.131'
+                    - '0.281'
+                    - '0.0862'
+                    - '52.51'
+                    - '68.44'
+                    - '219.2'
+                    - '-13.23'
+                -   - '136'
+                    - Ethylenediamine
+                    - C2H8N2
+                    - g
+                    - 107-15-3
+                    - '60.098'
+                    - '593'
+                    - '6.29'
+                    - '0.264'
+                    - '0.337'
+                    - '0.4724'
+                    - '-17.3'
+                    - '103'
+                    - '321.833'
+                    - '-16.91'
+                -   - '137'
+                    - Ethylene glycol
+                    - C2H6O2
+                    - g
+                    - 107-21-1
+                    - '62.068'
+                    - '720'
+                    - '8.2'
+                    - '0.191'
+                    - '0.262'
+                    - '0.5068'
+                    - '-392.2'
+                    - '-301.8'
+                    - '304.891'
+                    - '-10.527'
+                -   - '138'
+                    - Ethyleneimine
+                    - C2H5N
+                    - g
+                    - 151-56-4
+                    - '43.068'
+                    - '537'
+                    - '6.85'
+                    - '0.173'
+                    - '0.265'
+                    - '0.2007'
+                    - '123.428'
+                    - '177.987'
+                    - '250.62'
+                    - '-14.81'
+                -   - '139'
+                    - Ethylene oxide
+                    - C2H4O
+                    - g
+                    - 75-21-8
+                    - '44.053'
+                    - '469.15'
+                    - '7.19'
+                    - '0.140296'
+                    - '0.25876'
+                    - '0.1974'
+                    - '-52.63'
+                    - '-13.23'
+                    - '242.99'
+                    - '-12.18'
+                -   - '140'
+                    - Ethyl formate
+                    - C3H6O2
+                    - g
+                    - 109-94-4
+                    - '74.079'
+                    - '508.4'
+                    - '4.74'
+                    - '0.229'
+                    - '0.257'
+                    - '0.2847'
+                    - '-388.3'
+                    - '-303.1'
+                    - '328.2'
+                    - '-15.0696'
+                -   - '141'
+                    - 2-Ethyl hexanoic acid
+                    - C8H16O2
+                    - g
+                    - 149-57-5
+                    - '144.211'
+                    - '674.6'
+                    - '2.778'
+                    - '0.528'
+                    - '0.262'
+                    - '0.8067'
+                    - '-559.5'
+                    - '-325'
+                    - '510'
+                    - '-44.48'
+                -   - '142'
+                    - Ethylhexyl ether
+                    - C8H18O
+                    - g
+                    - 5756-43-4
+                    - '130.228'
+                    - '583'
+                    - '2.46'
+                    - '0.487'
+                    - '0.247'
+                    - '0.4944'
+                    - '-333.7'
+                    - '-90.42'
+                    - '507.6'
+                    - '-49.43'
+                -   - '143'
+                    - Ethylisopropyl ether
+                    - C5H12O
+                    - g
+                    - 625-54-7
+                    - '88.148'
+                    - '489'
+                    - '3.41'
+                    - '0.329'
+                    - '0.276'
+                    - '0.3056'
+                    - '-285.8'
+                    - '-126.4'
+                    - '380'
+                    - '-31.03'
+                -   - '144'
+                    - Ethylisopropyl ketone
+                    - C6H12O
+                    - g
+                    - 565-69-5
+                    - '100.159'
+                    - '567'
+                    - '3.32'
+                    - '0.369'
+                    - '0.26'
+                    - '0.3891'
+                    - '-286.1'
+                    - '-133'
+                    - '406.9'
+                    - '-34.863'
+                -   - '145'
+                    - Ethyl mercaptan
+                    - C2H6S
+                    - g
+                    - '1975-08-01'
+                    - '62.134'
+                    - '499.15'
+                    - '5.49'
+                    - '0.207'
+                    - '0.274'
+                    - '0.1878'
+                    - '-46.3'
+                    - '-4.814'
+                    - '296.1'
+                    - '-17.366'
+                -   - '146'
+                    - Ethyl propionate
+                    - C5H10O2
+                    - g
+                    - 105-37-3
+                    - '102.132'
+                    - '546'
+                    - '3.362'
+                    - '0.345'
+                    - '0.256'
+                    - '0.3944'
+                    - '-463.6'
+                    - '-319.3'
+                    - '402.5'
+                    - '-26.74'
+                -   - '147'
+                    - Ethylpropyl ether
+                    - C5H12O
+                    - g
+                    - 628-32-0
+                    - '88.148'
+                    - '500.23'
+                    - '3.37'
+                    - '0.339'
+                    - '0.275'
+                    - '0.3473'
+                    - '-272.2'
+                    - '-115.2'
+                    - '388.1'
+                    - '-31.2'
+                -   - '148'
+                    - Ethyltrichlorosilane
+                    - C2H5Cl3Si
+                    - g
+                    - 115-21-9
+                    - '163.506'
+                    - '559.95'
+                    - '3.33'
+                    - '0.414'
+                    - '0.296'
+                    - '0.2691'
+                    - '-595.4'
+                    - '-510.1'
+                    - '407'
+                    - '-16.71'
+                -   - '149'
+                    - Fluorine
+                    - F2
+                    - g
+                    - 7782-41-4
+                    - '37.997'
+                    - '144.12'
+                    - '5.172'
+                    - '0.066547'
+                    - '0.287'
+                    - '0.053'
+                    - '0'
+                    - '0'
+                    - '202.682'
+                    - '0'
+                -   - '150'
+                    - Fluorobenzene
+                    - C6H5F
+                    - g
+                    - 462-06-6
+                    - '96.102'
+                    - '560.09'
+                    - '4.551'
+                    - '0.269'
+                    - '0.263'
+                    - '0.2472'
+                    - '-116.566'
+                    - '-69.036'
+                    - '302.629'
+                    - '-28.1451'
+                -   - '151'
+                    - Fluoroethane
+                    - C2H5F
+                    - g
+                    - 353-36-6
+                    - '48.06'
+                    - '375.31'
+                    - '5.028'
+                    - '0.164'
+                    - '0.264'
+                    - '0.22'
+                    - '-264.4'
+                    - '-212.3'
+                    - '264.4'
+                    - '-11.27'
+                -   - '152'
+                    - Fluoromethane
+                    - CH3F
+                    - g
+                    - 593-53-3
+                    - '34.033'
+                    - '317.42'
+                    - '5.875'
+                    - '0.113'
+                    - '0.252'
+                    - '0.198'
+                    - '-234.3'
+                    - '-210.4'
+                    - '222.734'
+                    - '-5.219'
+                -   - '153'
+                    - Formaldehyde
+                    - CH2O
+                    - g
+                    - 50-00-0
+                    - '30.026'
+                    - '408'
+                    - '6.59'
+                    - '0.115'
+                    - '0.223'
+                    - '0.2818'
+                    - '-108.6'
+                    - '-102.6'
+                    - '218.66'
+                    - '-5.268'
+                -   - '154'
+                    - Formamide
+                    - CH3NO
+                    - g
+                    - '1975-12-07'
+                    - '45.041'
+                    - '771'
+                    - '7.8'
+                    - '0.163'
+                    - '0.198'
+                    - '0.4124'
+                    - '-192.2'
+                    - '-147.1'
+                    - '248.57'
+                    - '-5.021'
+                -   - '155'
+                    - Formic acid
+                    - CH2O2
+                    - g
+                    - 64-18-6
+                    - '46.026'
+                    - '588'
+                    - '5.81'
+                    - '0.125'
+                    - '0.149'
+                    - '0.3173'
+                    - '-405.5'
+                    - '-377.8'
+                    - '248.7'
+                    - '-2.115'
+                -   - '156'
+                    - Furan
+                    - C4H4O
+                    - g
+                    - 110-00-9
+                    - '68.074'
+                    - '490.15'
+                    - '5.5'
+                    - '0.218'
+                    - '0.294'
+                    - '0.2015'
+                    - '-34.8'
+                    - '0.8225'
+                    - '267.14'
+                    - '-19.959'
+                -   - '157'
+                    - Helium-4
+                    - He
+                    - g
+                    - 7440-59-7
+                    - '4.003'
+                    - '5.2'
+                    - '0.2275'
+                    - '0.0573'
+                    - '0.302'
+                    - '-0.39'
+                    - '0'
+                    - '0'
+                    - '126.044'
+                    - '0'
+                -   - '158'
+                    - Heptadecane
+                    - C17H36
+                    - g
+                    - 629-78-7
+                    - '240.468'
+                    - '736'
+                    - '1.34'
+                    - '1.11'
+                    - '0.244'
+                    - '0.7697'
+                    - '-394.45'
+                    - '90.83'
+                    - '820.23'
+                    - '-105.618'
+                -   - '159'
+                    - Heptanal
+                    - C7H14O
+                    - g
+                    - 111-71-7
+                    - '114.185'
+                    - '616.8'
+                    - '3.16'
+                    - '0.434'
+                    - '0.267'
+                    - '0.4279'
+                    - '-269.4'
+                    - '-91.91'
+                    - '461.38'
+                    - '-41.36'
+                -   - '160'
+                    - Heptane
+                    - C7H16
+                    - g
+                    - 142-82-5
+                    - '100.202'
+                    - '540.2'
+                    - '2.74'
+                    - '0.428'
+                    - '0.261'
+                    - '0.3495'
+                    - '-187.65'
+                    - '8.165'
+                    - '427.98'
+                    - '-44.6473'
+                -   - '161'
+                    - Heptanoic acid
+                    - C7H14O2
+                    - g
+                    - 111-14-8
+                    - '130.185'
+                    - '677.3'
+                    - '3.043'
+                    - '0.466'
+                    - '0.252'
+                    - '0.7564'
+                    - '-536.2'
+                    - '-334'
+                    - '480'
+                    - '-38.39'
+                -   - '162'
+                    - 1-Heptanol
+                    - C7H16O
+                    - g
+                    - 111-70-6
+                    - '116.201'
+                    - '632.3'
+                    - '3.085'
+                    - '0.444'
+                    - '0.261'
+                    - '0.5621'
+                    - '-336.8'
+                    - '-125.5'
+                    - '479.5'
+                    - '-42.85'
+                -   - '163'
+                    - 2-Heptanol
+                    - C7H16O
+                    - g
+                    - 543-49-7
+                    - '116.201'
+                    - '608.3'
+                    - '3.001'
+                    - '0.447'
+                    - '0.265'
+                    - '0.5628'
+                    - '-355.4'
+                    - '-142.5'
+                    - '474'
+                    - '-42.82'
+                -   - '164'
+                    - 3-Heptanone
+                    - C7H14O
+                    - g
+                    - 106-35-4
+                    - '114.185'
+                    - '606.6'
+                    - '2.92'
+                    - '0.433'
+                    - '0.251'
+                    - '0.4076'
+                    - '-301'
+                    - '-122.5'
+                    - '458'
+                    - '-40.98'
+                -   - '165'
+                    - 2-Heptanone
+                    - C7H14O
+                    - g
+                    - 110-43-0
+                    - '114.185'
+                    - '611.4'
+                    - '2.94'
+                    - '0.434'
+                    - '0.251'
+                    - '0.419'
+                    - '-300.453'
+                    - '-119.6'
+                    - '448.6'
+                    - '-40.9952'
+                -   - '166'
+                    - 1-Heptene
+                    - C7H14
+                    - g
+                    - 592-76-7
+                    - '98.186'
+                    - '537.4'
+                    - '2.92'
+                    - '0.402'
+                    - '0.263'
+                    - '0.3432'
+                    - '-62.89'
+                    - '94.82'
+                    - '425.2'
+                    - '-43.499'
+                -   - '167'
+                    - Heptyl mercaptan
+                    - C7H16S
+                    - g
+                    - 1639-09-4
+                    - '132.267'
+                    - '645'
+                    - '2.77'
+                    - '0.465'
+                    - '0.24'
+                    - '0.4226'
+                    - '-149.5'
+                    - '36.22'
+                    - '493.9'
+                    - '-47.865'
+                -   - '168'
+                    - 1-Heptyne
+                    - C7H12
+                    - g
+                    - 628-71-7
+                    - '96.17'
+                    - '547'
+                    - '3.21'
+                    - '0.387'
+                    - '0.273'
+                    - '0.3778'
+                    - '103'
+                    - '227'
+                    - '408.5'
+                    - '-42.717'
+                -   - '169'
+                    - Hexadecane
+                    - C16H34
+                    - g
+                    - 544-76-3
+                    - '226.441'
+                    - '723'
+                    - '1.4'
+                    - '1.04'
+                    - '0.243'
+                    - '0.7174'
+                    - '-374.17'
+                    - '82.16'
+                    - '781.02'
+                    - '-99.5145'
+                -   - '170'
+                    - Hexanal
+                    - C6H12O
+                    - g
+                    - 66-25-1
+                    - '100.159'
+                    - '591'
+                    - '3.46'
+                    - '0.369'
+                    - '0.26'
+                    - '0.3872'
+                    - '-248.6'
+                    - '-100.05'
+                    - '422.14'
+                    - '-35.2'
+                -   - '171'
+                    - Hexane
+                    - C6H14
+                    - g
+                    - 110-54-3
+                    - '86.175'
+                    - '507.6'
+                    - '3.025'
+                    - '0.371'
+                    - '0.266'
+                    - '0.3013'
+                    - '-166.94'
+                    - '-0.06634'
+                    - '388.74'
+                    - '-38.551'
+                -   - '172'
+                    - Hexanoic acid
+                    - C6H12O2
+                    - g
+                    - 142-62-1
+                    - '116.158'
+                    - '660.2'
+                    - '3.308'
+                    - '0.408'
+                    - '0.246'
+                    - '0.7299'
+                    - '-511.9'
+                    - '-338'
+                    - '441'
+                    - '-32.3'
+                -   - '173'
+                    - 1-Hexanol
+                    - C6H14O
+                    - g
+                    - 111-27-3
+                    - '102.175'
+                    - '611.3'
+                    - '3.446'
+                    - '0.382'
+                    - '0.259'
+                    - '0.5586'
+                    - '-316.2'
+                    - '-133.9'
+                    - '440.2'
+                    - '-36.75'
+                -   - '174'
+                    - 2-Hexanol
+                    - C6H14O
+                    - g
+                    - 626-93-7
+                    - '102.175'
+                    - '585.3'
+                    - '3.311'
+                    - '0.385'
+                    - '0.262'
+                    - '0.5574'
+                    - '-334.6'
+                    - '-150.6'
+                    - '434.9'
+                    - '-36.7'
+                -   - '175'
+                    - 2-Hexanone
+                    - C6H12O
+                    - g
+                    - 591-78-6
+                    - '100.159'
+                    - '587.61'
+                    - '3.287'
+                    - '0.378'
+                    - '0.254'
+                    - '0.3846'
+                    - '-279.826'
+                    - '-130.081'
+                    - '417.856'
+                    - '-34.9'
+                -   - '176'
+                    - 3-Hexanone
+                    - C6H12O
+                    - g
+                    - 589-38-8
+                    - '100.159'
+                    - '582.82'
+                    - '3.32'
+                    - '0.378'
+                    - '0.259'
+                    - '0.3801'
+                    - '-277.6'
+                    - '-126'
+                    - '409.2'
+                    - '-34.92'
+                -   - '177'
+                    - 1-Hexene
+                    - C6H12
+                    - g
+                    - 592-41-6
+                    - '84.159'
+                    - '504'
+                    - '3.21'
+                    - '0.348'
+                    - '0.267'
+                    - '0.2888'
+                    - '-41.67'
+                    - '87'
+                    - '386.3'
+                    - '-37.397'
+                -   - '178'
+                    - 3-Hexyne
+                    - C6H10
+                    - g
+                    - 928-49-4
+                    - '82.144'
+                    - '544'
+                    - '3.53'
+                    - '0.331'
+                    - '0.258'
+                    - '0.2183'
+                    - '106'
+                    - '199'
+                    - '376'
+                    - '-36.4'
+                -   - '179'
+                    - Hexyl mercaptan
+                    - C6H14S
+                    - g
+                    - 111-31-9
+                    - '118.24'
+                    - '623'
+                    - '3.08'
+                    - '0.412'
+                    - '0.245'
+                    - '0.3681'
+                    - '-129.2'
+                    - '27.59'
+                    - '454.6'
+                    - '-41.762'
+                -   - '180'
+                    - 1-Hexyne
+                    - C6H10
+                    - g
+                    - 693-02-7
+                    - '82.144'
+                    - '516.2'
+                    - '3.62'
+                    - '0.322'
+                    - '0.272'
+                    - '0.3327'
+                    - '123.7'
+                    - '218.5'
+                    - '369.4'
+                    - '-36.61'
+                -   - '181'
+                    - 2-Hexyne
+                    - C6H10
+                    - g
+                    - 764-35-2
+                    - '82.144'
+                    - '549'
+                    - '3.53'
+                    - '0.331'
+                    - '0.256'
+                    - '0.2214'
+                    - '105'
+                    - '199'
+                    - '372'
+                    - '-36.4'
+                -   - '182'
+                    - Hydrazine
+                    - H4N2
+                    - g
+                    - 302-01-2
+                    - '32.045'
+                    - '653.15'
+                    - '14.7'
+                    - '0.158'
+                    - '0.428'
+                    - '0.3143'
+                    - '95.353'
+                    - '159.17'
+                    - '238.61'
+                    - '-5.342'
+                -   - '183'
+                    - Hydrogen
+                    - H2
+                    - g
+                    - 1333-74-0
+                    - '2.016'
+                    - '33.19'
+                    - '1.313'
+                    - '0.064147'
+                    - '0.305'
+                    - '-0.216'
+                    - '0'
+                    - '0'
+                    - '130.571'
+                    - '-2.4182'
+                -   - '184'
+                    - Hydrogen bromide
+                    - HBr
+                    - g
+                    - 10035-10-6
+                    - '80.912'
+                    - '363.15'
+                    - '8.552'
+                    - '0.1'
+                    - '0.283'
+                    - '0.0734'
+                    - '-36.29'
+                    - '-53.34'
+                    - '198.591'
+                    - '-0.6904'
+                -   - '185'
+                    - Hydrogen chloride
+                    - HCl
+                    - g
+                    - 7647-01-0
+                    - '36.461'
+                    - '324.65'
+                    - '8.31'
+                    - '0.081'
+                    - '0.249'
+                    - '0.1315'
+                    - '-92.31'
+                    - '-95.3'
+                    - '186.786'
+                    - '-0.286'
+                -   - '186'
+                    - Hydrogen cyanide
+                    - CHN
+                    - g
+                    - 74-90-8
+                    - '27.025'
+                    - '456.65'
+                    - '5.39'
+                    - '0.139'
+                    - '0.197'
+                    - '0.4099'
+                    - '135.143'
+                    - '124.725'
+                    - '201.719'
+                    - '-6.2329'
+                -   - '187'
+                    - Hydrogen fluoride
+                    - HF
+                    - g
+                    - 7664-39-3
+                    - '20.006'
+                    - '461.15'
+                    - '6.48'
+                    - '0.069'
+                    - '0.117'
+                    - '0.3823'
+                    - '-273.3'
+                    - '-275.4'
+                    - '173.67'
+                    - '1.524'
+                -   - '188'
+                    - Hydrogen sulfide
+                    - H2S
+                    - g
+                    - '7783-06-04'
+                    - '34.081'
+                    - '373.53'
+                    - '8.963'
+                    - '0.0985'
+                    - '0.284'
+                    - '0.0942'
+                    - '-20.63'
+                    - '-33.44'
+                    - '205.6'
+                    - '-5.18'
+                -   - '189'
+                    - Isobutyric acid
+                    - C4H8O2
+                    - g
+                    - 79-31-2
+                    - '88.105'
+                    - '605'
+                    - '3.7'
+                    - '0.292'
+                    - '0.215'
+                    - '0.6141'
+                    - '-484.1'
+                    - '-362.1'
+                    - '341.2'
+                    - '-20.004'
+                -   - '190'
+                    - Isopropyl amine
+                    - C3H9N
+                    - g
+                    - 75-31-0
+                    - '59.11'
+                    - '471.85'
+                    - '4.54'
+                    - '0.221'
+                    - '0.256'
+                    - '0.2759'
+                    - '-83.8'
+                    - '31.92'
+                    - '312.4'
+                    - '-21.566'
+                -   - '191'
+                    - Malonic acid
+                    - C3H4O4
+                    - g
+                    - 141-82-2
+                    - '104.061'
+                    - '805'
+                    - '5.64'
+                    - '0.258'
+                    - '0.217'
+                    - '0.9418'
+                    - '-766.8'
+                    - '-670'
+                    - '370'
+                    - '-7.732'
+                -   - '192'
+                    - Methacrylic acid
+                    - C4H6O2
+                    - g
+                    - 79-41-4
+                    - '86.089'
+                    - '662'
+                    - '4.79'
+                    - '0.28'
+                    - '0.244'
+                    - '0.3318'
+                    - '-368'
+                    - '-288'
+                    - '350'
+                    - '-19.3'
+                -   - '193'
+                    - Methane
+                    - CH4
+                    - g
+                    - 74-82-8
+                    - '16.042'
+                    - '190.564'
+                    - '4.599'
+                    - '0.0986'
+                    - '0.286'
+                    - '0.0115'
+                    - '-74.52'
+                    - '-50.49'
+                    - '186.27'
+                    - '-8.0262'
+                -   - '194'
+                    - Methanol
+                    - CH4O
+                    - g
+                    - 67-56-1
+                    - '32.042'
+                    - '512.5'
+                    - '8.084'
+                    - '0.117'
+                    - '0.222'
+                    - '0.5658'
+                    - '-200.94'
+                    - '-162.32'
+                    - '239.88'
+                    - '-6.382'
+                -   - '195'
+                    - N-Methyl acetamide
+                    - C3H7NO
+                    - g
+                    - 79-16-3
+                    - '73.094'
+                    - '718'
+                    - '4.98'
+                    - '0.267'
+                    - '0.223'
+                    - '0.4351'
+                    - '-240'
+                    - '-135'
+                    - '320'
+                    - '-17.1'
+                -   - '196'
+                    - Methyl acetate
+                    - C3H6O2
+                    - g
+                    - 79-20-9
+                    - '74.079'
+                    - '506.55'
+                    - '4.75'
+                    - '0.228'
+                    - '0.257'
+                    - '0.3313'
+                    - '-411.9'
+                    - '-324.2'
+                    - '319.8'
+                    - '-14.61'
+                -   - '197'
+                    - Methyl acetylene
+                    - C3H4
+                    - g
+                    - 74-99-7
+                    - '40.064'
+                    - '402.4'
+                    - '5.63'
+                    - '0.164'
+                    - '0.276'
+                    - '0.2115'
+                    - '184.9'
+                    - '193.84'
+                    - '248.36'
+                    - '-18.487'
+                -   - '198'
+                    - Methyl acrylate
+                    - C4H6O2
+                    - g
+                    - 96-33-3
+                    - '86.089'
+                    - '536'
+                    - '4.25'
+                    - '0.27'
+                    - '0.258'
+                    - '0.3423'
+                    - '-333'
+                    - '-257'
+                    - '366'
+                    - '-19.303'
+                -   - '199'
+                    - Methyl amine
+                    - CH5N
+                    - g
+                    - 74-89-5
+                    - '31.057'
+                    - '430.05'
+                    - '7.46'
+                    - '0.154'
+                    - '0.321'
+                    - '0.2814'
+                    - '-22.97'
+                    - '32.07'
+                    - '243.3'
+                    - '-9.7508'
+                -   - '200'
+                    - Methyl benzoate
+                    - C8H8O2
+                    - g
+                    - 93-58-3
+                    - '136.148'
+                    - '693'
+                    - '3.59'
+                    - '0.436'
+                    - '0.272'
+                    - '0.4205'
+                    - '-287.9'
+                    - '-181'
+                    - '414'
+                    - '-37.72'
+                -   - '201'
+                    - 3-Methyl-1,2-butadiene
+                    - C5H8
+                    - g
+                    - 598-25-4
+                    - '68.117'
+                    - '490'
+                    - '3.83'
+                    - '0.291'
+                    - '0.274'
+                    - '0.1874'
+                    - '129.08'
+                    - '197.5'
+                    - '321.51'
+                    - '-30.32'
+                -   - '202'
+                    - 2-Methylbutane
+                    - C5H12
+                    - g
+                    - 78-78-4
+                    - '72.149'
+                    - '460.4'
+                    - '3.38'
+                    - '0.306'
+                    - '0.27'
+                    - '0.2279'
+                    - '-153.7'
+                    - '-14.05'
+                    - '343.74'
+                    - '-32.3954'
+                -   - '203'
+                    - 2-Methylbutanoic acid
+                    - C5H10O2
+                    - g
+                    - 116-53-0
+                    - '102.132'
+                    - '643'
+                    - '3.89'
+                    - '0.347'
+                    - '0.252'
+                    - '0.5894'
+                    - '-498'
+                    - '-349.9'
+                    - '390'
+                    - '-26.22'
+                -   - '204'
+                    - 3-Methyl-1-butanol
+                    - C5H12O
+                    - g
+                    - 123-51-3
+                    - '88.148'
+                    - '577.2'
+                    - '3.93'
+                    - '0.329'
+                    - '0.269'
+                    - '0.5939'
+                    - '-303'
+                    - '-141'
+                    - '386.9'
+                    - '-30.62'
+                -   - '205'
+                    - 2-Methyl-1-butene
+                    - C5H10
+                    - g
+                    - 563-46-2
+                    - '70.133'
+                    - '465'
+                    - '3.447'
+                    - '0.292'
+                    - '0.26'
+                    - '0.2341'
+                    - '-35.3'
+                    - '66.68'
+                    - '339.5'
+                    - '-31.159'
+                -   - '206'
+                    - 2-Methyl-2-butene
+                    - C5H10
+                    - g
+                    - 513-35-9
+                    - '70.133'
+                    - '470'
+                    - '3.42'
+                    - '0.292'
+                    - '0.256'
+                    - '0.287'
+                    - '-41.8'
+                    - '60.45'
+                    - '338.6'
+                    - '-31.088'
+                -   - '207'
+                    - 2-Methyl-1-butene-3-yne
+                    - C5H6
+                    - g
+                    - 78-80-8
+                    - '66.101'
+                    - '492'
+                    - '4.38'
+                    - '0.248'
+                    - '0.266'
+                    - '0.137'
+                    - '260'
+                    - '302.5'
+                    - '278'
+                    - '-29.3'
+                -   - '208'
+                    - Methylbutyl ether
+                    - C5H12O
+                    - g
+                    - 628-28-4
+                    - '88.148'
+                    - '512.74'
+                    - '3.371'
+                    - '0.329'
+                    - '0.26'
+                    - '0.313'
+                    - '-258.1'
+                    - '-101.7'
+                    - '390.1'
+                    - '-31.2818'
+                -   - '209'
+                    - Methylbutyl sulfide
+                    - C5H12S
+                    - g
+                    - 628-29-5
+                    - '104.214'
+                    - '593'
+                    - '3.47'
+                    - '0.36'
+                    - '0.253'
+                    - '0.3229'
+                    - '-102'
+                    - '26.91'
+                    - '411.8'
+                    - '-35.723'
+                -   - '210'
+                    - 3-Methyl-1-butyne
+                    - C5H8
+                    - g
+                    - 598-23-2
+                    - '68.117'
+                    - '463.2'
+                    - '4.2'
+                    - '0.275'
+                    - '0.3'
+                    - '0.3081'
+                    - '138'
+                    - '207.2'
+                    - '318.9'
+                    - '-30.46'
+                -   - '211'
+                    - Methyl butyrate
+                    - C5H10O2
+                    - g
+                    - 623-42-7
+                    - '102.132'
+                    - '554.5'
+                    - '3.473'
+                    - '0.34'
+                    - '0.256'
+                    - '0.3775'
+                    - '-450.7'
+                    - '-305.3'
+                    - '398.8'
+                    - '-26.86'
+                -   - '212'
+                    - Methylchlorosilane
+                    - CH5ClSi
+                    - g
+                    - 993-00-0
+                    - '80.589'
+                    - '442'
+                    - '4.17'
+                    - '0.246'
+                    - '0.279'
+                    - '0.2252'
+                    - '-215'
+                    - '-166.1'
+                    - '298.277'
+                    - '-16.93'
+                -   - '213'
+                    - Methylcyclohexane
+                    - C7H14
+                    - g
+                    - 108-87-2
+                    - '98.186'
+                    - '572.1'
+                    - '3.48'
+                    - '0.369'
+                    - '0.27'
+                    - '0.2361'
+                    - '-154.8'
+                    - '27.33'
+                    - '343.3'
+                    - '-42.5714'
+                -   - '214'
+                    - 1-Methylcyclohexanol
+                    - C7H14O
+                    - g
+                    - 590-67-0
+                    - '114.185'
+                    - '686'
+                    - '4'
+                    - '0.374'
+                    - '0.262'
+                    - '0.2213'
+                    - '-332'
+                    - '-129'
+                    - '375'
+                    - '-40.58'
+                -   - '215'
+                    - cis-2-Methylcyclohexanol
+                    - C7H14O
+                    - g
+                    - 7443-70-1
+                    - '114.185'
+                    - '614'
+                    - '3.79'
+                    - '0.374'
+                    - '0.278'
+                    - '0.6805'
+                    - '-327'
+                    - '-126.8'
+                    - '385.3'
+                    - '-40.574'
+                -   - '216'
+                    - trans-2-Methylcyclohexanol
+                    - C7H14O
+                    - g
+                    - 7443-52-9
+                    - '114.185'
+                    - '617'
+                    - '3.79'
+                    - '0.374'
+                    - '0.276'
+                    - '0.679'
+                    - '-352.6'
+                    - '-152.4'
+                    - '385.3'
+                    - '-40.318'
+                -   - '217'
+                    - Methylcyclopentane
+                    - C6H12
+                    - g
+                    - 96-37-7
+                    - '84.159'
+                    - '532.7'
+                    - '3.79'
+                    - '0.319'
+                    - '0.273'
+                    - '0.2288'
+                    - '-106.2'
+                    - '36.3'
+                    - '339.9'
+                    - '-36.741'
+                -   - '218'
+                    - 1-Methylcyclopentene
+                    - C6H10
+                    - g
+                    - 693-89-0
+                    - '82.144'
+                    - '542'
+                    - '4.13'
+                    - '0.303'
+                    - '0.278'
+                    - '0.2318'
+                    - '-3.8'
+                    - '103.8'
+                    - '326.4'
+                    - '-35.34'
+                -   - '219'
+                    - 3-Methylcyclopentene
+                    - C6H10
+                    - g
+                    - 1120-62-3
+                    - '82.144'
+                    - '526'
+                    - '4.13'
+                    - '0.303'
+                    - '0.286'
+                    - '0.2296'
+                    - '7.4'
+                    - '113.8'
+                    - '330.5'
+                    - '-35.464'
+                -   - '220'
+                    - Methyldichlorosilane
+                    - CH4Cl2Si
+                    - g
+                    - 75-54-7
+                    - '115.034'
+                    - '483'
+                    - '3.95'
+                    - '0.289'
+                    - '0.284'
+                    - '0.2758'
+                    - '-402'
+                    - '-348.3'
+                    - '328.7'
+                    - '-13.57'
+                -   - '221'
+                    - Methylethyl ether
+                    - C3H8O
+                    - g
+                    - 540-67-0
+                    - '60.095'
+                    - '437.8'
+                    - '4.4'
+                    - '0.221'
+                    - '0.267'
+                    - '0.2314'
+                    - '-216.4'
+                    - '-117.1'
+                    - '308.81'
+                    - '-19.314'
+                -   - '222'
+                    - Methylethyl ketone
+                    - C4H8O
+                    - g
+                    - 78-93-3
+                    - '72.106'
+                    - '535.5'
+                    - '4.15'
+                    - '0.267'
+                    - '0.249'
+                    - '0.3234'
+                    - '-239'
+                    - '-147'
+                    - '339.4'
+                    - '-22.68'
+                -   - '223'
+                    - Methylethyl sulfide
+                    - C3H8S
+                    - g
+                    - 624-89-5
+                    - '76.161'
+                    - '533'
+                    - '4.26'
+                    - '0.254'
+                    - '0.244'
+                    - '0.2091'
+                    - '-59.6'
+                    - '11.47'
+                    - '333.2'
+                    - '-23.54'
+                -   - '224'
+                    - Methyl formate
+                    - C2H4O2
+                    - g
+                    - 107-31-3
+                    - '60.052'
+                    - '487.2'
+                    - '6'
+                    - '0.172'
+                    - '0.255'
+                    - '0.2556'
+                    - '-352.4'
+                    - '-295'
+                    - '285.2'
+                    - '-8.924'
+                -   - '225'
+                    - Methylisobutyl ether
+                    - C5H12O
+                    - g
+                    - 625-44-5
+                    - '88.148'
+                    - '497'
+                    - '3.41'
+                    - '0.329'
+                    - '0.272'
+                    - '0.3078'
+                    - '-266'
+                    - '-107'
+                    - '381'
+                    - '-31.22'
+                -   - '226'
+                    - Methylisobutyl ketone
+                    - C6H12O
+                    - g
+                    - 108-10-1
+                    - '100.159'
+                    - '574.6'
+                    - '3.27'
+                    - '0.369'
+                    - '0.253'
+                    - '0.3557'
+                    - '-286.4'
+                    - '-135.1'
+                    - '412.9'
+                    - '-34.762'
+                -   - '227'
+                    - Methyl Isocyanate
+                    - C2H3NO
+                    - g
+                    - 624-83-9
+                    - '57.051'
+                    - '488'
+                    - '5.48'
+                    - '0.202'
+                    - '0.273'
+                    - '0.3007'
+                    - '-62.4'
+                    - '0.244'
+                    - '195.5'
+                    - '-10.6'
+                -   - '228'
+                    - Methylisopropyl ether
+                    - C4H10O
+                    - g
+                    - 598-53-8
+                    - '74.122'
+                    - '464.48'
+                    - '3.762'
+                    - '0.276'
+                    - '0.269'
+                    - '0.2656'
+                    - '-252'
+                    - '-121.8'
+                    - '341.6'
+                    - '-25.311'
+                -   - '229'
+                    - Methylisopropyl ketone
+                    - C5H10O
+                    - g
+                    - 563-80-4
+                    - '86.132'
+                    - '553.4'
+                    - '3.8'
+                    - '0.31'
+                    - '0.256'
+                    - '0.3208'
+                    - '-262.6'
+                    - '-139.3'
+                    - '369.9'
+                    - '-28.77'
+                -   - '230'
+                    - Methylisopropyl sulfide
+                    - C4H10S
+                    - g
+                    - 1551-21-9
+                    - '90.187'
+                    - '553.1'
+                    - '4.021'
+                    - '0.328'
+                    - '0.28718'
+                    - '0.2461'
+                    - '-89.6'
+                    - '14.509'
+                    - '359'
+                    - '-29.57'
+                -   - '231'
+                    - Methyl mercaptan
+                    - CH4S
+                    - g
+                    - 74-93-1
+                    - '48.107'
+                    - '469.95'
+                    - '7.23'
+                    - '0.145'
+                    - '0.268'
+                    - '0.1582'
+                    - '-22.9'
+                    - '-9.8'
+                    - '255'
+                    - '-11.517'
+                -   - '232'
+                    - Methyl methacrylate
+                    - C5H8O2
+                    - g
+                    - 80-62-6
+                    - '100.116'
+                    - '566'
+                    - '3.68'
+                    - '0.323'
+                    - '0.253'
+                    - '0.2802'
+                    - '-360'
+                    - '-254'
+                    - '401'
+                    - '-25.4'
+                -   - '233'
+                    - 2-Methyloctanoic acid
+                    - C9H18O2
+                    - g
+                    - 3004-93-1
+                    - '158.238'
+                    - '694'
+                    - '2.54'
+                    - '0.572'
+                    - '0.252'
+                    - '0.7913'
+                    - '-579.5'
+                    - '-318'
+                    - '553.3'
+                    - '-50.56'
+                -   - '234'
+                    - 2-Methylpentane
+                    - C6H14
+                    - g
+                    - 107-83-5
+                    - '86.175'
+                    - '497.7'
+                    - '3.04'
+                    - '0.368'
+                    - '0.27'
+                    - '0.2791'
+                    - '-174.55'
+                    - '-5.338'
+                    - '380.89'
+                    - '-38.4915'
+                -   - '235'
+                    - Methyl pentyl ether
+                    - C6H14O
+                    - g
+                    - 628-80-8
+                    - '102.175'
+                    - '546.49'
+                    - '3.042'
+                    - '0.38'
+                    - '0.254'
+                    - '0.3442'
+                    - '-278'
+                    - '-93.5'
+                    - '432'
+                    - '-37.39'
+                -   - '236'
+                    - 2-Methylpropane
+                    - C4H10
+                    - g
+                    - 75-28-5
+                    - '58.122'
+                    - '407.8'
+                    - '3.64'
+                    - '0.259'
+                    - '0.278'
+                    - '0.1835'
+                    - '-134.99'
+                    - '-21.44'
+                    - '295.5'
+                    - '-26.4895'
+                -   - '237'
+                    - 2-Methyl-2-propanol
+                    - C4H10O
+                    - g
+                    - 75-65-0
+                    - '74.122'
+                    - '506.2'
+                    - '3.972'
+                    - '0.275'
+                    - '0.26'
+                    - '0.6152'
+                    - '-312.4'
+                    - '-177.6'
+                    - '326.3'
+                    - '-24.239'
+                -   - '238'
+                    - 2-Methyl propene
+                    - C4H8
+                    - g
+                    - 115-11-7
+                    - '56.106'
+                    - '417.9'
+                    - '4'
+                    - '0.239'
+                    - '0.275'
+                    - '0.1948'
+                    - '-17.1'
+                    - '58.08'
+                    - '293.09'
+                    - '-25.242'
+                -   - '239'
+                    - Methyl propionate
+                    - C4H8O2
+                    - g
+                    - 554-12-1
+                    - '88.105'
+                    - '530.6'
+                    - '4.004'
+                    - '0.282'
+                    - '0.256'
+                    - '0.3466'
+                    - '-427.5'
+                    - '-311'
+                    - '359.6'
+                    - '-20.78'
+                -   - '240'
+                    - Methylpropyl ether
+                    - C4H10O
+                    - g
+                    - 557-17-5
+                    - '74.122'
+                    - '476.25'
+                    - '3.801'
+                    - '0.276'
+                    - '0.265'
+                    - '0.277'
+                    - '-238.2'
+                    - '-111'
+                    - '352'
+                    - '-25.1739'
+                -   - '241'
+                    - Methylpropyl sulfide
+                    - C4H10S
+                    - g
+                    - 3877-15-4
+                    - '90.187'
+                    - '565'
+                    - '3.97'
+                    - '0.307'
+                    - '0.259'
+                    - '0.2737'
+                    - '-82.3'
+                    - '17.93'
+                    - '371.7'
+                    - '-29.62'
+                -   - '242'
+                    - Methylsilane
+                    - CH6Si
+                    - g
+                    - 992-94-9
+                    - '46.144'
+                    - '352.5'
+                    - '4.7'
+                    - '0.205'
+                    - '0.329'
+                    - '0.1314'
+                    - '-29.1'
+                    - '18.53'
+                    - '256.5'
+                    - '-19.99'
+                -   - '243'
+                    - alpha-Methyl styrene
+                    - C9H10
+                    - g
+                    - 98-83-9
+                    - '118.176'
+                    - '654'
+                    - '3.36'
+                    - '0.399'
+                    - '0.247'
+                    - '0.323'
+                    - '118.3'
+                    - '217.3'
+                    - '372.5'
+                    - '-48.214'
+                -   - '244'
+                    - Methyl tert-butyl ether
+                    - C5H12O
+                    - g
+                    - 1634-04-4
+                    - '88.148'
+                    - '497.1'
+                    - '3.287'
+                    - '0.314'
+                    - '0.25'
+                    - '0.2466'
+                    - '-283.2'
+                    - '-117'
+                    - '357.8'
+                    - '-31.05'
+                -   - '245'
+                    - Methyl vinyl ether
+                    - C3H6O
+                    - g
+                    - 107-25-5
+                    - '58.079'
+                    - '437'
+                    - '4.67'
+                    - '0.21'
+                    - '0.27'
+                    - '0.2416'
+                    - '-108'
+                    - '-47.3'
+                    - '308'
+                    - '-17.7431'
+                -   - '246'
+                    - Naphthalene
+                    - C10H8
+                    - g
+                    - 91-20-3
+                    - '128.171'
+                    - '748.4'
+                    - '4.05'
+                    - '0.407'
+                    - '0.265'
+                    - '0.302'
+                    - '150.58'
+                    - '224.08'
+                    - '333.15'
+                    - '-49.809'
+                -   - '247'
+                    - Neon
+                    - Ne
+                    - g
+                    - '7440-01-09'
+                    - '20.18'
+                    - '44.4'
+                    - '2.653'
+                    - '0.0417'
+                    - '0.3'
+                    - '-0.0396'
+                    - '0'
+                    - '0'
+                    - '146.219'
+                    - '0'
+                -   - '248'
+                    - Nitroethane
+                    - C2H5NO2
+                    - g
+                    - 79-24-3
+                    - '75.067'
+                    - '593'
+                    - '5.16'
+                    - '0.236'
+                    - '0.247'
+                    - '0.3803'
+                    - '-102.1'
+                    - '-6.125'
+                    - '316.8'
+                    - '-12.5'
+                -   - '249'
+                    - Nitrogen
+                    - N2
+                    - g
+                    - 7727-37-9
+                    - '28.013'
+                    - '126.2'
+                    - '3.4'
+                    - '0.08921'
+                    - '0.289'
+                    - '0.0377'
+                    - '0'
+                    - '0'
+                    - '191.5'
+                    - '0'
+                -   - '250'
+                    - Nitrogen trifluoride
+                    - F3N
+                    - g
+                    - 7783-54-2
+                    - '71.002'
+                    - '234'
+                    - '4.461'
+                    - '0.11875'
+                    - '0.272'
+                    - '0.12'
+                    - '-132.089'
+                    - '-90.6'
+                    - '260.62'
+                    - '0'
+                -   - '251'
+                    - Nitromethane
+                    - CH3NO2
+                    - g
+                    - 75-52-5
+                    - '61.04'
+                    - '588.15'
+                    - '6.31'
+                    - '0.173'
+                    - '0.223'
+                    - '0.348'
+                    - '-74.7'
+                    - '-6.934'
+                    - '275.1'
+                    - '-6.432'
+                -   - '252'
+                    - Nitrous oxide
+                    - N2O
+                    - g
+                    - 10024-97-2
+                    - '44.013'
+                    - '309.57'
+                    - '7.245'
+                    - '0.0974'
+                    - '0.274'
+                    - '0.1409'
+                    - '82.05'
+                    - '104.16'
+                    - '219.85'
+                    - '-0.820482'
+                -   - '253'
+                    - Nitric oxide
+                    - 'NO'
+                    - g
+                    - 10102-43-9
+                    - '30.006'
+                    - '180.15'
+                    - '6.48'
+                    - '0.058'
+                    - '0.251'
+                    - '0.5829'
+                    - '90.25'
+                    - '86.57'
+                    - '210.6'
+                    - '-0.902489'
+                -   - '254'
+                    - Nonadecane
+                    - C19H40
+                    - g
+                    - 629-92-5
+                    - '268.521'
+                    - '758'
+                    - '1.21'
+                    - '1.26'
+                    - '0.242'
+                    - '0.8522'
+                    - '-435.79'
+                    - '107.4'
+                    - '898.66'
+                    - '-117.812'
+                -   - '255'
+                    - Nonanal
+                    - C9H18O
+                    - g
+                    - 124-19-6
+                    - '142.239'
+                    - '658'
+                    - '2.73'
+                    - '0.527'
+                    - '0.263'
+                    - '0.5117'
+                    - '-310.9'
+                    - '-75.53'
+                    - '539.88'
+                    - '-53.5'
+                -   - '256'
+                    - Nonane
+                    - C9H20
+                    - g
+                    - 111-84-2
+                    - '128.255'
+                    - '594.6'
+                    - '2.29'
+                    - '0.551'
+                    - '0.255'
+                    - '0.4435'
+                    - '-228.74'
+                    - '24.98'
+                    - '506.4'
+                    - '-56.8455'
+                -   - '257'
+                    - Nonanoic acid
+                    - C9H18O2
+                    - g
+                    - 112-05-0
+                    - '158.238'
+                    - '710.7'
+                    - '2.514'
+                    - '0.584'
+                    - '0.248'
+                    - '0.7724'
+                    - '-577.3'
+                    - '-317'
+                    - '559'
+                    - '-50.61'
+                -   - '258'
+                    - 1-Nonanol
+                    - C9H20O
+                    - g
+                    - 143-08-8
+                    - '144.255'
+                    - '670.9'
+                    - '2.527'
+                    - '0.576'
+                    - '0.261'
+                    - '0.5841'
+                    - '-377.9'
+                    - '-108.6'
+                    - '557.9'
+                    - '-55.06'
+                -   - '259'
+                    - 2-Nonanol
+                    - C9H20O
+                    - g
+                    - 628-99-9
+                    - '144.255'
+                    - '649.5'
+                    - '2.541'
+                    - '0.577'
+                    - '0.271'
+                    - '0.5911'
+                    - '-397.1'
+                    - '-126.1'
+                    - '552.3'
+                    - '-55.06'
+                -   - '260'
+                    - 1-Nonene
+                    - C9H18
+                    - g
+                    - 124-11-8
+                    - '126.239'
+                    - '593.1'
+                    - '2.428'
+                    - '0.524'
+                    - '0.258'
+                    - '0.4367'
+                    - '-103.5'
+                    - '112.3'
+                    - '504.1'
+                    - '-55.716'
+                -   - '261'
+                    - Nonyl mercaptan
+                    - C9H20S
+                    - g
+                    - 1455-21-6
+                    - '160.32'
+                    - '681'
+                    - '2.31'
+                    - '0.571'
+                    - '0.233'
+                    - '0.526'
+                    - '-190.8'
+                    - '52.8'
+                    - '572.4'
+                    - '-60.06'
+                -   - '262'
+                    - 1-Nonyne
+                    - C9H16
+                    - g
+                    - '3452-09-03'
+                    - '124.223'
+                    - '598.05'
+                    - '2.61'
+                    - '0.497'
+                    - '0.261'
+                    - '0.471'
+                    - '61.7'
+                    - '243.4'
+                    - '486.99'
+                    - '-54.93'
+                -   - '263'
+                    - Octadecane
+                    - C18H38
+                    - g
+                    - 593-45-3
+                    - '254.494'
+                    - '747'
+                    - '1.27'
+                    - '1.19'
+                    - '0.243'
+                    - '0.8114'
+                    - '-415.12'
+                    - '99.1'
+                    - '859.45'
+                    - '-111.715'
+                -   - '264'
+                    - Octanal
+                    - C8H16O
+                    - g
+                    - 124-13-0
+                    - '128.212'
+                    - '638.9'
+                    - '2.96'
+                    - '0.488'
+                    - '0.272'
+                    - '0.4636'
+                    - '-290.2'
+                    - '-83.77'
+                    - '500.63'
+                    - '-47.4'
+                -   - '265'
+                    - Octane
+                    - C8H18
+                    - g
+                    - 111-65-9
+                    - '114.229'
+                    - '568.7'
+                    - '2.49'
+                    - '0.486'
+                    - '0.256'
+                    - '0.3996'
+                    - '-208.75'
+                    - '16'
+                    - '467.23'
+                    - '-50.7415'
+                -   - '266'
+                    - Octanoic acid
+                    - C8H16O2
+                    - g
+                    - 124-07-2
+                    - '144.211'
+                    - '694.26'
+                    - '2.779'
+                    - '0.523'
+                    - '0.252'
+                    - '0.7706'
+                    - '-556'
+                    - '-325'
+                    - '520'
+                    - '-44.48'
+                -   - '267'
+                    - 1-Octanol
+                    - C8H18O
+                    - g
+                    - 111-87-5
+                    - '130.228'
+                    - '652.3'
+                    - '2.783'
+                    - '0.509'
+                    - '0.261'
+                    - '0.5697'
+                    - '-357.3'
+                    - '-117'
+                    - '518.7'
+                    - '-48.95'
+                -   - '268'
+                    - 2-Octanol
+                    - C8H18O
+                    - g
+                    - 123-96-6
+                    - '130.228'
+                    - '629.8'
+                    - '2.749'
+                    - '0.512'
+                    - '0.269'
+                    - '0.5807'
+                    - '-376.2'
+                    - '-134.3'
+                    - '513.2'
+                    - '-48.94'
+                -   - '269'
+                    - 2-Octanone
+                    - C8H16O
+                    - g
+                    - 111-13-7
+                    - '128.212'
+                    - '632.7'
+                    - '2.64'
+                    - '0.497'
+                    - '0.249'
+                    - '0.4549'
+                    - '-321.6'
+                    - '-113.8'
+                    - '496.2'
+                    - '-46.984'
+                -   - '270'
+                    - 3-Octanone
+                    - C8H16O
+                    - g
+                    - 106-68-3
+                    - '128.212'
+                    - '627.7'
+                    - '2.704'
+                    - '0.497'
+                    - '0.257'
+                    - '0.4406'
+                    - '-339'
+                    - '-128.1'
+                    - '487.9'
+                    - '-47.11'
+                -   - '271'
+                    - 1-Octene
+                    - C8H16
+                    - g
+                    - 111-66-0
+                    - '112.213'
+                    - '566.9'
+                    - '2.663'
+                    - '0.464'
+                    - '0.262'
+                    - '0.3921'
+                    - '-81.94'
+                    - '105.7'
+                    - '463.7'
+                    - '-49.61'
+                -   - '272'
+                    - Octyl mercaptan
+                    - C8H18S
+                    - g
+                    - 111-88-6
+                    - '146.294'
+                    - '667.3'
+                    - '2.52'
+                    - '0.518'
+                    - '0.235'
+                    - '0.4497'
+                    - '-170.1'
+                    - '44.57'
+                    - '533.1'
+                    - '-53.962'
+                -   - '273'
+                    - 1-Octyne
+                    - C8H14
+                    - g
+                    - 629-05-0
+                    - '110.197'
+                    - '574'
+                    - '2.88'
+                    - '0.442'
+                    - '0.267'
+                    - '0.4233'
+                    - '82.3'
+                    - '235'
+                    - '447.8'
+                    - '-48.8145'
+                -   - '274'
+                    - Oxalic acid
+                    - C2H2O4
+                    - g
+                    - 144-62-7
+                    - '90.035'
+                    - '804'
+                    - '7.02'
+                    - '0.205'
+                    - '0.215'
+                    - '0.9176'
+                    - '-723.7'
+                    - '-661.4'
+                    - '343.3'
+                    - '-1.989'
+                -   - '275'
+                    - Oxygen
+                    - O2
+                    - g
+                    - 7782-44-7
+                    - '31.999'
+                    - '154.58'
+                    - '5.043'
+                    - '0.0734'
+                    - '0.288'
+                    - '0.0222'
+                    - '0'
+                    - '0'
+                    - '205.043'
+                    - '0'
+                -   - '276'
+                    - Ozone
+                    - O3
+                    - g
+                    - 10028-15-6
+                    - '47.998'
+                    - '261'
+                    - '5.57'
+                    - '0.089'
+                    - '0.228'
+                    - '0.2119'
+                    - '142.671'
+                    - '163.164'
+                    - '238.823'
+                    - '-1.42671'
+                -   - '277'
+                    - Pentadecane
+                    - C15H32
+                    - g
+                    - 629-62-9
+                    - '212.415'
+                    - '708'
+                    - '1.48'
+                    - '0.969'
+                    - '0.244'
+                    - '0.6863'
+                    - '-353.11'
+                    - '74.26'
+                    - '741.81'
+                    - '-93.4237'
+                -   - '278'
+                    - Pentanal
+                    - C5H10O
+                    - g
+                    - 110-62-3
+                    - '86.132'
+                    - '566.1'
+                    - '3.97'
+                    - '0.313'
+                    - '0.264'
+                    - '0.3472'
+                    - '-227.8'
+                    - '-107.1'
+                    - '382.89'
+                    - '-29.1'
+                -   - '279'
+                    - Pentane
+                    - C5H12
+                    - g
+                    - 109-66-0
+                    - '72.149'
+                    - '469.7'
+                    - '3.37'
+                    - '0.313'
+                    - '0.27'
+                    - '0.2515'
+                    - '-146.76'
+                    - '-8.813'
+                    - '349.45'
+                    - '-32.4494'
+                -   - '280'
+                    - Pentanoic acid
+                    - C5H10O2
+                    - g
+                    - 109-52-4
+                    - '102.132'
+                    - '639.16'
+                    - '3.63'
+                    - '0.35'
+                    - '0.239'
+                    - '0.7052'
+                    - '-491.3'
+                    - '-347'
+                    - '402'
+                    - '-26.17'
+                -   - '281'
+                    - 1-Pentanol
+                    - C5H12O
+                    - g
+                    - 71-41-0
+                    - '88.148'
+                    - '588.1'
+                    - '3.897'
+                    - '0.326'
+                    - '0.258'
+                    - '0.5748'
+                    - '-295.7'
+                    - '-142.3'
+                    - '401'
+                    - '-30.64'
+                -   - '282'
+                    - 2-Pentanol
+                    - C5H12O
+                    - g
+                    - 6032-29-7
+                    - '88.148'
+                    - '561'
+                    - '3.7'
+                    - '0.326'
+                    - '0.259'
+                    - '0.5549'
+                    - '-313.7'
+                    - '-158.8'
+                    - '395.8'
+                    - '-30.58'
+                -   - '283'
+                    - 2-Pentanone
+                    - C5H10O
+                    - g
+                    - 107-87-9
+                    - '86.132'
+                    - '561.08'
+                    - '3.694'
+                    - '0.301'
+                    - '0.238'
+                    - '0.3433'
+                    - '-259.2'
+                    - '-138.3'
+                    - '378.6'
+                    - '-28.7956'
+                -   - '284'
+                    - 3-Pentanone
+                    - C5H10O
+                    - g
+                    - 96-22-0
+                    - '86.132'
+                    - '560.95'
+                    - '3.74'
+                    - '0.336'
+                    - '0.269'
+                    - '0.3448'
+                    - '-257.9'
+                    - '-134.4'
+                    - '370'
+                    - '-28.804'
+                -   - '285'
+                    - 1-Pentene
+                    - C5H10
+                    - g
+                    - 109-67-1
+                    - '70.133'
+                    - '464.8'
+                    - '3.56'
+                    - '0.293'
+                    - '0.27'
+                    - '0.2372'
+                    - '-21.62'
+                    - '78.37'
+                    - '346.2'
+                    - '-31.3037'
+                -   - '286'
+                    - 2-Pentyl mercaptan
+                    - C5H12S
+                    - g
+                    - 2084-19-7
+                    - '104.214'
+                    - '584.3'
+                    - '3.536'
+                    - '0.385'
+                    - '0.28'
+                    - '0.2685'
+                    - '-113'
+                    - '18.14'
+                    - '405'
+                    - '-35.64'
+                -   - '287'
+                    - Pentyl mercaptan
+                    - C5H12S
+                    - g
+                    - 110-66-7
+                    - '104.214'
+                    - '598'
+                    - '3.47'
+                    - '0.359'
+                    - '0.251'
+                    - '0.3207'
+                    - '-108.4'
+                    - '19.4408'
+                    - '415.4'
+                    - '-35.641'
+                -   - '288'
+                    - 1-Pentyne
+                    - C5H8
+                    - g
+                    - 627-19-0
+                    - '68.117'
+                    - '481.2'
+                    - '4.17'
+                    - '0.277'
+                    - '0.289'
+                    - '0.2899'
+                    - '144.4'
+                    - '210.3'
+                    - '329.8'
+                    - '-30.51'
+                -   - '289'
+                    - 2-Pentyne
+                    - C5H8
+                    - g
+                    - 627-21-4
+                    - '68.117'
+                    - '519'
+                    - '4.03'
+                    - '0.276'
+                    - '0.258'
+                    - '0.1752'
+                    - '128.9'
+                    - '194.5'
+                    - '330.84'
+                    - '-30.291'
+                -   - '290'
+                    - Phenanthrene
+                    - C14H10
+                    - g
+                    - '1985-01-08'
+                    - '178.229'
+                    - '869'
+                    - '2.9'
+                    - '0.554'
+                    - '0.222'
+                    - '0.4707'
+                    - '201.2'
+                    - '302.19'
+                    - '394.5'
+                    - '-68.282'
+                -   - '291'
+                    - Phenol
+                    - C6H6O
+                    - g
+                    - 108-95-2
+                    - '94.111'
+                    - '694.25'
+                    - '6.13'
+                    - '0.229'
+                    - '0.243'
+                    - '0.4435'
+                    - '-96.399'
+                    - '-32.637'
+                    - '314.81'
+                    - '-29.21'
+                -   - '292'
+                    - Phenyl isocyanate
+                    - C7H5NO
+                    - g
+                    - 103-71-9
+                    - '119.121'
+                    - '653'
+                    - '4.06'
+                    - '0.37'
+                    - '0.277'
+                    - '0.4123'
+                    - '-14.54'
+                    - '48.7212'
+                    - '352.7'
+                    - '-32.98'
+                -   - '293'
+                    - Phthalic anhydride
+                    - C8H4O3
+                    - g
+                    - 85-44-9
+                    - '148.116'
+                    - '791'
+                    - '4.72'
+                    - '0.421'
+                    - '0.302'
+                    - '0.7025'
+                    - '-371.4'
+                    - '-307.001'
+                    - '399.5'
+                    - '-31.715'
+                -   - '294'
+                    - Propadiene
+                    - C3H4
+                    - g
+                    - 463-49-0
+                    - '40.064'
+                    - '394'
+                    - '5.25'
+                    - '0.165'
+                    - '0.264'
+                    - '0.1041'
+                    - '190.5'
+                    - '200.8'
+                    - '243.9'
+                    - '-18.563'
+                -   - '295'
+                    - Propane
+                    - C3H8
+                    - g
+                    - 74-98-6
+                    - '44.096'
+                    - '369.83'
+                    - '4.248'
+                    - '0.2'
+                    - '0.276'
+                    - '0.1523'
+                    - '-104.68'
+                    - '-24.39'
+                    - '270.2'
+                    - '-20.4311'
+                -   - '296'
+                    - 1-Propanol
+                    - C3H8O
+                    - g
+                    - 71-23-8
+                    - '60.095'
+                    - '536.8'
+                    - '5.169'
+                    - '0.219'
+                    - '0.254'
+                    - '0.6209'
+                    - '-254.6'
+                    - '-159.9'
+                    - '322.6'
+                    - '-18.44'
+                -   - '297'
+                    - 2-Propanol
+                    - C3H8O
+                    - g
+                    - 67-63-0
+                    - '60.095'
+                    - '508.3'
+                    - '4.765'
+                    - '0.222'
+                    - '0.25'
+                    - '0.6544'
+                    - '-272.1'
+                    - '-175.2'
+                    - '317.5'
+                    - '-18.34'
+                -   - '298'
+                    - Propenylcyclohexene
+                    - C3H14
+                    - g
+                    - 13511-13-2
+                    - '122.207'
+                    - '636'
+                    - '3.12'
+                    - '0.437'
+                    - '0.258'
+                    - '0.342'
+                    - '46.77'
+                    - '208.5'
+                    - '423.3'
+                    - '-52.32'
+                -   - '299'
+                    - Propionaldehyde
+                    - C3H6O
+                    - g
+                    - 123-38-6
+                    - '58.079'
+                    - '504.4'
+                    - '4.92'
+                    - '0.204'
+                    - '0.239'
+                    - '0.2559'
+                    - '-186.3'
+                    - '-124.6'
+                    - '304.4'
+                    - '-16.857'
+                -   - '300'
+                    - Propionic acid
+                    - C3H6O2
+                    - g
+                    - '1979-09-04'
+                    - '74.079'
+                    - '600.81'
+                    - '4.668'
+                    - '0.235'
+                    - '0.22'
+                    - '0.5796'
+                    - '-479.9'
+                    - '-385'
+                    - '294.9'
+                    - '-13.95'
+                -   - '301'
+                    - Propionitrile
+                    - C3H5N
+                    - g
+                    - 107-12-0
+                    - '55.079'
+                    - '564.4'
+                    - '4.18'
+                    - '0.229'
+                    - '0.204'
+                    - '0.3243'
+                    - '51.8'
+                    - '97.4949'
+                    - '286.14'
+                    - '-18.007'
+                -   - '302'
+                    - Propyl acetate
+                    - C5H10O2
+                    - g
+                    - 109-60-4
+                    - '102.132'
+                    - '549.73'
+                    - '3.36'
+                    - '0.345'
+                    - '0.254'
+                    - '0.3889'
+                    - '-464.8'
+                    - '-320.4'
+                    - '402.3'
+                    - '-26.72'
+                -   - '303'
+                    - Propyl amine
+                    - C3H9N
+                    - g
+                    - 107-10-8
+                    - '59.11'
+                    - '496.95'
+                    - '4.74'
+                    - '0.26'
+                    - '0.298'
+                    - '0.2798'
+                    - '-70.5'
+                    - '41.7'
+                    - '324.2'
+                    - '-21.65'
+                -   - '304'
+                    - Propylbenzene
+                    - C9H12
+                    - g
+                    - 103-65-1
+                    - '120.192'
+                    - '638.35'
+                    - '3.2'
+                    - '0.44'
+                    - '0.265'
+                    - '0.3444'
+                    - '7.9'
+                    - '137.6'
+                    - '400.14'
+                    - '-49.5415'
+                -   - '305'
+                    - Propylene
+                    - C3H6
+                    - g
+                    - 115-07-1
+                    - '42.08'
+                    - '364.85'
+                    - '4.6'
+                    - '0.185'
+                    - '0.281'
+                    - '0.1376'
+                    - '20.23'
+                    - '62.64'
+                    - '267'
+                    - '-19.262'
+                -   - '306'
+                    - Propyl formate
+                    - C4H8O2
+                    - g
+                    - 110-74-7
+                    - '88.105'
+                    - '538'
+                    - '4.02'
+                    - '0.285'
+                    - '0.256'
+                    - '0.3088'
+                    - '-407.6'
+                    - '-293.6'
+                    - '367.8'
+                    - '-20.41'
+                -   - '307'
+                    - 2-Propyl mercaptan
+                    - C3H8S
+                    - g
+                    - 75-33-2
+                    - '76.161'
+                    - '517'
+                    - '4.75'
+                    - '0.254'
+                    - '0.281'
+                    - '0.2138'
+                    - '-75.9'
+                    - '-2.18'
+                    - '324.3'
+                    - '-23.398'
+                -   - '308'
+                    - Propyl mercaptan
+                    - C3H8S
+                    - g
+                    - 107-03-9
+                    - '76.161'
+                    - '536.6'
+                    - '4.63'
+                    - '0.254'
+                    - '0.264'
+                    - '0.2318'
+                    - '-67.5'
+                    - '2.583'
+                    - '336.5'
+                    - '-23.458'
+                -   - '309'
+                    - 1,2-Propylene glycol
+                    - C3H8O2
+                    - g
+                    - 57-55-6
+                    - '76.094'
+                    - '626'
+                    - '6.1'
+                    - '0.239'
+                    - '0.28'
+                    - '1.1065'
+                    - '-421.5'
+                    - '-304'
+                    - '352'
+                    - '-16.476'
+                -   - '310'
+                    - Quinone
+                    - C6H4O2
+                    - g
+                    - 106-51-4
+                    - '108.095'
+                    - '683'
+                    - '5.96'
+                    - '0.291'
+                    - '0.305'
+                    - '0.4945'
+                    - '-122.9'
+                    - '-69.2'
+                    - '320.5'
+                    - '-26.58'
+                -   - '311'
+                    - Silicon tetrafluoride
+                    - F4Si
+                    - g
+                    - 7783-61-1
+                    - '104.079'
+                    - '259'
+                    - '3.72'
+                    - '0.202'
+                    - '0.349'
+                    - '0.3858'
+                    - '-1614.94'
+                    - '-1572.7'
+                    - '282.651'
+                    - '7.055'
+                -   - '312'
+                    - Styrene
+                    - C8H8
+                    - g
+                    - 100-42-5
+                    - '104.149'
+                    - '636'
+                    - '3.84'
+                    - '0.352'
+                    - '0.256'
+                    - '0.2971'
+                    - '147.4'
+                    - '213.9'
+                    - '345.1'
+                    - '-42.19'
+                -   - '313'
+                    - Succinic acid
+                    - C4H6O4
+                    - g
+                    - 110-15-6
+                    - '118.088'
+                    - '806'
+                    - '4.71'
+                    - '0.317'
+                    - '0.223'
+                    - '0.9922'
+                    - '-822.9'
+                    - '-697.3'
+                    - '403.4'
+                    - '-13.591'
+                -   - '314'
+                    - Sulfur dioxide
+                    - O2S
+                    - g
+                    - '7446-09-05'
+                    - '64.064'
+                    - '430.75'
+                    - '7.884'
+                    - '0.122'
+                    - '0.269'
+                    - '0.2454'
+                    - '-296.84'
+                    - '-300.12'
+                    - '248.1'
+                    - '0'
+                -   - '315'
+                    - Sulfur hexafluoride
+                    - F6S
+                    - g
+                    - 2551-62-4
+                    - '146.055'
+                    - '318.69'
+                    - '3.76'
+                    - '0.19852'
+                    - '0.282'
+                    - '0.2151'
+                    - '-1220.47'
+                    - '-1116.53'
+                    - '291.625'
+                    - '9.24'
+                -   - '316'
+                    - Sulfur trioxide
+                    - O3S
+                    - g
+                    - '7446-11-09'
+                    - '80.063'
+                    - '490.85'
+                    - '8.21'
+                    - '0.127'
+                    - '0.255'
+                    - '0.424'
+                    - '-395.72'
+                    - '-370.95'
+                    - '256.51'
+                    - '1.422'
+                -   - '317'
+                    - Terephthalic acid
+                    - C8H6O4
+                    - g
+                    - 100-21-0
+                    - '166.131'
+                    - '1113'
+                    - '3.95'
+                    - '0.424'
+                    - '0.181'
+                    - '1.0591'
+                    - '-717.9'
+                    - '-599'
+                    - '448'
+                    - '-30.576'
+                -   - '318'
+                    - o-Terphenyl
+                    - C18H14
+                    - g
+                    - 84-15-1
+                    - '230.304'
+                    - '857'
+                    - '2.99'
+                    - '0.731'
+                    - '0.307'
+                    - '0.5513'
+                    - '276.6'
+                    - '423'
+                    - '526.3'
+                    - '-90.53'
+                -   - '319'
+                    - Tetradecane
+                    - C14H30
+                    - g
+                    - 629-59-4
+                    - '198.388'
+                    - '693'
+                    - '1.57'
+                    - '0.897'
+                    - '0.244'
+                    - '0.643'
+                    - '-332.44'
+                    - '65.99'
+                    - '702.59'
+                    - '-87.3282'
+                -   - '320'
+                    - Tetrahydrofuran
+                    - C4H8O
+                    - g
+                    - 109-99-9
+                    - '72.106'
+                    - '540.15'
+                    - '5.19'
+                    - '0.224'
+                    - '0.259'
+                    - '0.2254'
+                    - '-184.18'
+                    - '-79.69'
+                    - '297.29'
+                    - '-23.25'
+                -   - '321'
+                    - 1,2,3,4-Tetrahydronaphthalene
+                    - C10H12
+                    - g
+                    - 119-64-2
+                    - '132.202'
+                    - '720'
+                    - '3.65'
+                    - '0.408'
+                    - '0.249'
+                    - '0.3353'
+                    - '26.61'
+                    - '167.1'
+                    - '369.64'
+                    - '-53.575'
+                -   - '322'
+                    - Tetrahydrothiophene
+                    - C4H8S
+                    - g
+                    - 110-01-0
+                    - '88.171'
+                    - '631.95'
+                    - '5.16'
+                    - '0.249'
+                    - '0.245'
+                    - '0.1996'
+                    - '-33.76'
+                    - '45.9'
+                    - '310'
+                    - '-27.6549'
+                -   - '323'
+                    - 2,2,3,3-Tetramethylbutane
+                    - C8H18
+                    - g
+                    - 594-82-1
+                    - '114.229'
+                    - '568'
+                    - '2.87'
+                    - '0.461'
+                    - '0.28'
+                    - '0.245'
+                    - '-225.6'
+                    - '22.39'
+                    - '389.3'
+                    - '-50.639'
+                -   - '324'
+                    - Thiophene
+                    - C4H4S
+                    - g
+                    - 110-02-1
+                    - '84.14'
+                    - '579.35'
+                    - '5.69'
+                    - '0.219'
+                    - '0.259'
+                    - '0.197'
+                    - '115.44'
+                    - '126.7'
+                    - '278.4'
+                    - '-24.352'
+                -   - '325'
+                    - Toluene
+                    - C7H8
+                    - g
+                    - 108-88-3
+                    - '92.138'
+                    - '591.75'
+                    - '4.108'
+                    - '0.316'
+                    - '0.264'
+                    - '0.264'
+                    - '50.17'
+                    - '122.2'
+                    - '320.99'
+                    - '-37.34'
+                -   - '326'
+                    - 1,1,2-Trichloroethane
+                    - C2H3Cl3
+                    - g
+                    - 79-00-5
+                    - '133.404'
+                    - '602'
+                    - '4.48'
+                    - '0.281'
+                    - '0.252'
+                    - '0.2591'
+                    - '-142'
+                    - '-80.97'
+                    - '337.1'
+                    - '-9.685'
+                -   - '327'
+                    - Tridecane
+                    - C13H28
+                    - g
+                    - 629-50-5
+                    - '184.361'
+                    - '675'
+                    - '1.68'
+                    - '0.826'
+                    - '0.247'
+                    - '0.6174'
+                    - '-311.77'
+                    - '57.71'
+                    - '663.37'
+                    - '-81.229'
+                -   - '328'
+                    - Triethyl amine
+                    - C6H15N
+                    - g
+                    - 121-44-8
+                    - '101.19'
+                    - '535.15'
+                    - '3.04'
+                    - '0.39'
+                    - '0.266'
+                    - '0.3162'
+                    - '-95.8'
+                    - '114.1'
+                    - '405.4'
+                    - '-40.405'
+                -   - '329'
+                    - Trimethyl amine
+                    - C3H9N
+                    - g
+                    - 75-50-3
+                    - '59.11'
+                    - '433.25'
+                    - '4.07'
+                    - '0.254'
+                    - '0.287'
+                    - '0.2062'
+                    - '-24.31'
+                    - '98.99'
+                    - '287'
+                    - '-22.449'
+                -   - '330'
+                    - 1,2,3-Trimethylbenzene
+                    - C9H12
+                    - g
+                    - 526-73-8
+                    - '120.192'
+                    - '664.5'
+                    - '3.454'
+                    - '0.414'
+                    - '0.259'
+                    - '0.3666'
+                    - '-9.5'
+                    - '126.1'
+                    - '380.5'
+                    - '-49.34'
+                -   - '331'
+                    - 1,2,4-Trimethylbenzene
+                    - C9H12
+                    - g
+                    - 95-63-6
+                    - '120.192'
+                    - '649.1'
+                    - '3.232'
+                    - '0.43'
+                    - '0.258'
+                    - '0.3787'
+                    - '-13.8'
+                    - '117.1'
+                    - '396.1'
+                    - '-49.307'
+                -   - '332'
+                    - 2,2,4-Trimethylpentane
+                    - C8H18
+                    - g
+                    - 540-84-1
+                    - '114.229'
+                    - '543.8'
+                    - '2.57'
+                    - '0.468'
+                    - '0.266'
+                    - '0.3035'
+                    - '-224.01'
+                    - '13.94'
+                    - '422.96'
+                    - '-50.6528'
+                -   - '333'
+                    - 2,3,3-Trimethylpentane
+                    - C8H18
+                    - g
+                    - 560-21-4
+                    - '114.229'
+                    - '573.5'
+                    - '2.82'
+                    - '0.455'
+                    - '0.269'
+                    - '0.2903'
+                    - '-218.45'
+                    - '18.28'
+                    - '427.02'
+                    - '-50.6876'
+                -   - '334'
+                    - 1,3,5-Trinitrobenzene
+                    - C6H3N3O6
+                    - g
+                    - 99-35-4
+                    - '213.105'
+                    - '846'
+                    - '3.39'
+                    - '0.479'
+                    - '0.231'
+                    - '0.8623'
+                    - '62.4'
+                    - '267.9'
+                    - '443.5'
+                    - '-26.867'
+                -   - '335'
+                    - 2,4,6-Trinitrotoluene
+                    - C7H5N3O6
+                    - g
+                    - 118-96-7
+                    - '227.131'
+                    - '828'
+                    - '3.04'
+                    - '0.572'
+                    - '0.253'
+                    - '0.8972'
+                    - '43.4'
+                    - '284.4'
+                    - '460.7'
+                    - '-32.959'
+                -   - '336'
+                    - Undecane
+                    - C11H24
+                    - g
+                    - 1120-21-4
+                    - '156.308'
+                    - '639'
+                    - '1.95'
+                    - '0.685'
+                    - '0.252'
+                    - '0.5303'
+                    - '-270.43'
+                    - '41.16'
+                    - '584.93'
+                    - '-69.036'
+                -   - '337'
+                    - 1-Undecanol
+                    - C11H24O
+                    - g
+                    - 112-42-5
+                    - '172.308'
+                    - '703.9'
+                    - '2.119'
+                    - '0.715'
+                    - '0.259'
+                    - '0.6236'
+                    - '-419'
+                    - '-91.77'
+                    - '636.3'
+                    - '-67.26'
+                -   - '338'
+                    - Vinyl acetate
+                    - C4H6O2
+                    - g
+                    - 108-05-4
+                    - '86.089'
+                    - '519.13'
+                    - '3.958'
+                    - '0.27'
+                    - '0.248'
+                    - '0.3513'
+                    - '-314.9'
+                    - '-227.9'
+                    - '328'
+                    - '-19.5'
+                -   - '339'
+                    - Vinyl acetylene
+                    - C4H4
+                    - g
+                    - 689-97-4
+                    - '52.075'
+                    - '454'
+                    - '4.86'
+                    - '0.205'
+                    - '0.264'
+                    - '0.1069'
+                    - '304.6'
+                    - '306'
+                    - '279.4'
+                    - '-23.62'
+                -   - '340'
+                    - Vinyl chloride
+                    - C2H3Cl
+                    - g
+                    - '1975-01-04'
+                    - '62.498'
+                    - '432'
+                    - '5.67'
+                    - '0.179'
+                    - '0.283'
+                    - '0.1001'
+                    - '28.45'
+                    - '41.95'
+                    - '273.54'
+                    - '-11.78'
+                -   - '341'
+                    - Vinyl trichlorosilane
+                    - C2H3Cl3Si
+                    - g
+                    - 75-94-5
+                    - '161.49'
+                    - '543.15'
+                    - '3.06'
+                    - '0.408'
+                    - '0.276'
+                    - '0.2815'
+                    - '-481.16'
+                    - '-425.514'
+                    - '373.966'
+                    - '-15.44'
+                -   - '342'
+                    - Water
+                    - H2O
+                    - g
+                    - 7732-18-5
+                    - '18.015'
+                    - '647.096'
+                    - '22.064'
+                    - '0.0559472'
+                    - '0.229'
+                    - '0.3449'
+                    - '-241.814'
+                    - '-228.59'
+                    - '188.724'
+                    - '0'
+                -   - '343'
+                    - m-Xylene
+                    - C8H10
+                    - g
+                    - 108-38-3
+                    - '106.165'
+                    - '617'
+                    - '3.541'
+                    - '0.375'
+                    - '0.259'
+                    - '0.3265'
+                    - '17.32'
+                    - '118.76'
+                    - '358.54'
+                    - '-43.318'
+                -   - '344'
+                    - o-Xylene
+                    - C8H10
+                    - g
+                    - 95-47-6
+                    - '106.165'
+                    - '630.3'
+                    - '3.732'
+                    - '0.37'
+                    - '0.264'
+                    - '0.3101'
+                    - '19.08'
+                    - '122'
+                    - '353.83'
+                    - '-43.33'
+                -   - '345'
+                    - p-Xylene
+                    - C8H10
+                    - g
+                    - 106-42-3
+                    - '106.165'
+                    - '616.2'
+                    - '3.511'
+                    - '0.378'
+                    - '0.259'
+                    - '0.3218'
+                    - '18.03'
+                    - '121.4'
+                    - '352.165'
+                    - '-43.33'
+                ITEMS: []
+                DATA: []
+            vapor-pressure:
+                TABLE-ID: 2
+                DESCRIPTION: Vapor pressure equation for mozichem-hub.
+                EQUATIONS:
+                    EQ-1:
+                        BODY:
+                        - parms['C1 | C1 | 1'] = parms['C1 | C1 | 1']/1
+                        - parms['C2 | C2 | 1'] = parms['C2 | C2 | 1']/1
+                        - parms['C3 | C3 | 1'] = parms['C3 | C3 | 1']/1
+                        - parms['C4 | C4 | 1'] = parms['C4 | C4 | 1']/1
+                        - parms['C5 | C5 | 1'] = parms['C5 | C5 | 1']/1
+                        - res['vapor-pressure | VaPr | Pa'] = math.exp(parms['C1 | C1 | 1']
+                            + parms['C2 | C2 | 1']/args['Temperature | T | K'] + parms['C3
+                            | C3 | 1']*math.log(args['Temperature | T | K']) + parms['C4 |
+                            C4 | 1']*(args['Temperature | T | K']**parms['C5 | C5 | 1']))
+                        BODY-INTEGRAL: None
+                        BODY-FIRST-DERIVATIVE: None
+                        BODY-SECOND-DERIVATIVE: None
+                STRUCTURE:
+                    COLUMNS:
+                    - No.
+                    - Name
+                    - Formula
+                    - State
+                    - CAS no.
+                    - C1
+                    - C2
+                    - C3
+                    - C4
+                    - C5
+                    - Tmin
+                    - P(Tmin)
+                    - Tmax
+                    - P(Tmax)
+                    - Eq
+                    SYMBOL:
+                    - '-'
+                    - '-'
+                    - '-'
+                    - '-'
+                    - '-'
+                    - C1
+                    - C2
+                    - C3
+                    - C4
+                    - C5
+                    - Tmin
+                    - P(Tmin)
+                    - Tmax
+                    - P(Tmax)
+                    - VaPr
+                    UNIT:
+                    - '-'
+                    - '-'
+                    - '-'
+                    - '-'
+                    - '-'
+                    - '1'
+                    - '1'
+                    - '1'
+                    - '1'
+                    - '1'
+                    - K
+                    - Pa
+                    - K
+                    - Pa
+                    - Pa
+                    CONVERSION:
+                    - 1.0
+                    - 1.0
+                    - 1.0
+                    - 1.0
+                    - 1.0
+                    - 1.0
+                    - 1.0
+                    - 1.0
+                    - 1.0
+                    - 1.0
+                    - 1.0
+                    - 1.0
+                    - 1.0
+                    - 1.0
+                    - 1.0
+                VALUES:
+                -   - '1'
+                    - Acetaldehyde
+                    - C2H4O
+                    - l
+                    - 75-07-0
+                    - '193.69'
+                    - '-8036.7'
+                    - '-29.502'
+                    - '4.37E-02'
+                    - '1'
+                    - '150.15'
+                    - '3.23E-01'
+                    - '466'
+                    - '5.57E+06'
+                    - '1'
+                -   - '2'
+                    - Acetamide
+                    - C2H5NO
+                    - l
+                    - 60-35-5
+                    - '125.81'
+                    - '-12376'
+                    - '-14.589'
+                    - '5.08E-06'
+                    - '2'
+                    - '353.33'
+                    - '3.36E+02'
+                    - '761'
+                    - '6.57E+06'
+                    - '1'
+                -   - '3'
+                    - Acetic acid
+                    - C2H4O2
+                    - l
+                    - 64-19-7
+                    - '53.27'
+                    - '-6304.5'
+                    - '-4.2985'
+                    - '8.89E-18'
+                    - '6'
+                    - '289.81'
+                    - '1.28E+03'
+                    - '591.95'
+                    - '5.74E+06'
+                    - '1'
+                -   - '4'
+                    - Acetic anhydride
+                    - C4H6O3
+                    - l
+                    - 108-24-7
+                    - '100.95'
+                    - '-8873.2'
+                    - '-11.451'
+                    - '6.13E-06'
+                    - '2'
+                    - '200.15'
+                    - '2.20E-02'
+                    - '606'
+                    - '3.97E+06'
+                    - '1'
+                -   - '5'
+                    - Acetone
+                    - C3H6O
+                    - l
+                    - 67-64-1
+                    - '69.006'
+                    - '-5599.6'
+                    - '-7.0985'
+                    - '6.22E-06'
+                    - '2'
+                    - '178.45'
+                    - '2.79E+00'
+                    - '508.2'
+                    - '4.71E+06'
+                    - '1'
+                -   - '6'
+                    - Acetonitrile
+                    - C2H3N
+                    - l
+                    - '1975-05-08'
+                    - '58.302'
+                    - '-5385.6'
+                    - '-5.4954'
+                    - '5.36E-06'
+                    - '2'
+                    - '229.32'
+                    - '1.87E+02'
+                    - '545.5'
+                    - '4.85E+06'
+                    - '1'
+                -   - '7'
+                    - Acetylene
+                    - C2H2
+                    - l
+                    - 74-86-2
+                    - '39.63'
+                    - '-2552.2'
+                    - '-2.78'
+                    - '2.39E-16'
+                    - '6'
+                    - '192.4'
+                    - '1.27E+05'
+                    - '308.3'
+                    - '6.11E+06'
+                    - '1'
+                -   - '8'
+                    - Acrolein
+                    - C3H4O
+                    - l
+                    - '0107-02-08'
+                    - '138.4'
+                    - '-7122.7'
+                    - '-19.638'
+                    - '2.64E-02'
+                    - '1'
+                    - '185.45'
+                    - '1.03E+01'
+                    - '506'
+                    - '5.02E+06'
+                    - '1'
+                -   - '9'
+                    - Acrylic acid
+                    - C3H4O2
+                    - l
+                    - '1979-10-07'
+                    - '46.745'
+                    - '-6587.1'
+                    - '-3.2208'
+                    - '5.23E-07'
+                    - '2'
+                    - '286.15'
+                    - '2.57E+02'
+                    - '615'
+                    - '5.66E+06'
+                    - '1'
+                -   - '10'
+                    - Acrylonitrile
+                    - C3H3N
+                    - l
+                    - 107-13-1
+                    - '87.604'
+                    - '-6392.7'
+                    - '-10.101'
+                    - '1.09E-05'
+                    - '2'
+                    - '189.63'
+                    - '3.68E+00'
+                    - '535'
+                    - '4.48E+06'
+                    - '1'
+                -   - '11'
+                    - Air
+                    - Mixture
+                    - l
+                    - 132259-10-0
+                    - '21.662'
+                    - '-692.39'
+                    - '-0.392'
+                    - '4.76E-03'
+                    - '1'
+                    - '59.15'
+                    - '5.64E+03'
+                    - '132.45'
+                    - '3.79E+06'
+                    - '1'
+                -   - '12'
+                    - Ammonia
+                    - H3N
+                    - l
+                    - 7664-41-7
+                    - '90.483'
+                    - '-4669.7'
+                    - '-11.607'
+                    - '1.72E-02'
+                    - '1'
+                    - '195.41'
+                    - '6.11E+03'
+                    - '405.65'
+                    - '1.13E+07'
+                    - '1'
+                -   - '13'
+                    - Anisole
+                    - C7H8O
+                    - l
+                    - 100-66-3
+                    - '128.06'
+                    - '-9307.7'
+                    - '-16.693'
+                    - '1.49E-02'
+                    - '1'
+                    - '235.65'
+                    - '2.45E+00'
+                    - '645.6'
+                    - '4.27E+06'
+                    - '1'
+                -   - '14'
+                    - Argon
+                    - Ar
+                    - l
+                    - 7440-37-1
+                    - '42.127'
+                    - '-1093.1'
+                    - '-4.1425'
+                    - '5.73E-05'
+                    - '2'
+                    - '83.78'
+                    - '6.87E+04'
+                    - '150.86'
+                    - '4.90E+06'
+                    - '1'
+                -   - '15'
+                    - Benzamide
+                    - C7H7NO
+                    - l
+                    - 55-21-0
+                    - '85.474'
+                    - '-11932'
+                    - '-8.3348'
+                    - '1.29E-18'
+                    - '6'
+                    - '403'
+                    - '3.55E+02'
+                    - '824'
+                    - '5.05E+06'
+                    - '1'
+                -   - '16'
+                    - Benzene
+                    - C6H6
+                    - l
+                    - 71-43-2
+                    - '83.107'
+                    - '-6486.2'
+                    - '-9.2194'
+                    - '6.98E-06'
+                    - '2'
+                    - '278.68'
+                    - '4.76E+03'
+                    - '562.05'
+                    - '4.88E+06'
+                    - '1'
+                -   - '17'
+                    - Benzenethiol
+                    - C6H6S
+                    - l
+                    - 108-98-5
+                    - '77.765'
+                    - '-8455.1'
+                    - '-7.7404'
+                    - '4.31E-18'
+                    - '6'
+                    - '258.27'
+                    - '7.68E+00'
+                    - '689'
+                    - '4.73E+06'
+                    - '1'
+                -   - '18'
+                    - Benzoic acid
+                    - C7H6O2
+                    - l
+                    - 65-85-0
+                    - '88.513'
+                    - '-11829'
+                    - '-8.6826'
+                    - '2.32E-19'
+                    - '6'
+                    - '395.45'
+                    - '7.96E+02'
+                    - '751'
+                    - '4.47E+06'
+                    - '1'
+                -   - '19'
+                    - Benzonitrile
+                    - C7H5N
+                    - l
+                    - 100-47-0
+                    - '138.5'
+                    - '-11195'
+                    - '-17.085'
+                    - '9.56E-06'
+                    - '2'
+                    - '260.4'
+                    - '3.08E+00'
+                    - '699.35'
+                    - '4.24E+06'
+                    - '1'
+                -   - '20'
+                    - Benzophenone
+                    - C13H10O
+                    - l
+                    - 119-61-9
+                    - '88.404'
+                    - '-11769'
+                    - '-8.9014'
+                    - '1.93E-18'
+                    - '6'
+                    - '321.35'
+                    - '1.49E+00'
+                    - '830'
+                    - '3.36E+06'
+                    - '1'
+                -   - '21'
+                    - Benzyl alcohol
+                    - C7H8O
+                    - l
+                    - 100-51-6
+                    - '100.68'
+                    - '-11059'
+                    - '-10.709'
+                    - '3.06E-18'
+                    - '6'
+                    - '257.85'
+                    - '1.88E-01'
+                    - '720.15'
+                    - '4.37E+06'
+                    - '1'
+                -   - '22'
+                    - Benzyl ethyl ether
+                    - C9H12O
+                    - l
+                    - 539-30-0
+                    - '68.541'
+                    - '-7886.2'
+                    - '-6.5804'
+                    - '2.43E-06'
+                    - '2'
+                    - '275.65'
+                    - '2.31E+01'
+                    - '662'
+                    - '3.11E+06'
+                    - '1'
+                -   - '23'
+                    - Benzyl mercaptan
+                    - C7H8S
+                    - l
+                    - 100-53-8
+                    - '118.02'
+                    - '-10527'
+                    - '-13.91'
+                    - '6.48E-06'
+                    - '2'
+                    - '243.95'
+                    - '2.98E-01'
+                    - '718'
+                    - '4.07E+06'
+                    - '1'
+                -   - '24'
+                    - Biphenyl
+                    - C12H10
+                    - l
+                    - 92-52-4
+                    - '77.314'
+                    - '-9910.4'
+                    - '-7.5079'
+                    - '2.24E-18'
+                    - '6'
+                    - '342.2'
+                    - '9.42E+01'
+                    - '773'
+                    - '3.41E+06'
+                    - '1'
+                -   - '25'
+                    - Bromine
+                    - Br2
+                    - l
+                    - 7726-95-6
+                    - '108.26'
+                    - '-6592'
+                    - '-14.16'
+                    - '1.60E-02'
+                    - '1'
+                    - '265.85'
+                    - '5.85E+03'
+                    - '584.15'
+                    - '1.03E+07'
+                    - '1'
+                -   - '26'
+                    - Bromobenzene
+                    - C6H5Br
+                    - l
+                    - 108-86-1
+                    - '63.749'
+                    - '-7130.2'
+                    - '-5.879'
+                    - '5.21E-18'
+                    - '6'
+                    - '242.43'
+                    - '7.84E+00'
+                    - '670.15'
+                    - '4.52E+06'
+                    - '1'
+                -   - '27'
+                    - Bromoethane
+                    - C2H5Br
+                    - l
+                    - 74-96-4
+                    - '62.217'
+                    - '-5113.3'
+                    - '-5.9761'
+                    - '4.72E-17'
+                    - '6'
+                    - '154.55'
+                    - '3.72E-01'
+                    - '503.8'
+                    - '6.29E+06'
+                    - '1'
+                -   - '28'
+                    - Bromomethane
+                    - CH3 Br
+                    - l
+                    - 74-83-9
+                    - '72.586'
+                    - '-4698.6'
+                    - '-7.9966'
+                    - '1.16E-05'
+                    - '2'
+                    - '179.47'
+                    - '1.95E+02'
+                    - '467'
+                    - '8.00E+06'
+                    - '1'
+                -   - '29'
+                    - 1,2-Butadiene
+                    - C4H6
+                    - l
+                    - 590-19-2
+                    - '39.714'
+                    - '-3769.9'
+                    - '-2.6407'
+                    - '6.94E-18'
+                    - '6'
+                    - '136.95'
+                    - '4.47E-01'
+                    - '452'
+                    - '4.36E+06'
+                    - '1'
+                -   - '30'
+                    - 1,3-Butadiene
+                    - C4H6
+                    - l
+                    - 106-99-0
+                    - '75.572'
+                    - '-4621.9'
+                    - '-8.5323'
+                    - '1.23E-05'
+                    - '2'
+                    - '164.25'
+                    - '6.92E+01'
+                    - '425'
+                    - '4.30E+06'
+                    - '1'
+                -   - '31'
+                    - Butane
+                    - C4H10
+                    - l
+                    - 106-97-8
+                    - '66.343'
+                    - '-4363.2'
+                    - '-7.046'
+                    - '9.45E-06'
+                    - '2'
+                    - '134.86'
+                    - '6.74E-01'
+                    - '425.12'
+                    - '3.77E+06'
+                    - '1'
+                -   - '32'
+                    - 1,2-Butanediol
+                    - C4H10O2
+                    - l
+                    - '0584-03-02'
+                    - '103.28'
+                    - '-11548'
+                    - '-10.925'
+                    - '4.26E-18'
+                    - '6'
+                    - '220'
+                    - '2.93E-04'
+                    - '680'
+                    - '5.20E+06'
+                    - '1'
+                -   - '33'
+                    - 1,3-Butanediol
+                    - C4H10O2
+                    - l
+                    - 107-88-0
+                    - '123.22'
+                    - '-12620'
+                    - '-13.986'
+                    - '3.93E-06'
+                    - '2'
+                    - '196.15'
+                    - '3.74E-07'
+                    - '676'
+                    - '4.03E+06'
+                    - '1'
+                -   - '34'
+                    - 1-Butanol
+                    - C4H10O
+                    - l
+                    - 71-36-3
+                    - '106.295'
+                    - '-9866.4'
+                    - '-11.655'
+                    - '1.08E-17'
+                    - '6'
+                    - '183.85'
+                    - '2.90E-04'
+                    - '563.1'
+                    - '4.40E+06'
+                    - '1'
+                -   - '35'
+                    - 2-Butanol
+                    - C4H10O
+                    - l
+                    - 78-92-2
+                    - '114.68'
+                    - '-9850.2'
+                    - '-12.963'
+                    - '1.87E-17'
+                    - '6'
+                    - '158.45'
+                    - '1.95E-06'
+                    - '535.9'
+                    - '4.18E+06'
+                    - '1'
+                -   - '36'
+                    - 1-Butene
+                    - C4H8
+                    - l
+                    - 106-98-9
+                    - '51.836'
+                    - '-4019.2'
+                    - '-4.5229'
+                    - '4.88E-17'
+                    - '6'
+                    - '87.8'
+                    - '6.94E-07'
+                    - '419.5'
+                    - '4.02E+06'
+                    - '1'
+                -   - '37'
+                    - cis-2-Butene
+                    - C4H8
+                    - l
+                    - 590-18-1
+                    - '72.541'
+                    - '-4691.2'
+                    - '-7.9776'
+                    - '1.04E-05'
+                    - '2'
+                    - '134.26'
+                    - '2.72E-01'
+                    - '435.5'
+                    - '4.24E+06'
+                    - '1'
+                -   - '38'
+                    - trans-2-Butene
+                    - C4H8
+                    - l
+                    - 624-64-6
+                    - '71.704'
+                    - '-4563.1'
+                    - '-7.9053'
+                    - '1.13E-05'
+                    - '2'
+                    - '167.62'
+                    - '7.45E+01'
+                    - '428.6'
+                    - '4.10E+06'
+                    - '1'
+                -   - '39'
+                    - Butyl acetate
+                    - C6H12O2
+                    - l
+                    - 123-86-4
+                    - '122.82'
+                    - '-9253.2'
+                    - '-14.99'
+                    - '1.05E-05'
+                    - '2'
+                    - '199.65'
+                    - '8.17E-02'
+                    - '575.4'
+                    - '3.09E+06'
+                    - '1'
+                -   - '40'
+                    - Butylbenzene
+                    - C10H14
+                    - l
+                    - 104-51-8
+                    - '101.22'
+                    - '-9255.4'
+                    - '-11.538'
+                    - '5.92E-06'
+                    - '2'
+                    - '185.3'
+                    - '1.54E-04'
+                    - '660.5'
+                    - '2.88E+06'
+                    - '1'
+                -   - '41'
+                    - Butyl mercaptan
+                    - C4H10S
+                    - l
+                    - 109-79-5
+                    - '65.382'
+                    - '-6262.4'
+                    - '-6.2585'
+                    - '1.49E-17'
+                    - '6'
+                    - '157.46'
+                    - '2.35E-03'
+                    - '570.1'
+                    - '3.97E+06'
+                    - '1'
+                -   - '42'
+                    - sec-Butyl mercaptan
+                    - C4H10S
+                    - l
+                    - 513-53-1
+                    - '60.649'
+                    - '-5785.9'
+                    - '-5.6113'
+                    - '1.59E-17'
+                    - '6'
+                    - '133.02'
+                    - '3.40E-05'
+                    - '554'
+                    - '4.06E+06'
+                    - '1'
+                -   - '43'
+                    - 1-Butyne
+                    - C4H6
+                    - l
+                    - 107-00-6
+                    - '77.004'
+                    - '-5054.5'
+                    - '-8.5665'
+                    - '1.02E-05'
+                    - '2'
+                    - '147.43'
+                    - '1.18E+00'
+                    - '440'
+                    - '4.60E+06'
+                    - '1'
+                -   - '44'
+                    - Butyraldehyde
+                    - C4H8O
+                    - l
+                    - 123-72-8
+                    - '99.33'
+                    - '-7083.6'
+                    - '-11.733'
+                    - '1.00E-05'
+                    - '2'
+                    - '176.75'
+                    - '3.17E-01'
+                    - '537.2'
+                    - '4.32E+06'
+                    - '1'
+                -   - '45'
+                    - Butyric acid
+                    - C4H8O2
+                    - l
+                    - 107-92-6
+                    - '93.815'
+                    - '-9942.2'
+                    - '-9.8019'
+                    - '9.31E-18'
+                    - '6'
+                    - '267.95'
+                    - '6.78E+00'
+                    - '615.7'
+                    - '4.07E+06'
+                    - '1'
+                -   - '46'
+                    - Butyronitrile
+                    - C4H7N
+                    - l
+                    - 109-74-0
+                    - '66.32'
+                    - '-6714.9'
+                    - '-6.3087'
+                    - '1.35E-17'
+                    - '6'
+                    - '161.25'
+                    - '6.18E-04'
+                    - '582.25'
+                    - '3.79E+06'
+                    - '1'
+                -   - '47'
+                    - Carbon dioxide
+                    - CO2
+                    - l
+                    - 124-38-9
+                    - '140.54'
+                    - '-4735'
+                    - '-21.268'
+                    - '4.09E-02'
+                    - '1'
+                    - '216.58'
+                    - '5.19E+05'
+                    - '304.21'
+                    - '7.39E+06'
+                    - '1'
+                -   - '48'
+                    - Carbon disulfide
+                    - CS2
+                    - l
+                    - 75-15-0
+                    - '67.114'
+                    - '-4820.4'
+                    - '-7.5303'
+                    - '9.17E-03'
+                    - '1'
+                    - '161.11'
+                    - '1.49E+00'
+                    - '552'
+                    - '8.04E+06'
+                    - '1'
+                -   - '49'
+                    - Carbon monoxide
+                    - CO
+                    - l
+                    - 630-08-0
+                    - '45.698'
+                    - '-1076.6'
+                    - '-4.8814'
+                    - '7.57E-05'
+                    - '2'
+                    - '68.15'
+                    - '1.54E+04'
+                    - '132.92'
+                    - '3.49E+06'
+                    - '1'
+                -   - '50'
+                    - Carbon tetrachloride
+                    - CCl4
+                    - l
+                    - 56-23-5
+                    - '78.441'
+                    - '-6128.1'
+                    - '-8.5766'
+                    - '6.85E-06'
+                    - '2'
+                    - '250.33'
+                    - '1.12E+03'
+                    - '556.35'
+                    - '4.54E+06'
+                    - '1'
+                -   - '51'
+                    - Carbon tetrafluoride
+                    - CF4
+                    - l
+                    - 75-73-0
+                    - '61.89'
+                    - '-2296.3'
+                    - '-7.086'
+                    - '3.47E-05'
+                    - '2'
+                    - '89.56'
+                    - '1.08E+02'
+                    - '227.51'
+                    - '3.74E+06'
+                    - '1'
+                -   - '52'
+                    - Chlorine
+                    - Cl2
+                    - l
+                    - 7782-50-5
+                    - '71.334'
+                    - '-3855'
+                    - '-8.5171'
+                    - '1.24E-02'
+                    - '1'
+                    - '172.12'
+                    - '1.37E+03'
+                    - '417.15'
+                    - '7.79E+06'
+                    - '1'
+                -   - '53'
+                    - Chlorobenzene
+                    - C6H5Cl
+                    - l
+                    - 108-90-7
+                    - '54.144'
+                    - '-6244.4'
+                    - '-4.5343'
+                    - '4.70E-18'
+                    - '6'
+                    - '227.95'
+                    - '8.45E+00'
+                    - '632.35'
+                    - '4.53E+06'
+                    - '1'
+                -   - '54'
+                    - Chloroethane
+                    - C2H5Cl
+                    - l
+                    - 75-00-3
+                    - '65.988'
+                    - '-4661.3'
+                    - '-6.8586'
+                    - '7.94E-06'
+                    - '2'
+                    - '134.8'
+                    - '1.25E-01'
+                    - '460.35'
+                    - '5.33E+06'
+                    - '1'
+                -   - '55'
+                    - Chloroform
+                    - CHCl3
+                    - l
+                    - 67-66-3
+                    - '146.43'
+                    - '-7792.3'
+                    - '-20.614'
+                    - '2.46E-02'
+                    - '1'
+                    - '207.15'
+                    - '5.25E+01'
+                    - '536.4'
+                    - '5.55E+06'
+                    - '1'
+                -   - '56'
+                    - Chloromethane
+                    - CH3 Cl
+                    - l
+                    - 74-87-3
+                    - '64.697'
+                    - '-4048.1'
+                    - '-6.8066'
+                    - '1.04E-05'
+                    - '2'
+                    - '175.43'
+                    - '8.71E+02'
+                    - '416.25'
+                    - '6.69E+06'
+                    - '1'
+                -   - '57'
+                    - 1-Chloropropane
+                    - C3H7Cl
+                    - l
+                    - 540-54-5
+                    - '79.24'
+                    - '-5718.8'
+                    - '-8.789'
+                    - '8.45E-06'
+                    - '2'
+                    - '150.35'
+                    - '6.96E-02'
+                    - '503.15'
+                    - '4.58E+06'
+                    - '1'
+                -   - '58'
+                    - 2-Chloropropane
+                    - C3H7Cl
+                    - l
+                    - 75-29-6
+                    - '46.854'
+                    - '-4445.5'
+                    - '-3.6533'
+                    - '1.33E-17'
+                    - '6'
+                    - '155.97'
+                    - '9.08E-01'
+                    - '489'
+                    - '4.51E+06'
+                    - '1'
+                -   - '59'
+                    - m-Cresol
+                    - C7H8O
+                    - l
+                    - 108-39-4
+                    - '95.403'
+                    - '-10581'
+                    - '-10.004'
+                    - '4.30E-18'
+                    - '6'
+                    - '285.39'
+                    - '5.86E+00'
+                    - '705.85'
+                    - '4.52E+06'
+                    - '1'
+                -   - '60'
+                    - o-Cresol
+                    - C7H8O
+                    - l
+                    - 95-48-7
+                    - '210.88'
+                    - '-13928'
+                    - '-29.483'
+                    - '2.52E-02'
+                    - '1'
+                    - '304.19'
+                    - '6.53E+01'
+                    - '697.55'
+                    - '5.06E+06'
+                    - '1'
+                -   - '61'
+                    - p-Cresol
+                    - C7H8O
+                    - l
+                    - 106-44-5
+                    - '118.53'
+                    - '-11957'
+                    - '-13.293'
+                    - '8.70E-18'
+                    - '6'
+                    - '307.93'
+                    - '3.45E+01'
+                    - '704.65'
+                    - '5.15E+06'
+                    - '1'
+                -   - '62'
+                    - Cumene
+                    - C9H12
+                    - l
+                    - 98-82-8
+                    - '102.81'
+                    - '-8674.6'
+                    - '-11.922'
+                    - '7.00E-06'
+                    - '2'
+                    - '177.14'
+                    - '4.71E-04'
+                    - '631'
+                    - '3.23E+06'
+                    - '1'
+                -   - '63'
+                    - Cyanogen
+                    - C2N2
+                    - l
+                    - 460-19-5
+                    - '81.565'
+                    - '-4808.9'
+                    - '-9.3748'
+                    - '1.39E-05'
+                    - '2'
+                    - '245.25'
+                    - '7.39E+04'
+                    - '400.15'
+                    - '5.96E+06'
+                    - '1'
+                -   - '64'
+                    - Cyclobutane
+                    - C4H8
+                    - l
+                    - 287-23-0
+                    - '85.899'
+                    - '-4884.4'
+                    - '-10.883'
+                    - '1.49E-02'
+                    - '1'
+                    - '182.48'
+                    - '1.80E+02'
+                    - '459.93'
+                    - '4.99E+06'
+                    - '1'
+                -   - '65'
+                    - Cyclohexane
+                    - C6H12
+                    - l
+                    - 110-82-7
+                    - '51.087'
+                    - '-5226.4'
+                    - '-4.2278'
+                    - '9.76E-18'
+                    - '6'
+                    - '279.69'
+                    - '5.36E+03'
+                    - '553.8'
+                    - '4.09E+06'
+                    - '1'
+                -   - '66'
+                    - Cyclohexanol
+                    - C6H12O
+                    - l
+                    - 108-93-0
+                    - '189.19'
+                    - '-14337'
+                    - '-24.148'
+                    - '1.07E-05'
+                    - '2'
+                    - '296.6'
+                    - '7.65E+01'
+                    - '650.1'
+                    - '4.27E+06'
+                    - '1'
+                -   - '67'
+                    - Cyclohexanone
+                    - C6H10O
+                    - l
+                    - 108-94-1
+                    - '85.424'
+                    - '-7944.4'
+                    - '-9.2862'
+                    - '5.00E-06'
+                    - '2'
+                    - '242'
+                    - '6.80E+00'
+                    - '653'
+                    - '3.99E+06'
+                    - '1'
+                -   - '68'
+                    - Cyclohexene
+                    - C6H10
+                    - l
+                    - 110-83-8
+                    - '88.184'
+                    - '-6624.9'
+                    - '-10.059'
+                    - '8.26E-06'
+                    - '2'
+                    - '169.67'
+                    - '1.04E-01'
+                    - '560.4'
+                    - '4.39E+06'
+                    - '1'
+                -   - '69'
+                    - Cyclopentane
+                    - C5H10
+                    - l
+                    - 287-92-3
+                    - '66.341'
+                    - '-5198.5'
+                    - '-6.8103'
+                    - '6.19E-06'
+                    - '2'
+                    - '179.28'
+                    - '9.07E+00'
+                    - '511.7'
+                    - '4.51E+06'
+                    - '1'
+                -   - '70'
+                    - Cyclopentene
+                    - C5H8
+                    - l
+                    - 142-29-0
+                    - '67.952'
+                    - '-5187.5'
+                    - '-7.0785'
+                    - '6.82E-06'
+                    - '2'
+                    - '138.13'
+                    - '1.28E-02'
+                    - '507'
+                    - '4.80E+06'
+                    - '1'
+                -   - '71'
+                    - Cyclopropane
+                    - C3H6
+                    - l
+                    - 75-19-4
+                    - '40.608'
+                    - '-3179.6'
+                    - '-2.8937'
+                    - '5.61E-17'
+                    - '6'
+                    - '145.59'
+                    - '7.80E+01'
+                    - '398'
+                    - '5.49E+06'
+                    - '1'
+                -   - '72'
+                    - Cyclohexyl mercaptan
+                    - C6H12S
+                    - l
+                    - 1569-69-3
+                    - '85.146'
+                    - '-7843.7'
+                    - '-9.2982'
+                    - '5.18E-06'
+                    - '2'
+                    - '189.64'
+                    - '8.24E-03'
+                    - '664'
+                    - '3.97E+06'
+                    - '1'
+                -   - '73'
+                    - Decanal
+                    - C10H20O
+                    - l
+                    - 112-31-2
+                    - '201.64'
+                    - '-15133'
+                    - '-26.264'
+                    - '1.46E-05'
+                    - '2'
+                    - '267.15'
+                    - '4.86E-01'
+                    - '674.2'
+                    - '2.60E+06'
+                    - '1'
+                -   - '74'
+                    - Decane
+                    - C10H22
+                    - l
+                    - 124-18-5
+                    - '112.73'
+                    - '-9749.6'
+                    - '-13.245'
+                    - '7.13E-06'
+                    - '2'
+                    - '243.51'
+                    - '1.39E+00'
+                    - '617.7'
+                    - '2.09E+06'
+                    - '1'
+                -   - '75'
+                    - Decanoic acid
+                    - C10H20O2
+                    - l
+                    - 334-48-5
+                    - '123.36'
+                    - '-14680'
+                    - '-13.474'
+                    - '1.95E-18'
+                    - '6'
+                    - '304.55'
+                    - '1.50E-01'
+                    - '722.1'
+                    - '2.23E+06'
+                    - '1'
+                -   - '76'
+                    - 1-Decanol
+                    - C10H22O
+                    - l
+                    - 112-30-1
+                    - '156.239'
+                    - '-15212'
+                    - '-18.424'
+                    - '8.50E-18'
+                    - '6'
+                    - '280.05'
+                    - '1.51E-01'
+                    - '688'
+                    - '2.31E+06'
+                    - '1'
+                -   - '77'
+                    - 1-Decene
+                    - C10H20
+                    - l
+                    - '0872-05-09'
+                    - '68.401'
+                    - '-7776.9'
+                    - '-6.4637'
+                    - '6.38E-18'
+                    - '6'
+                    - '206.89'
+                    - '2.59E-02'
+                    - '616.6'
+                    - '2.22E+06'
+                    - '1'
+                -   - '78'
+                    - Decyl mercaptan
+                    - C10H22S
+                    - l
+                    - 0143-10-2
+                    - '91.91'
+                    - '-10565'
+                    - '-9.5957'
+                    - '5.70E-18'
+                    - '6'
+                    - '247.56'
+                    - '2.59E-02'
+                    - '696'
+                    - '2.13E+06'
+                    - '1'
+                -   - '79'
+                    - 1-Decyne
+                    - C10H18
+                    - l
+                    - 764-93-2
+                    - '142.94'
+                    - '-11119'
+                    - '-17.818'
+                    - '1.10E-05'
+                    - '2'
+                    - '229.15'
+                    - '1.60E-01'
+                    - '619.85'
+                    - '2.36E+06'
+                    - '1'
+                -   - '80'
+                    - Deuterium
+                    - D2
+                    - l
+                    - 7782-39-0
+                    - '18.947'
+                    - '-154.47'
+                    - '-0.5723'
+                    - '3.89E-02'
+                    - '1'
+                    - '18.73'
+                    - '1.72E+04'
+                    - '38.35'
+                    - '1.66E+06'
+                    - '1'
+                -   - '81'
+                    - 1,1-Dibromoethane
+                    - C2H4Br2
+                    - l
+                    - 557-91-5
+                    - '62.711'
+                    - '-6503.5'
+                    - '-5.7669'
+                    - '1.04E-06'
+                    - '2'
+                    - '210.15'
+                    - '2.64E+00'
+                    - '628'
+                    - '6.03E+06'
+                    - '1'
+                -   - '82'
+                    - 1,2-Dibromoethane
+                    - C2H4Br2
+                    - l
+                    - 106-93-4
+                    - '43.751'
+                    - '-5587.7'
+                    - '-3.0891'
+                    - '8.27E-07'
+                    - '2'
+                    - '282.85'
+                    - '7.53E+02'
+                    - '650.15'
+                    - '5.38E+06'
+                    - '1'
+                -   - '83'
+                    - Dibromomethane
+                    - CH2Br2
+                    - l
+                    - 74-95-3
+                    - '86.295'
+                    - '-7010.3'
+                    - '-9.5972'
+                    - '6.78E-06'
+                    - '2'
+                    - '220.6'
+                    - '2.13E+01'
+                    - '611'
+                    - '7.17E+06'
+                    - '1'
+                -   - '84'
+                    - Dibutyl ether
+                    - C8H18O
+                    - l
+                    - 142-96-1
+                    - '72.227'
+                    - '-7537.6'
+                    - '-7.0596'
+                    - '9.14E-18'
+                    - '6'
+                    - '175.3'
+                    - '7.14E-04'
+                    - '584.1'
+                    - '2.46E+06'
+                    - '1'
+                -   - '85'
+                    - m-Dichlorobenzene
+                    - C6H4Cl2
+                    - l
+                    - 541-73-1
+                    - '53.187'
+                    - '-6827.5'
+                    - '-4.3233'
+                    - '2.31E-18'
+                    - '6'
+                    - '248.39'
+                    - '6.41E+00'
+                    - '683.95'
+                    - '4.07E+06'
+                    - '1'
+                -   - '86'
+                    - o-Dichlorobenzene
+                    - C6H4Cl2
+                    - l
+                    - 95-50-1
+                    - '77.105'
+                    - '-8111.1'
+                    - '-7.8886'
+                    - '2.73E-06'
+                    - '2'
+                    - '256.15'
+                    - '6.49E+00'
+                    - '705'
+                    - '4.07E+06'
+                    - '1'
+                -   - '87'
+                    - p-Dichlorobenzene
+                    - C6H4Cl2
+                    - l
+                    - 106-46-7
+                    - '88.31'
+                    - '-8463.4'
+                    - '-9.6308'
+                    - '4.58E-06'
+                    - '2'
+                    - '326.14'
+                    - '1.23E+03'
+                    - '684.75'
+                    - '4.07E+06'
+                    - '1'
+                -   - '88'
+                    - 1,1-Dichloroethane
+                    - C2H4Cl2
+                    - l
+                    - 75-34-3
+                    - '66.611'
+                    - '-5493.1'
+                    - '-6.7301'
+                    - '5.36E-06'
+                    - '2'
+                    - '176.19'
+                    - '2.21E+00'
+                    - '523'
+                    - '5.11E+06'
+                    - '1'
+                -   - '89'
+                    - 1,2-Dichloroethane
+                    - C2H4Cl2
+                    - l
+                    - '0107-06-02'
+                    - '92.355'
+                    - '-6920.4'
+                    - '-10.651'
+                    - '9.14E-06'
+                    - '2'
+                    - '237.49'
+                    - '2.37E+02'
+                    - '561.6'
+                    - '5.32E+06'
+                    - '1'
+                -   - '90'
+                    - Dichloromethane
+                    - CH2Cl2
+                    - l
+                    - '1975-09-02'
+                    - '101.6'
+                    - '-6541.6'
+                    - '-12.247'
+                    - '1.23E-05'
+                    - '2'
+                    - '178.01'
+                    - '5.93E+00'
+                    - '510'
+                    - '6.09E+06'
+                    - '1'
+                -   - '91'
+                    - 1,1-Dichloropropane
+                    - C3H6Cl2
+                    - l
+                    - 78-99-9
+                    - '83.495'
+                    - '-6661.4'
+                    - '-9.2386'
+                    - '6.77E-06'
+                    - '2'
+                    - '200'
+                    - '4.52E+00'
+                    - '560'
+                    - '4.24E+06'
+                    - '1'
+                -   - '92'
+                    - 1,2-Dichloropropane
+                    - C3H6Cl2
+                    - l
+                    - 78-87-5
+                    - '65.955'
+                    - '-6015.6'
+                    - '-6.5509'
+                    - '4.32E-06'
+                    - '2'
+                    - '172.71'
+                    - '8.25E-02'
+                    - '572'
+                    - '4.23E+06'
+                    - '1'
+                -   - '93'
+                    - Diethanol amine
+                    - C4H11NO2
+                    - l
+                    - 111-42-2
+                    - '106.38'
+                    - '-13714'
+                    - '-11.06'
+                    - '3.26E-18'
+                    - '6'
+                    - '301.15'
+                    - '1.02E-01'
+                    - '736.6'
+                    - '4.26E+06'
+                    - '1'
+                -   - '94'
+                    - Diethyl amine
+                    - C4H11N
+                    - l
+                    - 109-89-7
+                    - '49.314'
+                    - '-4949'
+                    - '-3.9256'
+                    - '9.20E-18'
+                    - '6'
+                    - '223.35'
+                    - '3.74E+02'
+                    - '496.6'
+                    - '3.67E+06'
+                    - '1'
+                -   - '95'
+                    - Diethyl ether
+                    - C4H10O
+                    - l
+                    - 60-29-7
+                    - '136.9'
+                    - '-6954.3'
+                    - '-19.254'
+                    - '2.45E-02'
+                    - '1'
+                    - '156.85'
+                    - '3.95E-01'
+                    - '466.7'
+                    - '3.64E+06'
+                    - '1'
+                -   - '96'
+                    - Diethyl sulfide
+                    - C4H10S
+                    - l
+                    - 352-93-2
+                    - '46.705'
+                    - '-5177.4'
+                    - '-3.5985'
+                    - '1.71E-06'
+                    - '2'
+                    - '169.2'
+                    - '9.93E-02'
+                    - '557.15'
+                    - '3.96E+06'
+                    - '1'
+                -   - '97'
+                    - 1,1-Difluoroethane
+                    - C2H4F2
+                    - l
+                    - 75-37-6
+                    - '73.491'
+                    - '-4385.9'
+                    - '-8.1851'
+                    - '1.30E-05'
+                    - '2'
+                    - '154.56'
+                    - '6.45E+01'
+                    - '386.44'
+                    - '4.51E+06'
+                    - '1'
+                -   - '98'
+                    - 1,2-Difluoroethane
+                    - C2H4F2
+                    - l
+                    - 624-72-6
+                    - '84.625'
+                    - '-5217.4'
+                    - '-9.871'
+                    - '1.31E-05'
+                    - '2'
+                    - '215'
+                    - '2.83E+03'
+                    - '445'
+                    - '4.37E+06'
+                    - '1'
+                -   - '99'
+                    - Difluoromethane
+                    - CH2F2
+                    - l
+                    - '1975-10-05'
+                    - '69.132'
+                    - '-3847.7'
+                    - '-7.5868'
+                    - '1.51E-05'
+                    - '2'
+                    - '136.95'
+                    - '5.43E+01'
+                    - '351.255'
+                    - '5.76E+06'
+                    - '1'
+                -   - '100'
+                    - Di-isopropyl amine
+                    - C6H15N
+                    - l
+                    - 108-18-9
+                    - '462.84'
+                    - '-18227'
+                    - '-73.734'
+                    - '9.28E-02'
+                    - '1'
+                    - '176.85'
+                    - '4.47E-03'
+                    - '523.1'
+                    - '3.20E+06'
+                    - '1'
+                -   - '101'
+                    - Di-isopropyl ether
+                    - C6H14O
+                    - l
+                    - 108-20-3
+                    - '41.631'
+                    - '-4668.7'
+                    - '-2.8551'
+                    - '6.37E-04'
+                    - '1'
+                    - '187.65'
+                    - '6.86E+00'
+                    - '500.05'
+                    - '2.87E+06'
+                    - '1'
+                -   - '102'
+                    - Di-isopropyl ketone
+                    - C7H14O
+                    - l
+                    - 565-80-0
+                    - '50.868'
+                    - '-6036.5'
+                    - '-4.066'
+                    - '1.13E-06'
+                    - '2'
+                    - '204.81'
+                    - '8.21E-01'
+                    - '576'
+                    - '3.02E+06'
+                    - '1'
+                -   - '103'
+                    - 1,1-Dimethoxyethane
+                    - C4H10O2
+                    - l
+                    - 534-15-6
+                    - '53.637'
+                    - '-5251.2'
+                    - '-4.5649'
+                    - '1.68E-17'
+                    - '6'
+                    - '159.95'
+                    - '9.45E-02'
+                    - '507.8'
+                    - '3.77E+06'
+                    - '1'
+                -   - '104'
+                    - 1,2-Dimethoxypropane
+                    - C5H12O2
+                    - l
+                    - 7778-85-0
+                    - '62.097'
+                    - '-6174.9'
+                    - '-5.715'
+                    - '1.23E-17'
+                    - '6'
+                    - '226.1'
+                    - '4.50E+01'
+                    - '543'
+                    - '3.45E+06'
+                    - '1'
+                -   - '105'
+                    - Dimethyl acetylene
+                    - C4H6
+                    - l
+                    - 503-17-3
+                    - '66.592'
+                    - '-4999.8'
+                    - '-6.8387'
+                    - '6.68E-06'
+                    - '2'
+                    - '240.91'
+                    - '6.12E+03'
+                    - '473.2'
+                    - '4.87E+06'
+                    - '1'
+                -   - '106'
+                    - Dimethyl amine
+                    - C2H7N
+                    - l
+                    - 124-40-3
+                    - '71.738'
+                    - '-5302'
+                    - '-7.3324'
+                    - '6.42E-17'
+                    - '6'
+                    - '180.96'
+                    - '7.56E+01'
+                    - '437.2'
+                    - '5.26E+06'
+                    - '1'
+                -   - '107'
+                    - 2,3-Dimethylbutane
+                    - C6H14
+                    - l
+                    - 79-29-8
+                    - '77.161'
+                    - '-5691.1'
+                    - '-8.501'
+                    - '8.03E-06'
+                    - '2'
+                    - '145.19'
+                    - '1.52E-02'
+                    - '500'
+                    - '3.13E+06'
+                    - '1'
+                -   - '108'
+                    - 1,1-Dimethylcyclohexane
+                    - C8H16
+                    - l
+                    - 590-66-9
+                    - '81.184'
+                    - '-6927'
+                    - '-8.8498'
+                    - '5.46E-06'
+                    - '2'
+                    - '239.66'
+                    - '6.06E+01'
+                    - '591.15'
+                    - '2.94E+06'
+                    - '1'
+                -   - '109'
+                    - cis-1,2-Dimethylcyclohexane
+                    - C8H16
+                    - l
+                    - '2207-01-04'
+                    - '78.952'
+                    - '-7075.4'
+                    - '-8.4344'
+                    - '4.50E-06'
+                    - '2'
+                    - '223.16'
+                    - '6.41E+00'
+                    - '606.15'
+                    - '2.94E+06'
+                    - '1'
+                -   - '110'
+                    - trans-1,2-Dimethylcyclohexane
+                    - C8H16
+                    - l
+                    - 6876-23-9
+                    - '78.429'
+                    - '-6882.1'
+                    - '-8.4129'
+                    - '4.98E-06'
+                    - '2'
+                    - '184.99'
+                    - '8.04E-02'
+                    - '596.15'
+                    - '2.94E+06'
+                    - '1'
+                -   - '111'
+                    - Dimethyl disulfide
+                    - C2H6S2
+                    - l
+                    - 624-92-0
+                    - '81.045'
+                    - '-6941.3'
+                    - '-8.777'
+                    - '5.55E-06'
+                    - '2'
+                    - '188.44'
+                    - '2.07E-01'
+                    - '615'
+                    - '5.36E+06'
+                    - '1'
+                -   - '112'
+                    - Dimethyl ether
+                    - C2H6O
+                    - l
+                    - 0115-10-6
+                    - '44.704'
+                    - '-3525.6'
+                    - '-3.4444'
+                    - '5.46E-17'
+                    - '6'
+                    - '131.65'
+                    - '3.05E+00'
+                    - '400.1'
+                    - '5.27E+06'
+                    - '1'
+                -   - '113'
+                    - N,N-Dimethyl formamide
+                    - C3H7NO
+                    - l
+                    - '1968-12-02'
+                    - '82.762'
+                    - '-7955.5'
+                    - '-8.8038'
+                    - '4.24E-06'
+                    - '2'
+                    - '212.72'
+                    - '1.95E-01'
+                    - '649.6'
+                    - '4.37E+06'
+                    - '1'
+                -   - '114'
+                    - 2,3-Dimethylpentane
+                    - C7H16
+                    - l
+                    - 565-59-3
+                    - '78.335'
+                    - '-6348.7'
+                    - '-8.5105'
+                    - '6.43E-06'
+                    - '2'
+                    - '160'
+                    - '1.26E-02'
+                    - '537.3'
+                    - '2.88E+06'
+                    - '1'
+                -   - '115'
+                    - Dimethyl phthalate
+                    - C10H10O4
+                    - l
+                    - 0131-11-3
+                    - '72.517'
+                    - '-10415'
+                    - '-6.755'
+                    - '1.33E-06'
+                    - '2'
+                    - '274.18'
+                    - '3.72E-02'
+                    - '766'
+                    - '2.78E+06'
+                    - '1'
+                -   - '116'
+                    - Dimethylsilane
+                    - C2H8Si
+                    - l
+                    - 1111-74-6
+                    - '63.08'
+                    - '-4062.3'
+                    - '-6.425'
+                    - '1.51E-16'
+                    - '6'
+                    - '122.93'
+                    - '4.15E-01'
+                    - '402'
+                    - '3.56E+06'
+                    - '1'
+                -   - '117'
+                    - Dimethyl sulfide
+                    - C2H6S
+                    - l
+                    - 75-18-3
+                    - '84.39'
+                    - '-5740.6'
+                    - '-9.6454'
+                    - '1.01E-05'
+                    - '2'
+                    - '174.88'
+                    - '7.86E+00'
+                    - '503.04'
+                    - '5.53E+06'
+                    - '1'
+                -   - '118'
+                    - Dimethyl sulfoxide
+                    - C2H6OS
+                    - l
+                    - 67-68-5
+                    - '56.273'
+                    - '-7620.6'
+                    - '-4.6279'
+                    - '4.38E-07'
+                    - '2'
+                    - '291.67'
+                    - '5.02E+01'
+                    - '729'
+                    - '5.65E+06'
+                    - '1'
+                -   - '119'
+                    - Dimethyl terephthalate
+                    - C10H10O4
+                    - l
+                    - 120-61-6
+                    - '43.541'
+                    - '-8204.8'
+                    - '-2.7519'
+                    - '1.05E-18'
+                    - '6'
+                    - '413.8'
+                    - '1.26E+03'
+                    - '772'
+                    - '2.78E+06'
+                    - '1'
+                -   - '120'
+                    - 1,4-Dioxane
+                    - C4H8O2
+                    - l
+                    - 123-91-1
+                    - '44.494'
+                    - '-5406.7'
+                    - '-3.1287'
+                    - '2.89E-18'
+                    - '6'
+                    - '284.95'
+                    - '2.53E+03'
+                    - '587'
+                    - '5.16E+06'
+                    - '1'
+                -   - '121'
+                    - Diphenyl ether
+                    - C12H10O
+                    - l
+                    - 101-84-8
+                    - '59.969'
+                    - '-8585.5'
+                    - '-5.1538'
+                    - '2.00E-18'
+                    - '6'
+                    - '300.03'
+                    - '7.09E+00'
+                    - '766.8'
+                    - '3.10E+06'
+                    - '1'
+                -   - '122'
+                    - Dipropyl amine
+                    - C6H15N
+                    - l
+                    - 142-84-7
+                    - '54'
+                    - '-6018.5'
+                    - '-4.4981'
+                    - '9.97E-18'
+                    - '6'
+                    - '210.15'
+                    - '3.69E+00'
+                    - '550'
+                    - '3.11E+06'
+                    - '1'
+                -   - '123'
+                    - Dodecane
+                    - C12H26
+                    - l
+                    - 112-40-3
+                    - '137.47'
+                    - '-11976'
+                    - '-16.698'
+                    - '8.09E-06'
+                    - '2'
+                    - '263.57'
+                    - '6.15E-01'
+                    - '658'
+                    - '1.82E+06'
+                    - '1'
+                -   - '124'
+                    - Eicosane
+                    - C20H42
+                    - l
+                    - 112-95-8
+                    - '203.66'
+                    - '-19441'
+                    - '-25.525'
+                    - '8.84E-06'
+                    - '2'
+                    - '309.58'
+                    - '9.26E-03'
+                    - '768'
+                    - '1.18E+06'
+                    - '1'
+                -   - '125'
+                    - Ethane
+                    - C2H6
+                    - l
+                    - 74-84-0
+                    - '51.857'
+                    - '-2598.7'
+                    - '-5.1283'
+                    - '1.49E-05'
+                    - '2'
+                    - '90.35'
+                    - '1.13E+00'
+                    - '305.32'
+                    - '4.85E+06'
+                    - '1'
+                -   - '126'
+                    - Ethanol
+                    - C2H6O
+                    - l
+                    - 64-17-5
+                    - '73.304'
+                    - '-7122.3'
+                    - '-7.1424'
+                    - '2.89E-06'
+                    - '2'
+                    - '159.05'
+                    - '4.96E-04'
+                    - '514'
+                    - '6.11E+06'
+                    - '1'
+                -   - '127'
+                    - Ethyl acetate
+                    - C4H8O2
+                    - l
+                    - 141-78-6
+                    - '66.824'
+                    - '-6227.6'
+                    - '-6.41'
+                    - '1.79E-17'
+                    - '6'
+                    - '189.6'
+                    - '1.43E+00'
+                    - '523.3'
+                    - '3.85E+06'
+                    - '1'
+                -   - '128'
+                    - Ethyl amine
+                    - C2H7N
+                    - l
+                    - '1975-04-07'
+                    - '81.56'
+                    - '-5596.9'
+                    - '-9.0779'
+                    - '8.79E-06'
+                    - '2'
+                    - '192.15'
+                    - '1.52E+02'
+                    - '456.15'
+                    - '5.59E+06'
+                    - '1'
+                -   - '129'
+                    - Ethylbenzene
+                    - C8H10
+                    - l
+                    - 100-41-4
+                    - '89.063'
+                    - '-7733.7'
+                    - '-9.917'
+                    - '5.99E-06'
+                    - '2'
+                    - '178.2'
+                    - '3.91E-03'
+                    - '617.15'
+                    - '3.59E+06'
+                    - '1'
+                -   - '130'
+                    - Ethyl benzoate
+                    - C9H10O2
+                    - l
+                    - 93-89-0
+                    - '52.923'
+                    - '-7531.7'
+                    - '-4.2347'
+                    - '1.18E-06'
+                    - '2'
+                    - '238.45'
+                    - '1.69E-01'
+                    - '698'
+                    - '3.20E+06'
+                    - '1'
+                -   - '131'
+                    - 2-Ethyl butanoic acid
+                    - C6H12O2
+                    - l
+                    - '1988-09-05'
+                    - '90.464'
+                    - '-10243'
+                    - '-9.2836'
+                    - '5.26E-18'
+                    - '6'
+                    - '258.15'
+                    - '4.63E-01'
+                    - '655'
+                    - '3.40E+06'
+                    - '1'
+                -   - '132'
+                    - Ethyl butyrate
+                    - C6H12O2
+                    - l
+                    - 105-54-4
+                    - '57.661'
+                    - '-6346.5'
+                    - '-5.032'
+                    - '8.25E-18'
+                    - '6'
+                    - '175.15'
+                    - '1.04E-02'
+                    - '571'
+                    - '2.94E+06'
+                    - '1'
+                -   - '133'
+                    - Ethylcyclohexane
+                    - C8H16
+                    - l
+                    - 1678-91-7
+                    - '80.208'
+                    - '-7203.2'
+                    - '-8.6023'
+                    - '4.59E-06'
+                    - '2'
+                    - '161.84'
+                    - '3.57E-04'
+                    - '609.15'
+                    - '3.04E+06'
+                    - '1'
+                -   - '134'
+                    - Ethylcyclopentane
+                    - C7H14
+                    - l
+                    - 1640-89-7
+                    - '88.671'
+                    - '-7012.7'
+                    - '-10.045'
+                    - '7.46E-06'
+                    - '2'
+                    - '134.71'
+                    - '3.71E-06'
+                    - '569.5'
+                    - '3.41E+06'
+                    - '1'
+                -   - '135'
+                    - Ethylene
+                    - C2H4
+                    - l
+                    - 74-85-1
+                    - '53.963'
+                    - '-2443'
+                    - '-5.5643'
+                    - '1.91E-05'
+                    - '2'
+                    - '104'
+                    - '1.26E+02'
+                    - '282.34'
+                    - '5.03E+06'
+                    - '1'
+                -   - '136'
+                    - Ethylenediamine
+                    - C2H8N2
+                    - l
+                    - 107-15-3
+                    - '73.51'
+                    - '-7572.7'
+                    - '-7.1435'
+                    - '1.21E-17'
+                    - '6'
+                    - '284.29'
+                    - '6.78E+02'
+                    - '593'
+                    - '6.29E+06'
+                    - '1'
+                -   - '137'
+                    - Ethylene glycol
+                    - C2H6O2
+                    - l
+                    - 107-21-1
+                    - '84.09'
+                    - '-10411'
+                    - '-8.1976'
+                    - '1.65E-18'
+                    - '6'
+                    - '260.15'
+                    - '2.19E-01'
+                    - '720'
+                    - '8.26E+06'
+                    - '1'
+                -   - '138'
+                    - Ethyleneimine
+                    - C2H5N
+                    - l
+                    - 151-56-4
+                    - '66.51'
+                    - '-6019.2'
+                    - '-6.3332'
+                    - '1.04E-17'
+                    - '6'
+                    - '195.2'
+                    - '9.71E+00'
+                    - '537'
+                    - '6.85E+06'
+                    - '1'
+                -   - '139'
+                    - Ethylene oxide
+                    - C2H4O
+                    - l
+                    - 75-21-8
+                    - '91.944'
+                    - '-5293.4'
+                    - '-11.682'
+                    - '1.49E-02'
+                    - '1'
+                    - '160.65'
+                    - '7.79E+00'
+                    - '469.15'
+                    - '7.26E+06'
+                    - '1'
+                -   - '140'
+                    - Ethyl formate
+                    - C3H6O2
+                    - l
+                    - 109-94-4
+                    - '73.833'
+                    - '-5817'
+                    - '-7.809'
+                    - '6.32E-06'
+                    - '2'
+                    - '193.55'
+                    - '1.81E+01'
+                    - '508.4'
+                    - '4.71E+06'
+                    - '1'
+                -   - '141'
+                    - 2-Ethyl hexanoic acid
+                    - C8H16O2
+                    - l
+                    - 149-57-5
+                    - '117.52'
+                    - '-12991'
+                    - '-12.895'
+                    - '6.13E-18'
+                    - '6'
+                    - '235'
+                    - '2.86E-04'
+                    - '674.6'
+                    - '2.79E+06'
+                    - '1'
+                -   - '142'
+                    - Ethylhexyl ether
+                    - C8H18O
+                    - l
+                    - 5756-43-4
+                    - '77.523'
+                    - '-7978.8'
+                    - '-7.7757'
+                    - '1.01E-17'
+                    - '6'
+                    - '180'
+                    - '7.60E-04'
+                    - '583'
+                    - '2.46E+06'
+                    - '1'
+                -   - '143'
+                    - Ethylisopropyl ether
+                    - C5H12O
+                    - l
+                    - 625-54-7
+                    - '57.723'
+                    - '-5236.9'
+                    - '-5.2136'
+                    - '2.30E-17'
+                    - '6'
+                    - '140'
+                    - '4.31E-03'
+                    - '489'
+                    - '3.42E+06'
+                    - '1'
+                -   - '144'
+                    - Ethylisopropyl ketone
+                    - C6H12O
+                    - l
+                    - 565-69-5
+                    - '57.459'
+                    - '-6356.8'
+                    - '-4.9545'
+                    - '5.20E-18'
+                    - '6'
+                    - '204.15'
+                    - '9.70E-01'
+                    - '567'
+                    - '3.29E+06'
+                    - '1'
+                -   - '145'
+                    - Ethyl mercaptan
+                    - C2H6S
+                    - l
+                    - '1975-08-01'
+                    - '65.551'
+                    - '-5027.4'
+                    - '-6.6853'
+                    - '6.32E-06'
+                    - '2'
+                    - '125.26'
+                    - '1.14E-03'
+                    - '499.15'
+                    - '5.49E+06'
+                    - '1'
+                -   - '146'
+                    - Ethyl propionate
+                    - C5H10O2
+                    - l
+                    - 105-37-3
+                    - '105.64'
+                    - '-8007'
+                    - '-12.477'
+                    - '9.00E-06'
+                    - '2'
+                    - '199.25'
+                    - '7.80E-01'
+                    - '546'
+                    - '3.34E+06'
+                    - '1'
+                -   - '147'
+                    - Ethylpropyl ether
+                    - C5H12O
+                    - l
+                    - 628-32-0
+                    - '86.898'
+                    - '-6646.4'
+                    - '-9.5758'
+                    - '5.96E-17'
+                    - '6'
+                    - '145.65'
+                    - '1.61E-03'
+                    - '500.23'
+                    - '3.37E+06'
+                    - '1'
+                -   - '148'
+                    - Ethyltrichlorosilane
+                    - C2H5Cl3Si
+                    - l
+                    - 115-21-9
+                    - '62.614'
+                    - '-6148.2'
+                    - '-5.84'
+                    - '1.09E-17'
+                    - '6'
+                    - '167.55'
+                    - '1.85E-02'
+                    - '559.95'
+                    - '3.32E+06'
+                    - '1'
+                -   - '149'
+                    - Fluorine
+                    - F2
+                    - l
+                    - 7782-41-4
+                    - '42.393'
+                    - '-1103.3'
+                    - '-4.1203'
+                    - '5.78E-05'
+                    - '2'
+                    - '53.48'
+                    - '2.53E+02'
+                    - '144.12'
+                    - '5.17E+06'
+                    - '1'
+                -   - '150'
+                    - Fluorobenzene
+                    - C6H5F
+                    - l
+                    - '0462-06-06'
+                    - '51.915'
+                    - '-5439'
+                    - '-4.2896'
+                    - '8.75E-18'
+                    - '6'
+                    - '230.94'
+                    - '1.51E+02'
+                    - '560.09'
+                    - '4.54E+06'
+                    - '1'
+                -   - '151'
+                    - Fluoroethane
+                    - C2H5F
+                    - l
+                    - 353-36-6
+                    - '56.639'
+                    - '-3576.5'
+                    - '-5.5801'
+                    - '9.90E-06'
+                    - '2'
+                    - '129.95'
+                    - '8.37E+00'
+                    - '375.31'
+                    - '5.01E+06'
+                    - '1'
+                -   - '152'
+                    - Fluoromethane
+                    - CH3F
+                    - l
+                    - 593-53-3
+                    - '59.123'
+                    - '-3043.7'
+                    - '-6.1845'
+                    - '1.66E-05'
+                    - '2'
+                    - '131.35'
+                    - '4.33E+02'
+                    - '317.42'
+                    - '5.88E+06'
+                    - '1'
+                -   - '153'
+                    - Formaldehyde
+                    - CH2O
+                    - l
+                    - 50-00-0
+                    - '101.51'
+                    - '-4917.2'
+                    - '-13.765'
+                    - '2.20E-02'
+                    - '1'
+                    - '181.15'
+                    - '8.87E+02'
+                    - '408'
+                    - '6.59E+06'
+                    - '1'
+                -   - '154'
+                    - Formamide
+                    - CH3NO
+                    - l
+                    - '1975-12-07'
+                    - '100.3'
+                    - '-10763'
+                    - '-10.946'
+                    - '3.85E-06'
+                    - '2'
+                    - '275.6'
+                    - '1.04E+00'
+                    - '771'
+                    - '7.75E+06'
+                    - '1'
+                -   - '155'
+                    - Formic acid
+                    - CH2O2
+                    - l
+                    - 64-18-6
+                    - '50.323'
+                    - '-5378.2'
+                    - '-4.203'
+                    - '3.47E-06'
+                    - '2'
+                    - '281.45'
+                    - '2.40E+03'
+                    - '588'
+                    - '5.81E+06'
+                    - '1'
+                -   - '156'
+                    - Furan
+                    - C4H4O
+                    - l
+                    - 110-00-9
+                    - '74.738'
+                    - '-5417'
+                    - '-8.0636'
+                    - '7.47E-06'
+                    - '2'
+                    - '187.55'
+                    - '5.00E+01'
+                    - '490.15'
+                    - '5.55E+06'
+                    - '1'
+                -   - '157'
+                    - Helium-4
+                    - He
+                    - l
+                    - 7440-59-7
+                    - '11.533'
+                    - '-8.99'
+                    - '0.6724'
+                    - '2.74E-01'
+                    - '1'
+                    - '1.76'
+                    - '1.46E+03'
+                    - '5.2'
+                    - '2.29E+05'
+                    - '1'
+                -   - '158'
+                    - Heptadecane
+                    - C17H36
+                    - l
+                    - 629-78-7
+                    - '156.95'
+                    - '-15557'
+                    - '-18.966'
+                    - '6.46E-06'
+                    - '2'
+                    - '295.13'
+                    - '4.65E-02'
+                    - '736'
+                    - '1.34E+06'
+                    - '1'
+                -   - '159'
+                    - Heptanal
+                    - C7H14O
+                    - l
+                    - 111-71-7
+                    - '92.252'
+                    - '-8349'
+                    - '-10.274'
+                    - '5.93E-06'
+                    - '2'
+                    - '229.8'
+                    - '1.45E+00'
+                    - '616.8'
+                    - '3.16E+06'
+                    - '1'
+                -   - '160'
+                    - Heptane
+                    - C7H16
+                    - l
+                    - 142-82-5
+                    - '87.829'
+                    - '-6996.4'
+                    - '-9.8802'
+                    - '7.21E-06'
+                    - '2'
+                    - '182.57'
+                    - '1.83E-01'
+                    - '540.2'
+                    - '2.72E+06'
+                    - '1'
+                -   - '161'
+                    - Heptanoic acid
+                    - C7H14O2
+                    - l
+                    - 111-14-8
+                    - '120.47'
+                    - '-13106'
+                    - '-13.31'
+                    - '5.84E-18'
+                    - '6'
+                    - '265.83'
+                    - '4.34E-02'
+                    - '677.3'
+                    - '3.04E+06'
+                    - '1'
+                -   - '162'
+                    - 1-Heptanol
+                    - C7H16O
+                    - l
+                    - 111-70-6
+                    - '147.41'
+                    - '-13466'
+                    - '-17.353'
+                    - '1.13E-17'
+                    - '6'
+                    - '239.15'
+                    - '1.95E-02'
+                    - '632.3'
+                    - '3.01E+06'
+                    - '1'
+                -   - '163'
+                    - 2-Heptanol
+                    - C7H16O
+                    - l
+                    - 543-49-7
+                    - '124.23'
+                    - '-11637'
+                    - '-14.148'
+                    - '6.95E-17'
+                    - '5.7'
+                    - '230'
+                    - '3.68E-02'
+                    - '608.3'
+                    - '3.00E+06'
+                    - '1'
+                -   - '164'
+                    - 3-Heptanone
+                    - C7H14O
+                    - l
+                    - 106-35-4
+                    - '78.463'
+                    - '-8077.2'
+                    - '-7.9062'
+                    - '8.05E-18'
+                    - '6'
+                    - '234.15'
+                    - '2.30E+00'
+                    - '606.6'
+                    - '2.92E+06'
+                    - '1'
+                -   - '165'
+                    - 2-Heptanone
+                    - C7H14O
+                    - l
+                    - 110-43-0
+                    - '75.494'
+                    - '-7896.5'
+                    - '-7.5047'
+                    - '8.91E-18'
+                    - '6'
+                    - '238.15'
+                    - '3.54E+00'
+                    - '611.4'
+                    - '2.95E+06'
+                    - '1'
+                -   - '166'
+                    - 1-Heptene
+                    - C7H14
+                    - l
+                    - 592-76-7
+                    - '65.922'
+                    - '-6189'
+                    - '-6.3629'
+                    - '2.01E-17'
+                    - '6'
+                    - '154.12'
+                    - '1.86E-03'
+                    - '537.4'
+                    - '2.92E+06'
+                    - '1'
+                -   - '167'
+                    - Heptyl mercaptan
+                    - C7H16S
+                    - l
+                    - '1639-09-04'
+                    - '79.858'
+                    - '-8501.8'
+                    - '-8.1043'
+                    - '8.15E-18'
+                    - '6'
+                    - '229.92'
+                    - '3.05E-01'
+                    - '645'
+                    - '2.77E+06'
+                    - '1'
+                -   - '168'
+                    - 1-Heptyne
+                    - C7H12
+                    - l
+                    - 628-71-7
+                    - '59.083'
+                    - '-6031.8'
+                    - '-5.3072'
+                    - '1.44E-17'
+                    - '6'
+                    - '192.22'
+                    - '8.15E-01'
+                    - '547'
+                    - '3.21E+06'
+                    - '1'
+                -   - '169'
+                    - Hexadecane
+                    - C16H34
+                    - l
+                    - 544-76-3
+                    - '156.06'
+                    - '-15015'
+                    - '-18.941'
+                    - '6.82E-06'
+                    - '2'
+                    - '291.31'
+                    - '9.23E-02'
+                    - '723'
+                    - '1.41E+06'
+                    - '1'
+                -   - '170'
+                    - Hexanal
+                    - C6H12O
+                    - l
+                    - 66-25-1
+                    - '81.507'
+                    - '-7776.8'
+                    - '-8.4516'
+                    - '1.51E-17'
+                    - '6'
+                    - '217.15'
+                    - '1.25E+00'
+                    - '591'
+                    - '3.46E+06'
+                    - '1'
+                -   - '171'
+                    - Hexane
+                    - C6H14
+                    - l
+                    - 110-54-3
+                    - '104.65'
+                    - '-6995.5'
+                    - '-12.702'
+                    - '1.24E-05'
+                    - '2'
+                    - '177.83'
+                    - '9.02E-01'
+                    - '507.6'
+                    - '3.05E+06'
+                    - '1'
+                -   - '172'
+                    - Hexanoic acid
+                    - C6H12O2
+                    - l
+                    - 142-62-1
+                    - '114.05'
+                    - '-12332'
+                    - '-12.45'
+                    - '5.63E-18'
+                    - '6'
+                    - '269.25'
+                    - '2.43E-01'
+                    - '660.2'
+                    - '3.28E+06'
+                    - '1'
+                -   - '173'
+                    - 1-Hexanol
+                    - C6H14O
+                    - l
+                    - 111-27-3
+                    - '135.421'
+                    - '-12288'
+                    - '-15.732'
+                    - '1.27E-17'
+                    - '6'
+                    - '228.55'
+                    - '2.25E-02'
+                    - '611.3'
+                    - '3.44E+06'
+                    - '1'
+                -   - '174'
+                    - 2-Hexanol
+                    - C6H14O
+                    - l
+                    - 626-93-7
+                    - '109.42'
+                    - '-10449'
+                    - '-12.051'
+                    - '2.61E-46'
+                    - '16'
+                    - '223'
+                    - '7.44E-02'
+                    - '585.3'
+                    - '3.30E+06'
+                    - '1'
+                -   - '175'
+                    - 2-Hexanone
+                    - C6H12O
+                    - l
+                    - 591-78-6
+                    - '107.44'
+                    - '-8528.6'
+                    - '-12.679'
+                    - '8.46E-06'
+                    - '2'
+                    - '217.35'
+                    - '1.45E+00'
+                    - '587.61'
+                    - '3.29E+06'
+                    - '1'
+                -   - '176'
+                    - 3-Hexanone
+                    - C6H12O
+                    - l
+                    - 589-38-8
+                    - '73.155'
+                    - '-7242.9'
+                    - '-7.2569'
+                    - '1.27E-17'
+                    - '6'
+                    - '217.5'
+                    - '2.22E+00'
+                    - '582.82'
+                    - '3.32E+06'
+                    - '1'
+                -   - '177'
+                    - 1-Hexene
+                    - C6H12
+                    - l
+                    - 592-41-6
+                    - '51.024'
+                    - '-4986.4'
+                    - '-4.2463'
+                    - '1.68E-17'
+                    - '6'
+                    - '133.39'
+                    - '7.96E-04'
+                    - '504'
+                    - '3.21E+06'
+                    - '1'
+                -   - '178'
+                    - 3-Hexyne
+                    - C6H10
+                    - l
+                    - 928-49-4
+                    - '47.091'
+                    - '-5104'
+                    - '-3.6371'
+                    - '5.16E-04'
+                    - '1'
+                    - '170.05'
+                    - '2.20E-01'
+                    - '544'
+                    - '3.54E+06'
+                    - '1'
+                -   - '179'
+                    - Hexyl mercaptan
+                    - C6H14S
+                    - l
+                    - 111-31-9
+                    - '68.467'
+                    - '-7390.5'
+                    - '-6.5456'
+                    - '7.76E-18'
+                    - '6'
+                    - '192.62'
+                    - '1.31E-02'
+                    - '623'
+                    - '3.08E+06'
+                    - '1'
+                -   - '180'
+                    - 1-Hexyne
+                    - C6H10
+                    - l
+                    - '0693-02-07'
+                    - '133.2'
+                    - '-7492.9'
+                    - '-18.405'
+                    - '2.21E-02'
+                    - '1'
+                    - '141.25'
+                    - '3.92E-04'
+                    - '516.2'
+                    - '3.64E+06'
+                    - '1'
+                -   - '181'
+                    - 2-Hexyne
+                    - C6H10
+                    - l
+                    - 764-35-2
+                    - '123.71'
+                    - '-7639'
+                    - '-16.451'
+                    - '1.65E-02'
+                    - '1'
+                    - '183.65'
+                    - '5.40E-01'
+                    - '549'
+                    - '3.53E+06'
+                    - '1'
+                -   - '182'
+                    - Hydrazine
+                    - H4N2
+                    - l
+                    - '0302-01-02'
+                    - '76.858'
+                    - '-7245.2'
+                    - '-8.22'
+                    - '6.16E-03'
+                    - '1'
+                    - '274.69'
+                    - '4.08E+02'
+                    - '653.15'
+                    - '1.47E+07'
+                    - '1'
+                -   - '183'
+                    - Hydrogen
+                    - H2
+                    - l
+                    - 1333-74-0
+                    - '12.69'
+                    - '-94.9'
+                    - '1.1125'
+                    - '3.29E-04'
+                    - '2'
+                    - '13.95'
+                    - '7.21E+03'
+                    - '33.19'
+                    - '1.32E+06'
+                    - '1'
+                -   - '184'
+                    - Hydrogen bromide
+                    - HBr
+                    - l
+                    - 10035-10-6
+                    - '29.315'
+                    - '-2424.5'
+                    - '-1.1354'
+                    - '2.38E-18'
+                    - '6'
+                    - '185.15'
+                    - '2.95E+04'
+                    - '363.15'
+                    - '8.46E+06'
+                    - '1'
+                -   - '185'
+                    - Hydrogen chloride
+                    - HCl
+                    - l
+                    - 7647-01-0
+                    - '104.27'
+                    - '-3731.2'
+                    - '-15.047'
+                    - '3.13E-02'
+                    - '1'
+                    - '158.97'
+                    - '1.35E+04'
+                    - '324.65'
+                    - '8.36E+06'
+                    - '1'
+                -   - '186'
+                    - Hydrogen cyanide
+                    - CHN
+                    - l
+                    - 74-90-8
+                    - '36.75'
+                    - '-3927.1'
+                    - '-2.1245'
+                    - '3.89E-17'
+                    - '6'
+                    - '259.83'
+                    - '1.87E+04'
+                    - '456.65'
+                    - '5.35E+06'
+                    - '1'
+                -   - '187'
+                    - Hydrogen fluoride
+                    - HF
+                    - l
+                    - 7664-39-3
+                    - '59.544'
+                    - '-4143.8'
+                    - '-6.1764'
+                    - '1.42E-05'
+                    - '2'
+                    - '189.79'
+                    - '3.37E+02'
+                    - '461.15'
+                    - '6.49E+06'
+                    - '1'
+                -   - '188'
+                    - Hydrogen sulfide
+                    - H2S
+                    - l
+                    - '7783-06-04'
+                    - '85.584'
+                    - '-3839.9'
+                    - '-11.199'
+                    - '1.88E-02'
+                    - '1'
+                    - '187.68'
+                    - '2.29E+04'
+                    - '373.53'
+                    - '9.00E+06'
+                    - '1'
+                -   - '189'
+                    - Isobutyric acid
+                    - C4H8O2
+                    - l
+                    - 79-31-2
+                    - '110.38'
+                    - '-10540'
+                    - '-12.262'
+                    - '1.43E-17'
+                    - '6'
+                    - '227.15'
+                    - '7.82E-02'
+                    - '605'
+                    - '3.68E+06'
+                    - '1'
+                -   - '190'
+                    - Isopropyl amine
+                    - C3H9N
+                    - l
+                    - 75-31-0
+                    - '136.66'
+                    - '-7201.5'
+                    - '-18.934'
+                    - '2.23E-02'
+                    - '1'
+                    - '177.95'
+                    - '7.73E+00'
+                    - '471.85'
+                    - '4.54E+06'
+                    - '1'
+                -   - '191'
+                    - Malonic acid
+                    - C3H4O4
+                    - l
+                    - 141-82-2
+                    - '122.92'
+                    - '-16258'
+                    - '-13.113'
+                    - '2.06E-18'
+                    - '6'
+                    - '407.95'
+                    - '7.03E+01'
+                    - '805'
+                    - '5.65E+06'
+                    - '1'
+                -   - '192'
+                    - Methacrylic acid
+                    - C4H6O2
+                    - l
+                    - 79-41-4
+                    - '109.53'
+                    - '-10410'
+                    - '-12.289'
+                    - '3.20E-06'
+                    - '2'
+                    - '288.15'
+                    - '5.86E+01'
+                    - '662'
+                    - '4.81E+06'
+                    - '1'
+                -   - '193'
+                    - Methane
+                    - CH4
+                    - l
+                    - 74-82-8
+                    - '39.205'
+                    - '-1324.4'
+                    - '-3.4366'
+                    - '3.10E-05'
+                    - '2'
+                    - '90.69'
+                    - '1.17E+04'
+                    - '190.56'
+                    - '4.59E+06'
+                    - '1'
+                -   - '194'
+                    - Methanol
+                    - CH4O
+                    - l
+                    - 67-56-1
+                    - '82.718'
+                    - '-6904.5'
+                    - '-8.8622'
+                    - '7.47E-06'
+                    - '2'
+                    - '175.47'
+                    - '1.11E-01'
+                    - '512.5'
+                    - '8.15E+06'
+                    - '1'
+                -   - '195'
+                    - N-Methyl acetamide
+                    - C3H7NO
+                    - l
+                    - 79-16-3
+                    - '79.128'
+                    - '-9523.9'
+                    - '-7.7355'
+                    - '3.16E-18'
+                    - '6'
+                    - '301.15'
+                    - '2.86E+01'
+                    - '718'
+                    - '5.00E+06'
+                    - '1'
+                -   - '196'
+                    - Methyl acetate
+                    - C3H6O2
+                    - l
+                    - 79-20-9
+                    - '61.267'
+                    - '-5618.6'
+                    - '-5.6473'
+                    - '2.11E-17'
+                    - '6'
+                    - '175.15'
+                    - '1.02E+00'
+                    - '506.55'
+                    - '4.70E+06'
+                    - '1'
+                -   - '197'
+                    - Methyl acetylene
+                    - C3H4
+                    - l
+                    - 74-99-7
+                    - '50.242'
+                    - '-3811.9'
+                    - '-4.2526'
+                    - '6.53E-17'
+                    - '6'
+                    - '170.45'
+                    - '4.15E+02'
+                    - '402.4'
+                    - '5.62E+06'
+                    - '1'
+                -   - '198'
+                    - Methyl acrylate
+                    - C4H6O2
+                    - l
+                    - 96-33-3
+                    - '107.69'
+                    - '-7027.2'
+                    - '-13.916'
+                    - '1.52E-02'
+                    - '1'
+                    - '196.32'
+                    - '4.07E+00'
+                    - '536'
+                    - '4.28E+06'
+                    - '1'
+                -   - '199'
+                    - Methyl amine
+                    - CH5N
+                    - l
+                    - 74-89-5
+                    - '75.206'
+                    - '-5082.8'
+                    - '-8.0919'
+                    - '8.11E-06'
+                    - '2'
+                    - '179.69'
+                    - '1.77E+02'
+                    - '430.05'
+                    - '7.41E+06'
+                    - '1'
+                -   - '200'
+                    - Methyl benzoate
+                    - C8H8O2
+                    - l
+                    - 93-58-3
+                    - '84.828'
+                    - '-9334.7'
+                    - '-8.7063'
+                    - '6.17E-18'
+                    - '6'
+                    - '260.75'
+                    - '1.81E+00'
+                    - '693'
+                    - '3.59E+06'
+                    - '1'
+                -   - '201'
+                    - 3-Methyl-1,2-butadiene
+                    - C5H8
+                    - l
+                    - 598-25-4
+                    - '66.575'
+                    - '-5213.4'
+                    - '-6.7693'
+                    - '4.81E-06'
+                    - '2'
+                    - '159.53'
+                    - '7.28E-01'
+                    - '490'
+                    - '3.83E+06'
+                    - '1'
+                -   - '202'
+                    - 2-Methylbutane
+                    - C5H12
+                    - l
+                    - 78-78-4
+                    - '71.308'
+                    - '-4976'
+                    - '-7.7169'
+                    - '8.73E-06'
+                    - '2'
+                    - '113.25'
+                    - '1.21E-04'
+                    - '460.4'
+                    - '3.37E+06'
+                    - '1'
+                -   - '203'
+                    - 2-Methylbutanoic acid
+                    - C5H10O2
+                    - l
+                    - 116-53-0
+                    - '85.383'
+                    - '-9575.4'
+                    - '-8.6164'
+                    - '5.61E-18'
+                    - '6'
+                    - '193'
+                    - '6.94E-05'
+                    - '643'
+                    - '3.89E+06'
+                    - '1'
+                -   - '204'
+                    - 3-Methyl-1-butanol
+                    - C5H12O
+                    - l
+                    - 123-51-3
+                    - '121.85'
+                    - '-10976'
+                    - '-13.869'
+                    - '1.43E-17'
+                    - '6'
+                    - '155.95'
+                    - '8.67E-09'
+                    - '577.2'
+                    - '3.92E+06'
+                    - '1'
+                -   - '205'
+                    - 2-Methyl-1-butene
+                    - C5H10
+                    - l
+                    - 563-46-2
+                    - '93.131'
+                    - '-5525.4'
+                    - '-11.852'
+                    - '1.42E-02'
+                    - '1'
+                    - '135.58'
+                    - '2.05E-02'
+                    - '465'
+                    - '3.47E+06'
+                    - '1'
+                -   - '206'
+                    - 2-Methyl-2-butene
+                    - C5H10
+                    - l
+                    - 513-35-9
+                    - '83.927'
+                    - '-5640.5'
+                    - '-9.6453'
+                    - '1.11E-05'
+                    - '2'
+                    - '139.39'
+                    - '1.94E-02'
+                    - '470'
+                    - '3.39E+06'
+                    - '1'
+                -   - '207'
+                    - 2-Methyl-1-butene-3-yne
+                    - C5H6
+                    - l
+                    - 78-80-8
+                    - '95.453'
+                    - '-5448.8'
+                    - '-12.384'
+                    - '1.56E-02'
+                    - '1'
+                    - '160.15'
+                    - '2.92E+00'
+                    - '492'
+                    - '4.47E+06'
+                    - '1'
+                -   - '208'
+                    - Methylbutyl ether
+                    - C5H12O
+                    - l
+                    - 628-28-4
+                    - '60.164'
+                    - '-5621.7'
+                    - '-5.53'
+                    - '1.86E-17'
+                    - '6'
+                    - '157.48'
+                    - '2.99E-02'
+                    - '512.74'
+                    - '3.38E+06'
+                    - '1'
+                -   - '209'
+                    - Methylbutyl sulfide
+                    - C5H12S
+                    - l
+                    - 628-29-5
+                    - '96.344'
+                    - '-7856.3'
+                    - '-11.058'
+                    - '7.31E-06'
+                    - '2'
+                    - '175.3'
+                    - '4.61E-03'
+                    - '593'
+                    - '3.46E+06'
+                    - '1'
+                -   - '210'
+                    - 3-Methyl-1-butyne
+                    - C5H8
+                    - l
+                    - 598-23-2
+                    - '69.459'
+                    - '-5250'
+                    - '-7.1125'
+                    - '7.93E-17'
+                    - '6'
+                    - '183.45'
+                    - '4.36E+01'
+                    - '463.2'
+                    - '4.20E+06'
+                    - '1'
+                -   - '211'
+                    - Methyl butyrate
+                    - C5H10O2
+                    - l
+                    - 623-42-7
+                    - '71.87'
+                    - '-6885.7'
+                    - '-7.0944'
+                    - '1.49E-17'
+                    - '6'
+                    - '187.35'
+                    - '1.34E-01'
+                    - '554.5'
+                    - '3.48E+06'
+                    - '1'
+                -   - '212'
+                    - Methylchlorosilane
+                    - CH5ClSi
+                    - l
+                    - 993-00-0
+                    - '95.984'
+                    - '-5401.7'
+                    - '-11.829'
+                    - '1.81E-05'
+                    - '2'
+                    - '139.05'
+                    - '4.12E-01'
+                    - '442'
+                    - '4.17E+06'
+                    - '1'
+                -   - '213'
+                    - Methylcyclohexane
+                    - C7H14
+                    - l
+                    - 108-87-2
+                    - '92.684'
+                    - '-7080.8'
+                    - '-10.695'
+                    - '8.14E-06'
+                    - '2'
+                    - '146.58'
+                    - '1.52E-04'
+                    - '572.1'
+                    - '3.49E+06'
+                    - '1'
+                -   - '214'
+                    - 1-Methylcyclohexanol
+                    - C7H14O
+                    - l
+                    - 590-67-0
+                    - '134.63'
+                    - '-10682'
+                    - '-16.511'
+                    - '8.44E-06'
+                    - '2'
+                    - '299.15'
+                    - '2.57E+02'
+                    - '686'
+                    - '3.99E+06'
+                    - '1'
+                -   - '215'
+                    - cis-2-Methylcyclohexanol
+                    - C7H14O
+                    - l
+                    - 7443-70-1
+                    - '125.1'
+                    - '-10288'
+                    - '-15.157'
+                    - '1.09E-05'
+                    - '2'
+                    - '280.15'
+                    - '4.56E+01'
+                    - '614'
+                    - '3.81E+06'
+                    - '1'
+                -   - '216'
+                    - trans-2-Methylcyclohexanol
+                    - C7H14O
+                    - l
+                    - 7443-52-9
+                    - '54.179'
+                    - '-7477.2'
+                    - '-4.22'
+                    - '3.52E-18'
+                    - '6'
+                    - '269.15'
+                    - '1.62E+01'
+                    - '617'
+                    - '3.77E+06'
+                    - '1'
+                -   - '217'
+                    - Methylcyclopentane
+                    - C6H12
+                    - l
+                    - 96-37-7
+                    - '55.368'
+                    - '-5149.8'
+                    - '-5.0136'
+                    - '3.22E-06'
+                    - '2'
+                    - '130.73'
+                    - '2.25E-04'
+                    - '532.7'
+                    - '3.76E+06'
+                    - '1'
+                -   - '218'
+                    - 1-Methylcyclopentene
+                    - C6H10
+                    - l
+                    - 693-89-0
+                    - '52.732'
+                    - '-5286.9'
+                    - '-4.4509'
+                    - '1.09E-17'
+                    - '6'
+                    - '146.62'
+                    - '3.98E-03'
+                    - '542'
+                    - '4.13E+06'
+                    - '1'
+                -   - '219'
+                    - 3-Methylcyclopentene
+                    - C6H10
+                    - l
+                    - 1120-62-3
+                    - '52.601'
+                    - '-5120.3'
+                    - '-4.4554'
+                    - '1.33E-17'
+                    - '6'
+                    - '115'
+                    - '2.12E-06'
+                    - '526'
+                    - '4.13E+06'
+                    - '1'
+                -   - '220'
+                    - Methyldichlorosilane
+                    - CH4Cl2Si
+                    - l
+                    - 75-54-7
+                    - '79.788'
+                    - '-5420'
+                    - '-9.0702'
+                    - '1.15E-05'
+                    - '2'
+                    - '182.55'
+                    - '2.58E+01'
+                    - '483'
+                    - '3.96E+06'
+                    - '1'
+                -   - '221'
+                    - Methylethyl ether
+                    - C3H8O
+                    - l
+                    - 540-67-0
+                    - '78.586'
+                    - '-5176.3'
+                    - '-8.7501'
+                    - '9.17E-06'
+                    - '2'
+                    - '160'
+                    - '7.85E+00'
+                    - '437.8'
+                    - '4.43E+06'
+                    - '1'
+                -   - '222'
+                    - Methylethyl ketone
+                    - C4H8O
+                    - l
+                    - 78-93-3
+                    - '72.698'
+                    - '-6143.6'
+                    - '-7.5779'
+                    - '5.65E-06'
+                    - '2'
+                    - '186.48'
+                    - '1.39E+00'
+                    - '535.5'
+                    - '4.12E+06'
+                    - '1'
+                -   - '223'
+                    - Methylethyl sulfide
+                    - C3H8S
+                    - l
+                    - 624-89-5
+                    - '79.07'
+                    - '-6114.1'
+                    - '-8.631'
+                    - '6.53E-06'
+                    - '2'
+                    - '167.23'
+                    - '2.25E-01'
+                    - '533'
+                    - '4.26E+06'
+                    - '1'
+                -   - '224'
+                    - Methyl formate
+                    - C2H4O2
+                    - l
+                    - 107-31-3
+                    - '77.184'
+                    - '-5606.1'
+                    - '-8.392'
+                    - '7.85E-06'
+                    - '2'
+                    - '174.15'
+                    - '6.88E+00'
+                    - '487.2'
+                    - '5.98E+06'
+                    - '1'
+                -   - '225'
+                    - Methylisobutyl ether
+                    - C5H12O
+                    - l
+                    - 625-44-5
+                    - '57.984'
+                    - '-5339.6'
+                    - '-5.2362'
+                    - '2.08E-17'
+                    - '6'
+                    - '150'
+                    - '2.13E-02'
+                    - '497'
+                    - '3.42E+06'
+                    - '1'
+                -   - '226'
+                    - Methylisobutyl ketone
+                    - C6H12O
+                    - l
+                    - 0108-10-1
+                    - '80.503'
+                    - '-7421.8'
+                    - '-8.379'
+                    - '1.81E-17'
+                    - '6'
+                    - '189.15'
+                    - '6.99E-02'
+                    - '574.6'
+                    - '3.27E+06'
+                    - '1'
+                -   - '227'
+                    - Methyl Isocyanate
+                    - C2H3NO
+                    - l
+                    - 624-83-9
+                    - '57.612'
+                    - '-5197.9'
+                    - '-5.1269'
+                    - '2.17E-17'
+                    - '6'
+                    - '256.15'
+                    - '7.28E+03'
+                    - '488'
+                    - '5.48E+06'
+                    - '1'
+                -   - '228'
+                    - Methylisopropyl ether
+                    - C4H10O
+                    - l
+                    - 598-53-8
+                    - '53.867'
+                    - '-4701'
+                    - '-4.7052'
+                    - '2.88E-17'
+                    - '6'
+                    - '127.93'
+                    - '3.32E-03'
+                    - '464.48'
+                    - '3.76E+06'
+                    - '1'
+                -   - '229'
+                    - Methylisopropyl ketone
+                    - C5H10O
+                    - l
+                    - 563-80-4
+                    - '45.242'
+                    - '-5324.4'
+                    - '-3.2551'
+                    - '3.04E-18'
+                    - '6'
+                    - '180.15'
+                    - '2.95E-01'
+                    - '553.4'
+                    - '3.79E+06'
+                    - '1'
+                -   - '230'
+                    - Methylisopropyl sulfide
+                    - C4H10S
+                    - l
+                    - 1551-21-9
+                    - '52.82'
+                    - '-5437.7'
+                    - '-4.442'
+                    - '9.51E-18'
+                    - '6'
+                    - '171.64'
+                    - '1.80E-01'
+                    - '553.1'
+                    - '4.02E+06'
+                    - '1'
+                -   - '231'
+                    - Methyl mercaptan
+                    - CH4S
+                    - l
+                    - 74-93-1
+                    - '54.15'
+                    - '-4337.7'
+                    - '-4.8127'
+                    - '4.50E-17'
+                    - '6'
+                    - '150.18'
+                    - '3.15E+00'
+                    - '469.95'
+                    - '7.23E+06'
+                    - '1'
+                -   - '232'
+                    - Methyl methacrylate
+                    - C5H8O2
+                    - l
+                    - 80-62-6
+                    - '107.36'
+                    - '-8085.3'
+                    - '-12.72'
+                    - '8.33E-06'
+                    - '2'
+                    - '224.95'
+                    - '1.91E+01'
+                    - '566'
+                    - '3.67E+06'
+                    - '1'
+                -   - '233'
+                    - 2-Methyloctanoic acid
+                    - C9H18O2
+                    - l
+                    - 3004-93-1
+                    - '105.7'
+                    - '-12458'
+                    - '-11.234'
+                    - '4.46E-18'
+                    - '6'
+                    - '240'
+                    - '4.19E-04'
+                    - '694'
+                    - '2.55E+06'
+                    - '1'
+                -   - '234'
+                    - 2-Methylpentane
+                    - C6H14
+                    - l
+                    - 107-83-5
+                    - '53.579'
+                    - '-5041.2'
+                    - '-4.6404'
+                    - '1.94E-17'
+                    - '6'
+                    - '119.55'
+                    - '2.07E-05'
+                    - '497.7'
+                    - '3.04E+06'
+                    - '1'
+                -   - '235'
+                    - Methyl pentyl ether
+                    - C6H14O
+                    - l
+                    - 628-80-8
+                    - '61.907'
+                    - '-6188.9'
+                    - '-5.706'
+                    - '1.18E-17'
+                    - '6'
+                    - '176'
+                    - '6.33E-02'
+                    - '546.49'
+                    - '3.04E+06'
+                    - '1'
+                -   - '236'
+                    - 2-Methylpropane
+                    - C4H10
+                    - l
+                    - 75-28-5
+                    - '108.43'
+                    - '-5039.9'
+                    - '-15.012'
+                    - '2.27E-02'
+                    - '1'
+                    - '113.54'
+                    - '1.21E-02'
+                    - '407.8'
+                    - '3.63E+06'
+                    - '1'
+                -   - '237'
+                    - 2-Methyl-2-propanol
+                    - C4H10O
+                    - l
+                    - 75-65-0
+                    - '172.27'
+                    - '-11589'
+                    - '-22.113'
+                    - '1.37E-05'
+                    - '2'
+                    - '298.97'
+                    - '5.88E+03'
+                    - '506.2'
+                    - '3.96E+06'
+                    - '1'
+                -   - '238'
+                    - 2-Methyl propene
+                    - C4H8
+                    - l
+                    - 0115-11-7
+                    - '78.01'
+                    - '-4634.1'
+                    - '-8.9575'
+                    - '1.34E-05'
+                    - '2'
+                    - '132.81'
+                    - '6.45E-01'
+                    - '417.9'
+                    - '4.00E+06'
+                    - '1'
+                -   - '239'
+                    - Methyl propionate
+                    - C4H8O2
+                    - l
+                    - 0554-12-1
+                    - '70.717'
+                    - '-6439.7'
+                    - '-6.9845'
+                    - '2.01E-17'
+                    - '6'
+                    - '185.65'
+                    - '6.34E-01'
+                    - '530.6'
+                    - '4.03E+06'
+                    - '1'
+                -   - '240'
+                    - Methylpropyl ether
+                    - C4H10O
+                    - l
+                    - 557-17-5
+                    - '67.942'
+                    - '-5419.1'
+                    - '-6.8067'
+                    - '4.78E-17'
+                    - '6'
+                    - '133.97'
+                    - '2.90E-03'
+                    - '476.25'
+                    - '3.80E+06'
+                    - '1'
+                -   - '241'
+                    - Methylpropyl sulfide
+                    - C4H10S
+                    - l
+                    - 3877-15-4
+                    - '83.711'
+                    - '-6786.9'
+                    - '-9.2526'
+                    - '6.67E-06'
+                    - '2'
+                    - '160.17'
+                    - '4.26E-03'
+                    - '565'
+                    - '3.97E+06'
+                    - '1'
+                -   - '242'
+                    - Methylsilane
+                    - CH6Si
+                    - l
+                    - 992-94-9
+                    - '37.205'
+                    - '-2590.3'
+                    - '-2.5993'
+                    - '6.05E-06'
+                    - '2'
+                    - '116.34'
+                    - '1.43E+01'
+                    - '352.5'
+                    - '4.70E+06'
+                    - '1'
+                -   - '243'
+                    - '#NAME?'
+                    - C9H10
+                    - l
+                    - 98-83-9
+                    - '56.485'
+                    - '-6954.2'
+                    - '-4.7889'
+                    - '2.78E-18'
+                    - '6'
+                    - '249.95'
+                    - '9.23E+00'
+                    - '654'
+                    - '3.34E+06'
+                    - '1'
+                -   - '244'
+                    - Methyl tert-butyl ether
+                    - C5H12O
+                    - l
+                    - '1634-04-04'
+                    - '57.1511'
+                    - '-5201.7'
+                    - '-5.1429'
+                    - '1.65E-17'
+                    - '6'
+                    - '164.55'
+                    - '4.93E-01'
+                    - '497.1'
+                    - '3.29E+06'
+                    - '1'
+                -   - '245'
+                    - Methyl vinyl ether
+                    - C3H6O
+                    - l
+                    - 107-25-5
+                    - '51.085'
+                    - '-4271'
+                    - '-4.307'
+                    - '3.05E-17'
+                    - '6'
+                    - '151.15'
+                    - '3.37E+00'
+                    - '437'
+                    - '4.58E+06'
+                    - '1'
+                -   - '246'
+                    - Naphthalene
+                    - C10H8
+                    - l
+                    - 91-20-3
+                    - '62.964'
+                    - '-8137.5'
+                    - '-5.6317'
+                    - '2.27E-18'
+                    - '6'
+                    - '353.43'
+                    - '9.91E+02'
+                    - '748.4'
+                    - '4.07E+06'
+                    - '1'
+                -   - '247'
+                    - Neon
+                    - Ne
+                    - l
+                    - '7440-01-09'
+                    - '29.755'
+                    - '-271.06'
+                    - '-2.6081'
+                    - '5.27E-04'
+                    - '2'
+                    - '24.56'
+                    - '4.38E+04'
+                    - '44.4'
+                    - '2.67E+06'
+                    - '1'
+                -   - '248'
+                    - Nitroethane
+                    - C2H5NO2
+                    - l
+                    - 79-24-3
+                    - '75.632'
+                    - '-7202.3'
+                    - '-7.6464'
+                    - '1.83E-17'
+                    - '6'
+                    - '183.63'
+                    - '3.18E-02'
+                    - '593'
+                    - '5.16E+06'
+                    - '1'
+                -   - '249'
+                    - Nitrogen
+                    - N2
+                    - l
+                    - 7727-37-9
+                    - '58.282'
+                    - '-1084.1'
+                    - '-8.3144'
+                    - '4.41E-02'
+                    - '1'
+                    - '63.15'
+                    - '1.25E+04'
+                    - '126.2'
+                    - '3.39E+06'
+                    - '1'
+                -   - '250'
+                    - Nitrogen trifluoride
+                    - F3N
+                    - l
+                    - 7783-54-2
+                    - '68.149'
+                    - '-2257.9'
+                    - '-8.9118'
+                    - '2.32E-02'
+                    - '1'
+                    - '66.46'
+                    - '1.86E-01'
+                    - '234'
+                    - '4.50E+06'
+                    - '1'
+                -   - '251'
+                    - Nitromethane
+                    - CH3NO2
+                    - l
+                    - 75-52-5
+                    - '57.278'
+                    - '-6089'
+                    - '-4.9821'
+                    - '1.22E-17'
+                    - '6'
+                    - '244.6'
+                    - '1.47E+02'
+                    - '588.15'
+                    - '6.31E+06'
+                    - '1'
+                -   - '252'
+                    - Nitrous oxide
+                    - N2O
+                    - l
+                    - 10024-97-2
+                    - '96.512'
+                    - '-4045'
+                    - '-12.277'
+                    - '2.89E-05'
+                    - '2'
+                    - '182.3'
+                    - '8.69E+04'
+                    - '309.57'
+                    - '7.28E+06'
+                    - '1'
+                -   - '253'
+                    - Nitric oxide
+                    - 'NO'
+                    - l
+                    - 10102-43-9
+                    - '72.974'
+                    - '-2650'
+                    - '-8.261'
+                    - '9.70E-15'
+                    - '6'
+                    - '109.5'
+                    - '2.20E+04'
+                    - '180.15'
+                    - '6.52E+06'
+                    - '1'
+                -   - '254'
+                    - Nonadecane
+                    - C19H40
+                    - l
+                    - 629-92-5
+                    - '182.54'
+                    - '-17897'
+                    - '-22.498'
+                    - '7.40E-06'
+                    - '2'
+                    - '305.04'
+                    - '1.59E-02'
+                    - '758'
+                    - '1.21E+06'
+                    - '1'
+                -   - '255'
+                    - Nonanal
+                    - C9H18O
+                    - l
+                    - 124-19-6
+                    - '337.71'
+                    - '-18506'
+                    - '-50.224'
+                    - '4.73E-02'
+                    - '1'
+                    - '255.15'
+                    - '3.42E-01'
+                    - '658'
+                    - '2.74E+06'
+                    - '1'
+                -   - '256'
+                    - Nonane
+                    - C9H20
+                    - l
+                    - 111-84-2
+                    - '109.35'
+                    - '-9030.4'
+                    - '-12.882'
+                    - '7.85E-06'
+                    - '2'
+                    - '219.66'
+                    - '4.31E-01'
+                    - '594.6'
+                    - '2.31E+06'
+                    - '1'
+                -   - '257'
+                    - Nonanoic acid
+                    - C9H18O2
+                    - l
+                    - 112-05-0
+                    - '137.6'
+                    - '-14948'
+                    - '-15.618'
+                    - '5.57E-18'
+                    - '6'
+                    - '285.55'
+                    - '4.71E-02'
+                    - '710.7'
+                    - '2.50E+06'
+                    - '1'
+                -   - '258'
+                    - 1-Nonanol
+                    - C9H20O
+                    - l
+                    - '0143-08-08'
+                    - '162.854'
+                    - '-15205'
+                    - '-19.424'
+                    - '1.07E-17'
+                    - '6'
+                    - '268.15'
+                    - '8.55E-02'
+                    - '670.9'
+                    - '2.52E+06'
+                    - '1'
+                -   - '259'
+                    - 2-Nonanol
+                    - C9H20O
+                    - l
+                    - 628-99-9
+                    - '146.46'
+                    - '-13813'
+                    - '-17.158'
+                    - '8.63E-40'
+                    - '14'
+                    - '238.15'
+                    - '4.32E-03'
+                    - '649.5'
+                    - '2.55E+06'
+                    - '1'
+                -   - '260'
+                    - 1-Nonene
+                    - C9H18
+                    - l
+                    - 0124-11-8
+                    - '63.313'
+                    - '-7040.4'
+                    - '-5.8055'
+                    - '7.58E-18'
+                    - '6'
+                    - '191.91'
+                    - '2.04E-02'
+                    - '593.1'
+                    - '2.43E+06'
+                    - '1'
+                -   - '261'
+                    - Nonyl mercaptan
+                    - C9H20S
+                    - l
+                    - 1455-21-6
+                    - '106.2'
+                    - '-10982'
+                    - '-11.696'
+                    - '8.90E-18'
+                    - '6'
+                    - '253.05'
+                    - '1.47E-01'
+                    - '681'
+                    - '2.33E+06'
+                    - '1'
+                -   - '262'
+                    - 1-Nonyne
+                    - C9H16
+                    - l
+                    - '3452-09-03'
+                    - '114.77'
+                    - '-9430.8'
+                    - '-13.631'
+                    - '8.19E-06'
+                    - '2'
+                    - '223.15'
+                    - '4.50E-01'
+                    - '598.05'
+                    - '2.62E+06'
+                    - '1'
+                -   - '263'
+                    - Octadecane
+                    - C18H38
+                    - l
+                    - 593-45-3
+                    - '157.68'
+                    - '-16093'
+                    - '-18.954'
+                    - '5.93E-06'
+                    - '2'
+                    - '301.31'
+                    - '3.39E-02'
+                    - '747'
+                    - '1.26E+06'
+                    - '1'
+                -   - '264'
+                    - Octanal
+                    - C8H16O
+                    - l
+                    - 124-13-0
+                    - '83.601'
+                    - '-8865.8'
+                    - '-8.5711'
+                    - '7.94E-18'
+                    - '6'
+                    - '246'
+                    - '1.46E+00'
+                    - '638.9'
+                    - '2.95E+06'
+                    - '1'
+                -   - '265'
+                    - Octane
+                    - C8H18
+                    - l
+                    - 111-65-9
+                    - '96.084'
+                    - '-7900.2'
+                    - '-11.003'
+                    - '7.18E-06'
+                    - '2'
+                    - '216.38'
+                    - '2.11E+00'
+                    - '568.7'
+                    - '2.47E+06'
+                    - '1'
+                -   - '266'
+                    - Octanoic acid
+                    - C8H16O2
+                    - l
+                    - '0124-07-02'
+                    - '140.16'
+                    - '-14813'
+                    - '-16.004'
+                    - '6.42E-18'
+                    - '6'
+                    - '289.65'
+                    - '1.83E-01'
+                    - '694.26'
+                    - '2.76E+06'
+                    - '1'
+                -   - '267'
+                    - 1-Octanol
+                    - C8H18O
+                    - l
+                    - 111-87-5
+                    - '144.111'
+                    - '-13667'
+                    - '-16.826'
+                    - '9.37E-18'
+                    - '6'
+                    - '257.65'
+                    - '9.60E-02'
+                    - '652.3'
+                    - '2.78E+06'
+                    - '1'
+                -   - '268'
+                    - 2-Octanol
+                    - C8H18O
+                    - l
+                    - 123-96-6
+                    - '133.41'
+                    - '-12630'
+                    - '-15.369'
+                    - '2.99E-41'
+                    - '14'
+                    - '241.55'
+                    - '4.04E-02'
+                    - '629.8'
+                    - '2.75E+06'
+                    - '1'
+                -   - '269'
+                    - 2-Octanone
+                    - C8H16O
+                    - l
+                    - 111-13-7
+                    - '63.775'
+                    - '-7711.3'
+                    - '-5.7359'
+                    - '3.09E-18'
+                    - '6'
+                    - '252.85'
+                    - '4.68E+00'
+                    - '632.7'
+                    - '2.65E+06'
+                    - '1'
+                -   - '270'
+                    - 3-Octanone
+                    - C8H16O
+                    - l
+                    - 106-68-3
+                    - '72.382'
+                    - '-8054.8'
+                    - '-7.0002'
+                    - '5.83E-18'
+                    - '6'
+                    - '255.55'
+                    - '7.84E+00'
+                    - '627.7'
+                    - '2.71E+06'
+                    - '1'
+                -   - '271'
+                    - 1-Octene
+                    - C8H16
+                    - l
+                    - 111-66-0
+                    - '74.936'
+                    - '-7155.9'
+                    - '-7.5843'
+                    - '1.71E-17'
+                    - '6'
+                    - '171.45'
+                    - '2.98E-03'
+                    - '566.9'
+                    - '2.66E+06'
+                    - '1'
+                -   - '272'
+                    - Octyl mercaptan
+                    - C8H18S
+                    - l
+                    - 111-88-6
+                    - '78.368'
+                    - '-8855.4'
+                    - '-7.8202'
+                    - '5.66E-18'
+                    - '6'
+                    - '223.95'
+                    - '3.05E-02'
+                    - '667.3'
+                    - '2.52E+06'
+                    - '1'
+                -   - '273'
+                    - 1-Octyne
+                    - C8H14
+                    - l
+                    - 629-05-0
+                    - '64.612'
+                    - '-6802.5'
+                    - '-6.0261'
+                    - '1.10E-17'
+                    - '6'
+                    - '193.55'
+                    - '1.04E-01'
+                    - '574'
+                    - '2.88E+06'
+                    - '1'
+                -   - '274'
+                    - Oxalic acid
+                    - C2H2O4
+                    - l
+                    - 144-62-7
+                    - '122.04'
+                    - '-16050'
+                    - '-12.986'
+                    - '2.09E-18'
+                    - '6'
+                    - '462.65'
+                    - '2.15E+03'
+                    - '804'
+                    - '7.06E+06'
+                    - '1'
+                -   - '275'
+                    - Oxygen
+                    - O2
+                    - l
+                    - 7782-44-7
+                    - '51.245'
+                    - '-1200.2'
+                    - '-6.4361'
+                    - '2.84E-02'
+                    - '1'
+                    - '54.36'
+                    - '1.48E+02'
+                    - '154.58'
+                    - '5.02E+06'
+                    - '1'
+                -   - '276'
+                    - Ozone
+                    - O3
+                    - l
+                    - 10028-15-6
+                    - '40.067'
+                    - '-2204.8'
+                    - '-2.9351'
+                    - '7.75E-16'
+                    - '6'
+                    - '80.15'
+                    - '7.35E-01'
+                    - '261'
+                    - '5.57E+06'
+                    - '1'
+                -   - '277'
+                    - Pentadecane
+                    - C15H32
+                    - l
+                    - 629-62-9
+                    - '135.57'
+                    - '-13478'
+                    - '-16.022'
+                    - '5.61E-06'
+                    - '2'
+                    - '283.07'
+                    - '1.29E-01'
+                    - '708'
+                    - '1.47E+06'
+                    - '1'
+                -   - '278'
+                    - Pentanal
+                    - C5H10O
+                    - l
+                    - 110-62-3
+                    - '149.58'
+                    - '-8890'
+                    - '-20.697'
+                    - '2.21E-02'
+                    - '1'
+                    - '182'
+                    - '5.23E-02'
+                    - '566.1'
+                    - '3.97E+06'
+                    - '1'
+                -   - '279'
+                    - Pentane
+                    - C5H12
+                    - l
+                    - 109-66-0
+                    - '78.741'
+                    - '-5420.3'
+                    - '-8.8253'
+                    - '9.62E-06'
+                    - '2'
+                    - '143.42'
+                    - '6.86E-02'
+                    - '469.7'
+                    - '3.36E+06'
+                    - '1'
+                -   - '280'
+                    - Pentanoic acid
+                    - C5H10O2
+                    - l
+                    - 109-52-4
+                    - '101.7'
+                    - '-10955'
+                    - '-10.829'
+                    - '7.19E-18'
+                    - '6'
+                    - '239.15'
+                    - '3.28E-02'
+                    - '639.16'
+                    - '3.59E+06'
+                    - '1'
+                -   - '281'
+                    - 1-Pentanol
+                    - C5H12O
+                    - l
+                    - 71-41-0
+                    - '114.748'
+                    - '-10643'
+                    - '-12.858'
+                    - '1.25E-17'
+                    - '6'
+                    - '195.56'
+                    - '5.48E-04'
+                    - '588.1'
+                    - '3.90E+06'
+                    - '1'
+                -   - '282'
+                    - 2-Pentanol
+                    - C5H12O
+                    - l
+                    - 6032-29-7
+                    - '122.26'
+                    - '-10774'
+                    - '-13.943'
+                    - '1.07E-42'
+                    - '15'
+                    - '200'
+                    - '4.15E-03'
+                    - '561'
+                    - '3.71E+06'
+                    - '1'
+                -   - '283'
+                    - 2-Pentanone
+                    - C5H10O
+                    - l
+                    - 107-87-9
+                    - '84.635'
+                    - '-7078.4'
+                    - '-9.3'
+                    - '6.27E-06'
+                    - '2'
+                    - '196.29'
+                    - '7.52E-01'
+                    - '561.08'
+                    - '3.71E+06'
+                    - '1'
+                -   - '284'
+                    - 3-Pentanone
+                    - C5H10O
+                    - l
+                    - 96-22-0
+                    - '44.286'
+                    - '-5415.1'
+                    - '-3.0913'
+                    - '1.86E-18'
+                    - '6'
+                    - '234.18'
+                    - '7.34E+01'
+                    - '560.95'
+                    - '3.70E+06'
+                    - '1'
+                -   - '285'
+                    - 1-Pentene
+                    - C5H10
+                    - l
+                    - 109-67-1
+                    - '46.994'
+                    - '-4289.5'
+                    - '-3.7345'
+                    - '2.54E-17'
+                    - '6'
+                    - '108.02'
+                    - '3.70E-05'
+                    - '464.8'
+                    - '3.56E+06'
+                    - '1'
+                -   - '286'
+                    - 2-Pentyl mercaptan
+                    - C5H12S
+                    - l
+                    - 2084-19-7
+                    - '58.985'
+                    - '-6193.1'
+                    - '-5.2746'
+                    - '7.40E-18'
+                    - '6'
+                    - '160.75'
+                    - '1.77E-03'
+                    - '584.3'
+                    - '3.54E+06'
+                    - '1'
+                -   - '287'
+                    - Pentyl mercaptan
+                    - C5H12S
+                    - l
+                    - 110-66-7
+                    - '67.309'
+                    - '-6880.8'
+                    - '-6.4449'
+                    - '1.01E-17'
+                    - '6'
+                    - '197.45'
+                    - '2.01E-01'
+                    - '598'
+                    - '3.47E+06'
+                    - '1'
+                -   - '288'
+                    - 1-Pentyne
+                    - C5H8
+                    - l
+                    - 627-19-0
+                    - '82.805'
+                    - '-5683.8'
+                    - '-9.4301'
+                    - '1.08E-05'
+                    - '2'
+                    - '167.45'
+                    - '2.40E+00'
+                    - '481.2'
+                    - '4.17E+06'
+                    - '1'
+                -   - '289'
+                    - 2-Pentyne
+                    - C5H8
+                    - l
+                    - 627-21-4
+                    - '137.29'
+                    - '-7447.1'
+                    - '-19.01'
+                    - '2.14E-02'
+                    - '1'
+                    - '163.83'
+                    - '2.05E-01'
+                    - '519'
+                    - '4.02E+06'
+                    - '1'
+                -   - '290'
+                    - Phenanthrene
+                    - C14H10
+                    - l
+                    - '1985-01-08'
+                    - '72.958'
+                    - '-10943'
+                    - '-6.7902'
+                    - '1.09E-18'
+                    - '6'
+                    - '372.38'
+                    - '2.93E+01'
+                    - '869'
+                    - '2.90E+06'
+                    - '1'
+                -   - '291'
+                    - Phenol
+                    - C6H6O
+                    - l
+                    - 108-95-2
+                    - '95.444'
+                    - '-10113'
+                    - '-10.09'
+                    - '6.76E-18'
+                    - '6'
+                    - '314.06'
+                    - '1.88E+02'
+                    - '694.25'
+                    - '6.06E+06'
+                    - '1'
+                -   - '292'
+                    - Phenyl isocyanate
+                    - C7H5NO
+                    - l
+                    - 103-71-9
+                    - '86.779'
+                    - '-8101.8'
+                    - '-9.5303'
+                    - '6.14E-06'
+                    - '2'
+                    - '243.15'
+                    - '4.33E+00'
+                    - '653'
+                    - '4.06E+06'
+                    - '1'
+                -   - '293'
+                    - Phthalic anhydride
+                    - C8H4O3
+                    - l
+                    - 85-44-9
+                    - '126.5'
+                    - '-12551'
+                    - '-15.002'
+                    - '7.75E-06'
+                    - '2'
+                    - '404.15'
+                    - '7.90E+02'
+                    - '791'
+                    - '4.73E+06'
+                    - '1'
+                -   - '294'
+                    - Propadiene
+                    - C3H4
+                    - l
+                    - 463-49-0
+                    - '57.069'
+                    - '-3682.7'
+                    - '-5.5662'
+                    - '6.51E-06'
+                    - '2'
+                    - '136.87'
+                    - '1.83E+01'
+                    - '394'
+                    - '5.22E+06'
+                    - '1'
+                -   - '295'
+                    - Propane
+                    - C3H8
+                    - l
+                    - 74-98-6
+                    - '59.078'
+                    - '-3492.6'
+                    - '-6.0669'
+                    - '1.09E-05'
+                    - '2'
+                    - '85.47'
+                    - '1.68E-04'
+                    - '369.83'
+                    - '4.21E+06'
+                    - '1'
+                -   - '296'
+                    - 1-Propanol
+                    - C3H8O
+                    - l
+                    - 71-23-8
+                    - '84.6642'
+                    - '-8307.2'
+                    - '-8.5767'
+                    - '7.51E-18'
+                    - '6'
+                    - '146.95'
+                    - '4.28E-07'
+                    - '536.8'
+                    - '5.17E+06'
+                    - '1'
+                -   - '297'
+                    - 2-Propanol
+                    - C3H8O
+                    - l
+                    - 67-63-0
+                    - '96.094'
+                    - '-8575.4'
+                    - '-10.292'
+                    - '1.67E-17'
+                    - '6'
+                    - '185.26'
+                    - '1.95E-02'
+                    - '508.3'
+                    - '4.78E+06'
+                    - '1'
+                -   - '298'
+                    - Propenylcyclohexene
+                    - C9H14
+                    - l
+                    - 13511-13-2
+                    - '64.268'
+                    - '-7298.9'
+                    - '-5.9109'
+                    - '4.85E-18'
+                    - '6'
+                    - '199'
+                    - '2.48E-02'
+                    - '636'
+                    - '3.13E+06'
+                    - '1'
+                -   - '299'
+                    - Propionaldehyde
+                    - C3H6O
+                    - l
+                    - 123-38-6
+                    - '80.581'
+                    - '-5896.1'
+                    - '-8.9301'
+                    - '8.22E-06'
+                    - '2'
+                    - '170'
+                    - '1.31E+00'
+                    - '504.4'
+                    - '4.92E+06'
+                    - '1'
+                -   - '300'
+                    - Propionic acid
+                    - C3H6O2
+                    - l
+                    - '1979-09-04'
+                    - '54.552'
+                    - '-7149.4'
+                    - '-4.2769'
+                    - '1.18E-18'
+                    - '6'
+                    - '252.45'
+                    - '1.31E+01'
+                    - '600.81'
+                    - '4.61E+06'
+                    - '1'
+                -   - '301'
+                    - Propionitrile
+                    - C3H5N
+                    - l
+                    - 107-12-0
+                    - '82.699'
+                    - '-6703.5'
+                    - '-9.1506'
+                    - '7.54E-06'
+                    - '2'
+                    - '180.26'
+                    - '1.69E-01'
+                    - '564.4'
+                    - '4.19E+06'
+                    - '1'
+                -   - '302'
+                    - Propyl acetate
+                    - C5H10O2
+                    - l
+                    - 109-60-4
+                    - '115.16'
+                    - '-8433.9'
+                    - '-13.934'
+                    - '1.03E-05'
+                    - '2'
+                    - '178.15'
+                    - '1.71E-02'
+                    - '549.73'
+                    - '3.37E+06'
+                    - '1'
+                -   - '303'
+                    - Propyl amine
+                    - C3H9N
+                    - l
+                    - 0107-10-8
+                    - '58.398'
+                    - '-5312.7'
+                    - '-5.2876'
+                    - '1.99E-06'
+                    - '2'
+                    - '188.36'
+                    - '1.30E+01'
+                    - '496.95'
+                    - '4.74E+06'
+                    - '1'
+                -   - '304'
+                    - Propylbenzene
+                    - C9H12
+                    - l
+                    - 103-65-1
+                    - '91.379'
+                    - '-8276.8'
+                    - '-10.176'
+                    - '5.62E-06'
+                    - '2'
+                    - '173.55'
+                    - '1.81E-04'
+                    - '638.35'
+                    - '3.20E+06'
+                    - '1'
+                -   - '305'
+                    - Propylene
+                    - C3H6
+                    - l
+                    - '0115-07-01'
+                    - '43.905'
+                    - '-3097.8'
+                    - '-3.4425'
+                    - '1.00E-16'
+                    - '6'
+                    - '87.89'
+                    - '1.17E-03'
+                    - '364.85'
+                    - '4.60E+06'
+                    - '1'
+                -   - '306'
+                    - Propyl formate
+                    - C4H8O2
+                    - l
+                    - 110-74-7
+                    - '104.08'
+                    - '-7535.9'
+                    - '-12.348'
+                    - '9.60E-06'
+                    - '2'
+                    - '180.25'
+                    - '2.11E-01'
+                    - '538'
+                    - '4.03E+06'
+                    - '1'
+                -   - '307'
+                    - 2-Propyl mercaptan
+                    - C3H8S
+                    - l
+                    - 75-33-2
+                    - '60.43'
+                    - '-5276.9'
+                    - '-5.6572'
+                    - '2.60E-17'
+                    - '6'
+                    - '142.61'
+                    - '9.73E-03'
+                    - '517'
+                    - '4.75E+06'
+                    - '1'
+                -   - '308'
+                    - Propyl mercaptan
+                    - C3H8S
+                    - l
+                    - '0107-03-09'
+                    - '62.165'
+                    - '-5624'
+                    - '-5.8595'
+                    - '2.06E-17'
+                    - '6'
+                    - '159.95'
+                    - '6.51E-02'
+                    - '536.6'
+                    - '4.63E+06'
+                    - '1'
+                -   - '309'
+                    - 1,2-Propylene glycol
+                    - C3H8O2
+                    - l
+                    - 57-55-6
+                    - '212.8'
+                    - '-15420'
+                    - '-28.109'
+                    - '2.16E-05'
+                    - '2'
+                    - '213.15'
+                    - '9.29E-05'
+                    - '626'
+                    - '6.04E+06'
+                    - '1'
+                -   - '310'
+                    - Quinone
+                    - C6H4O2
+                    - l
+                    - 106-51-4
+                    - '48.651'
+                    - '-7289.5'
+                    - '-3.4453'
+                    - '1.01E-18'
+                    - '6'
+                    - '388.85'
+                    - '1.17E+04'
+                    - '683'
+                    - '5.93E+06'
+                    - '1'
+                -   - '311'
+                    - Silicon tetrafluoride
+                    - F4Si
+                    - l
+                    - 7783-61-1
+                    - '272.85'
+                    - '-9548.9'
+                    - '-40.089'
+                    - '6.37E-15'
+                    - '6'
+                    - '186.35'
+                    - '2.21E+05'
+                    - '259'
+                    - '3.75E+06'
+                    - '1'
+                -   - '312'
+                    - Styrene
+                    - C8H8
+                    - l
+                    - 100-42-5
+                    - '105.93'
+                    - '-8685.9'
+                    - '-12.42'
+                    - '7.56E-06'
+                    - '2'
+                    - '242.54'
+                    - '1.06E+01'
+                    - '636'
+                    - '3.82E+06'
+                    - '1'
+                -   - '313'
+                    - Succinic acid
+                    - C4H6O4
+                    - l
+                    - 110-15-6
+                    - '128.65'
+                    - '-16958'
+                    - '-13.872'
+                    - '2.16E-18'
+                    - '6'
+                    - '460.65'
+                    - '8.85E+02'
+                    - '806'
+                    - '4.73E+06'
+                    - '1'
+                -   - '314'
+                    - Sulfur dioxide
+                    - O2S
+                    - l
+                    - '7446-09-05'
+                    - '47.365'
+                    - '-4084.5'
+                    - '-3.6469'
+                    - '1.80E-17'
+                    - '6'
+                    - '197.67'
+                    - '1.67E+03'
+                    - '430.75'
+                    - '7.86E+06'
+                    - '1'
+                -   - '315'
+                    - Sulfur hexafluoride
+                    - F6S
+                    - l
+                    - 2551-62-4
+                    - '29.16'
+                    - '-2383.6'
+                    - '-1.1342'
+                    - '0.00E+00'
+                    - '0'
+                    - '223.15'
+                    - '2.30E+05'
+                    - '318.69'
+                    - '3.77E+06'
+                    - '1'
+                -   - '316'
+                    - Sulfur trioxide
+                    - O3S
+                    - l
+                    - '7446-11-09'
+                    - '180.99'
+                    - '-12060'
+                    - '-22.839'
+                    - '7.24E-17'
+                    - '6'
+                    - '289.95'
+                    - '2.09E+04'
+                    - '490.85'
+                    - '8.19E+06'
+                    - '1'
+                -   - '317'
+                    - Terephthalic acid
+                    - C8H6O4
+                    - l
+                    - 100-21-0
+                    - '248.72'
+                    - '-32238'
+                    - '-30.009'
+                    - '4.80E-06'
+                    - '2'
+                    - '700.15'
+                    - '4.57E+03'
+                    - '1113'
+                    - '3.94E+06'
+                    - '1'
+                -   - '318'
+                    - o-Terphenyl
+                    - C18H14
+                    - l
+                    - 84-15-1
+                    - '110.52'
+                    - '-14045'
+                    - '-11.861'
+                    - '2.21E-18'
+                    - '6'
+                    - '329.35'
+                    - '4.14E-01'
+                    - '857'
+                    - '2.97E+06'
+                    - '1'
+                -   - '319'
+                    - Tetradecane
+                    - C14H30
+                    - l
+                    - 629-59-4
+                    - '140.47'
+                    - '-13231'
+                    - '-16.859'
+                    - '6.59E-06'
+                    - '2'
+                    - '279.01'
+                    - '2.53E-01'
+                    - '693'
+                    - '1.57E+06'
+                    - '1'
+                -   - '320'
+                    - Tetrahydrofuran
+                    - C4H8O
+                    - l
+                    - 109-99-9
+                    - '54.898'
+                    - '-5305.4'
+                    - '-4.7627'
+                    - '1.43E-17'
+                    - '6'
+                    - '164.65'
+                    - '1.96E-01'
+                    - '540.15'
+                    - '5.20E+06'
+                    - '1'
+                -   - '321'
+                    - 1,2,3,4-Tetrahydronaphthalene
+                    - C10H12
+                    - l
+                    - 119-64-2
+                    - '137.23'
+                    - '-10620'
+                    - '-17.908'
+                    - '1.45E-02'
+                    - '1'
+                    - '237.38'
+                    - '1.33E-01'
+                    - '720'
+                    - '3.62E+06'
+                    - '1'
+                -   - '322'
+                    - Tetrahydrothiophene
+                    - C4H8S
+                    - l
+                    - 110-01-0
+                    - '75.881'
+                    - '-6910.6'
+                    - '-7.9499'
+                    - '4.43E-06'
+                    - '2'
+                    - '176.99'
+                    - '1.54E-02'
+                    - '631.95'
+                    - '5.12E+06'
+                    - '1'
+                -   - '323'
+                    - 2,2,3,3-Tetramethylbutane
+                    - C8H18
+                    - l
+                    - 594-82-1
+                    - '57.963'
+                    - '-5901.5'
+                    - '-5.2048'
+                    - '9.13E-18'
+                    - '6'
+                    - '373.96'
+                    - '8.69E+04'
+                    - '568'
+                    - '2.87E+06'
+                    - '1'
+                -   - '324'
+                    - Thiophene
+                    - C4H4S
+                    - l
+                    - '0110-02-01'
+                    - '93.193'
+                    - '-7001.5'
+                    - '-10.738'
+                    - '8.23E-06'
+                    - '2'
+                    - '234.94'
+                    - '1.86E+02'
+                    - '579.35'
+                    - '5.70E+06'
+                    - '1'
+                -   - '325'
+                    - Toluene
+                    - C7H8
+                    - l
+                    - 108-88-3
+                    - '76.945'
+                    - '-6729.8'
+                    - '-8.179'
+                    - '5.30E-06'
+                    - '2'
+                    - '178.18'
+                    - '4.75E-02'
+                    - '591.75'
+                    - '4.08E+06'
+                    - '1'
+                -   - '326'
+                    - 1,1,2-Trichloroethane
+                    - C2H3Cl3
+                    - l
+                    - 79-00-5
+                    - '54.153'
+                    - '-6041.8'
+                    - '-4.5383'
+                    - '4.98E-18'
+                    - '6'
+                    - '236.5'
+                    - '4.47E+01'
+                    - '602'
+                    - '4.45E+06'
+                    - '1'
+                -   - '327'
+                    - Tridecane
+                    - C13H28
+                    - l
+                    - 629-50-5
+                    - '137.45'
+                    - '-12549'
+                    - '-16.543'
+                    - '7.13E-06'
+                    - '2'
+                    - '267.76'
+                    - '2.51E-01'
+                    - '675'
+                    - '1.68E+06'
+                    - '1'
+                -   - '328'
+                    - Triethyl amine
+                    - C6H15N
+                    - l
+                    - 121-44-8
+                    - '56.55'
+                    - '-5681.9'
+                    - '-4.9815'
+                    - '1.24E-17'
+                    - '6'
+                    - '158.45'
+                    - '1.06E-02'
+                    - '535.15'
+                    - '3.04E+06'
+                    - '1'
+                -   - '329'
+                    - Trimethyl amine
+                    - C3H9N
+                    - l
+                    - 75-50-3
+                    - '134.68'
+                    - '-6055.8'
+                    - '-19.415'
+                    - '2.86E-02'
+                    - '1'
+                    - '156.08'
+                    - '9.92E+00'
+                    - '433.25'
+                    - '4.10E+06'
+                    - '1'
+                -   - '330'
+                    - 1,2,3-Trimethylbenzene
+                    - C9H12
+                    - l
+                    - 526-73-8
+                    - '78.341'
+                    - '-8019.8'
+                    - '-8.1458'
+                    - '3.90E-06'
+                    - '2'
+                    - '247.79'
+                    - '3.71E+00'
+                    - '664.5'
+                    - '3.45E+06'
+                    - '1'
+                -   - '331'
+                    - 1,2,4-Trimethylbenzene
+                    - C9H12
+                    - l
+                    - 95-63-6
+                    - '85.301'
+                    - '-8215.9'
+                    - '-9.2166'
+                    - '4.80E-06'
+                    - '2'
+                    - '229.33'
+                    - '6.93E-01'
+                    - '649.1'
+                    - '3.21E+06'
+                    - '1'
+                -   - '332'
+                    - 2,2,4-Trimethylpentane
+                    - C8H18
+                    - l
+                    - 540-84-1
+                    - '84.912'
+                    - '-6722.2'
+                    - '-9.5157'
+                    - '7.22E-06'
+                    - '2'
+                    - '165.78'
+                    - '1.71E-02'
+                    - '543.8'
+                    - '2.55E+06'
+                    - '1'
+                -   - '333'
+                    - 2,3,3-Trimethylpentane
+                    - C8H18
+                    - l
+                    - 560-21-4
+                    - '83.105'
+                    - '-6903.7'
+                    - '-9.1858'
+                    - '6.47E-06'
+                    - '2'
+                    - '172.22'
+                    - '1.68E-02'
+                    - '573.5'
+                    - '2.81E+06'
+                    - '1'
+                -   - '334'
+                    - 1,3,5-Trinitrobenzene
+                    - C6H3N3O6
+                    - l
+                    - 99-35-4
+                    - '506.33'
+                    - '-37483'
+                    - '-69.22'
+                    - '2.74E-05'
+                    - '2'
+                    - '398.4'
+                    - '8.50E+00'
+                    - '846'
+                    - '3.41E+06'
+                    - '1'
+                -   - '335'
+                    - 2,4,6-Trinitrotoluene
+                    - C7H5N3O6
+                    - l
+                    - 118-96-7
+                    - '302'
+                    - '-24324'
+                    - '-40.13'
+                    - '1.74E-05'
+                    - '2'
+                    - '354'
+                    - '9.36E-01'
+                    - '828'
+                    - '3.02E+06'
+                    - '1'
+                -   - '336'
+                    - Undecane
+                    - C11H24
+                    - l
+                    - 1120-21-4
+                    - '131'
+                    - '-11143'
+                    - '-15.855'
+                    - '8.19E-06'
+                    - '2'
+                    - '247.57'
+                    - '4.08E-01'
+                    - '639'
+                    - '1.95E+06'
+                    - '1'
+                -   - '337'
+                    - 1-Undecanol
+                    - C11H24O
+                    - l
+                    - 112-42-5
+                    - '182.571'
+                    - '-17112'
+                    - '-22.125'
+                    - '1.13E-17'
+                    - '6'
+                    - '288.45'
+                    - '1.26E-01'
+                    - '703.9'
+                    - '2.12E+06'
+                    - '1'
+                -   - '338'
+                    - Vinyl acetate
+                    - C4H6O2
+                    - l
+                    - '0108-05-04'
+                    - '57.406'
+                    - '-5702.8'
+                    - '-5.0307'
+                    - '1.10E-17'
+                    - '6'
+                    - '180.35'
+                    - '7.06E-01'
+                    - '519.13'
+                    - '3.93E+06'
+                    - '1'
+                -   - '339'
+                    - Vinyl acetylene
+                    - C4H4
+                    - l
+                    - 689-97-4
+                    - '55.682'
+                    - '-4439.3'
+                    - '-5.0136'
+                    - '1.97E-17'
+                    - '6'
+                    - '173.15'
+                    - '6.69E+01'
+                    - '454'
+                    - '4.89E+06'
+                    - '1'
+                -   - '340'
+                    - Vinyl chloride
+                    - C2H3Cl
+                    - l
+                    - '1975-01-04'
+                    - '91.432'
+                    - '-5141.7'
+                    - '-10.981'
+                    - '1.43E-05'
+                    - '2'
+                    - '119.36'
+                    - '1.92E-02'
+                    - '432'
+                    - '5.75E+06'
+                    - '1'
+                -   - '341'
+                    - Vinyl trichlorosilane
+                    - C2H3Cl3Si
+                    - l
+                    - 75-94-5
+                    - '54.571'
+                    - '-5561.5'
+                    - '-4.712'
+                    - '1.07E-17'
+                    - '6'
+                    - '178.35'
+                    - '3.54E-01'
+                    - '543.15'
+                    - '3.06E+06'
+                    - '1'
+                -   - '342'
+                    - Water
+                    - H2O
+                    - l
+                    - 7732-18-5
+                    - '73.649'
+                    - '-7258.2'
+                    - '-7.3037'
+                    - '4.17E-06'
+                    - '2'
+                    - '273.16'
+                    - '6.11E+02'
+                    - '647.096'
+                    - '2.19E+07'
+                    - '1'
+                -   - '343'
+                    - m-Xylene
+                    - C8H10
+                    - l
+                    - 108-38-3
+                    - '85.099'
+                    - '-7615.9'
+                    - '-9.3072'
+                    - '5.56E-06'
+                    - '2'
+                    - '225.3'
+                    - '3.18E+00'
+                    - '617'
+                    - '3.53E+06'
+                    - '1'
+                -   - '344'
+                    - o-Xylene
+                    - C8H10
+                    - l
+                    - 95-47-6
+                    - '90.405'
+                    - '-7955.2'
+                    - '-10.086'
+                    - '5.96E-06'
+                    - '2'
+                    - '247.98'
+                    - '2.18E+01'
+                    - '630.3'
+                    - '3.74E+06'
+                    - '1'
+                -   - '345'
+                    - p-Xylene
+                    - C8H10
+                    - l
+                    - 106-42-3
+                    - '88.72'
+                    - '-7741.2'
+                    - '-9.8693'
+                    - '6.08E-06'
+                    - '2'
+                    - '286.41'
+                    - '5.76E+02'
+                    - '616.2'
+                    - '3.50E+06'
+                    - '1'
+                ITEMS: []
+"""
@@ -0,0 +1,198 @@
+# import libs
+import logging
+import threading
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Tuple
+)
+
+# NOTE: logger
+logger = logging.getLogger(__name__)
+
+
+class DefaultReference:
+    """
+    Process-wide default reference (markdown databook).
+
+    The content is imported on first use and the same string object is
+    shared by all references thermodb (and so all mcp instances) of the
+    process. The databook/table sections are indexed on first use and only
+    the sections used by a component reference config are materialized.
+    """
+
+    def __init__(self) -> None:
+        self._content: Optional[str] = None
+        # NOTE: (databook, table) -> (start, end), header and databook spans
+        self._sections: Optional[Dict[Tuple[str, str], Tuple[int, int]]] = None
+        self._header: Tuple[int, int] = (0, 0)
+        self._databooks: Dict[str, Tuple[int, int]] = {}
+        # NOTE: materialized contents, frozenset of (databook, table) -> str
+        self._materialized: Dict[FrozenSet[Tuple[str, str]], str] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def content(self) -> str:
+        """
+        The default reference content (loaded on first access).
+        """
+        if self._content is None:
+            with self._lock:
+                if self._content is None:
+                    from .contents import REFERENCE_CONTENT
+                    self._content = REFERENCE_CONTENT
+        return self._content
+
+    def is_default(self, content: Any) -> bool:
+        """
+        Check if a content is the (shared) default reference content.
+        """
+        return self._content is not None and content is self._content
+
+    def _index(self) -> Dict[Tuple[str, str], Tuple[int, int]]:
+        """
+        Index the databook (`## `) and table (`### `) sections in one pass.
+        """
+        if self._sections is not None:
+            return self._sections
+
+        content = self.content
+        sections: Dict[Tuple[str, str], Tuple[int, int]] = {}
+        databooks: Dict[str, Tuple[int, int]] = {}
+        header_end = len(content)
+
+        databook: Optional[str] = None
+        table: Optional[str] = None
+        start = 0
+        position = 0
+
+        def close(end: int) -> None:
+            # NOTE: close the current table or databook header
+            if databook is None:
+                return
+            if table is None:
+                databooks[databook] = (start, end)
+            else:
+                sections[(databook, table)] = (start, end)
+
+        for line in content.splitlines(keepends=True):
+            if line.startswith('## '):
+                close(position)
+                if databook is None:
+                    header_end = position
+                databook, table, start = line[3:].strip(), None, position
+            elif line.startswith('### ') and databook is not None:
+                close(position)
+                table, start = line[4:].strip(), position
+            position += len(line)
+        close(position)
+
+        with self._lock:
+            self._header = (0, header_end)
+            self._databooks = databooks
+            self._sections = sections
+        return sections
+
+    def materialize(
+        self,
+        tables: List[Tuple[str, str]]
+    ) -> str:
+        """
+        Build the reference content with the given (databook, table) sections.
+
+        Parameters
+        ----------
+        tables : List[Tuple[str, str]]
+            The (databook, table) sections.
+
+        Returns
+        -------
+        str
+            The reference content, the whole content if all sections are
+            required or any of them is not found.
+        """
+        sections = self._index()
+        key = frozenset(tables)
+
+        # NOTE: all sections or unknown sections
+        if key >= set(sections.keys()) or not key <= set(sections.keys()):
+            return self.content
+
+        content_ = self._materialized.get(key, None)
+        if content_ is not None:
+            return content_
+
+        content = self.content
+        parts = [content[slice(*self._header)]]
+        for databook, databook_span in self._databooks.items():
+            tables_ = [
+                section for section in sections
+                if section[0] == databook and section in key
+            ]
+            if not tables_:
+                continue
+            parts.append(content[slice(*databook_span)])
+            parts.extend(content[slice(*sections[t])] for t in tables_)
+        content_ = ''.join(parts)
+
+        with self._lock:
+            self._materialized[key] = content_
+        return content_
+
+    def project(
+        self,
+        reference: Dict[str, List[str]],
+        reference_config: Dict[str, Any]
+    ) -> Dict[str, List[str]]:
+        """
+        Replace the default content of a component reference with the
+        sections used by the component reference config.
+
+        Parameters
+        ----------
+        reference : Dict[str, List[str]]
+            The component reference ({'reference': [contents]}).
+        reference_config : Dict[str, Any]
+            The component reference config (property -> databook/table).
+
+        Returns
+        -------
+        Dict[str, List[str]]
+            The projected reference (the same object if nothing changes).
+        """
+        contents = reference.get('reference', None) if isinstance(
+            reference, dict) else None
+        if not contents or not any(self.is_default(c) for c in contents):
+            return reference
+
+        # NOTE: (databook, table) used by the config
+        tables: List[Tuple[str, str]] = []
+        for config in (reference_config or {}).values():
+            if isinstance(config, dict):
+                databook, table = config.get('databook'), config.get('table')
+            else:
+                databook = getattr(config, 'databook', None)
+                table = getattr(config, 'table', None)
+            if not databook or not table:
+                # NOTE: unknown config, keep the whole content
+                return reference
+            tables.append((str(databook).strip(), str(table).strip()))
+
+        content_ = self.materialize(tables)
+        if content_ is self._content:
+            return reference
+
+        logger.debug(f"Default reference projected to {len(tables)} tables")
+        return {
+            **reference,
+            'reference': [
+                content_ if self.is_default(c) else c for c in contents
+            ]
+        }
+
+
+# NOTE: shared by all references thermodb of the process
+default_reference = DefaultReference()
@@ -0,0 +1,249 @@
+# import libs
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import (
+    Any,
+    Dict,
+    Optional,
+    Tuple
+)
+from pyThermoDB.references import (
+    ReferenceChecker,
+    extract_reference_from_str,
+    load_reference_from_str
+)
+# locals
+from ..config import app_settings
+from ..resources.thermodb_cache import ThermoDBCache
+
+# NOTE: logger
+logger = logging.getLogger(__name__)
+
+# NOTE: estimated parsed size per content character (bytes)
+PARSED_SIZE_FACTOR = 8
+
+
+class ParsedReference:
+    """
+    Parsed forms of a reference content, each parsed once on first use and
+    shared by all consumers of the same content.
+    """
+
+    def __init__(
+        self,
+        content: str,
+        memo_max_entries: int = 64
+    ) -> None:
+        """
+        Initialize the ParsedReference.
+
+        Parameters
+        ----------
+        content : str
+            The reference content.
+        memo_max_entries : int, optional
+            Maximum number of derived values kept (least recently used are
+            dropped), default is 64.
+        """
+        self.content = content
+        self.sha256 = ParsedReference.content_hash(content)
+
+        # NOTE: parsed forms (lazy)
+        self._extracted: Optional[Tuple[bool, str]] = None
+        self._reference: Optional[Dict[str, Any]] = None
+        self._checker: Optional[ReferenceChecker] = None
+
+        # NOTE: derived data of the consumers (e.g. component index), lru
+        self.memo: OrderedDict[str, Any] = OrderedDict()
+        self.memo_max_entries = max(1, memo_max_entries)
+        self._lock = threading.RLock()
+        # NOTE: memo key -> lock of its (running) factory
+        self._memo_locks: Dict[str, threading.Lock] = {}
+
+    @staticmethod
+    def content_hash(content: str) -> str:
+        """
+        Get the sha256 of a reference content.
+        """
+        return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+    @property
+    def extracted(self) -> Tuple[bool, str]:
+        """
+        The extracted (yaml) reference, `extract_reference_from_str` result.
+        """
+        if self._extracted is None:
+            with self._lock:
+                if self._extracted is None:
+                    self._extracted = extract_reference_from_str(
+                        content=self.content
+                    )
+        return self._extracted
+
+    @property
+    def reference(self) -> Dict[str, Any]:
+        """
+        The reference loaded from the content (`load_reference_from_str`).
+        """
+        if self._reference is None:
+            with self._lock:
+                if self._reference is None:
+                    self._reference = load_reference_from_str(self.content)
+        return self._reference
+
+    @property
+    def checker(self) -> ReferenceChecker:
+        """
+        The ReferenceChecker of the content.
+        """
+        if self._checker is None:
+            with self._lock:
+                if self._checker is None:
+                    self._checker = ReferenceChecker(self.content)
+        return self._checker
+
+    def memoize(self, key: str, factory: Any) -> Any:
+        """
+        Get a derived value of the reference, created by `factory` on a miss.
+
+        Notes
+        -----
+        - The memo keeps the `memo_max_entries` most recently used values,
+          an evicted value is created again on its next use.
+        - The factory runs outside the reference lock (the parsers and the
+          other derived values are not held up), concurrent misses of the
+          same key wait for a single factory call.
+        """
+        with self._lock:
+            value = self._memo_get(key)
+            if value is not None:
+                return value
+            key_lock = self._memo_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            # NOTE: created by a concurrent call
+            with self._lock:
+                value = self._memo_get(key)
+            if value is not None:
+                return value
+
+            try:
+                value = factory()
+            except Exception:
+                with self._lock:
+                    self._memo_locks.pop(key, None)
+                raise
+
+            with self._lock:
+                self._memo_locks.pop(key, None)
+                # NOTE: check then set
+                value_ = self._memo_get(key)
+                if value_ is not None:
+                    return value_
+                self.memo[key] = value
+                # NOTE: drop the least recently used
+                while len(self.memo) > self.memo_max_entries:
+                    self.memo.popitem(last=False)
+        return value
+
+    def _memo_get(self, key: str) -> Any:
+        """
+        Get a memo value and mark it as recently used (lock held by the
+        caller).
+        """
+        value = self.memo.get(key, None)
+        if value is not None:
+            self.memo.move_to_end(key)
+        return value
+
+class ParsedReferenceCache:
+    """
+    Bounded process-wide cache of parsed references by content hash.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 32,
+        max_bytes: int = 64 * 1024 * 1024,
+        memo_max_entries: int = 64
+    ) -> None:
+        """
+        Initialize the ParsedReferenceCache.
+
+        Parameters
+        ----------
+        max_entries : int, optional
+            Maximum number of parsed references, default is 32 (0 disables
+            the cache).
+        max_bytes : int, optional
+            Maximum (estimated) size of parsed references in bytes, default
+            is 64 MB.
+        memo_max_entries : int, optional
+            Maximum number of derived values of each parsed reference,
+            default is 64.
+        """
+        self._store = ThermoDBCache(
+            max_entries=max_entries,
+            max_bytes=max_bytes
+        )
+        self.memo_max_entries = memo_max_entries
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+    def get(self, content: str) -> ParsedReference:
+        """
+        Get the parsed reference of a content (created on a miss).
+
+        Parameters
+        ----------
+        content : str
+            The reference content.
+
+        Returns
+        -------
+        ParsedReference
+            The shared parsed reference.
+        """
+        sha = ParsedReference.content_hash(content)
+        parsed_reference = self._store.get(sha)
+        if parsed_reference is not None:
+            return parsed_reference
+
+        with self._lock:
+            parsed_reference = self._store.get(sha)
+            if parsed_reference is None:
+                parsed_reference = ParsedReference(
+                    content,
+                    memo_max_entries=self.memo_max_entries
+                )
+                self._store.put(
+                    sha,
+                    parsed_reference,
+                    size=PARSED_SIZE_FACTOR * len(content)
+                )
+                logger.debug(f"Parsed reference created: {sha[:12]}")
+            return parsed_reference
+
+    def clear(self) -> None:
+        """
+        Clear the cache.
+        """
+        self._store.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get the cache statistics.
+        """
+        return self._store.stats()
+
+
+# NOTE: process-wide parsed references
+parsed_references = ParsedReferenceCache(
+    max_entries=app_settings.parsed_reference_cache_max_entries,
+    max_bytes=app_settings.parsed_reference_cache_max_bytes,
+    memo_max_entries=app_settings.parsed_reference_memo_max_entries
+)
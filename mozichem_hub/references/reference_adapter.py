@@ -3,10 +3,11 @@ import yaml
 import json
 import logging
 from typing import Dict, Any, Literal, Union
-from pyThermoDB.references import ReferenceConfig, ReferenceChecker
+from pyThermoDB.references import ReferenceConfig
 from pythermodb_settings.models import ComponentConfig, ComponentRule
 # local
 from ..models import ComponentPropertySource
+from .parsed_reference import parsed_references
 
 
 class ReferencesAdapter:
@@ -61,23 +62,43 @@ class ReferencesAdapter:
             )
             res_dict = None
 
+        # NOTE: adapt the dictionary
+        return self.config_from_dict(res_dict)
+
+    def config_from_dict(
+        self,
+        reference_config: dict
+    ) -> Dict[str, Dict[str, ComponentPropertySource]]:
+        """
+        Convert the reference configuration from a dictionary to the required format (dictionary).
+
+        Parameters
+        ----------
+        reference_config : Dict[str, Dict[str, str]]
+            The reference configuration to be adapted.
+
+        Returns
+        -------
+        Dict[str, Dict[str, ComponentPropertySource]]
+            The adapted reference configuration as a dictionary.
+        """
         try:
             # NOTE: check if the result is a valid dictionary
-            if not isinstance(res_dict, dict):
+            if not isinstance(reference_config, dict):
                 raise ValueError(
                     "The reference configuration is not a valid dictionary.")
 
             # NOTE: check if the dictionary is empty
-            if not res_dict:
+            if not reference_config:
                 raise ValueError(
                     "The reference configuration is empty or invalid.")
 
-            # SECTION: convert ComponentPropertySource to dict
+            # SECTION: convert dict to ComponentPropertySource
             # init the result dictionary
             res: Dict[str, Any] = {}
 
-            # NOTE: iterate over the dictionary and convert ComponentPropertySource to dict
-            for key, value in res_dict.items():
+            # NOTE: iterate over the dictionary (no serialization round-trip)
+            for key, value in reference_config.items():
                 # NOTE: iterate over value
                 if not isinstance(value, dict):
                     raise ValueError(
@@ -96,10 +117,9 @@ class ReferencesAdapter:
 
                     # check if the inner value is a ComponentPropertySource
                     if isinstance(inner_value, ComponentPropertySource):
-                        # Convert ComponentPropertySource to dict
                         inner_res[inner_key] = inner_value
                     elif isinstance(inner_value, dict):
-                        # If it's already a dict, just use it
+                        # If it's a dict, convert it
                         inner_res[inner_key] = ComponentPropertySource(
                             **inner_value
                         )
@@ -117,39 +137,6 @@ class ReferencesAdapter:
             logging.error(f"Failed to adapt reference config: {e}")
             raise ValueError(f"Failed to adapt reference config: {e}") from e
 
-    def config_from_dict(
-        self,
-        reference_config: dict
-    ) -> Dict[str, Dict[str, ComponentPropertySource]]:
-        """
-        Convert the reference configuration from a dictionary to the required format (dictionary).
-
-        Parameters
-        ----------
-        reference_config : Dict[str, Dict[str, str]]
-            The reference configuration to be adapted.
-
-        Returns
-        -------
-        Dict[str, Dict[str, ComponentPropertySource]]
-            The adapted reference configuration as a dictionary.
-        """
-        # SECTION: check if the reference_config is a dictionary
-        if not isinstance(reference_config, dict):
-            raise ValueError(
-                "The reference configuration must be a dictionary.")
-
-        # NOTE: convert the dictionary to the required format
-        # Convert single quotes to double quotes
-        reference_config_str = str(reference_config)
-        reference_config_str = reference_config_str.replace("'", '"')
-
-        # return the adapted reference configuration
-        return self.config_from_str(
-            reference_config_str,
-            reference_config_type="dict"
-        )
-
     def build_reference_link(
         self,
         reference_config: Dict[str, Dict[str, ComponentPropertySource]]
@@ -320,6 +307,51 @@ class ReferencesAdapter:
             raise ValueError(
                 f"Failed to convert reference link from string to dict: {e}") from e
 
+    def merge_reference_links(
+            self,
+            *reference_links: Union[
+                Dict[str, Dict[str, ComponentRule]], str, None
+            ]
+    ) -> Dict[str, Dict[str, ComponentRule]]:
+        """
+        Merge reference links, a component of a later link replaces the same
+        component of the previous ones.
+
+        Parameters
+        ----------
+        *reference_links : Dict[str, Dict[str, ComponentRule]] | str | None
+            The reference links to be merged, a string link (user input) is
+            converted to a dictionary.
+
+        Returns
+        -------
+        Dict[str, Dict[str, ComponentRule]]
+            The merged reference link.
+        """
+        # NOTE: init
+        res: Dict[str, Dict[str, ComponentRule]] = {}
+
+        for reference_link in reference_links:
+            if not reference_link:
+                continue
+
+            # NOTE: string link (user-facing boundary)
+            if isinstance(reference_link, str):
+                reference_link = self.dict_from_reference_link(
+                    reference_link=reference_link
+                )
+                if not reference_link:
+                    continue
+
+            if not isinstance(reference_link, dict):
+                raise ValueError(
+                    f"Invalid reference link type: {type(reference_link)}."
+                )
+
+            res.update(reference_link)
+
+        return res
+
     def to_reference_config(
         self,
         reference_config: Dict[str, Dict[str, ComponentPropertySource]]
@@ -428,8 +460,8 @@ class ReferencesAdapter:
             The state of the component for which to extract the configuration.
         '''
         try:
-            # NOTE: initialize the ReferenceChecker
-            ReferenceChecker_ = ReferenceChecker(reference_content)
+            # NOTE: the ReferenceChecker (shared by content)
+            ReferenceChecker_ = parsed_references.get(reference_content).checker
 
             # NOTE: get component reference config
             component_reference_config = \
@@ -0,0 +1,534 @@
+# import libs
+import os
+import copy
+import json
+import struct
+import hashlib
+import logging
+import tempfile
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import (
+    Any,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Tuple
+)
+from pyThermoDB import __version__ as pythermodb_version
+from pyThermoDB.references import (
+    ReferenceChecker,
+    load_reference_from_str
+)
+# locals
+from ..config import app_settings
+from ..errors import (
+    ReferenceCompileError,
+    REFERENCE_COMPILE_ERROR_MSG
+)
+
+# NOTE: logger
+logger = logging.getLogger(__name__)
+
+# NOTE: file layout
+# magic (8 bytes) | header size (uint64) | header (json) | payload (json)
+MAGIC = b'MZREF002'
+PREFIX = struct.Struct('<8sQ')
+# NOTE: compiler format version (part of the artifact key)
+FORMAT_VERSION = 2
+COMPONENT_KEYS = ('Name-State', 'Formula-State')
+# NOTE: identity columns of a table
+IDENTITY_COLUMNS = ('Name', 'Formula', 'State')
+
+
+def content_sha256(content: str) -> str:
+    """
+    Get the sha256 of a reference content.
+    """
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+
+def artifact_key(sha: str) -> str:
+    """
+    Key of a compiled reference, the content sha256 with the compiler
+    format and the pyThermoDB (parsers) versions.
+    """
+    return hashlib.sha256(
+        f"{FORMAT_VERSION}|{pythermodb_version}|{sha}".encode('utf-8')
+    ).hexdigest()
+
+
+def _component_id(
+    name: str,
+    formula: str,
+    state: str
+) -> str:
+    return f"{name.strip()}|{formula.strip()}|{state.strip()}"
+
+
+def compile_reference(
+    content: str,
+    output_file: str
+) -> str:
+    """
+    Compile a reference content (markdown) into its binary form.
+
+    The binary form holds the databook names, the component index and the
+    component reference configs/rules produced by the text parsers, the
+    table data is still built by pyThermoDB from the content.
+
+    Parameters
+    ----------
+    content : str
+        The reference content.
+    output_file : str
+        The binary file path.
+
+    Returns
+    -------
+    str
+        The binary file path.
+    """
+    try:
+        # SECTION: text parsers
+        reference = load_reference_from_str(content)
+        ReferenceChecker_ = ReferenceChecker(content)
+
+        databook_names: List[str] = list(
+            ReferenceChecker_.get_databook_names())
+
+        # SECTION: component index, component id -> [(databook, table)]
+        index: Dict[str, List[Tuple[str, str]]] = {}
+        for databook_name in databook_names:
+            databook = reference.get(databook_name, {}) or {}
+
+            for table_name, table in (databook.get('TABLES', {}) or {}).items():
+                structure = table.get('STRUCTURE', {}) or {}
+                columns: List[str] = list(structure.get('COLUMNS', []) or [])
+                if not all(c in columns for c in IDENTITY_COLUMNS):
+                    continue
+
+                i_name, i_formula, i_state = (
+                    columns.index(c) for c in IDENTITY_COLUMNS
+                )
+                for row in table.get('VALUES', []) or []:
+                    try:
+                        name, formula, state = (
+                            row[i_name], row[i_formula], row[i_state]
+                        )
+                    except IndexError:
+                        continue
+                    if name is None or formula is None or state is None:
+                        continue
+                    index.setdefault(
+                        _component_id(str(name), str(formula), str(state)),
+                        []
+                    ).append((databook_name, table_name))
+
+        # SECTION: component reference configs and rules (text path)
+        components: Dict[str, Dict[str, Any]] = {}
+        for component_id_ in index:
+            name, formula, state = component_id_.split('|')
+            for databook_name in databook_names:
+                for component_key in COMPONENT_KEYS:
+                    key = f"{databook_name}|{component_key}|{component_id_}"
+                    try:
+                        config = \
+                            ReferenceChecker_.get_component_reference_config(
+                                component_name=name,
+                                component_formula=formula,
+                                component_state=state,
+                                databook_name=databook_name,
+                                component_key=component_key,
+                                add_label=True,
+                                check_labels=True
+                            )
+                        rules = ReferenceChecker_.generate_reference_link(
+                            databook_name=databook_name,
+                            component_name=name,
+                            component_formula=formula,
+                            component_state=state,
+                            component_key=component_key
+                        )
+                    except Exception as e:
+                        # NOTE: not compiled, the text path is used
+                        logger.debug(f"Component not compiled {key}: {e}")
+                        continue
+                    components[key] = {'config': config, 'rules': rules}
+
+        # SECTION: payload and header
+        payload = json.dumps({
+            'databooks': databook_names,
+            'index': index,
+            'components': components,
+        }, separators=(',', ':')).encode('utf-8')
+
+        header = json.dumps({
+            'format': FORMAT_VERSION,
+            'pythermodb': pythermodb_version,
+            'sha256': content_sha256(content),
+            'payload_sha256': hashlib.sha256(payload).hexdigest(),
+        }, separators=(',', ':')).encode('utf-8')
+
+        # SECTION: write (atomic)
+        folder = os.path.dirname(os.path.abspath(output_file))
+        os.makedirs(folder, exist_ok=True)
+        fd, tmp_file = tempfile.mkstemp(dir=folder, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(PREFIX.pack(MAGIC, len(header)))
+                f.write(header)
+                f.write(payload)
+            os.chmod(tmp_file, 0o644)
+            os.replace(tmp_file, output_file)
+        except Exception:
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
+            raise
+
+        logger.info(f"Reference compiled: {output_file}")
+        return output_file
+    except Exception as e:
+        raise ReferenceCompileError(
+            f"{REFERENCE_COMPILE_ERROR_MSG} {e}"
+        ) from e
+
+
+class CompiledReference:
+    """
+    Compiled (binary) reference, the component reference configs and rules
+    of a reference content without the text parsers.
+    """
+
+    def __init__(self, file_path: str) -> None:
+        """
+        Open a compiled reference.
+
+        Parameters
+        ----------
+        file_path : str
+            The binary file path.
+
+        Notes
+        -----
+        The file is rejected if its format or pyThermoDB version differs
+        from the current ones or its payload does not match the digest.
+        """
+        self.file_path = file_path
+
+        with open(file_path, 'rb') as f:
+            data = f.read()
+
+        # SECTION: header
+        magic, header_size = PREFIX.unpack_from(data, 0)
+        if magic != MAGIC:
+            raise ValueError(f"Not a compiled reference: {file_path}")
+
+        header = json.loads(
+            data[PREFIX.size:PREFIX.size + header_size].decode('utf-8')
+        )
+        if header.get('format') != FORMAT_VERSION:
+            raise ValueError(f"Incompatible format: {file_path}")
+        if header.get('pythermodb') != pythermodb_version:
+            raise ValueError(
+                f"Compiled with pyThermoDB {header.get('pythermodb')}: {file_path}")
+
+        # SECTION: payload (digest checked)
+        payload = data[PREFIX.size + header_size:]
+        if hashlib.sha256(payload).hexdigest() != header.get('payload_sha256'):
+            raise ValueError(f"Payload digest mismatch: {file_path}")
+        payload_ = json.loads(payload.decode('utf-8'))
+
+        self.sha256: str = header['sha256']
+        self.databook_names: List[str] = payload_['databooks']
+        self.index: Dict[str, List[List[str]]] = payload_['index']
+        self._components: Dict[str, Dict[str, Any]] = payload_['components']
+
+    def _component(
+        self,
+        databook_name: str,
+        component_name: str,
+        component_formula: str,
+        component_state: str,
+        component_key: Literal['Name-State', 'Formula-State']
+    ) -> Optional[Dict[str, Any]]:
+        component_id = _component_id(
+            component_name, component_formula, component_state)
+        return self._components.get(
+            f"{databook_name}|{component_key}|{component_id}", None
+        )
+
+    def component_reference_config(
+        self,
+        databook_name: str,
+        component_name: str,
+        component_formula: str,
+        component_state: str,
+        component_key: Literal[
+            'Name-State', 'Formula-State'
+        ] = 'Name-State'
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get the compiled component reference config (None if not compiled).
+        """
+        component = self._component(
+            databook_name,
+            component_name,
+            component_formula,
+            component_state,
+            component_key
+        )
+        return None if component is None else copy.deepcopy(
+            component['config'])
+
+    def component_reference_rules(
+        self,
+        databook_name: str,
+        component_name: str,
+        component_formula: str,
+        component_state: str,
+        component_key: Literal[
+            'Name-State', 'Formula-State'
+        ] = 'Name-State'
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get the compiled component reference rules (None if not compiled).
+        """
+        component = self._component(
+            databook_name,
+            component_name,
+            component_formula,
+            component_state,
+            component_key
+        )
+        return None if component is None else copy.deepcopy(
+            component['rules'])
+
+
+def default_folder() -> str:
+    """
+    Default folder of the compiled custom references (per user cache).
+    """
+    cache_dir = os.environ.get('XDG_CACHE_HOME') or os.path.join(
+        os.path.expanduser('~'), '.cache'
+    )
+    return os.path.join(cache_dir, 'mozichem_hub', 'references')
+
+
+def secure_folder(folder: str) -> bool:
+    """
+    Create the folder (0700) if needed, check that it is owned by the user
+    and not accessible by the others.
+
+    Returns
+    -------
+    bool
+        True if the folder can be used.
+    """
+    try:
+        os.makedirs(folder, mode=0o700, exist_ok=True)
+        if not hasattr(os, 'getuid'):
+            return True
+
+        stat_ = os.stat(folder)
+        if stat_.st_uid != os.getuid():
+            logger.warning(
+                f"Compiled reference folder not owned by the user: {folder}")
+            return False
+        if stat_.st_mode & 0o077:
+            os.chmod(folder, 0o700)
+        return True
+    except OSError as e:
+        logger.warning(f"Compiled reference folder not available: {e}")
+        return False
+
+
+class CompiledReferenceStore:
+    """
+    Process-wide store of the compiled custom references, looked up by the
+    content sha256.
+
+    Notes
+    -----
+    - The custom references are compiled in a background thread when they
+      are registered, a reference is used in its compiled form once
+      compiled (text path before).
+    - The default reference is not compiled, its component reference
+      configs are fixed (no text parsers) and its tables are built by
+      pyThermoDB from the content.
+    - The files are keyed by the content sha256 with the compiler format
+      and the pyThermoDB versions (`artifact_key`) in a folder of the user
+      (0700).
+    """
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        folder: Optional[str] = None
+    ) -> None:
+        """
+        Initialize the CompiledReferenceStore.
+
+        Parameters
+        ----------
+        enabled : bool, optional
+            Use the compiled references, default is True.
+        folder : str, optional
+            Folder of the compiled custom references, default is
+            `<user cache>/mozichem_hub/references`.
+        """
+        self.enabled = enabled
+        self.folder = folder or default_folder()
+        # NOTE: sha256 -> compiled reference
+        self._references: Dict[str, CompiledReference] = {}
+        # NOTE: sha256 -> pending compilation
+        self._pending: Dict[str, Future] = {}
+        self._folder_checked: Optional[bool] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def _folder(self) -> Optional[str]:
+        """
+        The folder of the compiled custom references, None if it can not be
+        used safely.
+        """
+        if self._folder_checked is None:
+            self._folder_checked = secure_folder(self.folder)
+        return self.folder if self._folder_checked else None
+
+    def _file(self, sha: str) -> Optional[str]:
+        folder = self._folder()
+        if folder is None:
+            return None
+        return os.path.join(folder, f"{artifact_key(sha)}.mzref")
+
+    def _open(self, sha: str) -> Optional[CompiledReference]:
+        file_path = self._file(sha)
+        if file_path is None or not os.path.exists(file_path):
+            return None
+        try:
+            compiled = CompiledReference(file_path)
+        except Exception as e:
+            logger.warning(f"Invalid compiled reference {file_path}: {e}")
+            return None
+        return compiled if compiled.sha256 == sha else None
+
+    def get(self, content: str) -> Optional[CompiledReference]:
+        """
+        Get the compiled form of a reference content.
+
+        Parameters
+        ----------
+        content : str
+            The reference content.
+
+        Returns
+        -------
+        CompiledReference | None
+            The compiled reference, None if not compiled (or disabled).
+        """
+        if not self.enabled or not isinstance(content, str):
+            return None
+
+        sha = content_sha256(content)
+        compiled = self._references.get(sha, None)
+        if compiled is not None:
+            return compiled
+
+        with self._lock:
+            if sha not in self._references:
+                compiled = self._open(sha)
+                # NOTE: misses are not kept (compiled later or elsewhere)
+                if compiled is not None:
+                    self._references[sha] = compiled
+            return self._references.get(sha, None)
+
+    def compile(self, content: str) -> Optional[CompiledReference]:
+        """
+        Compile a reference content into the store folder (if not already
+        compiled).
+
+        Parameters
+        ----------
+        content : str
+            The reference content.
+
+        Returns
+        -------
+        CompiledReference | None
+            The compiled reference, None if disabled (or the folder can not
+            be used).
+        """
+        if not self.enabled:
+            return None
+
+        compiled = self.get(content)
+        if compiled is not None:
+            return compiled
+
+        sha = content_sha256(content)
+        file_path = self._file(sha)
+        if file_path is None:
+            return None
+        compile_reference(content, file_path)
+
+        with self._lock:
+            compiled = self._open(sha)
+            if compiled is not None:
+                self._references[sha] = compiled
+            return compiled
+
+    def compile_async(self, content: str) -> Optional[Future]:
+        """
+        Compile a reference content in a background thread.
+
+        Parameters
+        ----------
+        content : str
+            The reference content.
+
+        Returns
+        -------
+        Future | None
+            The compilation (result: the compiled reference), None if
+            disabled.
+        """
+        if not self.enabled:
+            return None
+
+        sha = content_sha256(content)
+        with self._lock:
+            future = self._pending.get(sha, None)
+            if future is not None:
+                return future
+
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=1,
+                    thread_name_prefix='mozichem-compile'
+                )
+            future = self._executor.submit(self.compile, content)
+            self._pending[sha] = future
+
+        def _done(future_: Future) -> None:
+            with self._lock:
+                self._pending.pop(sha, None)
+            e = future_.exception()
+            if e is not None:
+                logger.warning(
+                    f"Custom reference not compiled, text path is used: {e}")
+
+        future.add_done_callback(_done)
+        return future
+
+
+# NOTE: process-wide compiled references
+compiled_references = CompiledReferenceStore(
+    enabled=app_settings.compiled_reference,
+    folder=(
+        str(app_settings.compiled_reference_dir)
+        if app_settings.compiled_reference_dir else None
+    )
+)
+
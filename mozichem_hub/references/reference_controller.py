@@ -7,7 +7,7 @@ from typing import (
     Dict,
     Tuple,
 )
-from pythermodb_settings.models import ComponentConfig
+from pythermodb_settings.models import ComponentConfig, ComponentRule
 # locals
 from .reference_adapter import ReferencesAdapter
 from ..models import ComponentPropertySource
@@ -46,7 +46,7 @@ class ReferenceController(ReferencesAdapter):
     ) -> Tuple[
         Union[List[str], None],
         Union[Dict[str, Dict[str, ComponentPropertySource]], None],
-        Union[str, None]
+        Union[Dict[str, Dict[str, ComponentRule]], None]
     ]:
         """
         transformer for the reference content and configuration.
@@ -165,7 +165,7 @@ class ReferenceController(ReferencesAdapter):
         reference_config: Optional[
             Dict[str, Dict[str, ComponentPropertySource]]
         ] = None
-    ) -> Optional[str]:
+    ) -> Optional[Dict[str, Dict[str, ComponentRule]]]:
         """
         Build the reference link for the MCP server.
 
@@ -176,7 +176,7 @@ class ReferenceController(ReferencesAdapter):
 
         Returns
         -------
-        Optional[str]
+        Optional[Dict[str, Dict[str, ComponentRule]]]
             The reference link if provided, otherwise None.
         """
         try:
@@ -186,16 +186,8 @@ class ReferenceController(ReferencesAdapter):
                     "Reference config is empty. No link will be built.")
                 return None
 
-            # SECTION: build the reference link
-            reference_link = self.build_reference_link(reference_config)
-
-            # NOTE: check the result format
-            if reference_link is not None:
-                # convert the reference link to a string
-                reference_link = self.str_from_reference_link(reference_link)
-
-            # return the reference link
-            return reference_link
+            # SECTION: build the reference link (kept as a dictionary)
+            return self.build_reference_link(reference_config)
         except Exception as e:
             logging.error(
                 "Failed to build reference link. "
@@ -21,6 +21,7 @@ from .reference_services import ReferenceServices
 from .reference_controller import ReferenceController
 from ..models import References
 from .referencethermodb_controller import ReferenceThermoDBController
+from .parsed_reference import parsed_references
 
 # NOTE: logger
 logger = logging.getLogger(__name__)
@@ -302,12 +303,21 @@ class ReferenceMapper(ReferenceServices):
             component_formula_state = f"{component.formula}-{component.state}"
 
             # SECTION: generate the component reference thermodb
+            # NOTE: once per content and component (shared by content)
+            mapper_key = (
+                f"component_reference_mapper|{component.name}|"
+                f"{component.formula}|{component.state}|{component_key}|"
+                f"{','.join(sorted(ignore_state_props))}"
+            )
             component_reference_thermodb: ComponentReferenceThermoDB = \
-                component_reference_mapper(
-                    component=ptdb_component,
-                    reference_content=reference_content,
-                    component_key=component_key,
-                    ignore_state_props=ignore_state_props
+                parsed_references.get(reference_content).memoize(
+                    mapper_key,
+                    lambda: component_reference_mapper(
+                        component=ptdb_component,
+                        reference_content=reference_content,
+                        component_key=component_key,
+                        ignore_state_props=ignore_state_props
+                    )
                 )
 
             # NOTE: extract
@@ -14,7 +14,7 @@ from pythermodb_settings.models import (
 # local
 from ..models import References
 from .reference_adapter import ReferencesAdapter
-from .contents import REFERENCE_CONTENT
+from .default_reference import default_reference
 from .config import REFERENCE_CONFIGS
 
 
@@ -100,12 +100,12 @@ class ReferencesInitializer:
 
         Returns
         -------
-        str, Dict[str, Dict[str, ComponentPropertySource]], str
-            The local reference content, configuration, and rule.
+        References
+            The local reference contents, configuration, and link.
         """
         try:
-            # NOTE: Load the local reference content
-            reference_content = REFERENCE_CONTENT
+            # NOTE: Load the local reference content (shared, loaded once)
+            reference_content = default_reference.content
 
             # NOTE: Load the local reference configuration
             reference_config = REFERENCE_CONFIGS
@@ -117,13 +117,6 @@ class ReferencesInitializer:
                 reference_config=reference_config
             )
 
-            if reference_link is not None:
-                # ? convert reference link to string
-                reference_link = \
-                    self.ReferencesAdapter_.str_from_reference_link(
-                        reference_link=reference_link
-                    )
-
             # local references
             local_references = References(
                 contents=[reference_content],
@@ -153,7 +146,7 @@ class ReferencesInitializer:
             # SECTION: set local reference content and config
             local_reference_content = self.local_references.contents or []
             local_reference_config = self.local_references.config or {}
-            local_reference_link = self.local_references.link or ''
+            local_reference_link = self.local_references.link or {}
 
             # SECTION: check if external references are provided
             if external_references is None:
@@ -169,8 +162,8 @@ class ReferencesInitializer:
 
                 # NOTE: reference link
                 local_reference_link_ = \
-                    self.ReferencesAdapter_.dict_from_reference_link(
-                        reference_link=local_reference_link
+                    self.ReferencesAdapter_.merge_reference_links(
+                        local_reference_link
                     )
 
                 # LINK: Create the ReferenceThermoDB object
@@ -188,7 +181,7 @@ class ReferencesInitializer:
                 external_reference_config = external_references.config \
                     if external_references.config else {}
                 external_reference_link = external_references.link \
-                    if external_references.link else ''
+                    if external_references.link else {}
 
                 # SECTION: merge local and external references
                 # Combine local reference content with external references
@@ -201,12 +194,6 @@ class ReferencesInitializer:
                     **local_reference_config,
                     **external_reference_config
                 }
-                # ! reference link
-                reference_link = (
-                    local_reference_link +
-                    '\n' +
-                    external_reference_link
-                )
 
                 # NOTE: reference
                 reference = {
@@ -219,10 +206,11 @@ class ReferencesInitializer:
                         reference_config
                     )
 
-                # NOTE: reference link
+                # NOTE: reference link (external components replace local)
                 reference_link_ = \
-                    self.ReferencesAdapter_.dict_from_reference_link(
-                        reference_link=reference_link
+                    self.ReferencesAdapter_.merge_reference_links(
+                        local_reference_link,
+                        external_reference_link
                     )
 
                 # LINK: Create the ReferenceThermoDB object
@@ -1,14 +1,15 @@
 # import libs
+import copy
 import logging
 from typing import (
+    Any,
     Dict,
     Literal,
     List,
+    Optional,
 )
-from pyThermoDB.references import (
-    ReferenceChecker,
-    load_reference_from_str
-)
+from pyThermoDB.references import ReferenceChecker
+from pyThermoDB.references.symbols_controller import SymbolController
 from pythermodb_settings.models import (
     ComponentConfig,
     ComponentRule,
@@ -26,6 +27,9 @@ from ..errors import (
     COMPONENT_REFERENCE_CONFIG_ERROR_MSG,
     COMPONENT_REFERENCE_LINK_ERROR_MSG
 )
+from ..models import ComponentsReference
+from .reference_compiler import CompiledReference, compiled_references
+from .parsed_reference import ParsedReference, parsed_references
 
 
 class ReferenceThermoDBController():
@@ -49,11 +53,229 @@ class ReferenceThermoDBController():
         if not isinstance(reference_content, str):
             raise TypeError("reference_content must be a string.")
 
-        # SECTION: load the reference from string
-        self.reference = load_reference_from_str(reference_content)
+        # SECTION: compiled reference (if available)
+        self.compiled_reference: Optional[CompiledReference] = \
+            compiled_references.get(reference_content)
+
+        # NOTE: text parsers (shared by content, parsed on first use)
+        self.parsed_reference: ParsedReference = \
+            parsed_references.get(reference_content)
+
+        # NOTE: component index, databook -> table -> name -> record
+        # (None if a table can not be indexed)
+        self._components_index: Dict[
+            str, Optional[Dict[str, Dict[str, Dict[str, Any]]]]
+        ] = self.parsed_reference.memoize('components_index', dict)
+        # NOTE: per table config and link, (databook, table) -> value
+        self._table_configs: Dict[tuple, Optional[Dict[str, Any]]] = \
+            self.parsed_reference.memoize('table_configs', dict)
+        self._table_links: Dict[tuple, Dict[str, Dict[str, str]]] = \
+            self.parsed_reference.memoize('table_links', dict)
+
+    @property
+    def reference(self) -> Dict[str, Any]:
+        """
+        The reference loaded from the content (parsed on first access).
+        """
+        return self.parsed_reference.reference
+
+    @property
+    def ReferenceChecker_(self) -> ReferenceChecker:
+        """
+        The ReferenceChecker of the content (created on first access).
+        """
+        return self.parsed_reference.checker
+
+    def _component_index(
+        self,
+        databook_name: str
+    ) -> Optional[Dict[str, Dict[str, Dict[str, Any]]]]:
+        """
+        Index the components of all tables of a databook in one pass.
+
+        Parameters
+        ----------
+        databook_name : str
+            The name of the databook.
 
-        # SECTION: create ReferenceChecker instance
-        self.ReferenceChecker_ = ReferenceChecker(reference_content)
+        Returns
+        -------
+        Optional[Dict[str, Dict[str, Dict[str, Any]]]]
+            table -> component name -> record (Name, Formula, State), None if
+            any table can not be indexed (the text path is used then).
+
+        Notes
+        -----
+        The records follow `ReferenceChecker.get_table_components`, the last
+        row of a component name is kept.
+        """
+        if databook_name in self._components_index:
+            return self._components_index[databook_name]
+
+        index: Optional[Dict[str, Dict[str, Dict[str, Any]]]] = {}
+        tables = self.ReferenceChecker_.get_databook_tables(databook_name)
+        if not isinstance(tables, dict):
+            index = None
+        else:
+            for table_name, table in tables.items():
+                structure = table.get('STRUCTURE', None) if isinstance(
+                    table, dict) else None
+                values = table.get('VALUES', None) if isinstance(
+                    table, dict) else None
+                columns = structure.get('COLUMNS', None) if isinstance(
+                    structure, dict) else None
+
+                # NOTE: identity columns are required
+                if (
+                    not isinstance(values, list) or
+                    not isinstance(columns, list) or
+                    not all(c in columns for c in ('Name', 'Formula', 'State'))
+                ):
+                    index = None
+                    break
+
+                i_name = columns.index('Name')
+                i_formula = columns.index('Formula')
+                i_state = columns.index('State')
+
+                records: Dict[str, Dict[str, Any]] = {}
+                try:
+                    for row in values:
+                        records[row[i_name]] = {
+                            'Name': row[i_name],
+                            'Formula': row[i_formula],
+                            'State': row[i_state]
+                        }
+                except (TypeError, IndexError, KeyError):
+                    # NOTE: malformed rows
+                    index = None
+                    break
+                index[table_name] = records
+
+        self._components_index[databook_name] = index
+        return index
+
+    def _component_availability(
+        self,
+        databook_name: str,
+        component_name: str,
+        component_formula: str,
+        component_state: str,
+        component_key: Literal['Name-State', 'Formula-State']
+    ) -> Optional[Dict[str, bool]]:
+        """
+        Check the availability of a component in the tables of a databook
+        (same rules as `ReferenceChecker.check_component_availability`).
+
+        Returns
+        -------
+        Optional[Dict[str, bool]]
+            table -> available, None if the databook is not indexed.
+        """
+        index = self._component_index(databook_name)
+        if index is None:
+            return None
+
+        name_ = component_name.lower()
+        formula_ = component_formula.strip().lower()
+        state_ = component_state.strip().lower()
+
+        availability: Dict[str, bool] = {}
+        for table_name, records in index.items():
+            record = records.get(component_name.strip(), None)
+            if record is None:
+                continue
+
+            name = record['Name']
+            formula = record['Formula']
+            state = record['State']
+
+            if component_key == 'Name-State':
+                if name is None or state is None:
+                    continue
+                availability[table_name] = (
+                    name.lower().strip() == name_ and
+                    state.lower().strip() == state_
+                )
+            elif component_key == 'Formula-State':
+                if formula is None or state is None:
+                    continue
+                availability[table_name] = (
+                    formula.lower().strip() == formula_ and
+                    state.lower().strip() == state_
+                )
+
+        return availability
+
+    def _table_config(
+        self,
+        databook_name: str,
+        table_name: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get the reference config of a table (the same for all components),
+        None if the table is skipped by `get_component_reference_config`.
+        """
+        key = (databook_name, table_name)
+        if key in self._table_configs:
+            return self._table_configs[key]
+
+        checker = self.ReferenceChecker_
+        config: Optional[Dict[str, Any]] = None
+
+        table_type = checker.get_table_type(
+            databook_name=databook_name,
+            table_name=table_name
+        )
+        is_matrix = checker.is_matrix_table(databook_name, table_name)
+
+        if table_type == 'DATA':
+            symbols = (
+                checker.get_matrix_table_symbols(databook_name, table_name)
+                if is_matrix else
+                checker.get_table_data_details(databook_name, table_name)
+            )
+            if symbols is None or SymbolController().check_symbols(
+                list(symbols.values())
+            ):
+                config = {
+                    'databook': databook_name,
+                    'table': table_name,
+                    'mode': table_type,
+                    'labels': symbols
+                }
+        elif table_type == 'EQUATIONS':
+            symbol = checker.get_table_equation_details(
+                databook_name,
+                table_name
+            )
+            if symbol is None or SymbolController().check_symbols([symbol]):
+                config = {
+                    'databook': databook_name,
+                    'table': table_name,
+                    'mode': table_type,
+                    'label': symbol
+                }
+
+        self._table_configs[key] = config
+        return config
+
+    def _table_link(
+        self,
+        databook_name: str,
+        table_name: str
+    ) -> Dict[str, Dict[str, str]]:
+        """
+        Get the reference link of a table (the same for all components).
+        """
+        key = (databook_name, table_name)
+        if key not in self._table_links:
+            self._table_links[key] = \
+                self.ReferenceChecker_.generate_reference_link(
+                    databook_name=databook_name,
+                    table_names=[table_name]
+                )
+        return self._table_links[key]
 
     def get_databook_names(self) -> list:
         """
@@ -64,6 +286,8 @@ class ReferenceThermoDBController():
         list
             A list of databook names.
         """
+        if self.compiled_reference is not None:
+            return list(self.compiled_reference.databook_names)
         return self.ReferenceChecker_.get_databook_names()
 
     def get_default_databook_name(self) -> str:
@@ -148,16 +372,51 @@ class ReferenceThermoDBController():
                 raise NoDatabookFoundError(NO_DATABOOK_FOUND_MSG)
 
             # SECTION: generate the reference config
-            component_reference_config = \
-                self.ReferenceChecker_.get_component_reference_config(
+            # NOTE: compiled reference (if the component is compiled)
+            component_reference_config = None
+            if self.compiled_reference is not None:
+                component_reference_config = \
+                    self.compiled_reference.component_reference_config(
+                        databook_name=selected_databook,
+                        component_name=component_name,
+                        component_formula=component_formula,
+                        component_state=component_state,
+                        component_key=component_key
+                    )
+
+            # NOTE: component index
+            if component_reference_config is None:
+                availability = self._component_availability(
+                    databook_name=selected_databook,
                     component_name=component_name,
                     component_formula=component_formula,
                     component_state=component_state,
-                    databook_name=selected_databook,
-                    component_key=component_key,
-                    add_label=True,
-                    check_labels=True
-                )
+                    component_key=component_key
+                ) if (
+                    component_name and component_formula and component_state
+                ) else None
+
+                if availability is not None:
+                    component_reference_config = {}
+                    for table_name, available in availability.items():
+                        table_config = self._table_config(
+                            selected_databook, table_name
+                        ) if available else None
+                        if table_config is not None:
+                            component_reference_config[table_name] = \
+                                copy.deepcopy(table_config)
+
+            if component_reference_config is None:
+                component_reference_config = \
+                    self.ReferenceChecker_.get_component_reference_config(
+                        component_name=component_name,
+                        component_formula=component_formula,
+                        component_state=component_state,
+                        databook_name=selected_databook,
+                        component_key=component_key,
+                        add_label=True,
+                        check_labels=True
+                    )
 
             # check if the reference config is empty
             if not component_reference_config:
@@ -250,14 +509,51 @@ class ReferenceThermoDBController():
             databook_name = self.get_default_databook_name()
 
             # SECTION: get the reference link
-            reference_link: Dict[str, ComponentRule] = \
-                self.ReferenceChecker_.generate_reference_link(
+            # NOTE: compiled reference (if the component is compiled)
+            reference_link = None
+            if self.compiled_reference is not None:
+                reference_link = \
+                    self.compiled_reference.component_reference_rules(
+                        databook_name=databook_name,
+                        component_name=component_name,
+                        component_formula=component_formula,
+                        component_state=component_state,
+                        component_key=component_key
+                    )
+
+            # NOTE: component index (the text path is used if the
+            # component is not found in any table)
+            if reference_link is None:
+                availability = self._component_availability(
                     databook_name=databook_name,
                     component_name=component_name,
                     component_formula=component_formula,
                     component_state=component_state,
                     component_key=component_key
-            )
+                ) if (
+                    component_name and component_formula and component_state
+                ) else None
+
+                if availability:
+                    reference_link = {'DATA': {}, 'EQUATIONS': {}}
+                    for table_name, available in availability.items():
+                        if not available:
+                            continue
+                        table_link = self._table_link(
+                            databook_name, table_name)
+                        reference_link['DATA'].update(table_link['DATA'])
+                        reference_link['EQUATIONS'].update(
+                            table_link['EQUATIONS'])
+
+            if reference_link is None:
+                reference_link = \
+                    self.ReferenceChecker_.generate_reference_link(
+                        databook_name=databook_name,
+                        component_name=component_name,
+                        component_formula=component_formula,
+                        component_state=component_state,
+                        component_key=component_key
+                    )
 
             # res
             return reference_link
@@ -306,6 +602,86 @@ class ReferenceThermoDBController():
             raise ReferenceLinkGenerationError(
                 COMPONENT_REFERENCE_LINK_ERROR_MSG) from e
 
+    def generate_components_reference(
+        self,
+        components: list[Component],
+        component_key: Literal[
+            'Name-State', 'Formula-State'
+        ] = 'Name-State'
+    ) -> ComponentsReference:
+        """
+        Generate the reference configs and rules of a batch of components.
+
+        Parameters
+        ----------
+        components : list[Component]
+            A list of Component instances.
+        component_key : Literal['Name-State', 'Formula-State'], optional
+            Key to identify the component in the reference content, by default 'Name-State'.
+
+        Returns
+        -------
+        ComponentsReference
+            The shared reference, configs and rules by component id
+            (name-state and formula-state).
+
+        Notes
+        -----
+        Each component is resolved once, its name-state and formula-state
+        ids refer to the same config and rules.
+        """
+        # SECTION: reference
+        reference = {'reference': [self.reference_content]}
+
+        # SECTION: reference contents
+        reference_contents = [self.reference_content]
+
+        # SECTION: generate reference config and link for each component
+        components_reference_config: Dict[str, Dict[str, ComponentConfig]] = {}
+        components_reference_link: Dict[str, Dict[str, ComponentRule]] = {}
+
+        for component in components:
+            # ! component name-state
+            component_name_state = f"{component.name}-{component.state}"
+            # ! component formula-state
+            component_formula_state = f"{component.formula}-{component.state}"
+
+            # NOTE: already resolved (duplicate component)
+            if component_name_state in components_reference_config:
+                continue
+
+            # NOTE: generate reference config
+            component_reference_config = \
+                self.generate_component_reference_config(
+                    component_name=component.name,
+                    component_formula=component.formula,
+                    component_state=component.state,
+                    component_key=component_key
+                )
+
+            # NOTE: generate reference link
+            component_reference_link = \
+                self.generate_component_reference_link(
+                    component_name=component.name,
+                    component_formula=component.formula,
+                    component_state=component.state,
+                    component_key=component_key
+                )
+
+            # NOTE: save by name-state and formula-state
+            for component_id in (component_name_state, component_formula_state):
+                components_reference_config[component_id] = \
+                    component_reference_config
+                components_reference_link[component_id] = \
+                    component_reference_link
+
+        return ComponentsReference(
+            reference=reference,
+            contents=reference_contents,
+            configs=components_reference_config,
+            rules=components_reference_link
+        )
+
     def generate_components_reference_thermodb(
         self,
         components: list[Component],
@@ -329,69 +705,29 @@ class ReferenceThermoDBController():
             A list of ComponentReferenceThermoDB instances.
         """
         try:
-            # SECTION: reference
-            reference = {'reference': [self.reference_content]}
-
-            # SECTION: reference contents
-            reference_contents = [self.reference_content]
-
-            # SECTION: generate reference config and link for each component
-            # init components reference config
-            components_reference_config = {}
-            # init components reference link
-            components_reference_link = {}
+            # SECTION: shared configs and rules (one pass)
+            components_reference = self.generate_components_reference(
+                components=components,
+                component_key=component_key
+            )
 
             # NOTE: init
             components_reference_thermodb: List[ComponentReferenceThermoDB] = [
             ]
 
-            # SECTION: iterate over components
+            # SECTION: component slices
             for component in components:
-                # NOTE: generate reference config
-                component_reference_config = \
-                    self.generate_component_reference_config(
-                        component_name=component.name,
-                        component_formula=component.formula,
-                        component_state=component.state,
-                        component_key=component_key
-                    )
-
-                # NOTE: generate reference link
-                component_reference_link = \
-                    self.generate_component_reference_link(
-                        component_name=component.name,
-                        component_formula=component.formula,
-                        component_state=component.state,
-                        component_key=component_key
-                    )
-
                 # ! component name-state
                 component_name_state = f"{component.name}-{component.state}"
-                # ! component formula-state
-                component_formula_state = f"{component.formula}-{component.state}"
-
-                # NOTE: save by name-state
-                # add to components reference config
-                components_reference_config[component_name_state] = \
-                    component_reference_config
-                # add to components reference link
-                components_reference_link[component_name_state] = \
-                    component_reference_link
-
-                # NOTE: save by formula-state
-                # add to components reference config
-                components_reference_config[component_formula_state] = \
-                    component_reference_config
-                # add to components reference link
-                components_reference_link[component_formula_state] = \
-                    component_reference_link
 
-                # NOTE: create ReferenceThermoDB instance
+                # NOTE: create ReferenceThermoDB instance (component slice)
                 reference_thermodb = ReferenceThermoDB(
-                    reference=reference,
-                    contents=reference_contents,
-                    configs=components_reference_config,
-                    rules=components_reference_link
+                    reference=components_reference.reference,
+                    contents=components_reference.contents,
+                    configs=components_reference.configs[
+                        component_name_state
+                    ],
+                    rules=components_reference.rules[component_name_state]
                 )
 
                 # NOTE: create ComponentReferenceThermoDB instance
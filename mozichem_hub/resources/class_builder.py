@@ -1,14 +1,71 @@
 # import libs
 import logging
+import importlib
+import threading
 from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
     Optional,
     Union,
 )
 # local
+from ..config import MCP_MODULES
 # class lists
-from .ptmcore import PTMCore
-from .ptfcore import PTFCore
-from .ptdbcore import PTDBCore
+if TYPE_CHECKING:
+    from .ptmcore import PTMCore
+    from .ptfcore import PTFCore
+    from .ptdbcore import PTDBCore
+
+
+class MCPClassRegistry(Mapping):
+    """
+    Lazy registry of the MCP classes (mcp id -> class).
+
+    The module of an MCP class is given by the `module` key of MCP_MODULES and
+    is imported on first use, so the calculation backends (pyThermoModels,
+    pyThermoFlash, ...) are only imported for the mcp which is served.
+    """
+
+    def __init__(self, mcp_modules: List[Dict[str, Any]]):
+        # NOTE: mcp id -> module path
+        self._modules: Dict[str, str] = {
+            mcp['id']: mcp['module']
+            for mcp in mcp_modules
+            if 'id' in mcp and 'module' in mcp
+        }
+        # NOTE: mcp id -> class (resolved)
+        self._classes: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def __getitem__(self, mcp_id: str) -> Any:
+        mcp_class = self._classes.get(mcp_id, None)
+        if mcp_class is not None:
+            return mcp_class
+
+        # NOTE: not registered
+        module_path = self._modules[mcp_id]
+
+        with self._lock:
+            if mcp_id not in self._classes:
+                module = importlib.import_module(module_path)
+                self._classes[mcp_id] = getattr(module, mcp_id)
+            return self._classes[mcp_id]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._modules)
+
+    def __len__(self) -> int:
+        return len(self._modules)
+
+    def loaded(self) -> List[str]:
+        """
+        Get the mcp ids whose classes are already imported.
+        """
+        return list(self._classes.keys())
 
 
 class MCPClassBuilder:
@@ -16,11 +73,7 @@ class MCPClassBuilder:
     MCPClassBuilder class for building MCP classes.
     """
     # NOTE: attributes
-    _mcp_classes = {
-        'PTMCore': PTMCore,
-        'PTFCore': PTFCore,
-        'PTDBCore': PTDBCore
-    }
+    _mcp_classes = MCPClassRegistry(MCP_MODULES)
 
     def __init__(self):
         """
@@ -33,7 +86,7 @@ class MCPClassBuilder:
     def get_mcp_class(
         cls,
         mcp_name: str
-    ) -> Optional[Union[PTMCore, PTFCore, PTDBCore]]:
+    ) -> Optional[Union['PTMCore', 'PTFCore', 'PTDBCore']]:
         """
         Get the MCP class by its name.
 
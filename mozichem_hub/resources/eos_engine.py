@@ -0,0 +1,308 @@
+# import libs
+import logging
+from math import sqrt
+from typing import (
+    Any,
+    Dict,
+    Literal,
+    Tuple
+)
+import numpy as np
+import pycuc
+# locals
+from .raoult_engine import RaoultEngine
+
+# NOTE: logger
+logger = logging.getLogger(__name__)
+
+# NOTE: universal gas constant [J/mol.K] (as pyThermoModels)
+R_CONST = 8.314472
+
+# NOTE: generic cubic eos parameters (sigma, epsilon, omega, psi, alpha
+# coefficients), Introduction to Chemical Engineering Thermodynamics, table
+# 3.1 (as pyThermoModels)
+EOS_PARAMETERS: Dict[str, Dict[str, Any]] = {
+    'vdW': {
+        'sigma': 0.0, 'epsilon': 0.0, 'omega': 0.12500, 'psi': 0.42188,
+        'kappa': None
+    },
+    'RK': {
+        'sigma': 1.0, 'epsilon': 0.0, 'omega': 0.08664, 'psi': 0.42748,
+        'kappa': None
+    },
+    'SRK': {
+        'sigma': 1.0, 'epsilon': 0.0, 'omega': 0.08664, 'psi': 0.42748,
+        'kappa': (0.480, 1.574, -0.176)
+    },
+    'PR': {
+        'sigma': 1 + sqrt(2), 'epsilon': 1 - sqrt(2), 'omega': 0.07780,
+        'psi': 0.45724, 'kappa': (0.37464, 1.54226, -0.26992)
+    },
+}
+
+# NOTE: tolerance of the saturation check [Pa] (pyThermoModels default)
+SATURATION_TOLERANCE = 1e-1
+
+# NOTE: interval of the compressibility factor returned by the
+# pyThermoModels least-squares ('ls') solver (the single point tool default)
+# for each phase, the search is split at Z = 0.5 and a search without a root
+# stops at the bound (the supercritical phase is searched as vapor-liquid,
+# the largest value is used)
+LS_SEARCH_INTERVALS: Dict[str, Tuple[float, float]] = {
+    'VAPOR-LIQUID': (0.5, 5.0),
+    'LIQUID': (-2.0, 0.5),
+    'VAPOR': (0.5, 5.0),
+    'SUPERCRITICAL': (0.5, 5.0),
+}
+
+# NOTE: fugacity results of a point (unit, symbol as pyThermoModels)
+FUGACITY_COLUMNS: Dict[str, Tuple[str, str]] = {
+    'molar_volume': ('m3/mol', 'MoVo'),
+    'compressibility_coefficient': ('dimensionless', 'Z'),
+    'fugacity_coefficient': ('dimensionless', 'phi'),
+    'fugacity': ('Pa', 'Fug_PURE'),
+}
+
+
+def to_kelvin(values: np.ndarray, unit: str) -> np.ndarray:
+    """
+    Convert temperatures to K with pycuc (each distinct value once).
+    """
+    distinct, inverse = np.unique(
+        np.asarray(values, dtype=float), return_inverse=True)
+    converted = np.array(
+        [pycuc.to(v, f"{unit} => K") for v in distinct.tolist()],
+        dtype=float
+    )
+    return converted[inverse.reshape(np.shape(values))]
+
+
+class CubicEOSEngine:
+    """
+    Pure component fugacity of the cubic equations of state (vdW, RK, SRK,
+    PR) over arrays of state points, a fast path of the pyThermoModels
+    `cal_fugacity` method with the same phase and root selection.
+
+    Notes
+    -----
+    - The phase of each point follows the pyThermoModels root analysis, the
+      vapor pressure (VaPr) is evaluated with numpy over the temperatures.
+    - The roots of all cubic equations are the eigenvalues of their
+      companion matrices (one batched call), refined by Newton steps. They
+      agree with the pyThermoModels least-squares solver within its
+      tolerance, except where the root is outside the search interval of
+      that solver for the phase (it stops at the bound, e.g. Z = 0.5), these
+      points are marked by `matches_single_point`.
+    - The eos parameters and the fugacity coefficients follow the
+      pyThermoModels single component expressions (e.g. the alpha function
+      with the eos omega), so the batch and the single point tool use the
+      same model.
+    """
+
+    def __init__(
+        self,
+        component: str,
+        model_source: Dict[str, Any]
+    ) -> None:
+        """
+        Initialize the CubicEOSEngine.
+
+        Parameters
+        ----------
+        component : str
+            Component id of the model source (e.g. name-state).
+        model_source : Dict[str, Any]
+            The model source (datasource and equationsource).
+        """
+        self.component = component
+
+        # NOTE: critical constants [K], [Pa]
+        try:
+            datasource = model_source['datasource'][component]
+            Tc, Pc = datasource['Tc'], datasource['Pc']
+        except KeyError as e:
+            raise ValueError(
+                f"Critical constants (Tc, Pc) of '{component}' not found in the model source."
+            ) from e
+        self.Tc = float(pycuc.to(float(Tc['value']), f"{Tc['unit']} => K"))
+        self.Pc = float(pycuc.to(float(Pc['value']), f"{Pc['unit']} => Pa"))
+
+        # NOTE: vapor pressure equation (phase of the points)
+        self._vapor_pressure = RaoultEngine(
+            components=[component],
+            model_source=model_source
+        )
+
+    def phases(
+        self,
+        temperature: np.ndarray,
+        pressure: np.ndarray
+    ) -> np.ndarray:
+        """
+        Phase of the component at the points (pyThermoModels root analysis).
+
+        Parameters
+        ----------
+        temperature : np.ndarray
+            Temperatures [K], shape (n,).
+        pressure : np.ndarray
+            Pressures [Pa], shape (n,).
+
+        Returns
+        -------
+        np.ndarray
+            VAPOR-LIQUID, LIQUID, VAPOR or SUPERCRITICAL of each point.
+        """
+        T, P = temperature, pressure
+        VaPr = self._vapor_pressure.vapor_pressure(T)[:, 0]
+
+        subcritical = T < self.Tc
+        phase = np.select(
+            [
+                subcritical & (np.abs(VaPr - P) < SATURATION_TOLERANCE),
+                subcritical & (P >= VaPr),
+                subcritical & (P <= VaPr),
+                T > self.Tc
+            ],
+            ['VAPOR-LIQUID', 'LIQUID', 'VAPOR', 'SUPERCRITICAL'],
+            default=''
+        )
+        if np.any(phase == ''):
+            # NOTE: critical point, not calculated by pyThermoModels
+            raise ValueError(
+                f"Critical point of '{self.component}' in the points.")
+        return phase
+
+    def fugacity(
+        self,
+        temperature: np.ndarray,
+        pressure: np.ndarray,
+        eos_model: Literal['PR', 'SRK', 'RK', 'vdW'] = 'SRK'
+    ) -> Dict[str, np.ndarray]:
+        """
+        Fugacity of the pure component at the points.
+
+        Parameters
+        ----------
+        temperature : np.ndarray
+            Temperatures [K], shape (n,).
+        pressure : np.ndarray
+            Pressures [Pa], shape (n,).
+        eos_model : str, optional
+            The equation of state, default is 'SRK'.
+
+        Returns
+        -------
+        Dict[str, np.ndarray]
+            phase, molar_volume [m3/mol], compressibility_coefficient,
+            fugacity_coefficient, fugacity [Pa] and matches_single_point of
+            each point.
+
+        Notes
+        -----
+        - At a saturation point (VAPOR-LIQUID) the vapor root is used.
+        - matches_single_point is False where the root is outside the
+          search interval of the pyThermoModels least-squares solver for the
+          phase, the single point tool returns the interval bound there.
+        """
+        if eos_model not in EOS_PARAMETERS:
+            raise ValueError(f"Unknown equation of state: {eos_model}")
+
+        T = np.asarray(temperature, dtype=float)
+        P = np.asarray(pressure, dtype=float)
+        phase = self.phases(T, P)
+
+        # SECTION: eos parameters
+        params = EOS_PARAMETERS[eos_model]
+        sigma, epsilon = params['sigma'], params['epsilon']
+        omega, psi = params['omega'], params['psi']
+        R = R_CONST
+
+        Tr = T / self.Tc
+        Pr = P / self.Pc
+        kappa = params['kappa']
+        if eos_model == 'vdW':
+            alpha = np.ones_like(Tr)
+        elif eos_model == 'RK':
+            alpha = np.power(Tr, -0.50)
+        else:
+            # NOTE: with the eos omega (as pyThermoModels)
+            alpha = np.power(
+                1 + (kappa[0] + kappa[1] * omega + kappa[2] * omega ** 2) *
+                (1 - np.power(Tr, 0.5)),
+                2
+            )
+
+        a = psi * alpha * R ** 2 * self.Tc ** 2 / self.Pc
+        b = omega * R * self.Tc / self.Pc
+        beta = omega * (Pr / Tr)
+        q = psi * alpha / (omega * Tr)
+        B = b * P / (R * T)
+
+        # SECTION: roots, Z^3 + c1 Z^2 + c2 Z - c3 = 0
+        c1 = (sigma + epsilon) * beta - (1 + beta)
+        c2 = beta * (
+            q + epsilon * sigma * beta - (1 + beta) * (sigma + epsilon))
+        c3 = beta ** 2 * (q + (1 + beta) * epsilon * sigma)
+
+        companion = np.zeros((T.size, 3, 3))
+        companion[:, 0, :] = np.column_stack((-c1, -c2, c3))
+        companion[:, 1, 0] = 1.0
+        companion[:, 2, 1] = 1.0
+        roots = np.linalg.eigvals(companion)
+
+        # NOTE: real positive roots, liquid the smallest, others the largest
+        real = (
+            np.abs(roots.imag) <= 1e-6 * np.maximum(1.0, np.abs(roots.real))
+        ) & (roots.real > 0)
+        liquid = (phase == 'LIQUID')[:, None]
+        Z = np.where(
+            liquid,
+            np.where(real, roots.real, np.inf).min(axis=1, keepdims=True),
+            np.where(real, roots.real, -np.inf).max(axis=1, keepdims=True)
+        )[:, 0]
+        if not np.all(np.isfinite(Z)):
+            raise ValueError(
+                f"No positive root of the {eos_model} equation at some points.")
+
+        # NOTE: newton refinement
+        for _ in range(3):
+            f = ((Z + c1) * Z + c2) * Z - c3
+            df = (3 * Z + 2 * c1) * Z + c2
+            Z = Z - np.divide(f, df, out=np.zeros_like(Z), where=df != 0)
+
+        # SECTION: fugacity coefficient (single component expressions of
+        # pyThermoModels)
+        V = Z * R * T / P
+        with np.errstate(divide='ignore', invalid='ignore'):
+            if eos_model == 'vdW':
+                ln_phi = (Z - 1) - np.log(Z * (1 - b / V)) - a / (R * T * V)
+            elif eos_model == 'RK':
+                ln_phi = (Z - 1) - np.log(Z * (1 - b / V)) - \
+                    (a / (b * R * T)) * np.log(1 + b / V)
+            else:
+                ln_phi = (Z - 1) - np.log(Z - B) - \
+                    (alpha / (b * R * T * (sigma - epsilon))) * \
+                    np.log((Z + sigma * B) / (Z + epsilon * B))
+        phi = np.exp(ln_phi)
+        if not np.all(np.isfinite(phi)):
+            raise ValueError(
+                f"Fugacity coefficient of the {eos_model} equation not defined at some points.")
+
+        # NOTE: root inside the search interval of the least-squares solver
+        lower, upper = (
+            np.select(
+                [phase == phase_ for phase_ in LS_SEARCH_INTERVALS],
+                [interval[i] for interval in LS_SEARCH_INTERVALS.values()]
+            )
+            for i in (0, 1)
+        )
+
+        return {
+            'phase': np.char.lower(phase.astype(str)),
+            'molar_volume': Z * (R * T / P),
+            'compressibility_coefficient': Z,
+            'fugacity_coefficient': phi,
+            'fugacity': phi * P,
+            'matches_single_point': (Z >= lower) & (Z <= upper),
+        }
@@ -1,10 +1,12 @@
 # import libs
 import logging
+import threading
 from typing import (
     List,
     Dict,
     Any,
-    Callable
+    Callable,
+    Optional
 )
 from pythermodb_settings.models import ReferencesThermoDB
 # locals
@@ -22,6 +24,12 @@ from ..models import MoziTool
 class FunctionDispatcher(MoziToolBuilder, MCPClassBuilder):
     """
     Dispatcher class for defining functions in the MoziChem Hub.
+
+    Notes
+    -----
+    Each MCP core class (PTMCore, PTFCore, PTDBCore) is instantiated once per
+    hub and reused for tool building, tools info and execution. Call
+    `rebuild` when the references change.
     """
     # NOTE: attributes
 
@@ -49,6 +57,93 @@ class FunctionDispatcher(MoziToolBuilder, MCPClassBuilder):
             references_thermodb=references_thermodb
         )
 
+        # SECTION: mcp core instances and tools (built once per hub)
+        # NOTE: mcp id -> core instance
+        self._mcp_instances: Dict[str, Any] = {}
+        # NOTE: mcp name -> mozi tools
+        self._mozi_tools: Dict[str, List[MoziTool]] = {}
+        self._instances_lock = threading.RLock()
+
+    def clear_cache(self) -> None:
+        """
+        Clear the cached model sources of the hub.
+        """
+        self.Hub_.clear_model_source_cache()
+
+    def reset_instances(self) -> None:
+        """
+        Drop the mcp core instances and the built mozi tools, they are built
+        again (with the current hub) on the next lookup.
+        """
+        with self._instances_lock:
+            self._mcp_instances.clear()
+            self._mozi_tools.clear()
+
+    def rebuild(
+        self,
+        references_thermodb: Optional[ReferencesThermoDB] = None
+    ) -> None:
+        """
+        Rebuild the hub (if new references are provided) and the mcp core
+        instances.
+
+        Parameters
+        ----------
+        references_thermodb : ReferencesThermoDB, optional
+            The new references, default is None (keep the current hub).
+        """
+        with self._instances_lock:
+            # NOTE: invalidate the model sources of the old references
+            self.clear_cache()
+
+            if references_thermodb is not None:
+                # NOTE: the component thermodb cache is shared
+                self.Hub_ = Hub(
+                    references_thermodb=references_thermodb,
+                    thermodb_cache=self.Hub_.thermodb_cache
+                )
+
+            self.reset_instances()
+
+    def get_mcp_instance(self, mcp_id: str) -> Any:
+        """
+        Get the mcp core instance of the hub (built on first use).
+
+        Parameters
+        ----------
+        mcp_id : str
+            The id of the mcp (e.g. PTMCore).
+
+        Returns
+        -------
+        Any
+            The mcp core instance.
+        """
+        mcp_instance = self._mcp_instances.get(mcp_id, None)
+        if mcp_instance is not None:
+            return mcp_instance
+
+        with self._instances_lock:
+            mcp_instance = self._mcp_instances.get(mcp_id, None)
+            if mcp_instance is not None:
+                return mcp_instance
+
+            # NOTE: get the registered class
+            mcp_class = self.get_mcp_class(mcp_id)
+            if not mcp_class:
+                raise ValueError(
+                    f"MCP class '{mcp_id}' is not registered in the MoziChem Hub."
+                )
+
+            # NOTE: init the class with the hub
+            mcp_instance = mcp_class(self.Hub_) if isinstance(
+                mcp_class, type) else mcp_class
+
+            self._mcp_instances[mcp_id] = mcp_instance
+            logging.debug(f"MCP core instance created: {mcp_id}")
+
+            return mcp_instance
+
     def _init_mcp_class(self, mcp_name: str):
         """
         Initialize the MCP class based on the provided mcp_name.
@@ -75,23 +170,10 @@ class FunctionDispatcher(MoziToolBuilder, MCPClassBuilder):
                     f"MCP '{mcp_name}' does not have an ID defined."
                 )
 
-            # SECTION: init the MCP class
-            mcp_class = self.get_mcp_class(mcp_id)
-            # check if the class is found
-            if not mcp_class:
-                raise ValueError(
-                    f"MCP class '{mcp_id}' is not registered in the MoziChem Hub."
-                )
-
-            # return the initialized MCP class
-            if isinstance(mcp_class, type):
-                return {
-                    mcp_name: mcp_class(self.Hub_)
-                }
-            else:
-                return {
-                    mcp_name: mcp_class
-                }
+            # SECTION: get the MCP class instance
+            return {
+                mcp_name: self.get_mcp_instance(mcp_id)
+            }
 
         except Exception as e:
             raise Exception(
@@ -267,50 +349,56 @@ class FunctionDispatcher(MoziToolBuilder, MCPClassBuilder):
             Dictionary of local function names and their implementations.
         """
         try:
-            # SECTION: get function list from all modules
-            # NOTE: get all modules from MCP_MODULES
-            module_class = next(
-                (
-                    module["class"]
-                    for module in MCP_MODULES if module["name"] == mcp_name
-                ),
-                None
-            )
+            # SECTION: get the mcp module
+            mcp_module = self._select_mcp_by_name(mcp_name)
 
-            # check if module class is found
-            if not module_class:
-                raise ValueError(f"MCP module '{mcp_name}' not found.")
+            # NOTE: mcp id
+            mcp_id = mcp_module.get('id', None)
+            if not mcp_id:
+                raise ValueError(
+                    f"MCP '{mcp_name}' does not have an ID defined."
+                )
 
-            # SECTION: get all classes starts with 'MCP_'
-            mcp_registered = self._get_mcp_registered()
+            # SECTION: get the mcp core instance
+            mcp_instance = self.get_mcp_instance(mcp_id)
 
-            # SECTION: iterate over all modules
-            for mcp_class_name, mcp_class in mcp_registered.items():
-                # NOTE: check if the class is in module_classes
-                if mcp_class_name == module_class:
-                    # ! function is registered in the module
-                    # ! Dict[str, Callable]
-                    # add the class to the functions dict
-                    # ! check mcp_class is a class
-                    if isinstance(mcp_class, type):
-                        # initialize the class
-                        mcp_instance = mcp_class(self.Hub_)
-                        return mcp_instance.list_functions()
-                    elif hasattr(mcp_class, 'list_functions'):
-                        # if it has a method list_functions, call it
-                        return mcp_class.list_functions()
-                    else:
-                        raise ValueError(
-                            f"MCP class '{mcp_class_name}' does not have a method 'list_functions'."
-                        )
+            # ! Dict[str, Callable]
+            if not hasattr(mcp_instance, 'list_functions'):
+                raise ValueError(
+                    f"MCP class '{mcp_id}' does not have a method 'list_functions'."
+                )
 
-            raise ValueError(
-                f"No functions found for MCP module '{mcp_name}'. "
-                "Please check if the module is registered correctly."
-            )
+            return mcp_instance.list_functions()
         except Exception as e:
             raise Exception(f"Failed to get local function list: {e}") from e
 
+    def get_local_function(
+        self,
+        mcp_name: str,
+        function_name: str
+    ) -> Callable[..., Any]:
+        """
+        Get a local function of the given mcp by its name.
+
+        Parameters
+        ----------
+        mcp_name : str
+            The name of the mcp (e.g. eos-models-mcp).
+        function_name : str
+            The name of the function (tool).
+
+        Returns
+        -------
+        Callable[..., Any]
+            The function bound to the mcp core instance of the hub.
+        """
+        fn = self._get_local_functions(mcp_name).get(function_name, None)
+        if fn is None:
+            raise ValueError(
+                f"Function '{function_name}' not found in MCP '{mcp_name}'."
+            )
+        return fn
+
     def _get_all_local_functions(
         self
     ) -> Dict[str, Dict[str, Callable[..., Any]]]:
@@ -352,9 +440,9 @@ class FunctionDispatcher(MoziToolBuilder, MCPClassBuilder):
                     )
 
                 # ! function is registered in the module
-                # ! Dict[str, Callable]
+                # ! Dict[str, Callable] (from the hub core instance)
                 # add the class to the functions dict
-                functions[mcp_name] = mcp_class.list_functions()
+                functions[mcp_name] = self._get_local_functions(mcp_name)
 
             # return
             return functions
@@ -376,6 +464,11 @@ class FunctionDispatcher(MoziToolBuilder, MCPClassBuilder):
             List of function names.
         """
         try:
+            # NOTE: built once per hub
+            mozi_tools = self._mozi_tools.get(mcp_name, None)
+            if mozi_tools is not None:
+                return list(mozi_tools)
+
             # SECTION: get local function from the Hub
             local_functions: Dict[
                 str, Callable[..., Any]
@@ -386,8 +479,12 @@ class FunctionDispatcher(MoziToolBuilder, MCPClassBuilder):
             # build mozi tools from the functions
             mozi_tools = self.build_mozi_tools(mcp_name, local_functions)
 
+            # NOTE: store
+            with self._instances_lock:
+                self._mozi_tools[mcp_name] = mozi_tools
+
             # return
-            return mozi_tools
+            return list(mozi_tools)
         except Exception as e:
             raise Exception(f"Failed to get function list: {e}") from e
 
@@ -1,11 +1,17 @@
 # import libs
+import hashlib
+import json
 import logging
+import threading
 from typing import (
     Literal,
     List,
     Dict,
     Union,
-    Any
+    Any,
+    Optional,
+    Tuple,
+    FrozenSet
 )
 import pyThermoDB as ptdb
 from pythermodb_settings.models import (
@@ -15,9 +21,15 @@ from pythermodb_settings.models import (
     ReferencesThermoDB
 )
 from pyThermoDB import CompBuilder
-import pyThermoLinkDB as ptldb
 # locals
 from .hub_manager import HubManager
+from .thermodb_cache import (
+    ThermoDBCache,
+    thermodb_cache as default_thermodb_cache
+)
+from ..config import app_settings
+from ..references.default_reference import default_reference
+from ..references.parsed_reference import PARSED_SIZE_FACTOR
 from ..utils.component_utils import create_component_id
 from ..models import ComponentThermoDB
 # error messages
@@ -31,6 +43,7 @@ from ..errors import (
     ModelSourceBuildError,
     HubComponentModelSourceBuildError,
     HubComponentsModelSourceBuildError,
+    HubComponentReferenceConfigError,
     HUB_INITIALIZATION_ERROR_MSG,
     HUB_THERMO_HUB_BUILD_ERROR_MSG,
     HUB_THERMO_HUB_CLEAN_ERROR_MSG,
@@ -39,7 +52,8 @@ from ..errors import (
     COMPONENT_THERMODB_BUILD_ERROR_MSG,
     MODEL_SOURCE_BUILD_ERROR_MSG,
     HUB_COMPONENT_MODEL_SOURCE_BUILD_ERROR_MSG,
-    HUB_COMPONENTS_MODEL_SOURCE_BUILD_ERROR_MSG
+    HUB_COMPONENTS_MODEL_SOURCE_BUILD_ERROR_MSG,
+    HUB_COMPONENT_REFERENCE_CONFIG_ERROR_MSG
 )
 
 # Configure logger
@@ -49,12 +63,37 @@ logger = logging.getLogger(__name__)
 class Hub(HubManager):
     """
     Hub class for building and managing the thermodynamic properties
+
+    Notes
+    -----
+    Thread-safety:
+        - The reference state (reference, configs, rules, labels) is the
+          immutable base of the hub, it is set in `__init__` and only read
+          afterwards, so one hub can be shared by concurrent calls.
+        - `build_component_model_source` and `build_components_model_source`
+          assemble the model source in a per-call ThermoHub (overlay), no
+          shared ThermoHub is modified.
+        - The component thermodb and model source caches are guarded by
+          their own locks.
+        - The hub ThermoHub (`thermo_hub`) used by `register_component_thermodb`,
+          `build_model_source` and `clean_thermo_hub` without an explicit
+          target is shared; these calls are serialized by the hub lock.
+        - Model sources returned by the hub are shared and must be treated
+          as read-only.
+
+    Component ids:
+        - A component thermodb is registered once in a ThermoHub, by the id
+          it is built with (name-state or formula-state); the other id is an
+          alias resolved in the model source (same data and equations).
+        - The alias is registered separately only if its reference rule
+          differs from the rule of the registered id.
     """
     # NOTE: attributes
 
     def __init__(
             self,
             references_thermodb: ReferencesThermoDB,
+            thermodb_cache: Optional[ThermoDBCache] = None
     ):
         """
         Initialize the Hub instance.
@@ -63,6 +102,9 @@ class Hub(HubManager):
         ----------
         references_thermodb : ReferencesThermoDB
             The references thermodynamic database.
+        thermodb_cache : ThermoDBCache, optional
+            Cache of built component thermodbs, default is the process-wide
+            cache shared by all hubs.
 
 
         Notes
@@ -83,7 +125,32 @@ class Hub(HubManager):
             # LINK: initialize parent class
             super().__init__(references_thermodb)
 
+            # NOTE: lock of the hub ThermoHub
+            self._lock = threading.RLock()
+
+            # SECTION: component thermodb cache
+            self.thermodb_cache: ThermoDBCache = (
+                thermodb_cache if thermodb_cache is not None
+                else default_thermodb_cache
+            )
+            # NOTE: (component id, required props) -> reference fingerprint
+            self._component_fingerprints: Dict[
+                Tuple[str, Optional[FrozenSet[str]]], str
+            ] = {}
+            # NOTE: model source cache (per hub, dropped with the references)
+            self.model_source_cache = ThermoDBCache(
+                max_entries=app_settings.model_source_cache_max_entries,
+                max_bytes=app_settings.model_source_cache_max_bytes
+            )
+            # NOTE: custom reference overlays (content hash -> overlay hub)
+            self.overlays = ThermoDBCache(
+                max_entries=app_settings.custom_reference_cache_max_entries,
+                max_bytes=app_settings.custom_reference_cache_max_bytes
+            )
+
             # SECTION: Initialize the ThermoHub
+            # NOTE: component id aliases of the hub ThermoHub (alias -> id)
+            self.component_aliases: Dict[str, str] = {}
             logger.debug("Building ThermoHub instance")
             self.thermo_hub = self.build_thermo_hub()
 
@@ -101,7 +168,7 @@ class Hub(HubManager):
 
         try:
             # Initialize the ThermoHub
-            self.thermo_hub = ptldb.init()
+            self.thermo_hub = self._new_thermo_hub()
             logger.debug("ThermoHub instance built successfully")
             return self.thermo_hub
 
@@ -111,6 +178,286 @@ class Hub(HubManager):
                 HUB_THERMO_HUB_BUILD_ERROR_MSG
             ) from e
 
+    @staticmethod
+    def _new_thermo_hub():
+        """
+        Create a new ThermoHub with its own (empty) storage.
+
+        Notes
+        -----
+        ThermoDBHub declares its thermodb, rule and hub dictionaries at class
+        level, so a fresh instance shares them with every other instance until
+        `clean` rebinds them on the instance.
+        """
+        # NOTE: imported on first use (only the mcp calculations need it)
+        import pyThermoLinkDB as ptldb
+
+        thermo_hub = ptldb.init()
+        # ! detach from the class-level storage
+        thermo_hub.clean()
+        return thermo_hub
+
+    def _component_ids(
+        self,
+        component_thermodb: ComponentThermoDB
+    ) -> Tuple[str, str, bool]:
+        """
+        Registration ids of a component thermodb.
+
+        Parameters
+        ----------
+        component_thermodb : ComponentThermoDB
+            The component thermodynamic database.
+
+        Returns
+        -------
+        Tuple[str, str, bool]
+            The component id to register (the id of the component key), the
+            other id, and whether the other id is an alias (same reference
+            rule) or must be registered on its own.
+        """
+        component_identity = create_component_id(
+            component=component_thermodb.component
+        )
+        name_state = component_identity.name_state
+        formula_state = component_identity.formula_state
+
+        # NOTE: the id the thermodb is built with
+        if component_thermodb.component_key == 'Formula-State':
+            component_id, other_id = formula_state, name_state
+        else:
+            component_id, other_id = name_state, formula_state
+
+        # NOTE: same rule, same data/equations
+        is_alias = (
+            self._set_component_reference_rule(other_id) ==
+            self._set_component_reference_rule(component_id)
+        )
+        return component_id, other_id, is_alias
+
+    def component_aliases_of(
+        self,
+        components_thermodb: List[ComponentThermoDB]
+    ) -> Dict[str, str]:
+        """
+        Component id aliases of the component thermodbs.
+
+        Parameters
+        ----------
+        components_thermodb : List[ComponentThermoDB]
+            List of component thermodynamic databases.
+
+        Returns
+        -------
+        Dict[str, str]
+            The alias map (alias -> registered component id), an id which is
+            registered itself is not an alias.
+        """
+        registered: List[str] = []
+        aliases: Dict[str, str] = {}
+        for component_thermodb in components_thermodb:
+            component_id, other_id, is_alias = self._component_ids(
+                component_thermodb
+            )
+            registered.append(component_id)
+            if is_alias:
+                aliases.setdefault(other_id, component_id)
+            else:
+                registered.append(other_id)
+
+        return {
+            alias: component_id
+            for alias, component_id in aliases.items()
+            if alias not in registered
+        }
+
+    def _component_fingerprint(
+        self,
+        component_id: str,
+        reference_config: Dict[str, ComponentConfig],
+        reference: CustomReference,
+        ignore_labels: List[str],
+        required_props: Optional[FrozenSet[str]] = None
+    ) -> str:
+        """
+        Fingerprint of the resolved reference, config and ignore labels of a
+        component, used in the component thermodb cache key.
+
+        Parameters
+        ----------
+        component_id : str
+            The component id.
+        reference_config : Dict[str, ComponentConfig]
+            The resolved component reference config.
+        reference : CustomReference
+            The resolved component reference.
+        ignore_labels : List[str]
+            The resolved component ignore labels.
+        required_props : FrozenSet[str], optional
+            The required properties the config is projected to.
+
+        Returns
+        -------
+        str
+            The sha256 fingerprint.
+
+        Notes
+        -----
+        The reference state of a hub is read-only, so the fingerprint is
+        computed once per component id and required properties.
+        """
+        fingerprint_key = (component_id, required_props)
+        fingerprint = self._component_fingerprints.get(fingerprint_key)
+        if fingerprint is not None:
+            return fingerprint
+
+        # NOTE: serialize pydantic models by their dump
+        def _default(obj: Any) -> Any:
+            if hasattr(obj, 'model_dump'):
+                return obj.model_dump()
+            return str(obj)
+
+        payload = json.dumps(
+            {
+                'reference': reference,
+                'config': reference_config,
+                'ignore_labels': ignore_labels,
+            },
+            sort_keys=True,
+            default=_default
+        )
+        fingerprint = hashlib.sha256(payload.encode('utf-8')).hexdigest()
+        self._component_fingerprints[fingerprint_key] = fingerprint
+        return fingerprint
+
+    def _model_source_key(
+        self,
+        components_thermodb: List[ComponentThermoDB],
+        required_props: Optional[FrozenSet[str]] = None
+    ) -> Tuple:
+        """
+        Model source cache key, the sorted component ids together with the
+        component key, the reference fingerprint and the rule fingerprint of
+        each component, and the required properties.
+
+        Parameters
+        ----------
+        components_thermodb : List[ComponentThermoDB]
+            List of component thermodynamic databases of the request.
+        required_props : FrozenSet[str], optional
+            The required properties the thermodbs are built for.
+
+        Returns
+        -------
+        Tuple
+            The cache key.
+        """
+        items = []
+        for component_thermodb in components_thermodb:
+            component_identity = create_component_id(
+                component=component_thermodb.component
+            )
+            name_state = component_identity.name_state
+            formula_state = component_identity.formula_state
+
+            # NOTE: component id used to build the thermodb
+            component_id = (
+                formula_state
+                if component_thermodb.component_key == 'Formula-State'
+                else name_state
+            )
+
+            # NOTE: rules of both ids
+            rules_payload = json.dumps(
+                [
+                    self._set_component_reference_rule(name_state),
+                    self._set_component_reference_rule(formula_state),
+                    (self.thermodb_rules or {}).get(name_state),
+                    (self.thermodb_rules or {}).get(formula_state),
+                ],
+                sort_keys=True,
+                default=str
+            )
+
+            items.append((
+                name_state,
+                formula_state,
+                component_thermodb.component_key,
+                self._component_fingerprints.get(
+                    (component_id, required_props)
+                ),
+                hashlib.sha256(rules_payload.encode('utf-8')).hexdigest()
+            ))
+
+        return (
+            tuple(sorted(items, key=lambda x: tuple(map(str, x)))),
+            tuple(sorted(required_props)) if required_props else None
+        )
+
+    def overlay(
+        self,
+        references_thermodb: ReferencesThermoDB
+    ) -> 'Hub':
+        """
+        Create a hub which layers the given references over this hub.
+
+        Parameters
+        ----------
+        references_thermodb : ReferencesThermoDB
+            The references (e.g., a custom reference) to layer over the hub
+            references, the entries of the same component id (or 'ALL')
+            take precedence.
+
+        Returns
+        -------
+        Hub
+            The overlay hub, this hub is not modified.
+
+        Notes
+        -----
+        The overlay shares the component thermodb cache of this hub, the
+        reference maps are merged by a shallow copy (the contents are not
+        copied).
+        """
+        logger.debug("Creating hub overlay")
+
+        def _merge(base: Optional[Dict], layer: Optional[Dict]) -> Dict:
+            return {**(base or {}), **(layer or {})}
+
+        # NOTE: both sides are already validated
+        merged_references_thermodb = ReferencesThermoDB.model_construct(
+            reference=_merge(self.reference, references_thermodb.reference),
+            contents=_merge(
+                self.reference_contents,
+                references_thermodb.contents
+            ),
+            configs=_merge(self.reference_configs, references_thermodb.configs),
+            rules=_merge(self.thermodb_rules, references_thermodb.rules),
+            labels=_merge(self.labels, references_thermodb.labels),
+            ignore_labels=_merge(
+                self.ignore_labels,
+                references_thermodb.ignore_labels
+            ),
+            ignore_props=_merge(
+                self.ignore_props,
+                references_thermodb.ignore_props
+            ),
+        )
+
+        return Hub(
+            merged_references_thermodb,
+            thermodb_cache=self.thermodb_cache
+        )
+
+    def clear_model_source_cache(self) -> None:
+        """
+        Clear the model source cache and the custom reference overlays of the
+        hub.
+        """
+        logger.debug("Clearing model source cache")
+        self.model_source_cache.clear()
+        self.overlays.clear()
+
     def clean_thermo_hub(self):
         """
         Clean the ThermoHub, it remains.
@@ -119,7 +466,9 @@ class Hub(HubManager):
 
         try:
             # clean the ThermoHub
-            self.thermo_hub.clean()
+            with self._lock:
+                self.thermo_hub.clean()
+                self.component_aliases = {}
             logger.debug("ThermoHub cleaned successfully")
 
         except Exception as e:
@@ -130,7 +479,8 @@ class Hub(HubManager):
 
     def register_component_thermodb(
         self,
-        component_thermodb: ComponentThermoDB
+        component_thermodb: ComponentThermoDB,
+        thermo_hub: Optional[Any] = None
     ):
         """
         Register the component thermodynamic database in the ThermoHub.
@@ -142,6 +492,8 @@ class Hub(HubManager):
             - component: Component
             - thermodb: CompBuilder
             - component_key: Literal['name', 'formula']
+        thermo_hub : ThermoDBHub, optional
+            The ThermoHub to register in, default is the hub ThermoHub.
 
         Returns
         -------
@@ -150,53 +502,54 @@ class Hub(HubManager):
         """
         logger.debug("Registering component thermodynamic database")
 
+        # NOTE: the hub ThermoHub is shared, serialize the access
+        if thermo_hub is None:
+            with self._lock:
+                return self.register_component_thermodb(
+                    component_thermodb,
+                    thermo_hub=self.thermo_hub
+                )
+
         try:
             # NOTE: extract component
             component = component_thermodb.component
             thermodb = component_thermodb.thermodb
             # component_key = component_thermodb.component_key
 
-            # NOTE: set component identity
-            component_identity = create_component_id(
-                component=component
+            # NOTE: set component ids
+            component_id, other_id, is_alias = self._component_ids(
+                component_thermodb
             )
 
-            name_state = component_identity.name_state
-            formula_state = component_identity.formula_state
-
             logger.debug(
-                f"Registering component: {name_state} / {formula_state}")
-
-            # SECTION: create component reference rule
-            # ! by name-state
-            component_reference_rule_by_name = \
-                self._set_component_reference_rule(
-                    component_id=name_state
-                )
-            # ! by formula-state
-            component_reference_rule_by_formula = \
-                self._set_component_reference_rule(
-                    component_id=formula_state
-                )
+                f"Registering component: {component_id} / {other_id}")
 
             # SECTION: register the component thermodynamic database
-            # NOTE: by name
-            self.thermo_hub.add_thermodb(
-                name=name_state,
+            # NOTE: by the component key id
+            thermo_hub.add_thermodb(
+                name=component_id,
                 data=thermodb,
-                rules=component_reference_rule_by_name
+                rules=self._set_component_reference_rule(
+                    component_id=component_id
+                )
             )
 
-            # NOTE: by formula
-            self.thermo_hub.add_thermodb(
-                name=formula_state,
-                data=thermodb,
-                rules=component_reference_rule_by_formula
-            )
+            # NOTE: the other id, an alias unless its rule differs
+            if is_alias:
+                if thermo_hub is self.thermo_hub:
+                    self.component_aliases.setdefault(other_id, component_id)
+            else:
+                thermo_hub.add_thermodb(
+                    name=other_id,
+                    data=thermodb,
+                    rules=self._set_component_reference_rule(
+                        component_id=other_id
+                    )
+                )
 
             logger.debug(
                 f"Component thermodynamic database registered "
-                f"successfully: {name_state} / {formula_state}"
+                f"successfully: {component_id} / {other_id}"
             )
             return True
 
@@ -213,7 +566,8 @@ class Hub(HubManager):
         component: Component | List[Component],
         component_key: Literal[
             'Name-State', 'Formula-State'
-        ] = 'Name-State'
+        ] = 'Name-State',
+        required_props: Optional[List[str]] = None
     ) -> Union[
         ComponentThermoDB,
         List[ComponentThermoDB]
@@ -234,6 +588,10 @@ class Hub(HubManager):
             The mode to build the thermodynamic database, either by 'Name-State'
             or 'Formula-State'.
             Default is 'Name-State'.
+        required_props : List[str], optional
+            The property symbols required by the calling method (e.g. Tc,
+            Pc, AcFa, VaPr), only the tables which provide them are built.
+            Default is None (all tables of the component config).
 
         Returns
         -------
@@ -262,6 +620,11 @@ class Hub(HubManager):
             # initialize the component thermodynamic database
             components_thermodb: List[ComponentThermoDB] = []
 
+            # NOTE: required properties (None: all tables)
+            required_props_: Optional[FrozenSet[str]] = (
+                frozenset(required_props) if required_props else None
+            )
+
             # check reference
             if self.reference is None:
                 raise ValueError(
@@ -275,97 +638,105 @@ class Hub(HubManager):
                 component_formula = component.formula.strip()
                 component_state = component.state.strip().lower()
 
-                # SECTION: build the component thermodynamic database
+                # SECTION: set the component id
                 # NOTE: check build mode
                 if component_key == 'Name-State':  # ! >> name-state
-                    # NOTE: component reference config
                     component_id = create_component_id(
                         component=component
                     ).name_state
-
-                    # >>> get the component reference config
-                    component_reference_config_: Dict[str, ComponentConfig] = \
-                        self._set_component_reference_config(
-                            component_id=component_id
-                    )
-
-                    # >>> get the component reference
-                    component_reference_: CustomReference = \
-                        self._set_component_reference(
-                            component_id=component_id
-                        )
-
-                    # >>> get ignore labels
-                    # ! by default, empty list
-                    component_ignore_labels_: List[str] = self._set_component_ignore_labels(
-                        component_id=component_id
-                    )
-
-                    # ! by name (older version)
-                    # component_thermodb: CompBuilder = ptdb.build_component_thermodb(
-                    #     component_name=component_name,
-                    #     reference_config=component_reference_config,
-                    #     custom_reference=self.reference
-                    # )
-
-                    # ! by name (newer version)
-                    component_thermodb: CompBuilder = ptdb.check_and_build_component_thermodb(
-                        component=component,
-                        reference_config=component_reference_config_,
-                        custom_reference=component_reference_,
-                        component_key=component_key,
-                        ignore_state_props=component_ignore_labels_,
-                    )
                 elif component_key == 'Formula-State':  # ! >> formula-state
-                    # NOTE: component reference config
                     component_id = create_component_id(
                         component=component
                     ).formula_state
+                else:
+                    raise ValueError(
+                        f"Invalid build mode: {component_key}. Use 'name' or 'formula'.")
 
-                    # get the component reference config
-                    component_reference_config_: Dict[str, ComponentConfig] = \
-                        self._set_component_reference_config(
-                            component_id=component_id
-                    )
-
-                    # >>> get the component reference
-                    component_reference_: CustomReference = \
-                        self._set_component_reference(
-                            component_id=component_id
+                # >>> resolved component reference (config, reference,
+                # ignore labels), one lookup
+                component_reference_view = self.component_reference_view(
+                    component_id
+                )
+                component_reference_config_: Dict[str, ComponentConfig] = \
+                    component_reference_view.config
+                # ! only the tables of the required properties
+                if required_props_ is not None:
+                    component_reference_config_ = \
+                        self._project_component_reference_config(
+                            component_id=component_id,
+                            required_props=required_props_
                         )
+                component_reference_: CustomReference = \
+                    component_reference_view.reference
+                # ! by default, empty list
+                component_ignore_labels_: List[str] = \
+                    component_reference_view.ignore_labels
+
+                # NOTE: neither the component nor ALL
+                if (
+                    component_reference_config_ is None or
+                    component_reference_ is None
+                ):
+                    raise HubComponentReferenceConfigError(
+                        HUB_COMPONENT_REFERENCE_CONFIG_ERROR_MSG
+                    )
 
-                    # >>> get ignore labels
-                    # ! by default, empty list
-                    component_ignore_labels_: List[str] = self._set_component_ignore_labels(
-                        component_id=component_id
+                # SECTION: check the cache
+                cache_key = (
+                    component_name,
+                    component_formula,
+                    component_state,
+                    component_key,
+                    self._component_fingerprint(
+                        component_id=component_id,
+                        reference_config=component_reference_config_,
+                        reference=component_reference_,
+                        ignore_labels=component_ignore_labels_,
+                        required_props=required_props_
                     )
+                )
+                component_thermodb = self.thermodb_cache.get(cache_key)
+                source_size = self.thermodb_cache.size_of(cache_key) or 0
 
-                    # ! by formula (older version)
-                    # component_thermodb = ptdb.build_component_thermodb(
-                    #     component_name=component_formula,
-                    #     reference_config=component_reference_config,
-                    #     custom_reference=self.reference,
-                    #     component_key='Formula'
-                    # )
+                # SECTION: build the component thermodynamic database
+                if component_thermodb is None:
+                    logger.debug(
+                        f"Component thermodb cache miss: {component_id}")
+
+                    # NOTE: only the default reference tables in the config
+                    component_reference_ = default_reference.project(
+                        reference=component_reference_,
+                        reference_config=component_reference_config_
+                    )
 
-                    # ! by formula (newer version)
-                    component_thermodb = ptdb.check_and_build_component_thermodb(
+                    # ! by name/formula (newer version)
+                    component_thermodb: CompBuilder = ptdb.check_and_build_component_thermodb(
                         component=component,
                         reference_config=component_reference_config_,
                         custom_reference=component_reference_,
                         component_key=component_key,
                         ignore_state_props=component_ignore_labels_,
                     )
-                else:
-                    raise ValueError(
-                        f"Invalid build mode: {component_key}. Use 'name' or 'formula'.")
+
+                    # NOTE: store (sized by the reference content)
+                    source_size = PARSED_SIZE_FACTOR * sum(
+                        len(c) for c in component_reference_.get(
+                            'reference', None) or []
+                        if isinstance(c, str)
+                    )
+                    self.thermodb_cache.put(
+                        cache_key,
+                        component_thermodb,
+                        size=source_size or None
+                    )
 
                 # NOTE: save the component thermodynamic database
                 components_thermodb.append(
                     ComponentThermoDB(
                         component=component,
                         thermodb=component_thermodb,
-                        component_key=component_key
+                        component_key=component_key,
+                        source_size=source_size
                     )
                 )
 
@@ -386,13 +757,25 @@ class Hub(HubManager):
                 COMPONENT_THERMODB_BUILD_ERROR_MSG
             ) from e
 
-    def build_model_source(self) -> Dict[str, Dict[str, Any]]:
+    def build_model_source(
+        self,
+        thermo_hub: Optional[Any] = None,
+        component_ids: Optional[List[str]] = None,
+        component_aliases: Optional[Dict[str, str]] = None
+    ) -> Dict[str, Dict[str, Any]]:
         """
         Build the model source for the ThermoHub.
 
         Parameters
         ----------
-        None
+        thermo_hub : ThermoDBHub, optional
+            The ThermoHub to build, default is the hub ThermoHub.
+        component_ids : List[str], optional
+            The component ids to configure the thermodb rule for, default is
+            None (all rules).
+        component_aliases : Dict[str, str], optional
+            The component id aliases (alias -> registered id) to resolve in
+            the model source, default is the aliases of the hub ThermoHub.
 
         Returns
         -------
@@ -405,15 +788,40 @@ class Hub(HubManager):
         """
         logger.debug("Building model source for ThermoHub")
 
+        # NOTE: the hub ThermoHub is shared, serialize the access
+        if thermo_hub is None:
+            with self._lock:
+                return self.build_model_source(
+                    thermo_hub=self.thermo_hub,
+                    component_ids=component_ids,
+                    component_aliases=component_aliases
+                )
+
         try:
             # SECTION: config the thermodb rule
             if self.thermodb_rules is not None:
                 logger.debug("Configuring thermodb rule")
-                self.thermo_hub.config_thermodb_rule(self.thermodb_rules)
+                thermo_hub.config_thermodb_rule(
+                    self.thermodb_rules,
+                    names=component_ids
+                )
 
             # SECTION: build the datasource and equationsource
             logger.debug("Building datasource and equationsource")
-            datasource, equationsource = self.thermo_hub.build()
+            datasource, equationsource = thermo_hub.build()
+
+            # NOTE: resolve the aliases (same objects, a registered id wins)
+            if component_aliases is None and thermo_hub is self.thermo_hub:
+                component_aliases = self.component_aliases
+
+            for alias, component_id in (component_aliases or {}).items():
+                if component_id in datasource:
+                    datasource.setdefault(alias, datasource[component_id])
+                if component_id in equationsource:
+                    equationsource.setdefault(
+                        alias,
+                        equationsource[component_id]
+                    )
 
             # SECTION: build the model source
             model_source = {
@@ -432,7 +840,8 @@ class Hub(HubManager):
 
     def register_components_thermodb(
         self,
-        components_thermodb: List[ComponentThermoDB]
+        components_thermodb: List[ComponentThermoDB],
+        thermo_hub: Optional[Any] = None
     ) -> bool:
         """
         Register multiple component thermodynamic databases in the ThermoHub.
@@ -441,6 +850,8 @@ class Hub(HubManager):
         ----------
         components_thermodb : List[ComponentThermoDB]
             List of component thermodynamic databases to register.
+        thermo_hub : ThermoDBHub, optional
+            The ThermoHub to register in, default is the hub ThermoHub.
 
         Returns
         -------
@@ -458,7 +869,10 @@ class Hub(HubManager):
                 logger.debug(
                     f"Registering component {i+1}/{len(components_thermodb)}"
                 )
-                self.register_component_thermodb(component_thermodb)
+                self.register_component_thermodb(
+                    component_thermodb,
+                    thermo_hub=thermo_hub
+                )
 
             logger.info(
                 f"Successfully registered {len(components_thermodb)} "
@@ -474,12 +888,110 @@ class Hub(HubManager):
                 HUB_COMPONENTS_THERMODB_REGISTRATION_ERROR_MSG
             ) from e
 
+    def assemble_model_source(
+        self,
+        components_thermodb: List[ComponentThermoDB],
+        required_props: Optional[List[str]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Assemble a request-scoped model source for the given components.
+
+        Parameters
+        ----------
+        components_thermodb : List[ComponentThermoDB]
+            List of component thermodynamic databases of the request.
+        required_props : List[str], optional
+            The required properties the thermodbs are built for, default is
+            None (all tables).
+
+        Returns
+        -------
+        model_source : dict
+            The model source dictionary (datasource, equationsource) which
+            only contains the requested components.
+
+        Notes
+        -----
+        A new ThermoHub is created for each request and discarded afterwards,
+        the hub ThermoHub and the reference state are only read, so the build
+        cost depends on the request size and not on the hub history.
+
+        The assembled model source is cached by the component set, so the
+        same (binary, ternary, ...) system is not re-linked. The returned
+        dictionary is shared between calls and must not be modified.
+        """
+        logger.debug(
+            f"Assembling model source for {len(components_thermodb)} "
+            "components"
+        )
+
+        try:
+            # SECTION: check the model source cache
+            cache_key = self._model_source_key(
+                components_thermodb,
+                required_props=(
+                    frozenset(required_props) if required_props else None
+                )
+            )
+            model_source = self.model_source_cache.get(cache_key)
+            if model_source is not None:
+                logger.debug("Model source cache hit")
+                return model_source
+
+            # SECTION: request-scoped thermo hub
+            thermo_hub = self._new_thermo_hub()
+
+            # SECTION: register the component thermodynamic databases
+            self.register_components_thermodb(
+                components_thermodb,
+                thermo_hub=thermo_hub
+            )
+
+            # SECTION: requested component ids
+            component_ids: List[str] = []
+            for component_thermodb in components_thermodb:
+                component_identity = create_component_id(
+                    component=component_thermodb.component
+                )
+                component_ids.extend([
+                    component_identity.name_state,
+                    component_identity.formula_state
+                ])
+
+            # SECTION: build the model source
+            model_source = self.build_model_source(
+                thermo_hub=thermo_hub,
+                component_ids=component_ids,
+                component_aliases=self.component_aliases_of(
+                    components_thermodb
+                )
+            )
+
+            # NOTE: store (sized by the reference content of the components)
+            source_size = sum(
+                component_thermodb.source_size
+                for component_thermodb in components_thermodb
+            )
+            self.model_source_cache.put(
+                cache_key,
+                model_source,
+                size=source_size or None
+            )
+            return model_source
+
+        except Exception as e:
+            logger.error(f"Failed to assemble model source: {e}")
+            raise ModelSourceBuildError(
+                MODEL_SOURCE_BUILD_ERROR_MSG
+            ) from e
+
     def build_component_model_source(
         self,
         component: Component,
         component_key: Literal[
             'Name-State', 'Formula-State'
-        ] = 'Name-State'
+        ] = 'Name-State',
+        required_props: Optional[List[str]] = None
     ) -> Dict[str, Any]:
         """
         Build the model source for a component or list of components.
@@ -492,6 +1004,9 @@ class Hub(HubManager):
             The mode to build the model source, either by 'Name-State' or
             'Formula-State'.
             Default is 'Name-State'.
+        required_props : List[str], optional
+            The property symbols required by the calling method, only the
+            tables which provide them are built. Default is None (all).
 
         Returns
         -------
@@ -505,17 +1020,12 @@ class Hub(HubManager):
             logger.debug("Building component thermodynamic database")
             components_thermodb = self.build_component_thermodb(
                 component=component,
-                component_key=component_key
+                component_key=component_key,
+                required_props=required_props
             )
 
-            # SECTION: register the component thermodynamic database
-            if isinstance(components_thermodb, ComponentThermoDB):
-                # NOTE: if only one component, register it directly
-                logger.debug(
-                    "Registering single component thermodynamic database"
-                )
-                self.register_component_thermodb(components_thermodb)
-            else:
+            # SECTION: check the component thermodynamic database
+            if not isinstance(components_thermodb, ComponentThermoDB):
                 # NOTE: if multiple components, register them all
                 error_msg = (
                     "Multiple components provided, please register them "
@@ -524,9 +1034,12 @@ class Hub(HubManager):
                 logger.error(error_msg)
                 raise ValueError(error_msg)
 
-            # SECTION: build the model source
+            # SECTION: build the model source (request-scoped)
             logger.debug("Building model source")
-            model_source = self.build_model_source()
+            model_source = self.assemble_model_source(
+                [components_thermodb],
+                required_props=required_props
+            )
 
             logger.info(
                 f"Model source built successfully for component: "
@@ -548,7 +1061,8 @@ class Hub(HubManager):
         components: List[Component],
         component_key: Literal[
             'Name-State', 'Formula-State'
-        ] = 'Name-State'
+        ] = 'Name-State',
+        required_props: Optional[List[str]] = None
     ) -> Dict:
         """
         Build the model source for multiple components.
@@ -561,6 +1075,9 @@ class Hub(HubManager):
             The mode to build the model source, either by 'Name-State' or
             'Formula-State'.
             Default is 'Name-State'.
+        required_props : List[str], optional
+            The property symbols required by the calling method, only the
+            tables which provide them are built. Default is None (all).
 
         Returns
         -------
@@ -578,7 +1095,8 @@ class Hub(HubManager):
             logger.debug("Building component thermodynamic databases")
             components_thermodb = self.build_component_thermodb(
                 component=components,
-                component_key=component_key
+                component_key=component_key,
+                required_props=required_props
             )
 
             # SECTION: register the component thermodynamic databases
@@ -590,16 +1108,13 @@ class Hub(HubManager):
                 )
                 logger.error(error_msg)
                 raise ValueError(error_msg)
-            else:
-                # NOTE: if multiple components, register them all
-                logger.debug(
-                    "Registering multiple component thermodynamic databases"
-                )
-                self.register_components_thermodb(components_thermodb)
 
-            # SECTION: build the model source
+            # SECTION: build the model source (request-scoped)
             logger.debug("Building model source")
-            model_source = self.build_model_source()
+            model_source = self.assemble_model_source(
+                components_thermodb,
+                required_props=required_props
+            )
 
             logger.info(
                 f"Model source built successfully for {len(components)} "
@@ -1,8 +1,11 @@
 # import libs
 import logging
 from typing import (
+    Any,
     Dict,
+    FrozenSet,
     List,
+    Optional,
 )
 from pythermodb_settings.models import (
     ComponentConfig,
@@ -11,6 +14,7 @@ from pythermodb_settings.models import (
     ReferencesThermoDB
 )
 # locals
+from ..models import ComponentReferenceView
 from ..errors import (
     HubComponentReferenceConfigError,
     HubComponentReferenceRuleError,
@@ -67,6 +71,86 @@ class HubManager():
         self.ignore_props: Dict[str, List[str]] = \
             references_thermodb.ignore_props or {}
 
+        # SECTION: resolved component reference views
+        # NOTE: known component ids (unknown ids share the 'ALL' view)
+        component_ids = (
+            set(self.reference or {}) |
+            set(self.reference_configs or {}) |
+            set(self.thermodb_rules or {}) |
+            set(self.ignore_labels)
+        )
+        self.component_reference_views: Dict[
+            str, ComponentReferenceView
+        ] = {
+            component_id: self._resolve_component_reference_view(
+                component_id
+            )
+            for component_id in component_ids
+        }
+        # NOTE: fallback of the unknown ids, not stored per id
+        self._all_reference_view: ComponentReferenceView = (
+            self.component_reference_views.get('ALL', None) or
+            self._resolve_component_reference_view('ALL')
+        )
+
+    def _resolve_component_reference_view(
+        self,
+        component_id: str
+    ) -> ComponentReferenceView:
+        """
+        Resolve the reference state of a component id, each entry of the
+        component or otherwise of 'ALL'.
+
+        Parameters
+        ----------
+        component_id : str
+            The component id.
+
+        Returns
+        -------
+        ComponentReferenceView
+            The resolved component reference view.
+        """
+        def _resolve(entries: Dict[str, Any]) -> Any:
+            entry = (entries or {}).get(component_id, None)
+            if entry is None:
+                entry = (entries or {}).get('ALL', None)
+            return entry
+
+        # NOTE: already validated (references thermodb)
+        return ComponentReferenceView.model_construct(
+            component_id=component_id,
+            reference=_resolve(self.reference),
+            config=_resolve(self.reference_configs),
+            rule=_resolve(self.thermodb_rules),
+            ignore_labels=_resolve(self.ignore_labels) or []
+        )
+
+    def component_reference_view(
+        self,
+        component_id: str
+    ) -> ComponentReferenceView:
+        """
+        Get the resolved reference state of a component id.
+
+        Parameters
+        ----------
+        component_id : str
+            The component id (name-state or formula-state).
+
+        Returns
+        -------
+        ComponentReferenceView
+            The component reference view (read-only), the reference, config
+            and rule are None if neither the component nor 'ALL' has them.
+            An unknown id gets the shared 'ALL' view (component id 'ALL').
+        """
+        view = self.component_reference_views.get(component_id, None)
+        if view is None:
+            # NOTE: unknown id, resolved by 'ALL'
+            return self._all_reference_view
+        return view
+
     def _set_component_reference(
         self,
         component_id: str
@@ -84,48 +168,19 @@ class HubManager():
         CustomReference
             The reference for the specified component.
         """
-        logger.debug(f"Setting reference for component: {component_id}")
-
-        try:
-            # SECTION: get the reference for the component
-            component_reference = self.reference.get(
-                component_id,
-                None
-            )
+        component_reference = \
+            self.component_reference_view(component_id).reference
 
-            # NOTE: if not found, get ALL
-            if component_reference is None:
-                logger.debug(
-                    f"Component '{component_id}' reference not found, "
-                    "using ALL reference"
-                )
-                component_reference = self.reference.get(
-                    'ALL',
-                    None
-                )
-
-                # check if ALL is also not found
-                if component_reference is None:
-                    error_msg = (
-                        f"Component '{component_id}' not found in "
-                        "the reference."
-                    )
-                    logger.error(error_msg)
-                    raise ValueError(error_msg)
-
-            # SECTION: return the reference
-            logger.debug(
-                f"Reference set successfully for component: {component_id}"
-            )
-            return component_reference
-
-        except Exception as e:
+        # NOTE: neither the component nor ALL
+        if component_reference is None:
             logger.error(
-                f"Failed to set component reference for '{component_id}': {e}"
+                f"Component '{component_id}' not found in the reference."
             )
             raise HubComponentReferenceConfigError(
                 HUB_COMPONENT_REFERENCE_CONFIG_ERROR_MSG
-            ) from e
+            )
+
+        return component_reference
 
     def _set_component_reference_config(
         self,
@@ -133,60 +188,32 @@ class HubManager():
     ) -> Dict[str, ComponentConfig]:
         """
         Set the reference configuration for a specific component.
+
         Parameters
         ----------
         component_id : str
             The ID of the component for which to set the reference
             configuration.
+
         Returns
         -------
         Dict[str, Dict[str, str]]
             The reference configuration for the specified component.
         """
-        logger.debug(f"Setting reference config for component: {component_id}")
-
-        try:
-            # SECTION: get the reference configuration for the component
-            component_reference_config = self.reference_configs.get(
-                component_id,
-                None
-            )
+        component_reference_config = \
+            self.component_reference_view(component_id).config
 
-            # NOTE: if not found, get ALL
-            if component_reference_config is None:
-                logger.debug(
-                    f"Component '{component_id}' config not found, "
-                    "using ALL config"
-                )
-                component_reference_config = self.reference_configs.get(
-                    'ALL',
-                    None
-                )
-
-                # check if ALL is also not found
-                if component_reference_config is None:
-                    error_msg = (
-                        f"Component '{component_id}' not found in "
-                        "the reference configuration."
-                    )
-                    logger.error(error_msg)
-                    raise ValueError(error_msg)
-
-            # SECTION: return the reference configuration
-            logger.debug(
-                f"Reference config set successfully for "
-                f"component: {component_id}"
-            )
-            return component_reference_config
-
-        except Exception as e:
+        # NOTE: neither the component nor ALL
+        if component_reference_config is None:
             logger.error(
-                f"Failed to set component reference config for "
-                f"'{component_id}': {e}"
+                f"Component '{component_id}' not found in the reference "
+                "configuration."
             )
             raise HubComponentReferenceConfigError(
                 HUB_COMPONENT_REFERENCE_CONFIG_ERROR_MSG
-            ) from e
+            )
+
+        return component_reference_config
 
     def _set_component_reference_rule(
         self,
@@ -203,52 +230,21 @@ class HubManager():
         Returns
         -------
         Dict[str, Dict[str, str]]
-            The reference rule for the specified component, or None if not
-            found.
+            The reference rule for the specified component.
         """
-        logger.debug(f"Setting reference rule for component: {component_id}")
+        component_reference_rule = \
+            self.component_reference_view(component_id).rule
 
-        try:
-            # SECTION: get the reference rule for the component
-            component_reference_rule = self.thermodb_rules.get(
-                component_id,
-                None
-            )
-
-            # NOTE: if not found, get ALL
-            if component_reference_rule is None:
-                logger.debug(
-                    f"Component '{component_id}' rule not found, "
-                    "using ALL rule"
-                )
-                component_reference_rule = self.thermodb_rules.get(
-                    'ALL',
-                    None
-                )
-
-                # check if ALL is also not found
-                if component_reference_rule is None:
-                    error_msg = (
-                        f"Component '{component_id}' not found in "
-                        "the reference rule."
-                    )
-                    logger.error(error_msg)
-                    raise ValueError(error_msg)
-
-            logger.debug(
-                f"Reference rule set successfully for "
-                f"component: {component_id}"
-            )
-            return component_reference_rule
-
-        except Exception as e:
+        # NOTE: neither the component nor ALL
+        if component_reference_rule is None:
             logger.error(
-                f"Failed to set component reference rule for "
-                f"'{component_id}': {e}"
+                f"Component '{component_id}' not found in the reference rule."
             )
             raise HubComponentReferenceRuleError(
                 HUB_COMPONENT_REFERENCE_RULE_ERROR_MSG
-            ) from e
+            )
+
+        return component_reference_rule
 
     def _set_component_ignore_labels(
         self,
@@ -265,45 +261,69 @@ class HubManager():
         Returns
         -------
         List[str]
-            The ignore labels for the specified component.
+            The ignore labels for the specified component (empty if not
+            found).
         """
-        logger.debug(f"Setting ignore labels for component: {component_id}")
+        return self.component_reference_view(component_id).ignore_labels
 
-        try:
-            # SECTION: get the ignore labels for the component
-            component_ignore_labels = self.ignore_labels.get(
-                component_id,
-                None
-            )
-
-            # NOTE: if not found, get ALL
-            if component_ignore_labels is None:
-                logger.debug(
-                    f"Component '{component_id}' ignore labels not found, "
-                    "using ALL ignore labels"
-                )
-                component_ignore_labels = self.ignore_labels.get(
-                    'ALL',
-                    []
-                )
-
-            # SECTION: if still None, set to empty list
-            if component_ignore_labels is None:
-                component_ignore_labels = []
-
-            logger.debug(
-                f"Ignore labels set successfully for "
-                f"component: {component_id}"
-            )
+    def _project_component_reference_config(
+        self,
+        component_id: str,
+        required_props: Optional[FrozenSet[str]] = None
+    ) -> Optional[Dict[str, ComponentConfig]]:
+        """
+        Project the reference config of a component to the tables which
+        provide the required properties.
 
-            # return
-            return component_ignore_labels
+        Parameters
+        ----------
+        component_id : str
+            The component id.
+        required_props : FrozenSet[str], optional
+            The required property symbols (e.g. Tc, Pc, AcFa, VaPr), default
+            is None (all tables).
 
-        except Exception as e:
-            logger.error(
-                f"Failed to set component ignore labels for "
-                f"'{component_id}': {e}"
-            )
-            raise HubComponentReferenceConfigError(
-                HUB_COMPONENT_REFERENCE_CONFIG_ERROR_MSG
-            ) from e
+        Returns
+        -------
+        Dict[str, ComponentConfig], optional
+            The projected reference config, the whole config if no table
+            can be dropped or the config is not found.
+
+        Notes
+        -----
+        The symbols of a table are taken from its config (label, labels) or
+        otherwise from the component rule (EQUATIONS by property, DATA for
+        the data tables).
+        """
+        view = self.component_reference_view(component_id)
+        config = view.config
+        if not required_props or not config:
+            return config
+
+        rule = view.rule or {}
+        equation_rules: Dict[str, str] = rule.get('EQUATIONS', None) or {}
+        data_symbols = set((rule.get('DATA', None) or {}).values())
+
+        projected: Dict[str, ComponentConfig] = {}
+        for prop, prop_config in config.items():
+            prop_config_ = prop_config if isinstance(
+                prop_config, dict) else {}
+
+            # NOTE: symbols provided by the table
+            if prop_config_.get('label', None):
+                symbols = {prop_config_['label']}
+            elif prop_config_.get('labels', None):
+                symbols = set(prop_config_['labels'].values())
+            elif prop in equation_rules:
+                symbols = {equation_rules[prop]}
+            else:
+                symbols = data_symbols
+
+            if symbols & required_props:
+                projected[prop] = prop_config
+
+        # NOTE: nothing to build, keep the whole config
+        if not projected or len(projected) == len(config):
+            return config
+
+        return projected
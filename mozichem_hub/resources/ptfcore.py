@@ -1,14 +1,20 @@
 # import libs
+import os
 import logging
 from typing import (
     Dict,
     Any,
     Callable,
     List,
+    Optional,
+    Tuple,
     Annotated,
     Literal
 )
 import inspect
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 from pydantic import Field
 import pyThermoFlash as ptf
 # local
@@ -20,8 +26,12 @@ from pythermodb_settings.models import (
 from .utils import (
     set_feed_specification,
     get_components_formulas,
+    set_batch_points,
+    set_batch_columns,
 )
 from .hub import Hub
+from .raoult_engine import RaoultEngine, RAOULT_CALCS, convert_values
+from ..config import app_settings
 from ..errors import (
     PTFCalculationError,
     PTFInitializationError,
@@ -56,19 +66,321 @@ class PTFCore:
         # NOTE: store the hub instance
         self.hub = hub
 
+        # NOTE: thread pool of the batch chunks (created on first use)
+        self._batch_executor: Optional[ThreadPoolExecutor] = None
+        self._batch_lock = threading.Lock()
+
     @property
     def id(self):
         return self.__class__.__name__
 
+    @property
+    def batch_executor(self) -> Optional[ThreadPoolExecutor]:
+        """
+        The thread pool of the batch chunks, None if sequential.
+        """
+        workers = app_settings.batch_workers or os.cpu_count() or 1
+        if workers <= 1:
+            return None
+
+        if self._batch_executor is None:
+            with self._batch_lock:
+                if self._batch_executor is None:
+                    self._batch_executor = ThreadPoolExecutor(
+                        max_workers=workers,
+                        thread_name_prefix='mozichem-batch'
+                    )
+        return self._batch_executor
+
     def list_functions(self) -> Dict[str, Callable[..., Any]]:
         return {
             name: getattr(self, name)
             for name, obj in inspect.getmembers(
                 self.__class__, predicate=inspect.isfunction
             )
-            if not name.startswith('__') and name != 'list_functions'
+            if not name.startswith('_') and name != 'list_functions'
         }
 
+    def _calc_batch(
+        self,
+        calc_name: str,
+        components: List[Component],
+        mole_fractions: Optional[List[List[float]]],
+        states: List[Tuple[str, List[float], str]],
+        grid: bool,
+        **calc_kwargs
+    ) -> Dict[str, Any]:
+        """
+        Calculate a VLE method (e.g. `bubble_pressure`) at a batch of feeds
+        and state points of a component set, with one model source and VLE
+        for all points.
+
+        Parameters
+        ----------
+        calc_name : str
+            Name of the VLE method.
+        components : List[Component]
+            Components of the system, their mole fractions are the feed if
+            `mole_fractions` is not given.
+        mole_fractions : List[List[float]], optional
+            Feeds, the mole fractions of the components (same order).
+        states : List[Tuple[str, List[float], str]]
+            State variables, (name, values, unit), e.g. ('temperature',
+            [300, 310], 'K').
+        grid : bool
+            Calculate all combinations of the feeds and state values instead
+            of the (feed, state values) tuples.
+        **calc_kwargs
+            Arguments of the VLE method.
+
+        Returns
+        -------
+        Dict[str, Any]
+            The results as columns (one item per point).
+        """
+        logger.info(
+            f"Starting batch {calc_name} calculation for {len(components)} components"
+        )
+
+        try:
+            # SECTION: components id
+            component_formulas = get_components_formulas(components)
+
+            # SECTION: feeds
+            try:
+                if mole_fractions:
+                    feeds = np.asarray(mole_fractions, dtype=float)
+                    if feeds.ndim == 1:
+                        feeds = feeds.reshape(1, -1)
+                else:
+                    N0s = set_feed_specification(
+                        components=components,
+                        feed_mode="formula"
+                    )
+                    feeds = np.asarray(
+                        [[N0s[formula] for formula in component_formulas]],
+                        dtype=float
+                    )
+
+                if feeds.ndim != 2 or feeds.shape[1] != len(components):
+                    raise ValueError(
+                        f"Each feed must have {len(components)} mole fractions."
+                    )
+                logger.debug(f"Feeds: {len(feeds)}")
+            except Exception as e:
+                logger.error(f"Failed to set feed specification: {e}")
+                raise PTFFeedSpecificationError(
+                    f"Failed to set feed specification: {e}") from e
+
+            # SECTION: batch points (feed, state values)
+            try:
+                feed_index, *state_values = set_batch_points(
+                    np.arange(len(feeds)),
+                    *(values for _, values, _ in states),
+                    grid=grid
+                )
+                # NOTE: each distinct point is calculated once
+                points, inverse = np.unique(
+                    np.column_stack(
+                        (feeds[feed_index.astype(int)], *state_values)
+                    ),
+                    axis=0,
+                    return_inverse=True
+                )
+                logger.debug(
+                    f"Batch points: {feed_index.size}, distinct: {len(points)}")
+            except Exception as e:
+                logger.error(f"Failed to set batch points: {e}")
+                raise PTFCalculationError(
+                    f"Failed to set batch points: {e}") from e
+
+            # SECTION: build model source (once for all points)
+            try:
+                model_source = self.hub.build_components_model_source(
+                    components=components
+                )
+                logger.debug("Model source built successfully")
+            except Exception as e:
+                logger.error(f"Failed to build model source: {e}")
+                raise PTFModelSourceError(
+                    f"Failed to build model source: {e}") from e
+
+            # SECTION: initialize ptf (once for all points)
+            try:
+                vle = ptf.vle(
+                    components=component_formulas,
+                    model_source=model_source
+                )
+                calc = getattr(vle, calc_name)
+                logger.debug("PTF VLE initialized successfully")
+            except Exception as e:
+                logger.error(f"Failed to initialize PTF VLE: {e}")
+                raise PTFInitializationError(
+                    f"Failed to initialize PTF VLE: {e}") from e
+
+            # SECTION: calc
+            n_components = len(component_formulas)
+
+            def calc_chunk(chunk: List[List[float]]) -> List[Dict[str, Any]]:
+                results_ = []
+                for point in chunk:
+                    # NOTE: model input
+                    model_inputs = {
+                        "mole_fraction": dict(
+                            zip(component_formulas, point[:n_components])
+                        ),
+                        **{
+                            name: [value, unit]
+                            for (name, _, unit), value in zip(
+                                states, point[n_components:]
+                            )
+                        }
+                    }
+                    try:
+                        results_.append(
+                            calc(
+                                inputs=model_inputs,
+                                equilibrium_model='raoult',
+                                **calc_kwargs
+                            )
+                        )
+                    except Exception as e:
+                        logger.error(
+                            f"PTF {calc_name} calculation failed at {model_inputs}: {e}")
+                        raise PTFCalculationError(
+                            f"PTF {calc_name} calculation failed at {model_inputs}: {e}"
+                        ) from e
+                return results_
+
+            results: List[Optional[Dict[str, Any]]] = [None] * len(points)
+            if app_settings.raoult_fast_path and calc_name in RAOULT_CALCS:
+                # NOTE: closed-form raoult's law (all points at once)
+                try:
+                    results = self._calc_raoult(
+                        calc_name=calc_name,
+                        component_formulas=component_formulas,
+                        model_source=model_source,
+                        points=points,
+                        states=[(name, unit) for name, _, unit in states]
+                    )
+                except Exception as e:
+                    logger.error(
+                        f"Raoult {calc_name} calculation failed: {e}")
+                    raise PTFCalculationError(
+                        f"Raoult {calc_name} calculation failed: {e}"
+                    ) from e
+
+            # NOTE: the other points, chunks in parallel if there is a pool
+            remaining = [j for j, res in enumerate(results) if res is None]
+            chunk_size = max(1, app_settings.batch_chunk_size)
+            points_ = points[remaining].tolist()
+            chunks = [
+                points_[i:i + chunk_size]
+                for i in range(0, len(points_), chunk_size)
+            ]
+            executor = self.batch_executor if len(chunks) > 1 else None
+            for j, res in zip(
+                remaining,
+                (
+                    res
+                    for chunk_results in (
+                        executor.map(calc_chunk, chunks)
+                        if executor is not None
+                        else map(calc_chunk, chunks)
+                    )
+                    for res in chunk_results
+                )
+            ):
+                results[j] = res
+            logger.debug(
+                f"Batch {calc_name}: {len(points) - len(remaining)} points by raoult's law engine")
+            logger.info(
+                f"Batch {calc_name} calculation completed successfully")
+
+            # return (input order)
+            return {
+                'points': int(inverse.size),
+                **set_batch_columns(
+                    [results[j] for j in inverse.ravel().tolist()]
+                )
+            }
+        except (
+            PTFModelSourceError,
+            PTFInitializationError,
+            PTFFeedSpecificationError,
+            PTFCalculationError
+        ):
+            # Re-raise custom exceptions
+            raise
+        except Exception as e:
+            logger.error(
+                f"Unexpected error in batch {calc_name} calculation: {e}")
+            raise PTFCalculationError(
+                f"Unexpected error in batch {calc_name} calculation: {e}"
+            ) from e
+
+    def _calc_raoult(
+        self,
+        calc_name: str,
+        component_formulas: List[str],
+        model_source: Dict[str, Any],
+        points: np.ndarray,
+        states: List[Tuple[str, str]],
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Calculate a VLE method (`bubble_pressure`, `dew_pressure` or
+        `flash_isothermal`) at the points with the closed-form Raoult's law
+        engine.
+
+        Parameters
+        ----------
+        calc_name : str
+            Name of the VLE method.
+        component_formulas : List[str]
+            Component formulas (model source ids).
+        model_source : Dict[str, Any]
+            Model source of the components.
+        points : np.ndarray
+            Points, the feed mole fractions then the state values, shape
+            (n, components + states).
+        states : List[Tuple[str, str]]
+            State variables of the point columns, (name, unit), e.g.
+            ('temperature', 'K').
+
+        Returns
+        -------
+        List[Optional[Dict[str, Any]]]
+            Result of each point, None if the engine does not apply (e.g. a
+            single phase flash).
+        """
+        points = np.asarray(points, dtype=float)
+        n_components = len(component_formulas)
+
+        # NOTE: state values in SI units
+        state_values = {
+            name: convert_values(
+                points[:, n_components + i],
+                unit,
+                'K' if name == 'temperature' else 'Pa'
+            )
+            for i, (name, unit) in enumerate(states)
+        }
+
+        try:
+            engine = RaoultEngine(
+                components=component_formulas,
+                model_source=model_source
+            )
+        except ValueError as e:
+            # NOTE: not supported (pyThermoFlash for all points)
+            logger.debug(f"Raoult's law engine not used: {e}")
+            return [None] * len(points)
+
+        return getattr(engine, calc_name)(
+            points[:, :n_components],
+            **state_values
+        )
+
     def calc_bubble_pressure_ideal_vapor_ideal_liquid(
         self,
         components: Annotated[
@@ -143,10 +455,25 @@ class PTFCore:
 
             # SECTION: calc
             try:
-                res = vle.bubble_pressure(
-                    inputs=model_inputs,
-                    equilibrium_model=equilibrium_model
-                )
+                res = None
+                if app_settings.raoult_fast_path:
+                    # NOTE: closed-form raoult's law
+                    res = self._calc_raoult(
+                        calc_name='bubble_pressure',
+                        component_formulas=component_formulas,
+                        model_source=model_source,
+                        points=[
+                            [N0s[formula] for formula in component_formulas]
+                            + [temperature.value]
+                        ],
+                        states=[('temperature', temperature.unit)]
+                    )[0]
+
+                if res is None:
+                    res = vle.bubble_pressure(
+                        inputs=model_inputs,
+                        equilibrium_model=equilibrium_model
+                    )
                 logger.info(
                     "Bubble pressure calculation completed successfully")
                 logger.debug(f"Result: {res}")
@@ -245,10 +572,25 @@ class PTFCore:
 
             # SECTION: calc
             try:
-                res = vle.dew_pressure(
-                    inputs=model_inputs,
-                    equilibrium_model=equilibrium_model
-                )
+                res = None
+                if app_settings.raoult_fast_path:
+                    # NOTE: closed-form raoult's law
+                    res = self._calc_raoult(
+                        calc_name='dew_pressure',
+                        component_formulas=component_formulas,
+                        model_source=model_source,
+                        points=[
+                            [N0s[formula] for formula in component_formulas]
+                            + [temperature.value]
+                        ],
+                        states=[('temperature', temperature.unit)]
+                    )[0]
+
+                if res is None:
+                    res = vle.dew_pressure(
+                        inputs=model_inputs,
+                        equilibrium_model=equilibrium_model
+                    )
                 logger.info("Dew pressure calculation completed successfully")
                 logger.debug(f"Result: {res}")
             except Exception as e:
@@ -571,10 +913,25 @@ class PTFCore:
             logger.debug(f"Model inputs: {model_inputs}")
             # SECTION: calc
             try:
-                res = vle.flash_isothermal(
-                    inputs=model_inputs,
-                    equilibrium_model=equilibrium_model
-                )
+                res = None
+                if app_settings.raoult_fast_path:
+                    # NOTE: closed-form raoult's law
+                    res = self._calc_raoult(
+                        calc_name='flash_isothermal',
+                        component_formulas=component_formulas,
+                        model_source=model_source,
+                        points=[
+                            [N0s[formula] for formula in component_formulas]
+                            + [temperature.value, pressure.value]
+                        ],
+                        states=[('temperature', temperature.unit), ('pressure', pressure.unit)]
+                    )[0]
+
+                if res is None:
+                    res = vle.flash_isothermal(
+                        inputs=model_inputs,
+                        equilibrium_model=equilibrium_model
+                    )
                 logger.info("Flash calculation completed successfully")
                 logger.debug(f"Result: {res}")
             except Exception as e:
@@ -596,3 +953,220 @@ class PTFCore:
             raise PTFCalculationError(
                 f"Unexpected error in flash calculation: {e}"
             ) from e
+
+    def calc_bubble_pressure_ideal_vapor_ideal_liquid_batch(
+        self,
+        components: Annotated[
+            List[Component],
+            Field(..., description="List of components with their properties")
+        ],
+        temperatures: Annotated[
+            List[float],
+            Field(..., description="Temperatures of the points")
+        ],
+        mole_fractions: Annotated[
+            Optional[List[List[float]]],
+            Field(
+                default=None,
+                description="Feeds, mole fractions of the components (same order as the components), default is the mole fractions of the components"
+            )
+        ] = None,
+        temperature_unit: Annotated[
+            str,
+            Field(description="Unit of the temperatures, e.g., 'K', 'C'", default="K")
+        ] = "K",
+        grid: Annotated[
+            bool,
+            Field(
+                description="Calculate all combinations of the feeds and state values (grid) instead of the (feed, state values) points",
+                default=False
+            )
+        ] = False
+    ) -> dict:
+        """Calculates the bubble pressure of a batch of feeds and temperatures of a mixture of components using Raoult's law (ideal vapor and ideal liquid), results are returned as columns."""
+        return self._calc_batch(
+            calc_name='bubble_pressure',
+            components=components,
+            mole_fractions=mole_fractions,
+            states=[('temperature', temperatures, temperature_unit)],
+            grid=grid
+        )
+
+    def calc_dew_pressure_ideal_vapor_ideal_liquid_batch(
+        self,
+        components: Annotated[
+            List[Component],
+            Field(..., description="List of components with their properties")
+        ],
+        temperatures: Annotated[
+            List[float],
+            Field(..., description="Temperatures of the points")
+        ],
+        mole_fractions: Annotated[
+            Optional[List[List[float]]],
+            Field(
+                default=None,
+                description="Feeds, mole fractions of the components (same order as the components), default is the mole fractions of the components"
+            )
+        ] = None,
+        temperature_unit: Annotated[
+            str,
+            Field(description="Unit of the temperatures, e.g., 'K', 'C'", default="K")
+        ] = "K",
+        grid: Annotated[
+            bool,
+            Field(
+                description="Calculate all combinations of the feeds and state values (grid) instead of the (feed, state values) points",
+                default=False
+            )
+        ] = False
+    ) -> dict:
+        """Calculates the dew pressure of a batch of feeds and temperatures of a mixture of components using Raoult's law (ideal vapor and ideal liquid), results are returned as columns."""
+        return self._calc_batch(
+            calc_name='dew_pressure',
+            components=components,
+            mole_fractions=mole_fractions,
+            states=[('temperature', temperatures, temperature_unit)],
+            grid=grid
+        )
+
+    def calc_bubble_temperature_ideal_vapor_ideal_liquid_batch(
+        self,
+        components: Annotated[
+            List[Component],
+            Field(..., description="List of components with their properties")
+        ],
+        pressures: Annotated[
+            List[float],
+            Field(..., description="Pressures of the points")
+        ],
+        mole_fractions: Annotated[
+            Optional[List[List[float]]],
+            Field(
+                default=None,
+                description="Feeds, mole fractions of the components (same order as the components), default is the mole fractions of the components"
+            )
+        ] = None,
+        pressure_unit: Annotated[
+            str,
+            Field(description="Unit of the pressures, e.g., 'bar', 'kPa'", default="bar")
+        ] = "bar",
+        grid: Annotated[
+            bool,
+            Field(
+                description="Calculate all combinations of the feeds and state values (grid) instead of the (feed, state values) points",
+                default=False
+            )
+        ] = False,
+        solver_method: Annotated[
+            Literal['root', 'least-squares', 'fsolve'],
+            Field(
+                default='root',
+                description="Method to use for solving the bubble temperature calculation. Options are 'root', 'least-squares', or 'fsolve'."
+            )
+        ] = 'root'
+    ) -> dict:
+        """Calculates the bubble temperature of a batch of feeds and pressures of a mixture of components using Raoult's law (ideal vapor and ideal liquid), results are returned as columns."""
+        return self._calc_batch(
+            calc_name='bubble_temperature',
+            components=components,
+            mole_fractions=mole_fractions,
+            states=[('pressure', pressures, pressure_unit)],
+            grid=grid,
+            solver_method=solver_method
+        )
+
+    def calc_dew_temperature_ideal_vapor_ideal_liquid_batch(
+        self,
+        components: Annotated[
+            List[Component],
+            Field(..., description="List of components with their properties")
+        ],
+        pressures: Annotated[
+            List[float],
+            Field(..., description="Pressures of the points")
+        ],
+        mole_fractions: Annotated[
+            Optional[List[List[float]]],
+            Field(
+                default=None,
+                description="Feeds, mole fractions of the components (same order as the components), default is the mole fractions of the components"
+            )
+        ] = None,
+        pressure_unit: Annotated[
+            str,
+            Field(description="Unit of the pressures, e.g., 'bar', 'kPa'", default="bar")
+        ] = "bar",
+        grid: Annotated[
+            bool,
+            Field(
+                description="Calculate all combinations of the feeds and state values (grid) instead of the (feed, state values) points",
+                default=False
+            )
+        ] = False,
+        solver_method: Annotated[
+            Literal['root', 'least-squares', 'fsolve'],
+            Field(
+                default='least-squares',
+                description="Method to use for solving the dew temperature calculation. Options are 'root', 'least-squares', or 'fsolve'."
+            )
+        ] = 'least-squares'
+    ) -> dict:
+        """Calculates the dew temperature of a batch of feeds and pressures of a mixture of components using Raoult's law (ideal vapor and ideal liquid), results are returned as columns."""
+        return self._calc_batch(
+            calc_name='dew_temperature',
+            components=components,
+            mole_fractions=mole_fractions,
+            states=[('pressure', pressures, pressure_unit)],
+            grid=grid,
+            solver_method=solver_method
+        )
+
+    def calc_flash_isothermal_ideal_vapor_ideal_liquid_batch(
+        self,
+        components: Annotated[
+            List[Component],
+            Field(..., description="List of components with their properties")
+        ],
+        temperatures: Annotated[
+            List[float],
+            Field(..., description="Temperatures of the points")
+        ],
+        pressures: Annotated[
+            List[float],
+            Field(..., description="Pressures of the points")
+        ],
+        mole_fractions: Annotated[
+            Optional[List[List[float]]],
+            Field(
+                default=None,
+                description="Feeds, mole fractions of the components (same order as the components), default is the mole fractions of the components"
+            )
+        ] = None,
+        temperature_unit: Annotated[
+            str,
+            Field(description="Unit of the temperatures, e.g., 'K', 'C'", default="K")
+        ] = "K",
+        pressure_unit: Annotated[
+            str,
+            Field(description="Unit of the pressures, e.g., 'bar', 'kPa'", default="bar")
+        ] = "bar",
+        grid: Annotated[
+            bool,
+            Field(
+                description="Calculate all combinations of the feeds and state values (grid) instead of the (feed, state values) points",
+                default=False
+            )
+        ] = False
+    ) -> dict:
+        """Calculates the isothermal flash of a batch of feeds, temperatures and pressures of a mixture of components using Raoult's law for ideal vapor and ideal liquid, results are returned as columns."""
+        return self._calc_batch(
+            calc_name='flash_isothermal',
+            components=components,
+            mole_fractions=mole_fractions,
+            states=[
+                ('temperature', temperatures, temperature_unit),
+                ('pressure', pressures, pressure_unit)
+            ],
+            grid=grid
+        )
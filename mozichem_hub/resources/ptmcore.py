@@ -5,9 +5,12 @@ from typing import (
     Any,
     Callable,
     List,
+    Optional,
 )
 import inspect
+import threading
 from typing import Annotated, Literal
+import numpy as np
 from pydantic import Field
 import pyThermoModels as ptm
 # local
@@ -16,11 +19,18 @@ from pythermodb_settings.models import (
     Pressure,
     Component,
 )
-from .utils import set_feed_specification
+from .utils import (
+    set_feed_specification,
+    set_batch_points
+)
 from .hub import Hub
+from .eos_engine import CubicEOSEngine, FUGACITY_COLUMNS, to_kelvin
+from .raoult_engine import to_pascal
+from ..config import app_settings
 from ..descriptors import MCPDescriptor, get_mcp_ignore_state_props
 # from ..config import MCP_MODULES
 from .reference_utils import initialize_custom_reference
+from .reference_registry import reference_registry
 from ..errors import (
     PTMCalculationError,
     PTMInitializationError,
@@ -59,7 +69,20 @@ class PTMCore:
         self.hub = hub
 
         # SECTION: build eos
-        self.eos = ptm.eos()
+        # NOTE: eos keeps the model source as instance state, one per thread
+        self._local = threading.local()
+        self._local.eos = ptm.eos()
+
+    @property
+    def eos(self):
+        """
+        The eos instance of the current thread.
+        """
+        eos_ = getattr(self._local, 'eos', None)
+        if eos_ is None:
+            eos_ = ptm.eos()
+            self._local.eos = eos_
+        return eos_
 
     @property
     def id(self):
@@ -162,6 +185,44 @@ class PTMCore:
         # return summary
         return reference_inputs
 
+    def register_custom_reference(
+        self,
+        custom_reference_content: Annotated[
+            str,
+            Field(
+                ...,
+                description=(
+                    "Custom reference content provided by PyThermoDB, this consists of data and equations for all components."
+                )
+            )
+        ],
+        custom_reference_config: Annotated[
+            str,
+            Field(
+                default='None',
+                description=(
+                    "Custom reference configuration provided by PyThermoDB, this consists of the reference for data and equations for each component."
+                )
+            )
+        ] = 'None'
+    ) -> dict:
+        """Registers a custom reference once and returns its id to be used in the calculation tools"""
+        try:
+            registered_reference = reference_registry.register(
+                content=custom_reference_content,
+                config=custom_reference_config
+            )
+
+            # return
+            return {
+                "reference_id": registered_reference.reference_id,
+                "config": registered_reference.config is not None,
+            }
+        except Exception as e:
+            logger.error(f"Failed to register custom reference: {e}")
+            raise PTMReferenceError(
+                f"Failed to register custom reference: {e}") from e
+
     def calc_gas_component_fugacity(
         self,
         component: Annotated[
@@ -203,6 +264,15 @@ class PTMCore:
                     "Custom reference configuration provided by PyThermoDB, this consists of the reference for data and equations for each component."
                 )
             )
+        ] = 'None',
+        custom_reference_id: Annotated[
+            str,
+            Field(
+                default='None',
+                description=(
+                    "Id of a custom reference registered by `register_custom_reference`, used instead of the custom reference content and config."
+                )
+            )
         ] = 'None'
     ) -> dict:
         """Calculates the fugacity of a gas-phase component at given temperature and pressure"""
@@ -225,7 +295,7 @@ class PTMCore:
             # NOTE: get ignore_state_props for the component from MCPDescriptor
             ignore_state_props: List[str] = []
             try:
-                ignore_state_props = MCPDescriptor().mcp_method_ignore_state_props(
+                ignore_state_props = MCPDescriptor.mcp_method_ignore_state_props(
                     mcp_id=self.id,
                     method_name='calc_gas_component_fugacity'
                 )
@@ -238,13 +308,15 @@ class PTMCore:
 
             # SECTION: reinitialize hub if needed
             # NOTE: this is to ensure that the hub is initialized with custom reference content and config
+            # ! the custom reference hub is only used for this call
             try:
-                self.hub = initialize_custom_reference(
+                hub = initialize_custom_reference(
                     hub=self.hub,
                     components=component,
                     custom_reference_content=custom_reference_content,
                     custom_reference_config=custom_reference_config,
-                    ignore_state_props=ignore_state_props
+                    ignore_state_props=ignore_state_props,
+                    custom_reference_id=custom_reference_id
                 )
                 logger.debug("Custom reference initialized successfully")
             except Exception as e:
@@ -256,9 +328,13 @@ class PTMCore:
             try:
                 # REVIEW
                 # ! component-key is set to Name-State
-                model_source = self.hub.build_component_model_source(
+                model_source = hub.build_component_model_source(
                     component=component,
-                    component_key='Name-State'
+                    component_key='Name-State',
+                    required_props=MCPDescriptor.mcp_method_required_props(
+                        mcp_id=self.id,
+                        method_name='calc_gas_component_fugacity'
+                    )
                 )
                 logger.debug("Model source built successfully")
             except Exception as e:
@@ -306,6 +382,345 @@ class PTMCore:
                 f"Unexpected error in gas component fugacity calculation: {e}"
             ) from e
 
+    def calc_gas_component_fugacity_batch(
+        self,
+        component: Annotated[
+            Component,
+            Field(..., description="Component name and properties")
+        ],
+        temperatures: Annotated[
+            List[float],
+            Field(..., description="Temperatures of the points")
+        ],
+        pressures: Annotated[
+            List[float],
+            Field(..., description="Pressures of the points")
+        ],
+        temperature_unit: Annotated[
+            str,
+            Field(description="Unit of the temperatures, e.g., 'K', 'C'", default="K")
+        ] = "K",
+        pressure_unit: Annotated[
+            str,
+            Field(description="Unit of the pressures, e.g., 'bar', 'Pa'", default="bar")
+        ] = "bar",
+        grid: Annotated[
+            bool,
+            Field(
+                description="Evaluate all combinations of the temperatures and pressures (grid) instead of the (temperature, pressure) pairs",
+                default=False
+            )
+        ] = False,
+        eos_model: Annotated[
+            Literal['PR', 'SRK', 'RK', 'vdW'],
+            Field(description="EOS model to use, e.g., 'SRK', 'PR'", default="SRK")
+        ] = "SRK",
+        solver_method: Annotated[
+            Literal['ls', 'fsolve', 'root'],
+            Field(
+                description="Solver method of the point by point calculation, e.g., 'least-square method', 'fsolve', 'root' (the vectorized calculation solves the cubic equations directly)",
+                default="ls"
+            )
+        ] = "ls",
+        custom_reference_content: Annotated[
+            str,
+            Field(
+                default='None',
+                description=(
+                    "Custom reference content provided by PyThermoDB, this consists of data and equations for all components."
+                )
+            )
+        ] = 'None',
+        custom_reference_config: Annotated[
+            str,
+            Field(
+                default='None',
+                description=(
+                    "Custom reference configuration provided by PyThermoDB, this consists of the reference for data and equations for each component."
+                )
+            )
+        ] = 'None',
+        custom_reference_id: Annotated[
+            str,
+            Field(
+                default='None',
+                description=(
+                    "Id of a custom reference registered by `register_custom_reference`, used instead of the custom reference content and config."
+                )
+            )
+        ] = 'None'
+    ) -> dict:
+        """Calculates the fugacity of a gas-phase component at a batch (pairs or grid) of temperatures and pressures in one vectorized evaluation, results are returned as one column per quantity with one value per point"""
+        logger.info(
+            f"Starting batch gas component fugacity calculation for {component.name} using {eos_model} EOS"
+        )
+
+        try:
+            # SECTION: batch points
+            try:
+                T, P = set_batch_points(
+                    temperatures,
+                    pressures,
+                    grid=grid
+                )
+                # NOTE: each distinct point is calculated once
+                points, inverse = np.unique(
+                    np.column_stack((T, P)),
+                    axis=0,
+                    return_inverse=True
+                )
+                logger.debug(
+                    f"Batch points: {T.size}, distinct: {len(points)}")
+            except Exception as e:
+                logger.error(f"Failed to set batch points: {e}")
+                raise PTMCalculationError(
+                    f"Failed to set batch points: {e}") from e
+
+            # component ky (name-state)
+            component_ = f"{component.name}-{component.state}"
+
+            # SECTION: ignore state props
+            try:
+                ignore_state_props: List[str] = MCPDescriptor.mcp_method_ignore_state_props(
+                    mcp_id=self.id,
+                    method_name='calc_gas_component_fugacity_batch'
+                )
+            except Exception as e:
+                logger.error(f"Failed to get ignore state props: {e}")
+                raise PTMComponentError(
+                    f"Failed to get ignore state props: {e}") from e
+
+            # SECTION: reinitialize hub if needed
+            # ! the custom reference hub is only used for this call
+            try:
+                hub = initialize_custom_reference(
+                    hub=self.hub,
+                    components=component,
+                    custom_reference_content=custom_reference_content,
+                    custom_reference_config=custom_reference_config,
+                    ignore_state_props=ignore_state_props,
+                    custom_reference_id=custom_reference_id
+                )
+            except Exception as e:
+                logger.error(f"Failed to initialize custom reference: {e}")
+                raise PTMReferenceError(
+                    f"Failed to initialize custom reference: {e}") from e
+
+            # SECTION: build model source (once for all points)
+            try:
+                model_source = hub.build_component_model_source(
+                    component=component,
+                    component_key='Name-State',
+                    required_props=MCPDescriptor.mcp_method_required_props(
+                        mcp_id=self.id,
+                        method_name='calc_gas_component_fugacity_batch'
+                    )
+                )
+                logger.debug("Model source built successfully")
+            except Exception as e:
+                logger.error(f"Failed to build model source: {e}")
+                raise PTMModelSourceError(
+                    f"Failed to build model source: {e}") from e
+
+            # SECTION: calc (distinct points)
+            columns = None
+            if app_settings.eos_fast_path:
+                columns = self._calc_eos_batch(
+                    component_,
+                    model_source,
+                    points,
+                    temperature_unit=temperature_unit,
+                    pressure_unit=pressure_unit,
+                    eos_model=eos_model
+                )
+            if columns is None:
+                columns = self._calc_fugacity_points(
+                    component_,
+                    model_source,
+                    points,
+                    temperature_unit=temperature_unit,
+                    pressure_unit=pressure_unit,
+                    eos_model=eos_model,
+                    solver_method=solver_method
+                )
+
+            # SECTION: columns (input order)
+            order = inverse.ravel()
+            res = {
+                'points': int(T.size),
+                'component': component_,
+                'eos_model': eos_model,
+                'temperature': {
+                    'value': T.tolist(),
+                    'unit': temperature_unit,
+                    'symbol': 'T'
+                },
+                'pressure': {
+                    'value': P.tolist(),
+                    'unit': pressure_unit,
+                    'symbol': 'P'
+                },
+                'phase': columns['phase'][order].tolist(),
+                # NOTE: False where the single point tool ('ls' solver)
+                # stops at a bound of its search interval
+                'matches_single_point': columns[
+                    'matches_single_point'][order].tolist(),
+                **{
+                    key: {
+                        'value': columns[key][order].tolist(),
+                        'unit': unit,
+                        'symbol': symbol
+                    }
+                    for key, (unit, symbol) in FUGACITY_COLUMNS.items()
+                },
+            }
+            logger.info(
+                "Batch gas component fugacity calculation completed successfully")
+
+            # return
+            return res
+        except (
+            PTMCalculationError,
+            PTMComponentError,
+            PTMReferenceError,
+            PTMModelSourceError,
+            PTMFugacityError
+        ):
+            # Re-raise custom exceptions
+            raise
+        except Exception as e:
+            logger.error(
+                f"Unexpected error in batch gas component fugacity calculation: {e}")
+            raise PTMCalculationError(
+                f"Unexpected error in batch gas component fugacity calculation: {e}"
+            ) from e
+
+    def _calc_eos_batch(
+        self,
+        component: str,
+        model_source: Dict[str, Any],
+        points: np.ndarray,
+        temperature_unit: str,
+        pressure_unit: str,
+        eos_model: str
+    ) -> Optional[Dict[str, np.ndarray]]:
+        """
+        Calculate the pure component fugacity at the points with the cubic
+        eos engine (all points at once).
+
+        Parameters
+        ----------
+        component : str
+            Component id of the model source (name-state).
+        model_source : Dict[str, Any]
+            Model source of the component.
+        points : np.ndarray
+            Points, (temperature, pressure), shape (n, 2).
+        temperature_unit : str
+            Unit of the temperatures.
+        pressure_unit : str
+            Unit of the pressures.
+        eos_model : str
+            The equation of state.
+
+        Returns
+        -------
+        Optional[Dict[str, np.ndarray]]
+            Phase and fugacity columns of the points, None if the engine does
+            not apply (e.g. a vapor pressure equation of other args).
+        """
+        try:
+            engine = CubicEOSEngine(
+                component=component,
+                model_source=model_source
+            )
+            return engine.fugacity(
+                to_kelvin(points[:, 0], temperature_unit),
+                to_pascal(points[:, 1], pressure_unit),
+                eos_model=eos_model
+            )
+        except ValueError as e:
+            # NOTE: not supported (pyThermoModels for all points)
+            logger.debug(f"Cubic eos engine not used: {e}")
+            return None
+
+    def _calc_fugacity_points(
+        self,
+        component: str,
+        model_source: Dict[str, Any],
+        points: np.ndarray,
+        temperature_unit: str,
+        pressure_unit: str,
+        eos_model: str,
+        solver_method: str
+    ) -> Dict[str, np.ndarray]:
+        """
+        Calculate the pure component fugacity at the points with
+        pyThermoModels (point by point).
+
+        Parameters
+        ----------
+        component : str
+            Component id of the model source (name-state).
+        model_source : Dict[str, Any]
+            Model source of the component.
+        points : np.ndarray
+            Points, (temperature, pressure), shape (n, 2).
+        temperature_unit : str
+            Unit of the temperatures.
+        pressure_unit : str
+            Unit of the pressures.
+        eos_model : str
+            The equation of state.
+        solver_method : str
+            Solver method of the eos roots.
+
+        Returns
+        -------
+        Dict[str, np.ndarray]
+            Phase and fugacity columns of the points, at a saturation point
+            (vapor-liquid) the vapor values (all points match the single
+            point tool).
+        """
+        eos_ = self.eos
+        phases: List[str] = []
+        values: Dict[str, List[float]] = {key: [] for key in FUGACITY_COLUMNS}
+
+        for T_, P_ in points.tolist():
+            try:
+                res = eos_.cal_fugacity(
+                    model_name=eos_model,
+                    model_input={
+                        "component": component,
+                        "pressure": [P_, pressure_unit],
+                        "temperature": [T_, temperature_unit]
+                    },
+                    model_source=model_source,
+                    solver_method=solver_method
+                )
+            except Exception as e:
+                logger.error(
+                    f"PTM fugacity calculation failed at {T_} {temperature_unit}, {P_} {pressure_unit}: {e}")
+                raise PTMFugacityError(
+                    f"PTM fugacity calculation failed at {T_} {temperature_unit}, {P_} {pressure_unit}: {e}"
+                ) from e
+
+            # NOTE: one phase per point
+            if len(res['phase']) > 1:
+                phases.append('vapor-liquid')
+                values_ = res['vapor']
+            else:
+                phases.append(res['phase'][0])
+                values_ = res[res['phase'][0]]
+            for key in FUGACITY_COLUMNS:
+                values[key].append(float(values_[key]['value']))
+
+        return {
+            'phase': np.array(phases),
+            'matches_single_point': np.ones(len(phases), dtype=bool),
+            **{key: np.array(v, dtype=float) for key, v in values.items()}
+        }
+
     def calc_liquid_component_fugacity(
         self,
         component: Annotated[
@@ -445,7 +860,11 @@ class PTMCore:
             # SECTION: build model source
             try:
                 model_source = self.hub.build_components_model_source(
-                    components=components
+                    components=components,
+                    required_props=MCPDescriptor.mcp_method_required_props(
+                        mcp_id=self.id,
+                        method_name='calc_fugacity_gas_mixture'
+                    )
                 )
                 logger.debug("Model source built successfully")
             except Exception as e:
@@ -527,7 +946,11 @@ class PTMCore:
             # SECTION: build model source
             try:
                 model_source = self.hub.build_component_model_source(
-                    component=component
+                    component=component,
+                    required_props=MCPDescriptor.mcp_method_required_props(
+                        mcp_id=self.id,
+                        method_name='component_eos_roots_analysis'
+                    )
                 )
                 logger.debug("Model source built successfully")
             except Exception as e:
@@ -610,7 +1033,11 @@ class PTMCore:
             # SECTION: build model source
             try:
                 model_source = self.hub.build_components_model_source(
-                    components=components
+                    components=components,
+                    required_props=MCPDescriptor.mcp_method_required_props(
+                        mcp_id=self.id,
+                        method_name='multi_component_eos_roots_analysis'
+                    )
                 )
                 logger.debug("Model source built successfully")
             except Exception as e:
@@ -0,0 +1,518 @@
+# import libs
+import math
+import time
+import logging
+from functools import lru_cache
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Tuple
+)
+import numpy as np
+import pycuc
+
+# NOTE: logger
+logger = logging.getLogger(__name__)
+
+# NOTE: vle methods with a closed-form (raoult's law) evaluation
+RAOULT_CALCS = ('bubble_pressure', 'dew_pressure', 'flash_isothermal')
+
+
+class _ArrayMath:
+    """
+    The `math` module of the equation bodies for arrays (numpy functions
+    with the math names).
+    """
+    pi = math.pi
+    e = math.e
+    pow = staticmethod(np.power)
+
+    @staticmethod
+    def log(x: Any, base: Optional[float] = None) -> Any:
+        return np.log(x) if base is None else np.log(x) / np.log(base)
+
+    def __getattr__(self, name: str) -> Any:
+        fn = getattr(np, name, None)
+        return fn if fn is not None else np.vectorize(getattr(math, name))
+
+
+_array_math = _ArrayMath()
+
+
+@lru_cache(maxsize=None)
+def _pressure_references() -> Dict[str, float]:
+    """
+    Pressure units of pycuc (value per bar).
+    """
+    return pycuc.check_reference('PRESSURE', dataframe=False)
+
+
+def to_pascal(values: np.ndarray, unit: str) -> np.ndarray:
+    """
+    Convert pressures to Pa as pycuc does (value / from * to).
+    """
+    references = _pressure_references()
+    if unit in references:
+        return (
+            np.asarray(values, dtype=float)
+            / float(references[unit]) * float(references['Pa'])
+        )
+    return np.array(
+        [pycuc.to(v, f"{unit} => Pa") for v in np.ravel(values).tolist()],
+        dtype=float
+    ).reshape(np.shape(values))
+
+
+@lru_cache(maxsize=256)
+def _compile_body(body: str) -> Any:
+    """
+    Compile an equation body (shared by all equations with the same body).
+    """
+    return compile(body, '<equation>', 'exec')
+
+
+def convert_values(
+    values: np.ndarray,
+    unit: str,
+    to_unit: str
+) -> np.ndarray:
+    """
+    Convert values to a unit (each distinct value converted by pycuc, as the
+    VLE inputs).
+    """
+    distinct, inverse = np.unique(values, return_inverse=True)
+    converted = np.array(
+        [pycuc.convert_from_to(v, unit, to_unit) for v in distinct.tolist()],
+        dtype=float
+    )
+    return converted[inverse.reshape(np.shape(values))]
+
+
+class RaoultEngine:
+    """
+    Closed-form Raoult's law (ideal vapor and ideal liquid) calculations of a
+    component set over arrays of feeds and state points, a fast path of the
+    pyThermoFlash VLE methods with the same results.
+
+    Notes
+    -----
+    - The vapor pressure equations (VaPr) of all components are evaluated
+      with numpy over the temperatures, rounded and converted as
+      `TableEquation.cal` does.
+    - The bubble and dew pressures are closed-form in the vapor pressures,
+      the isothermal flash solves the Rachford-Rice equation of all points
+      at once (two-phase points only, None for the others).
+    """
+
+    def __init__(
+        self,
+        components: List[str],
+        model_source: Dict[str, Any]
+    ) -> None:
+        """
+        Initialize the RaoultEngine.
+
+        Parameters
+        ----------
+        components : List[str]
+            Component ids of the model source (e.g. formula-state).
+        model_source : Dict[str, Any]
+            The model source (datasource and equationsource).
+        """
+        self.components = components
+
+        # NOTE: vapor pressure equations (equation, compiled body, params,
+        # unit)
+        self._equations: List[Tuple[Any, Any, Dict[str, float], str]] = []
+        for component in components:
+            try:
+                eq = model_source['equationsource'][component]['VaPr']
+            except KeyError as e:
+                raise ValueError(
+                    f"Vapor pressure equation (VaPr) of '{component}' not found in the model source."
+                ) from e
+
+            # NOTE: temperature dependent only
+            symbols = [arg['symbol'] for arg in eq.args.values()]
+            if symbols != ['T']:
+                raise ValueError(
+                    f"Vapor pressure equation (VaPr) of '{component}' has the args {symbols}, only T is supported."
+                )
+
+            self._equations.append((
+                eq,
+                _compile_body(eq.body),
+                eq.load_parms_v2(),
+                next(iter(eq.returns.values()))['unit']
+            ))
+
+    def vapor_pressure(self, temperature: np.ndarray) -> np.ndarray:
+        """
+        Vapor pressure of the components at the temperatures.
+
+        Parameters
+        ----------
+        temperature : np.ndarray
+            Temperatures [K], shape (n,).
+
+        Returns
+        -------
+        np.ndarray
+            Vapor pressures [Pa], shape (n, components).
+        """
+        T = np.asarray(temperature, dtype=float)
+        VaPr = np.empty((T.size, len(self._equations)))
+
+        for i, (eq, code, parms, unit) in enumerate(self._equations):
+            try:
+                namespace = {
+                    'args': {'T': T},
+                    'parms': dict(parms),
+                    'math': _array_math
+                }
+                exec(code, namespace)
+                value = np.broadcast_to(
+                    np.asarray(namespace['res'], dtype=float), T.shape
+                )
+            except Exception:
+                # NOTE: scalar body (e.g. conditions on the args)
+                value = np.array(
+                    [eq.cal(T=T_)['value'] for T_ in T.tolist()],
+                    dtype=float
+                )
+
+            # NOTE: as TableEquation.cal (4 decimals) and pycuc (to Pa)
+            VaPr[:, i] = to_pascal(np.round(value, 4), unit)
+
+        return VaPr
+
+    def _check_mole_fractions(self, mole_fractions: np.ndarray) -> np.ndarray:
+        """
+        Mole fractions as an array (n, components) between 0 and 1.
+        """
+        z = np.asarray(mole_fractions, dtype=float)
+        if z.ndim != 2 or z.shape[1] != len(self.components):
+            raise ValueError(
+                f"Mole fractions must have {len(self.components)} values.")
+        if np.any((z < 0) | (z > 1)):
+            raise ValueError("Mole fractions must be between 0 and 1.")
+        return z
+
+    def _results(
+        self,
+        points: List[Dict[str, Any]],
+        message: str,
+        start_time: float,
+        **items
+    ) -> List[Dict[str, Any]]:
+        """
+        Complete the results of the points as the pyThermoFlash VLE methods.
+        """
+        # NOTE: calculation time per point
+        computation_time = (time.time() - start_time) / max(1, len(points))
+        for res in points:
+            res.update({
+                'message': message,
+                'components': self.components,
+                'equilibrium_model': 'raoult',
+                **items,
+                'fugacity_model': None,
+                'activity_model': None,
+                'computation_time': {
+                    "value": computation_time,
+                    "unit": "s"
+                }
+            })
+        return points
+
+    def bubble_pressure(
+        self,
+        mole_fractions: np.ndarray,
+        temperature: np.ndarray
+    ) -> List[Dict[str, Any]]:
+        """
+        Bubble pressure of the feeds (liquid mole fractions) at the
+        temperatures.
+
+        Parameters
+        ----------
+        mole_fractions : np.ndarray
+            Feeds, shape (n, components).
+        temperature : np.ndarray
+            Temperatures [K], shape (n,).
+
+        Returns
+        -------
+        List[Dict[str, Any]]
+            Result of each point (`VLE.bubble_pressure`).
+        """
+        start_time = time.time()
+        z = self._check_mole_fractions(mole_fractions)
+        T = np.asarray(temperature, dtype=float)
+        VaPr = self.vapor_pressure(T)
+
+        # SECTION: closed-form
+        BuPr = np.sum(z * VaPr, axis=1)
+        y = z * VaPr / BuPr[:, None]
+        K = np.multiply(y, 1 / z)
+
+        # SECTION: results
+        AcCo = np.ones(len(self.components))
+        points = [
+            {
+                "bubble_pressure": {
+                    "value": float(BuPr[j]),
+                    "unit": "Pa"
+                },
+                "temperature": {
+                    "value": float(T[j]),
+                    "unit": "K"
+                },
+                "feed_mole_fraction": z[j],
+                "vapor_mole_fraction": y[j],
+                "liquid_mole_fraction": z[j],
+                "mole_fraction_sum": {
+                    "zi": float(np.sum(z[j])),
+                    "xi": float(np.sum(z[j])),
+                    "yi": float(np.sum(y[j]))
+                },
+                "vapor_pressure": {
+                    "value": VaPr[j],
+                    "unit": "Pa"
+                },
+                "activity_coefficient": {
+                    "value": AcCo,
+                    "unit": "dimensionless"
+                },
+                "K_ratio": {
+                    "value": K[j],
+                    "unit": "dimensionless"
+                }
+            }
+            for j in range(len(T))
+        ]
+        return self._results(
+            points, "Bubble Pressure Calculation", start_time)
+
+    def dew_pressure(
+        self,
+        mole_fractions: np.ndarray,
+        temperature: np.ndarray
+    ) -> List[Dict[str, Any]]:
+        """
+        Dew pressure of the feeds (vapor mole fractions) at the temperatures.
+
+        Parameters
+        ----------
+        mole_fractions : np.ndarray
+            Feeds, shape (n, components).
+        temperature : np.ndarray
+            Temperatures [K], shape (n,).
+
+        Returns
+        -------
+        List[Dict[str, Any]]
+            Result of each point (`VLE.dew_pressure`).
+        """
+        start_time = time.time()
+        y = self._check_mole_fractions(mole_fractions)
+        T = np.asarray(temperature, dtype=float)
+        VaPr = self.vapor_pressure(T)
+
+        # SECTION: closed-form
+        # NOTE: row dot products (the same sums as VLE.dew_pressure)
+        DePr = 1 / np.array([
+            np.dot(y[j], 1 / VaPr[j]) for j in range(len(T))
+        ])
+        x = y * DePr[:, None] / VaPr
+        K = np.multiply(y, 1 / x)
+
+        # SECTION: results
+        AcCo = np.ones(len(self.components))
+        points = [
+            {
+                "dew_pressure": {
+                    "value": float(DePr[j]),
+                    "unit": "Pa"
+                },
+                # NOTE: as VLE.dew_pressure (temperature dict as the value)
+                "temperature": {
+                    "value": {
+                        "value": float(T[j]),
+                        "unit": "K"
+                    },
+                    "unit": "K"
+                },
+                "feed_mole_fraction": y[j],
+                "vapor_mole_fraction": y[j],
+                "liquid_mole_fraction": x[j],
+                "mole_fraction_sum": {
+                    "zi": float(np.sum(y[j])),
+                    "xi": float(np.sum(x[j])),
+                    "yi": float(np.sum(y[j]))
+                },
+                "vapor_pressure": {
+                    "value": VaPr[j],
+                    "unit": "Pa"
+                },
+                "activity_coefficient": {
+                    "value": AcCo,
+                    "unit": "dimensionless"
+                },
+                "K_ratio": {
+                    "value": K[j],
+                    "unit": "dimensionless"
+                },
+                "max_iter": 500,
+                "iteration": 0,
+                "tolerance": 1e-6
+            }
+            for j in range(len(T))
+        ]
+        return self._results(
+            points, "Dew Pressure Calculation", start_time)
+
+    def flash_isothermal(
+        self,
+        mole_fractions: np.ndarray,
+        temperature: np.ndarray,
+        pressure: np.ndarray,
+        tolerance: float = 1e-14,
+        max_iter: int = 100
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Isothermal flash of the feeds at the temperatures and pressures, the
+        Rachford-Rice equation of all points is solved at once (bracketed
+        Newton steps).
+
+        Parameters
+        ----------
+        mole_fractions : np.ndarray
+            Feeds, shape (n, components).
+        temperature : np.ndarray
+            Temperatures [K], shape (n,).
+        pressure : np.ndarray
+            Pressures [Pa], shape (n,).
+        tolerance : float, optional
+            Tolerance of the vapor fraction, default is 1e-14.
+        max_iter : int, optional
+            Maximum number of iterations, default is 100.
+
+        Returns
+        -------
+        List[Optional[Dict[str, Any]]]
+            Result of each point (`VLE.flash_isothermal`), None if the point
+            is not in the two-phase region (dew pressure < P < bubble
+            pressure).
+        """
+        start_time = time.time()
+        z = self._check_mole_fractions(mole_fractions)
+        T = np.asarray(temperature, dtype=float)
+        P = np.asarray(pressure, dtype=float)
+        VaPr = self.vapor_pressure(T)
+        K = VaPr / P[:, None]
+
+        # SECTION: two-phase points (rachford-rice: f(0) > 0, f(1) < 0)
+        two_phase = (
+            (np.sum(z * (K - 1), axis=1) > 0) &
+            (np.sum(z * (K - 1) / K, axis=1) < 0)
+        )
+        z_, Km1 = z[two_phase], K[two_phase] - 1
+
+        # SECTION: rachford-rice
+        V = np.full(len(z_), 0.5)
+        lower, upper = np.zeros(len(z_)), np.ones(len(z_))
+        # NOTE: converged points are kept (same result in any batch)
+        active = np.ones(len(z_), dtype=bool)
+        iteration = 0
+        for iteration in range(1, max_iter + 1):
+            denominator = 1 + V[:, None] * Km1
+            f = np.sum(z_ * Km1 / denominator, axis=1)
+            df = -np.sum(z_ * Km1 ** 2 / denominator ** 2, axis=1)
+
+            # NOTE: bracket of the root (f decreases with V)
+            lower = np.where(f > 0, V, lower)
+            upper = np.where(f < 0, V, upper)
+
+            # NOTE: newton step, bisection if out of the bracket
+            V_new = V - f / df
+            V_new = np.where(
+                (V_new <= lower) | (V_new >= upper),
+                0.5 * (lower + upper),
+                V_new
+            )
+            converged = np.abs(V_new - V) <= tolerance
+            V = np.where(active, V_new, V)
+            active &= ~converged
+            if not np.any(active):
+                break
+
+        solver_message = (
+            f"Rachford-Rice converged in {iteration} iterations."
+        )
+
+        # SECTION: results
+        AcCo = np.ones(len(self.components))
+        points: List[Optional[Dict[str, Any]]] = [None] * len(T)
+        for k, j in enumerate(np.flatnonzero(two_phase).tolist()):
+            x = z[j] / (1 + V[k] * (K[j] * AcCo - 1))
+            y = K[j] * AcCo * x
+            points[j] = {
+                "V_F_ratio": {
+                    "value": float(V[k]),
+                    "unit": "dimensionless"
+                },
+                "L_F_ratio": {
+                    "value": float(1 - V[k]),
+                    "unit": "dimensionless"
+                },
+                "feed_mole_fraction": z[j],
+                "liquid_mole_fraction": x,
+                "vapor_mole_fraction": y,
+                "mole_fraction_sum": {
+                    "xi": float(np.sum(x)),
+                    "yi": float(np.sum(y)),
+                    "zi": float(np.sum(z[j]))
+                },
+                "vapor_pressure": {
+                    "value": VaPr[j],
+                    "unit": "Pa"
+                },
+                "K_ratio": {
+                    "value": K[j],
+                    "unit": "dimensionless"
+                },
+                "temperature": {
+                    "value": float(T[j]),
+                    "unit": "K"
+                },
+                "pressure": {
+                    "value": float(P[j]),
+                    "unit": "Pa"
+                },
+                "activity_coefficient": {
+                    "value": AcCo,
+                    "unit": "dimensionless"
+                },
+                "solver_message": solver_message,
+            }
+
+        flashed = [res for res in points if res is not None]
+        self._results(
+            flashed,
+            "Flash Isothermal Calculation",
+            start_time,
+            flash_checker=False,
+            flash_checker_res=None
+        )
+        # NOTE: after the models (as VLE.flash_isothermal)
+        for res in flashed:
+            computation_time = res.pop('computation_time')
+            res['solver_method'] = 'rachford-rice'
+            res['computation_time'] = computation_time
+
+        logger.debug(
+            f"Rachford-Rice: {len(flashed)} of {len(points)} points flashed")
+        return points
@@ -0,0 +1,244 @@
+# import libs
+import hashlib
+import logging
+from typing import (
+    Optional,
+    List,
+    Dict,
+    Any
+)
+from pythermodb_settings.models import ReferencesThermoDB
+# locals
+from .thermodb_cache import ThermoDBCache
+from .reference_utils import (
+    set_custom_reference,
+    is_str_reference_valid
+)
+from ..config import app_settings
+from ..references.reference_compiler import compiled_references
+from ..references.parsed_reference import PARSED_SIZE_FACTOR
+from ..models import RegisteredReference
+from ..errors import (
+    CustomReferenceNotFoundError,
+    CustomReferenceRegistrationError,
+    EmptyReferenceContentError,
+    InvalidReferenceContentTypeError,
+    CUSTOM_REFERENCE_NOT_FOUND_MSG,
+    CUSTOM_REFERENCE_REGISTRATION_ERROR_MSG,
+    EMPTY_REFERENCE_CONTENT_ERROR_MSG
+)
+
+# NOTE: logger
+logger = logging.getLogger(__name__)
+
+
+class ReferenceRegistry():
+    """
+    Content-addressed registry of custom references.
+
+    A custom reference is validated (and parsed if the config is provided)
+    once at registration, tools then receive its id instead of the whole
+    content. The registry is bounded, the least recently used references are
+    evicted first.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 64,
+        max_bytes: int = 64 * 1024 * 1024
+    ) -> None:
+        """
+        Initialize the ReferenceRegistry.
+
+        Parameters
+        ----------
+        max_entries : int, optional
+            Maximum number of registered references, default is 64.
+        max_bytes : int, optional
+            Maximum total size of registered references in bytes, default
+            is 64 MB.
+        """
+        self._store = ThermoDBCache(
+            max_entries=max_entries,
+            max_bytes=max_bytes
+        )
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+    def __contains__(self, reference_id: str) -> bool:
+        return reference_id in self._store
+
+    @staticmethod
+    def reference_id(
+        content: str,
+        config: Optional[str] = None
+    ) -> str:
+        """
+        Content hash id of a custom reference.
+
+        Parameters
+        ----------
+        content : str
+            Custom reference content.
+        config : str, optional
+            Custom reference configuration.
+
+        Returns
+        -------
+        str
+            The reference id (first 32 hex digits of the sha256).
+        """
+        sha = hashlib.sha256()
+        sha.update(content.encode('utf-8'))
+        sha.update(b'\x00')
+        if config is not None:
+            sha.update(config.encode('utf-8'))
+        return sha.hexdigest()[:32]
+
+    def register(
+        self,
+        content: str,
+        config: Optional[str] = None
+    ) -> RegisteredReference:
+        """
+        Register a custom reference (idempotent).
+
+        Parameters
+        ----------
+        content : str
+            Custom reference content provided by PyThermoDB.
+        config : str, optional
+            Custom reference configuration provided by PyThermoDB.
+
+        Returns
+        -------
+        RegisteredReference
+            The registered reference including its id.
+        """
+        # import libs
+        from ..references import ReferenceMapper
+
+        try:
+            # SECTION: normalize
+            content, config = set_custom_reference(
+                custom_reference_content=content,
+                custom_reference_config=config
+            )
+            if content is None:
+                raise EmptyReferenceContentError(
+                    EMPTY_REFERENCE_CONTENT_ERROR_MSG
+                )
+
+            # SECTION: check the registry
+            reference_id = self.reference_id(content, config)
+            registered_reference = self._store.get(reference_id)
+            if registered_reference is not None:
+                logger.debug(
+                    f"Custom reference already registered: {reference_id}")
+                return registered_reference
+
+            # SECTION: validate the content
+            check_ = is_str_reference_valid(reference_content=content)
+            if not check_[0]:
+                raise InvalidReferenceContentTypeError(
+                    "Custom reference content is not valid."
+                )
+            if check_[1] is None or check_[1].strip() == '':
+                raise EmptyReferenceContentError(
+                    "Custom reference content is empty after validation."
+                )
+
+            # SECTION: compile (binary form, background, best effort)
+            try:
+                compiled_references.compile_async(check_[1])
+            except Exception as e:
+                logger.warning(
+                    f"Custom reference not compiled, text path is used: {e}")
+
+            # SECTION: parse (only if the config is provided)
+            references_thermodb: Optional[ReferencesThermoDB] = None
+            if config is not None:
+                references_thermodb = \
+                    ReferenceMapper().generate_reference_thermodb(
+                        reference_content=check_[1],
+                        reference_config=config
+                    )
+
+            # SECTION: store
+            registered_reference = RegisteredReference(
+                reference_id=reference_id,
+                content=check_[1],
+                config=config,
+                references_thermodb=references_thermodb
+            )
+            # NOTE: sized by the content (and its parsed form)
+            self._store.put(
+                reference_id,
+                registered_reference,
+                size=PARSED_SIZE_FACTOR * len(check_[1])
+            )
+
+            logger.info(f"Custom reference registered: {reference_id}")
+            return registered_reference
+        except Exception as e:
+            logger.error(f"Failed to register custom reference: {e}")
+            raise CustomReferenceRegistrationError(
+                f"{CUSTOM_REFERENCE_REGISTRATION_ERROR_MSG} {e}"
+            ) from e
+
+    def get(self, reference_id: str) -> RegisteredReference:
+        """
+        Get a registered custom reference.
+
+        Parameters
+        ----------
+        reference_id : str
+            The reference id returned by `register`.
+
+        Returns
+        -------
+        RegisteredReference
+            The registered reference.
+        """
+        registered_reference = self._store.get(reference_id.strip())
+        if registered_reference is None:
+            raise CustomReferenceNotFoundError(
+                f"{CUSTOM_REFERENCE_NOT_FOUND_MSG} ({reference_id})"
+            )
+        return registered_reference
+
+    def remove(self, reference_id: str) -> bool:
+        """
+        Remove a registered custom reference.
+
+        Parameters
+        ----------
+        reference_id : str
+            The reference id.
+
+        Returns
+        -------
+        bool
+            True if the reference was registered, False otherwise.
+        """
+        return self._store.pop(reference_id.strip()) is not None
+
+    def list_references(self) -> List[str]:
+        """
+        List the registered reference ids (least recently used first).
+        """
+        return self._store.keys()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get the registry statistics.
+        """
+        return self._store.stats()
+
+
+# NOTE: process-wide registry shared by the mcp tools and the api
+reference_registry = ReferenceRegistry(
+    max_entries=app_settings.reference_registry_max_entries,
+    max_bytes=app_settings.reference_registry_max_bytes
+)
@@ -1,4 +1,5 @@
 # import libs
+import hashlib
 import logging
 from typing import (
     Optional,
@@ -13,10 +14,14 @@ from pythermodb_settings.models import (
     ReferencesThermoDB,
     Component
 )
-from pyThermoDB.references import extract_reference_from_str
 # locals
 from .hub import Hub
+from ..references.parsed_reference import (
+    parsed_references,
+    PARSED_SIZE_FACTOR
+)
 from ..utils import create_component_id
+from ..models import RegisteredReference
 from ..errors import (
     CustomReferenceInitializationError,
     EmptyReferenceContentError,
@@ -103,11 +108,12 @@ def initialize_custom_reference(
     components: Component | List[Component],
     custom_reference_content: Optional[str],
     custom_reference_config: Optional[str],
-    ignore_state_props: Optional[List[str]] = None
+    ignore_state_props: Optional[List[str]] = None,
+    custom_reference_id: Optional[str] = None
 ) -> Hub:
     """
     Universal helper to initialize the hub with a custom reference if provided.
-    Returns a new hub instance if a custom reference is used, otherwise returns the original hub.
+    Returns an overlay hub (the custom reference layered over the original hub) if a custom reference is used, otherwise returns the original hub.
 
     Parameters
     ----------
@@ -121,15 +127,38 @@ def initialize_custom_reference(
         Custom reference configuration provided by the user.
     ignore_state_props : Optional[List[str]], optional
         List of properties to ignore state for, by default None.
+    custom_reference_id : Optional[str], optional
+        Id of a custom reference registered in the reference registry, by default None.
+        If provided, it is used instead of the custom reference content and config.
 
     Returns
     -------
     Hub
-        A new hub instance initialized with the custom reference if provided, otherwise the original hub.
+        An overlay hub initialized with the custom reference if provided, otherwise the original hub.
+
+    Notes
+    -----
+    - The overlay is only meant for the current call, the original hub is not modified.
+    - Overlays are cached in the original hub by a hash of the custom reference, so the
+    validation and parsing of the same custom reference is done once.
     """
     # import libs
     from ..references import ReferenceMapper
 
+    # SECTION: resolve the registered custom reference
+    registered_reference: Optional[RegisteredReference] = None
+    if (
+        custom_reference_id is not None and
+        custom_reference_id.strip() not in ('', 'None')
+    ):
+        # import libs
+        from .reference_registry import reference_registry
+
+        # NOTE: validated once at registration
+        registered_reference = reference_registry.get(custom_reference_id)
+        custom_reference_content = registered_reference.content
+        custom_reference_config = registered_reference.config
+
     # SECTION: set custom reference
     # NOTE: set custom reference content and config
     custom_reference_content, custom_reference_config = \
@@ -138,8 +167,28 @@ def initialize_custom_reference(
             custom_reference_config=custom_reference_config
         )
 
+    # NOTE: no custom reference provided, return the original hub
+    if custom_reference_content is None:
+        return hub
+
+    # SECTION: check the overlay cache
+    overlay_key = custom_reference_key(
+        components=components,
+        custom_reference_content=custom_reference_content,
+        custom_reference_config=custom_reference_config,
+        ignore_state_props=ignore_state_props
+    )
+    overlay_hub = hub.overlays.get(overlay_key)
+    if overlay_hub is not None:
+        logger.debug("Custom reference overlay found in cache")
+        return overlay_hub
+
     # SECTION: check format of custom reference content
-    if custom_reference_content is not None:
+    # NOTE: registered references are already validated
+    if (
+        custom_reference_content is not None and
+        registered_reference is None
+    ):
         # check reference is valid
         check_ = is_str_reference_valid(
             reference_content=custom_reference_content,
@@ -166,18 +215,24 @@ def initialize_custom_reference(
             custom_reference_content is not None and
             custom_reference_config is not None
         ):
-            # LINK: initialize reference mapper
-            ReferenceMapper_ = ReferenceMapper()
+            if (
+                registered_reference is not None and
+                registered_reference.references_thermodb is not None
+            ):
+                # NOTE: parsed once at registration
+                reference_thermodb: ReferencesThermoDB = \
+                    registered_reference.references_thermodb
+            else:
+                # LINK: initialize reference mapper
+                ReferenceMapper_ = ReferenceMapper()
 
-            # NOTE: build reference_thermodb
-            reference_thermodb: ReferencesThermoDB = \
-                ReferenceMapper_.generate_reference_thermodb(
-                    reference_content=custom_reference_content,
-                    reference_config=custom_reference_config
-                )
+                # NOTE: build reference_thermodb
+                reference_thermodb: ReferencesThermoDB = \
+                    ReferenceMapper_.generate_reference_thermodb(
+                        reference_content=custom_reference_content,
+                        reference_config=custom_reference_config
+                    )
 
-            # ! reinitialize hub with the new reference thermodb
-            return Hub(reference_thermodb)
         elif (
             custom_reference_content is not None and
             custom_reference_config is None
@@ -225,17 +280,76 @@ def initialize_custom_reference(
                 components_reference_thermodb=components_reference_thermodb
             )
 
-            # ! reinitialize hub with the new reference thermodb
-            return Hub(reference_thermodb)
         else:
             # NOTE: no custom reference provided, return the original hub
             return hub
+
+        # SECTION: layer the new reference thermodb over the hub
+        overlay_hub = hub.overlay(reference_thermodb)
+
+        # NOTE: store (sized by the reference content)
+        hub.overlays.put(
+            overlay_key,
+            overlay_hub,
+            size=PARSED_SIZE_FACTOR * len(custom_reference_content)
+        )
+        return overlay_hub
     except Exception as e:  # pragma: no cover
         logging.error(f"Failed to initialize custom reference: {e}")
         raise CustomReferenceInitializationError(
             CUSTOM_REFERENCE_INIT_ERROR_MSG) from e
 
 
+def custom_reference_key(
+    components: Component | List[Component],
+    custom_reference_content: str,
+    custom_reference_config: Optional[str],
+    ignore_state_props: Optional[List[str]] = None
+) -> str:
+    """
+    Hash of a custom reference used as the overlay cache key.
+
+    Parameters
+    ----------
+    components : Component | List[Component]
+        The component or list of components of the call, only used if the custom reference config is not provided (the reference is generated for these components).
+    custom_reference_content : str
+        Custom reference content provided by the user.
+    custom_reference_config : Optional[str]
+        Custom reference configuration provided by the user.
+    ignore_state_props : Optional[List[str]], optional
+        List of properties to ignore state for, by default None.
+
+    Returns
+    -------
+    str
+        The sha256 hash of the custom reference.
+    """
+    sha = hashlib.sha256()
+    sha.update(custom_reference_content.encode('utf-8'))
+    sha.update(b'\x00')
+
+    if custom_reference_config is not None:
+        sha.update(custom_reference_config.encode('utf-8'))
+    else:
+        # NOTE: the reference is generated for the given components
+        components_ = (
+            components if isinstance(components, list) else [components]
+        )
+        # NOTE: single component and list are generated differently
+        sha.update(b'L' if isinstance(components, list) else b'C')
+        for component in components_:
+            component_id_ = create_component_id(component=component)
+            sha.update(component_id_.name_state.encode('utf-8'))
+            sha.update(b'\x00')
+            sha.update(component_id_.formula_state.encode('utf-8'))
+            sha.update(b'\x00')
+        sha.update(b'\x01')
+        sha.update(','.join(ignore_state_props or []).encode('utf-8'))
+
+    return sha.hexdigest()
+
+
 def to_references_thermodb(
         components_reference_thermodb: List[ComponentReferenceThermoDB]
 ) -> ReferencesThermoDB:
@@ -273,43 +387,37 @@ def to_references_thermodb(
             # >> component formula-state
             component_formula_state = component_id_.formula_state
 
-            # components ids
+            # components ids (not yet registered)
             component_ids = [
-                component_name_state,
-                component_formula_state,
+                component_id
+                for component_id in (
+                    component_name_state,
+                    component_formula_state,
+                )
+                if component_id not in reference
             ]
 
-            # ! iterate over component ids
-            for component_id in component_ids:
-                # check if component_name already exists
-                if component_id in reference:
-                    continue  # skip if already exists
+            # ! entries are set once and shared by both ids (not copied)
+            reference_thermodb_ = component_ref.reference_thermodb
+            labels_ = reference_thermodb_.labels or []
+            ignore_labels_ = reference_thermodb_.ignore_labels or []
+            ignore_props_ = reference_thermodb_.ignore_props or []
 
+            for component_id in component_ids:
                 # ! required fields
-                # merge reference
-                reference[component_id] = component_ref.reference_thermodb.reference
-                # merge contents
-                contents[component_id] = component_ref.reference_thermodb.contents
-                # merge configs
-                configs[component_id] = component_ref.reference_thermodb.configs
-                # merge rules
-                rules[component_id] = component_ref.reference_thermodb.rules
-
-                # ! NOTE: merge labels, ignore_labels, ignore_props
-                # merge labels
-                labels[component_id] = component_ref.reference_thermodb.labels or []
-                # merge ignore_labels
-                ignore_labels[component_id] = component_ref.reference_thermodb.ignore_labels or [
-                ]
-                # merge ignore_props
-                ignore_props[component_id] = component_ref.reference_thermodb.ignore_props or [
-                ]
-
-            # NOTE: reset component ids
-            component_ids = []
+                reference[component_id] = reference_thermodb_.reference
+                contents[component_id] = reference_thermodb_.contents
+                configs[component_id] = reference_thermodb_.configs
+                rules[component_id] = reference_thermodb_.rules
+
+                # ! NOTE: labels, ignore_labels, ignore_props
+                labels[component_id] = labels_
+                ignore_labels[component_id] = ignore_labels_
+                ignore_props[component_id] = ignore_props_
 
         # NOTE: return ReferencesThermoDB
-        return ReferencesThermoDB(
+        # ! entries are already validated (component reference thermodbs)
+        return ReferencesThermoDB.model_construct(
             reference=reference,
             contents=contents,
             configs=configs,
@@ -349,9 +457,9 @@ def is_str_reference_valid(
     try:
         # SECTION: check if custom reference content is valid
         # NOTE: try to extract references from the content
-        extract_status, extracted_content_ = extract_reference_from_str(
-            content=reference_content,
-        )
+        # (parsed once per content, shared process-wide)
+        extract_status, extracted_content_ = \
+            parsed_references.get(reference_content).extracted
 
         # NOTE: if extraction is successful, return True and a yaml content string
         if extract_status:
@@ -0,0 +1,293 @@
+# import libs
+import logging
+import sys
+import threading
+from collections import OrderedDict
+from typing import (
+    Any,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Tuple
+)
+# locals
+from ..config import app_settings
+
+# NOTE: logger
+logger = logging.getLogger(__name__)
+
+
+class ThermoDBCache():
+    """
+    Bounded, thread-safe LRU cache of built component thermodynamic databases
+    (also used for the assembled model sources).
+
+    The cache is bounded by the number of entries and by an (estimated) byte
+    budget, the least recently used entries are evicted first.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        max_bytes: int = 64 * 1024 * 1024
+    ) -> None:
+        """
+        Initialize the ThermoDBCache.
+
+        Parameters
+        ----------
+        max_entries : int, optional
+            Maximum number of cached items, default is 256 (0 disables the
+            cache).
+        max_bytes : int, optional
+            Maximum total size of cached items in bytes, default is 64 MB.
+        """
+        # SECTION: limits
+        self.max_entries = max(int(max_entries), 0)
+        self.max_bytes = max(int(max_bytes), 0)
+
+        # SECTION: storage
+        # NOTE: key -> (value, size)
+        self._items: OrderedDict[
+            Hashable, Tuple[Any, int]
+        ] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.RLock()
+
+        # SECTION: counters
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._items)
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._items
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self.max_bytes > 0
+
+    @staticmethod
+    def estimate_size(value: Any, max_objects: int = 1024) -> int:
+        """
+        Estimate the size of a value in bytes (cheap structural estimate).
+
+        Parameters
+        ----------
+        value : Any
+            The value to estimate.
+        max_objects : int, optional
+            Maximum number of objects visited, default is 1024 (the rest of
+            the value is not counted).
+
+        Returns
+        -------
+        int
+            The estimated size in bytes.
+
+        Notes
+        -----
+        The shallow sizes of the objects reachable through dicts, lists,
+        tuples and sets are summed, other objects are counted with their
+        attribute dict but not followed. Callers that know the size of the
+        source (e.g. the reference content length) pass it to `put` instead.
+        """
+        size = 0
+        n_objects = 0
+        stack = [value]
+        while stack and n_objects < max_objects:
+            obj = stack.pop()
+            n_objects += 1
+            size += sys.getsizeof(obj, 64)
+
+            if isinstance(obj, dict):
+                stack.extend(obj.values())
+                size += sum(sys.getsizeof(k, 64) for k in obj)
+            elif isinstance(obj, (list, tuple, set, frozenset)):
+                stack.extend(obj)
+            else:
+                # NOTE: instance attributes (not followed)
+                attributes = getattr(obj, '__dict__', None)
+                if isinstance(attributes, dict):
+                    size += sys.getsizeof(attributes, 64)
+
+        return size
+
+    def get(
+        self,
+        key: Hashable,
+        default: Optional[Any] = None
+    ) -> Any:
+        """
+        Get a cached item and mark it as recently used.
+
+        Parameters
+        ----------
+        key : Hashable
+            The cache key.
+        default : Any, optional
+            Value returned if the key is not cached, default is None.
+
+        Returns
+        -------
+        Any
+            The cached value or default.
+        """
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                self.misses += 1
+                return default
+
+            # NOTE: mark as recently used
+            self._items.move_to_end(key)
+            self.hits += 1
+            return item[0]
+
+    def put(
+        self,
+        key: Hashable,
+        value: Any,
+        size: Optional[int] = None
+    ) -> bool:
+        """
+        Add an item to the cache, evicting the least recently used items if
+        the limits are exceeded.
+
+        Parameters
+        ----------
+        key : Hashable
+            The cache key.
+        value : Any
+            The value to cache.
+        size : int, optional
+            Size of the item in bytes, default is None (estimated).
+
+        Returns
+        -------
+        bool
+            True if the item is cached, False otherwise (cache disabled or
+            item larger than the byte budget).
+        """
+        if not self.enabled:
+            return False
+
+        # NOTE: estimate outside the lock
+        if size is None:
+            size = self.estimate_size(value)
+        if size > self.max_bytes:
+            logger.debug(
+                f"Item size {size} exceeds the cache byte budget, not cached"
+            )
+            return False
+
+        with self._lock:
+            # NOTE: replace existing item
+            if key in self._items:
+                self._bytes -= self._items.pop(key)[1]
+
+            self._items[key] = (value, size)
+            self._bytes += size
+
+            # SECTION: evict
+            while (
+                len(self._items) > self.max_entries or
+                self._bytes > self.max_bytes
+            ):
+                _, (_, evicted_size) = self._items.popitem(last=False)
+                self._bytes -= evicted_size
+                self.evictions += 1
+
+            return True
+
+    def pop(
+        self,
+        key: Hashable,
+        default: Optional[Any] = None
+    ) -> Any:
+        """
+        Remove an item from the cache.
+
+        Parameters
+        ----------
+        key : Hashable
+            The cache key.
+        default : Any, optional
+            Value returned if the key is not cached, default is None.
+
+        Returns
+        -------
+        Any
+            The removed value or default.
+        """
+        with self._lock:
+            item = self._items.pop(key, None)
+            if item is None:
+                return default
+            self._bytes -= item[1]
+            return item[0]
+
+    def size_of(self, key: Hashable) -> Optional[int]:
+        """
+        Get the size of a cached item in bytes (not counted as a hit).
+
+        Parameters
+        ----------
+        key : Hashable
+            The cache key.
+
+        Returns
+        -------
+        int, optional
+            The size of the item, None if the key is not cached.
+        """
+        with self._lock:
+            item = self._items.get(key)
+            return None if item is None else item[1]
+
+    def keys(self) -> List[Hashable]:
+        """
+        Get the cached keys (least recently used first).
+        """
+        with self._lock:
+            return list(self._items.keys())
+
+    def clear(self) -> None:
+        """
+        Remove all cached items (the counters are kept).
+        """
+        with self._lock:
+            self._items.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get the cache statistics.
+
+        Returns
+        -------
+        Dict[str, int]
+            hits, misses, evictions, entries, bytes and the limits.
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'entries': len(self._items),
+                'bytes': self._bytes,
+                'max_entries': self.max_entries,
+                'max_bytes': self.max_bytes,
+            }
+
+
+# NOTE: process-wide cache shared by all hubs
+thermodb_cache = ThermoDBCache(
+    max_entries=app_settings.thermodb_cache_max_entries,
+    max_bytes=app_settings.thermodb_cache_max_bytes
+)
@@ -1,10 +1,13 @@
 # import libs
 import logging
 from typing import (
+    Any,
     List,
     Literal,
-    Dict
+    Dict,
+    Tuple
 )
+import numpy as np
 # locals
 from pythermodb_settings.models import (
     Component,
@@ -145,3 +148,84 @@ def convert_str_numeric_to_int(
     except Exception as e:
         logging.error(f"Failed to convert string to numeric: {e}")
         raise ValueError(f"Failed to convert string to numeric: {e}") from e
+
+
+def set_batch_points(
+    *values: List[float],
+    grid: bool = False
+) -> Tuple[np.ndarray, ...]:
+    """
+    Set the points of a batch calculation from the values of each variable,
+    as tuples (a single value is broadcast) or as a grid of all
+    combinations (first variable major order).
+    """
+    values_ = [np.asarray(v, dtype=float).ravel() for v in values]
+    sizes = [v.size for v in values_]
+
+    if 0 in sizes:
+        raise ValueError("Batch points are empty.")
+
+    if grid:
+        return tuple(
+            v.ravel() for v in np.meshgrid(*values_, indexing='ij')
+        )
+
+    if len({size for size in sizes if size != 1}) > 1:
+        raise ValueError(
+            f"Batch points have different sizes {tuple(sizes)}, "
+            "use the same size, a single value or a grid."
+        )
+    return tuple(np.broadcast_arrays(*values_))
+
+
+def _batch_value(value: Any) -> Any:
+    """
+    Value of a batch column (numpy values as lists and numbers).
+    """
+    if isinstance(value, (np.ndarray, np.generic)):
+        return value.tolist()
+    return value
+
+
+def set_batch_columns(
+    results: List[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """
+    Set the results of a batch calculation (one dict per point) as columns,
+    a value (dict with `value`) or a number (array) becomes a list with one
+    item per point (None where the point does not have it), other items
+    keep their first value.
+    """
+    columns: Dict[str, Any] = {}
+
+    # NOTE: keys of all points (first seen order)
+    keys: Dict[str, None] = {}
+    for res in results:
+        keys.update(dict.fromkeys(res))
+
+    for key in keys:
+        items = [res.get(key, None) for res in results]
+        first = next((item for item in items if item is not None), None)
+
+        if isinstance(first, dict) and 'value' in first:
+            # NOTE: value column with the unit (symbol) of the first point
+            columns[key] = {
+                **{k: v for k, v in first.items() if k != 'value'},
+                'value': [
+                    _batch_value(item['value']) if item is not None else None
+                    for item in items
+                ]
+            }
+        elif isinstance(first, dict):
+            columns[key] = set_batch_columns(
+                [item if item is not None else {} for item in items]
+            )
+        elif (
+            isinstance(first, (int, float, np.ndarray, np.number)) and
+            not isinstance(first, bool)
+        ):
+            columns[key] = [_batch_value(item) for item in items]
+        else:
+            columns[key] = first
+
+    return columns
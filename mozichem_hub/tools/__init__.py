@@ -1,5 +1,7 @@
 from .tool_manager import ToolManager
+from .tool_pool import ToolPool
 
 __all__ = [
     "ToolManager",
+    "ToolPool",
 ]
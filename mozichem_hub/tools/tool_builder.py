@@ -1,9 +1,10 @@
 # import libs
-from typing import List, Dict, Callable, Any, Set
+from typing import List, Dict, Callable, Any, Set, Optional
 from fastmcp.tools import Tool
 # local
 from ..config import app_settings
 from ..models import MoziTool
+from .tool_pool import ToolPool
 from ..errors import (
     MCPToolBuildingError,
     MoziToolBuildingError,
@@ -19,6 +20,8 @@ class ToolBuilder():
     Builder class for managing the core functionalities of the MoziChem MCP.
     """
     # NOTE: attributes
+    # ! execution layer of the local tools (None: the tools run inline)
+    ToolPool_: Optional[ToolPool] = None
 
     def __init__(self):
         """
@@ -29,7 +32,8 @@ class ToolBuilder():
 
     def build_tools_from_mozi_tools(
         self,
-        mozi_tools: List[MoziTool]
+        mozi_tools: List[MoziTool],
+        mcp_name: Optional[str] = None
     ) -> List[Tool]:
         """
         Build the MCP tools from local resources (MoziTool).
@@ -38,6 +42,9 @@ class ToolBuilder():
         ----------
         mozi_tools : List[MoziTool]
             List of MoziTool instances to be converted to Tool instances.
+        mcp_name : str, optional
+            The name of the mcp of the tools, used by the tool pool for the
+            concurrency limit and the worker processes.
 
         Returns
         -------
@@ -49,14 +56,26 @@ class ToolBuilder():
         This method converts a list of MoziTool instances to Tool instances.
         The original function arguments are not used in this conversion,
         as the MoziTool instances already contain the necessary function references.
+
+        If a tool pool is set, each function is wrapped in an async adapter
+        which runs it in the pool.
         """
         try:
             # SECTION: Convert MoziTool instances to Tool instances
             mcp_tools: list[Tool] = []
 
             for mozi_tool in mozi_tools:
+                # NOTE: async adapter (tool pool)
+                fn = mozi_tool.fn
+                if self.ToolPool_ is not None:
+                    fn = self.ToolPool_.wrap(
+                        fn,
+                        tool_name=mozi_tool.name,
+                        mcp_name=mcp_name
+                    )
+
                 tool_ = Tool.from_function(
-                    fn=mozi_tool.fn,  # Pass the function as fn parameter
+                    fn=fn,  # Pass the function as fn parameter
                     name=mozi_tool.name,
                     description=mozi_tool.description,
                     tags=mozi_tool.tags,
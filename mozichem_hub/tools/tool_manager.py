@@ -12,6 +12,7 @@ from typing import (
 from pythermodb_settings.models import ReferencesThermoDB
 # local
 from .tool_builder import ToolBuilder
+from .tool_pool import ToolPool
 from ..resources import FunctionDispatcher
 from ..models import MoziTool
 # errors
@@ -37,9 +38,18 @@ class ToolManager(ToolBuilder):
     def __init__(
         self,
         references_thermodb: ReferencesThermoDB,
+        mcp_name: Optional[str] = None
     ):
         """
         Initialize the ToolManager instance.
+
+        Parameters
+        ----------
+        references_thermodb : ReferencesThermoDB
+            The references of the mcp.
+        mcp_name : str, optional
+            The name of the local mcp, the tool worker processes only build
+            its core, default is None (all mcp cores).
         """
         # SECTION: Initialize the Builder
         ToolBuilder().__init__()
@@ -52,6 +62,35 @@ class ToolManager(ToolBuilder):
             references_thermodb=self._references_thermodb
         )
 
+        # SECTION: tool pool (async execution of the local tools)
+        self.ToolPool_ = ToolPool(
+            references_thermodb=self._references_thermodb,
+            mcp_name=mcp_name
+        )
+
+    def update_references(
+        self,
+        references_thermodb: ReferencesThermoDB
+    ) -> None:
+        """
+        Update the references, the hub and the mcp core instances are rebuilt.
+
+        Parameters
+        ----------
+        references_thermodb : ReferencesThermoDB
+            The new references.
+        """
+        # NOTE: set references
+        self._references_thermodb = references_thermodb
+
+        # LINK: rebuild the FunctionDispatcher hub and instances
+        self.FunctionDispatcher_.rebuild(
+            references_thermodb=references_thermodb
+        )
+
+        # LINK: worker processes use the new references
+        self.ToolPool_.update_references(references_thermodb)
+
     def _retrieve_all_local_functions(self) -> Dict[str, List[MoziTool]]:
         """
         Retrieve all local functions.
@@ -145,7 +184,10 @@ class ToolManager(ToolBuilder):
 
             # NOTE: Build local tools
             # ! convert MoziTool to FastMCP Tool
-            local_tools = self.build_tools_from_mozi_tools(_functions)
+            local_tools = self.build_tools_from_mozi_tools(
+                _functions,
+                mcp_name=mcp_name
+            )
 
             # return the tools
             return local_tools
@@ -193,7 +235,10 @@ class ToolManager(ToolBuilder):
                         f"{FUNCTION_RETRIEVAL_ERROR_MSG} Function '{mcp_name}' not found in local resources.")
 
                 # NOTE: Build local tools
-                local_tools = self.build_tools_from_mozi_tools(_function)
+                local_tools = self.build_tools_from_mozi_tools(
+                    _function,
+                    mcp_name=mcp_name
+                )
 
             # SECTION: Build external tools
             external_tools = []  # Ensure external_tools is always initialized
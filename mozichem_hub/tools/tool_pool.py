@@ -0,0 +1,587 @@
+# import libs
+import os
+import asyncio
+import multiprocessing
+import logging
+import functools
+import inspect
+import threading
+import weakref
+from concurrent.futures import (
+    Executor,
+    ThreadPoolExecutor,
+    ProcessPoolExecutor
+)
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Optional,
+    Tuple
+)
+from pythermodb_settings.models import ReferencesThermoDB
+# locals
+from ..config import app_settings, MCP_MODULES
+from ..errors import (
+    ToolPoolError,
+    TOOL_POOL_ERROR_MSG
+)
+
+# NOTE: logger
+logger = logging.getLogger(__name__)
+
+# NOTE: execution modes
+TOOL_EXECUTORS = ('inline', 'thread', 'process')
+
+# NOTE: tools run in the parent process in 'process' mode (they update its
+# state, e.g. the custom reference registry)
+PARENT_PROCESS_TOOLS = ('register_custom_reference',)
+
+# SECTION: worker process state
+# NOTE: the dispatcher of a worker process (own hub), set by the initializer
+_worker_dispatcher: Optional[Any] = None
+
+
+def _init_worker(
+    references_thermodb: ReferencesThermoDB,
+    mcp_name: Optional[str] = None
+) -> None:
+    """
+    Initialize a worker process with its own function dispatcher (hub) and
+    the mcp core instance of the pool (all mcp cores if the pool has no
+    mcp), kept (with their caches) for the worker lifetime.
+    """
+    global _worker_dispatcher
+    # NOTE: imported in the worker (the resources import the mcp cores)
+    from ..resources import FunctionDispatcher
+
+    _worker_dispatcher = FunctionDispatcher(
+        references_thermodb=references_thermodb
+    )
+
+    # NOTE: build the mcp core instance(s) and their tools once
+    if mcp_name:
+        _worker_dispatcher.retrieve_mozi_tools(mcp_name)
+    else:
+        _worker_dispatcher.retrieve_all_mozi_tools()
+    logger.debug(
+        f"Tool worker initialized: pid {os.getpid()}, mcp {mcp_name or 'all'}"
+    )
+
+
+def _worker_memory() -> int:
+    """
+    Resident memory of the worker process in bytes (0 if unknown).
+    """
+    try:
+        # NOTE: linux, current resident set size
+        with open('/proc/self/statm', 'rb') as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf('SC_PAGE_SIZE')
+    except Exception:
+        pass
+
+    try:
+        # NOTE: peak resident set size (kB on linux, bytes on macOS)
+        import resource
+        import sys
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == 'darwin' else peak * 1024
+    except Exception:
+        return 0
+
+
+def _ping_worker() -> int:
+    """
+    Warm-up task, returns the pid of the (initialized) worker.
+    """
+    return os.getpid()
+
+
+def _warm_up_worker(mcp_name: str) -> int:
+    """
+    Warm-up task of an mcp, builds its fixed warm-up components (`warm_up`
+    of MCP_MODULES) with the references of the worker, returns the pid.
+    """
+    if _worker_dispatcher is None:
+        raise ToolPoolError(
+            f"{TOOL_POOL_ERROR_MSG} Worker process is not initialized."
+        )
+
+    # NOTE: imported in the worker
+    from pythermodb_settings.models import Component
+
+    mcp_module = next(m for m in MCP_MODULES if m['name'] == mcp_name)
+    components = (mcp_module.get('warm_up') or {}).get('components') or []
+    if components:
+        _worker_dispatcher.Hub_.build_components_model_source(
+            components=[Component(**component) for component in components]
+        )
+    return os.getpid()
+
+
+def _check_warm_up(future: Any) -> None:
+    """
+    Report a failed warm-up task.
+    """
+    if future.cancelled():
+        return
+    e = future.exception()
+    if e is not None:
+        logger.warning(f"Tool worker warm-up failed: {e}")
+
+
+def _resolve_references(
+    fn: Callable[..., Any],
+    args: Tuple[Any, ...],
+    kwargs: Dict[str, Any]
+) -> Tuple[Tuple[Any, ...], Dict[str, Any]]:
+    """
+    Replace a registered custom reference id (`custom_reference_id`) of a
+    tool call by the reference content and config, the registry of the
+    parent process is not shared with the worker processes.
+    """
+    try:
+        arguments = inspect.signature(fn).bind_partial(
+            *args, **kwargs
+        ).arguments
+    except (TypeError, ValueError):
+        return args, kwargs
+
+    reference_id = arguments.get('custom_reference_id', None)
+    if (
+        not isinstance(reference_id, str) or
+        reference_id.strip() in ('', 'None')
+    ):
+        return args, kwargs
+
+    # NOTE: imported on use (the resources import the tools)
+    from ..resources.reference_registry import reference_registry
+
+    registered_reference = reference_registry.get(reference_id)
+    arguments = dict(arguments)
+    arguments.update({
+        'custom_reference_content': registered_reference.content,
+        'custom_reference_config': registered_reference.config or 'None',
+        'custom_reference_id': 'None',
+    })
+    return (), arguments
+
+
+def _run_tool(
+    mcp_name: str,
+    tool_name: str,
+    args: Tuple[Any, ...],
+    kwargs: Dict[str, Any]
+) -> Tuple[Any, int, int]:
+    """
+    Run a tool in a worker process, resolved by its mcp and tool name.
+
+    Returns
+    -------
+    Tuple[Any, int, int]
+        The tool result, the worker pid and its resident memory (bytes).
+    """
+    if _worker_dispatcher is None:
+        raise ToolPoolError(
+            f"{TOOL_POOL_ERROR_MSG} Worker process is not initialized."
+        )
+
+    fn = _worker_dispatcher.get_local_function(mcp_name, tool_name)
+    return fn(*args, **kwargs), os.getpid(), _worker_memory()
+
+
+class ToolPool:
+    """
+    Execution layer of the MCP tools, each tool is wrapped in an async
+    adapter which runs the (synchronous, CPU-bound) tool body in a thread or
+    process pool, so a slow call does not hold up the other requests.
+
+    Notes
+    -----
+    - 'inline': the tools are not wrapped (run in the event loop).
+    - 'thread': the tool body runs in a thread pool (shared hub).
+    - 'process': the tool body runs in a process pool, each worker builds
+      its own hub and the core of the pool mcp (`mcp_name`, all mcp cores
+      if not set) from the references once (warmed up when the pool is
+      created, with the fixed `warm_up` components of that mcp) and
+      resolves the tool by its mcp and tool name,
+      only the tool arguments and the result are sent (picklable). A
+      registered custom reference id is resolved to its content in the
+      parent process, the tools without an mcp name and the
+      `PARENT_PROCESS_TOOLS` run in a thread pool of the parent process.
+    - The worker processes are recycled (a new pool replaces the current
+      one, running calls finish in the old pool) once a worker has run
+      `tool_process_max_tasks` tasks or its resident memory exceeds
+      `tool_process_max_memory`.
+    - The number of concurrent calls of each MCP is limited by a semaphore
+      (`tool_max_concurrency`, `tool_mcp_concurrency`), excess calls wait
+      in the event loop.
+    """
+
+    def __init__(
+        self,
+        references_thermodb: Optional[ReferencesThermoDB] = None,
+        mcp_name: Optional[str] = None,
+        executor: Optional[str] = None,
+        workers: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+        mcp_concurrency: Optional[Dict[str, int]] = None,
+        max_tasks: Optional[int] = None,
+        max_memory: Optional[int] = None,
+        warm_up: Optional[bool] = None
+    ) -> None:
+        """
+        Initialize the ToolPool.
+
+        Parameters
+        ----------
+        references_thermodb : ReferencesThermoDB, optional
+            The references of the worker processes hub ('process' mode).
+        mcp_name : str, optional
+            The mcp owning the pool, the worker processes build and warm up
+            only its core, default is None (all mcp cores).
+        executor : str, optional
+            'inline', 'thread' or 'process', default is `tool_executor`.
+        workers : int, optional
+            Number of pool workers, default is `tool_executor_workers` or
+            the number of cores.
+        max_concurrency : int, optional
+            Maximum concurrent calls per MCP, default is
+            `tool_max_concurrency` (0: the number of workers).
+        mcp_concurrency : Dict[str, int], optional
+            Maximum concurrent calls of specific MCPs by name, default is
+            `tool_mcp_concurrency`.
+        max_tasks : int, optional
+            Tasks of a worker process before the workers are recycled,
+            default is `tool_process_max_tasks` (0 disables).
+        max_memory : int, optional
+            Resident memory (bytes) of a worker process before the workers
+            are recycled, default is `tool_process_max_memory` (0 disables).
+        warm_up : bool, optional
+            Start and initialize the worker processes when the pool is
+            created, default is `tool_process_warm_up`.
+        """
+        self.executor_mode = executor or app_settings.tool_executor
+        if self.executor_mode not in TOOL_EXECUTORS:
+            raise ToolPoolError(
+                f"{TOOL_POOL_ERROR_MSG} Invalid executor "
+                f"'{self.executor_mode}', use one of {TOOL_EXECUTORS}."
+            )
+
+        self.workers: int = max(
+            1,
+            workers or app_settings.tool_executor_workers or
+            os.cpu_count() or 1
+        )
+        self.max_concurrency: int = (
+            max_concurrency if max_concurrency is not None
+            else app_settings.tool_max_concurrency
+        ) or self.workers
+        self.mcp_concurrency: Dict[str, int] = dict(
+            mcp_concurrency if mcp_concurrency is not None
+            else app_settings.tool_mcp_concurrency
+        )
+
+        # NOTE: worker processes recycling
+        self.max_tasks: int = (
+            max_tasks if max_tasks is not None
+            else app_settings.tool_process_max_tasks
+        )
+        self.max_memory: int = (
+            max_memory if max_memory is not None
+            else app_settings.tool_process_max_memory
+        )
+        self.warm_up: bool = (
+            warm_up if warm_up is not None
+            else app_settings.tool_process_warm_up
+        )
+        # NOTE: worker pid -> tasks (current pool)
+        self._worker_tasks: Dict[int, int] = {}
+        # NOTE: number of recycled pools
+        self.recycled: int = 0
+
+        self._references_thermodb = references_thermodb
+        self.mcp_name = mcp_name
+        self._executor: Optional[Executor] = None
+        # NOTE: parent process threads ('process' mode)
+        self._thread_executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        # NOTE: event loop -> mcp name -> semaphore
+        self._semaphores: weakref.WeakKeyDictionary = \
+            weakref.WeakKeyDictionary()
+
+    @property
+    def executor(self) -> Executor:
+        """
+        The pool executor (created on first use).
+        """
+        executor_ = self._executor
+        if executor_ is not None:
+            return executor_
+
+        with self._lock:
+            if self._executor is None:
+                self._executor = self._create_executor()
+            return self._executor
+
+    @property
+    def thread_executor(self) -> Executor:
+        """
+        The thread pool of the parent process, the pool executor in
+        'thread' mode (created on first use).
+        """
+        if self.executor_mode != 'process':
+            return self.executor
+
+        executor_ = self._thread_executor
+        if executor_ is not None:
+            return executor_
+
+        with self._lock:
+            if self._thread_executor is None:
+                self._thread_executor = ThreadPoolExecutor(
+                    max_workers=self.workers,
+                    thread_name_prefix='mozichem-tool'
+                )
+            return self._thread_executor
+
+    def _create_executor(self) -> Executor:
+        """
+        Create the thread or process pool.
+        """
+        try:
+            if self.executor_mode == 'process':
+                if self._references_thermodb is None:
+                    raise ValueError(
+                        "References are required for the process pool."
+                    )
+                logger.info(
+                    f"Starting tool process pool: {self.workers} workers"
+                )
+                executor_ = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=(
+                        multiprocessing.get_context(
+                            app_settings.tool_process_start_method
+                        )
+                        if app_settings.tool_process_start_method
+                        else None
+                    ),
+                    initializer=_init_worker,
+                    initargs=(self._references_thermodb, self.mcp_name)
+                )
+
+                # NOTE: start and initialize the workers, build the fixed
+                # warm-up components of the pool mcp (not awaited)
+                if self.warm_up:
+                    warm_up_mcps = [
+                        mcp_module['name'] for mcp_module in MCP_MODULES
+                        if mcp_module.get('warm_up') and (
+                            self.mcp_name is None or
+                            mcp_module['name'] == self.mcp_name
+                        )
+                    ]
+                    for _ in range(self.workers):
+                        executor_.submit(_ping_worker).add_done_callback(
+                            _check_warm_up
+                        )
+                        for warm_up_mcp in warm_up_mcps:
+                            executor_.submit(
+                                _warm_up_worker, warm_up_mcp
+                            ).add_done_callback(_check_warm_up)
+
+                return executor_
+
+            logger.info(f"Starting tool thread pool: {self.workers} workers")
+            return ThreadPoolExecutor(
+                max_workers=self.workers,
+                thread_name_prefix='mozichem-tool'
+            )
+        except Exception as e:
+            logger.error(f"Failed to create the tool pool: {e}")
+            raise ToolPoolError(f"{TOOL_POOL_ERROR_MSG} {e}") from e
+
+    def concurrency(self, mcp_name: Optional[str]) -> int:
+        """
+        Maximum concurrent calls of an MCP.
+        """
+        return self.mcp_concurrency.get(
+            mcp_name or '', None
+        ) or self.max_concurrency
+
+    def _semaphore(self, mcp_name: Optional[str]) -> asyncio.Semaphore:
+        """
+        Semaphore of an MCP in the running event loop.
+        """
+        loop = asyncio.get_running_loop()
+        semaphores = self._semaphores.get(loop, None)
+        if semaphores is None:
+            semaphores = self._semaphores.setdefault(loop, {})
+
+        semaphore = semaphores.get(mcp_name or '', None)
+        if semaphore is None:
+            semaphore = semaphores.setdefault(
+                mcp_name or '',
+                asyncio.Semaphore(self.concurrency(mcp_name))
+            )
+        return semaphore
+
+    async def run(
+        self,
+        mcp_name: Optional[str],
+        tool_name: str,
+        fn: Callable[..., Any],
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any]
+    ) -> Any:
+        """
+        Run a tool body in the pool.
+
+        Parameters
+        ----------
+        mcp_name : str, optional
+            The name of the mcp of the tool (concurrency limit and tool
+            lookup in the worker processes).
+        tool_name : str
+            The name of the tool.
+        fn : Callable[..., Any]
+            The tool function ('thread' mode).
+        args : Tuple[Any, ...]
+            Positional arguments.
+        kwargs : Dict[str, Any]
+            Keyword arguments.
+
+        Returns
+        -------
+        Any
+            The tool result.
+        """
+        async with self._semaphore(mcp_name):
+            loop = asyncio.get_running_loop()
+
+            # NOTE: worker processes resolve the tool by name
+            if (
+                self.executor_mode == 'process' and
+                mcp_name and
+                tool_name not in PARENT_PROCESS_TOOLS
+            ):
+                args, kwargs = _resolve_references(fn, args, kwargs)
+                executor_ = self.executor
+                result, pid, memory = await loop.run_in_executor(
+                    executor_,
+                    functools.partial(
+                        _run_tool, mcp_name, tool_name, args, kwargs
+                    )
+                )
+                self._check_worker(executor_, pid, memory)
+                return result
+
+            return await loop.run_in_executor(
+                self.thread_executor,
+                functools.partial(fn, *args, **kwargs)
+            )
+
+    def _check_worker(
+        self,
+        executor_: Executor,
+        pid: int,
+        memory: int
+    ) -> None:
+        """
+        Count the task of a worker process, the workers are recycled if the
+        worker reached the task or memory limit.
+        """
+        with self._lock:
+            # NOTE: the pool is already recycled
+            if executor_ is not self._executor:
+                return
+
+            tasks = self._worker_tasks.get(pid, 0) + 1
+            self._worker_tasks[pid] = tasks
+
+            if (
+                (self.max_tasks and tasks >= self.max_tasks) or
+                (self.max_memory and memory >= self.max_memory)
+            ):
+                logger.info(
+                    f"Recycling tool worker processes: pid {pid}, "
+                    f"{tasks} tasks, {memory / 1024 ** 2:.1f} MB"
+                )
+                self.recycled += 1
+                self._recycle()
+
+    def _recycle(self) -> None:
+        """
+        Replace the pool by a new one, the running calls finish in the old
+        pool (lock held by the caller).
+        """
+        executor_, self._executor = self._executor, None
+        self._worker_tasks = {}
+        if executor_ is not None:
+            executor_.shutdown(wait=False)
+        # NOTE: new (warmed up) pool
+        self._executor = self._create_executor()
+
+    def wrap(
+        self,
+        fn: Callable[..., Any],
+        tool_name: str,
+        mcp_name: Optional[str] = None
+    ) -> Callable[..., Any]:
+        """
+        Wrap a tool function in an async adapter which runs it in the pool.
+
+        Parameters
+        ----------
+        fn : Callable[..., Any]
+            The (synchronous) tool function.
+        tool_name : str
+            The name of the tool.
+        mcp_name : str, optional
+            The name of the mcp of the tool, default is None (the tool runs
+            in a thread of the parent process even in 'process' mode).
+
+        Returns
+        -------
+        Callable[..., Any]
+            The async tool function, with the signature of `fn`, or `fn`
+            itself if it is already async or the mode is 'inline'.
+        """
+        if (
+            self.executor_mode == 'inline' or
+            asyncio.iscoroutinefunction(fn)
+        ):
+            return fn
+
+        @functools.wraps(fn)
+        async def _tool(*args: Any, **kwargs: Any) -> Any:
+            return await self.run(mcp_name, tool_name, fn, args, kwargs)
+
+        return _tool
+
+    def update_references(
+        self,
+        references_thermodb: ReferencesThermoDB
+    ) -> None:
+        """
+        Set new references, the worker processes are started again with
+        them on the next call.
+        """
+        self._references_thermodb = references_thermodb
+        if self.executor_mode == 'process':
+            self.shutdown(wait=False)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Shut down the pool, a new pool is created on the next call.
+        """
+        with self._lock:
+            executor_, self._executor = self._executor, None
+            thread_executor_, self._thread_executor = \
+                self._thread_executor, None
+            self._worker_tasks = {}
+        for executor_ in (executor_, thread_executor_):
+            if executor_ is not None:
+                executor_.shutdown(wait=wait, cancel_futures=not wait)
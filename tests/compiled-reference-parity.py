@@ -0,0 +1,159 @@
+# import libs
+import os
+import sys
+import stat
+import json
+import time
+import tempfile
+from pyThermoDB.references import ReferenceChecker
+from mozichem_hub.references.default_reference import default_reference
+from mozichem_hub.references.reference_compiler import (
+    MAGIC,
+    PREFIX,
+    CompiledReference,
+    CompiledReferenceStore,
+    artifact_key,
+    compile_reference
+)
+# log
+from rich import print
+
+# NOTE: temporary folder of the artifacts
+temp_dir = tempfile.TemporaryDirectory()
+
+# SECTION: compile the default reference (as a custom reference content)
+content = default_reference.content
+compiled_file = compile_reference(
+    content,
+    os.path.join(temp_dir.name, 'reference.mzref')
+)
+compiled = CompiledReference(compiled_file)
+
+# SECTION: text path
+ReferenceChecker_ = ReferenceChecker(content)
+
+# SECTION: configs / rules parity
+n_checked = 0
+mismatches = []
+for component_id in compiled.index:
+    name, formula, state = component_id.split('|')
+    for databook_name in compiled.databook_names:
+        for component_key in ('Name-State', 'Formula-State'):
+            config = compiled.component_reference_config(
+                databook_name, name, formula, state, component_key)
+            rules = compiled.component_reference_rules(
+                databook_name, name, formula, state, component_key)
+            if config is None:
+                continue
+
+            config_ = ReferenceChecker_.get_component_reference_config(
+                component_name=name,
+                component_formula=formula,
+                component_state=state,
+                databook_name=databook_name,
+                component_key=component_key,
+                add_label=True,
+                check_labels=True
+            )
+            rules_ = ReferenceChecker_.generate_reference_link(
+                databook_name=databook_name,
+                component_name=name,
+                component_formula=formula,
+                component_state=state,
+                component_key=component_key
+            )
+            n_checked += 1
+            if config != config_ or rules != rules_:
+                mismatches.append((component_id, component_key))
+
+print(f"configs/rules checked: {n_checked}, mismatches: {mismatches}")
+
+# SECTION: artifact checks
+with open(compiled_file, 'rb') as f:
+    data = f.read()
+_, header_size = PREFIX.unpack_from(data, 0)
+header = json.loads(data[PREFIX.size:PREFIX.size + header_size])
+payload = data[PREFIX.size + header_size:]
+
+
+def rejected(data_: bytes, name: str) -> bool:
+    """
+    Write an artifact and check that it is rejected.
+    """
+    file_path = os.path.join(temp_dir.name, name)
+    with open(file_path, 'wb') as f:
+        f.write(data_)
+    try:
+        CompiledReference(file_path)
+        return False
+    except ValueError:
+        return True
+
+
+# NOTE: tampered payload (digest mismatch) is rejected
+tampered_rejected = rejected(
+    data.replace(b'"config"', b'"conf1g"', 1), 'tampered.mzref')
+
+# NOTE: artifact of another pyThermoDB version (valid payload) is rejected
+stale_header = json.dumps(
+    {**header, 'pythermodb': '0.0.0'}, separators=(',', ':')
+).encode('utf-8')
+stale_rejected = rejected(
+    PREFIX.pack(MAGIC, len(stale_header)) + stale_header + payload,
+    'stale.mzref'
+)
+
+# NOTE: user folder (0700), background compilation
+store = CompiledReferenceStore(
+    folder=os.path.join(temp_dir.name, "references"))
+future = store.compile_async(content + "\n")
+compiled_async = future.result()
+background_compiled = (
+    compiled_async is not None and
+    compiled_async is store.get(content + "\n") and
+    os.path.basename(compiled_async.file_path) ==
+    f"{artifact_key(compiled_async.sha256)}.mzref"
+)
+folder_mode = stat.S_IMODE(os.stat(store.folder).st_mode)
+print(
+    f"tampered payload rejected: {tampered_rejected} | "
+    f"other pyThermoDB version rejected: {stale_rejected} | "
+    f"background compile: {background_compiled} | "
+    f"folder mode: {oct(folder_mode)}"
+)
+
+# SECTION: timing (component config + rules)
+n_runs = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+component_id = next(iter(compiled.index))
+name, formula, state = component_id.split('|')
+databook_name = compiled.databook_names[0]
+
+t0 = time.perf_counter()
+for _ in range(n_runs):
+    ReferenceChecker(content).get_component_reference_config(
+        component_name=name,
+        component_formula=formula,
+        component_state=state,
+        databook_name=databook_name,
+        component_key='Name-State',
+        add_label=True,
+        check_labels=True
+    )
+t1 = time.perf_counter()
+for _ in range(n_runs):
+    CompiledReference(compiled_file).component_reference_config(
+        databook_name, name, formula, state, 'Name-State')
+t2 = time.perf_counter()
+
+print(
+    f"text path {1e3 * (t1 - t0) / n_runs:.2f} ms | "
+    f"compiled (open + lookup) {1e3 * (t2 - t1) / n_runs:.2f} ms"
+)
+
+temp_dir.cleanup()
+
+if mismatches or n_checked == 0 or not (
+    tampered_rejected and stale_rejected and background_compiled and
+    folder_mode == 0o700
+):
+    sys.exit(1)
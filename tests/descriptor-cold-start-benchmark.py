@@ -0,0 +1,50 @@
+# import libs
+import os
+import sys
+import subprocess
+import statistics
+# log
+from rich import print
+
+# SECTION: settings
+# NOTE: number of cold starts per mode
+n_runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+
+# NOTE: cold start = new interpreter, import + index all descriptors
+# (the package import time is measured first and subtracted)
+script = """
+import time
+t0 = time.perf_counter()
+from mozichem_hub.descriptors import descriptor_index
+t1 = time.perf_counter()
+descriptor_index.load_all()
+t2 = time.perf_counter()
+print(t1 - t0, t2 - t1)
+"""
+
+
+def cold_start(use_artifact: bool):
+    env = dict(os.environ)
+    env['mozichem_hub_descriptor_artifact'] = str(use_artifact).lower()
+    res = subprocess.run(
+        [sys.executable, '-c', script],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    import_time, load_time = map(float, res.stdout.split()[-2:])
+    return import_time, load_time
+
+
+# SECTION: benchmark
+for use_artifact in (False, True):
+    timings = [cold_start(use_artifact) for _ in range(n_runs)]
+    import_times = [t[0] for t in timings]
+    load_times = [t[1] for t in timings]
+    print(
+        f"{'json artifact' if use_artifact else 'yml files':>13} | "
+        f"import {1e3 * statistics.median(import_times):8.1f} ms | "
+        f"descriptors {1e3 * statistics.median(load_times):7.2f} ms "
+        f"(median of {n_runs})"
+    )
@@ -0,0 +1,134 @@
+# import libs
+import sys
+import time
+import logging
+import numpy as np
+from pythermodb_settings.models import (
+    Temperature,
+    Pressure,
+    Component
+)
+from mozichem_hub.config import app_settings
+from mozichem_hub.references import ReferenceMapper
+from mozichem_hub.resources import FunctionDispatcher
+# log
+from rich.console import Console
+
+# NOTE: no line wrapping
+print = Console(soft_wrap=True).print
+
+logging.disable(logging.CRITICAL)
+
+# SECTION: settings
+# NOTE: grid size (temperatures x pressures), vapor, liquid and supercritical
+# points
+n_temperatures = int(sys.argv[1]) if len(sys.argv) > 1 else 6
+n_pressures = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+# NOTE: grid size of the batch throughput run (batch only)
+n_large = int(sys.argv[3]) if len(sys.argv) > 3 else 100
+# NOTE: tolerance of the values (the single calls solve the eos roots by
+# least squares)
+rtol = 1e-3
+
+component = Component(name="carbon dioxide", formula="CO2", state="g")
+temperatures = np.linspace(230.0, 330.0, n_temperatures).tolist()
+pressures = np.linspace(5.0, 85.0, n_pressures).tolist()
+keys = (
+    'molar_volume', 'compressibility_coefficient', 'fugacity_coefficient',
+    'fugacity'
+)
+
+# SECTION: eos-models-mcp functions (default references)
+dispatcher = FunctionDispatcher(
+    references_thermodb=ReferenceMapper().generate_reference_thermodb()
+)
+single = dispatcher.get_local_function(
+    "eos-models-mcp", "calc_gas_component_fugacity")
+batch = dispatcher.get_local_function(
+    "eos-models-mcp", "calc_gas_component_fugacity_batch")
+
+
+def run_batch(temperatures, pressures, fast_path: bool = True):
+    """
+    Batch (grid) with or without the vectorized eos engine.
+    """
+    app_settings.eos_fast_path = fast_path
+    t0 = time.perf_counter()
+    res = batch(
+        component=component,
+        temperatures=temperatures,
+        pressures=pressures,
+        temperature_unit="K",
+        pressure_unit="bar",
+        grid=True,
+        eos_model="SRK"
+    )
+    return res, time.perf_counter() - t0
+
+
+# SECTION: warm up (model source)
+run_batch(temperatures[:1], pressures[:1])
+
+# SECTION: single calls
+t0 = time.perf_counter()
+singles = [
+    single(
+        component=component,
+        temperature=Temperature(value=T, unit="K"),
+        pressure=Pressure(value=P, unit="bar"),
+        eos_model="SRK"
+    )
+    for T in temperatures for P in pressures
+]
+t_single = time.perf_counter() - t0
+
+# SECTION: batch (vectorized) and batch (point by point)
+res, t_batch = run_batch(temperatures, pressures)
+res_points, t_points = run_batch(temperatures, pressures, fast_path=False)
+
+# NOTE: flat columns, one value per point
+flat = all(
+    len(res[key]['value']) == res['points'] for key in keys
+) and len(res['phase']) == res['points']
+
+# NOTE: same phase and close values as the single calls, the others are
+# points where the least squares search stopped at a bound (Z = 0.5), all
+# marked by matches_single_point
+n_close, others = 0, []
+for i, s in enumerate(singles):
+    phase = 'vapor' if len(s['phase']) > 1 else s['phase'][0]
+    if res['phase'][i] == ('vapor-liquid' if len(s['phase']) > 1 else phase) \
+            and all(
+                np.isclose(res[key]['value'][i], s[phase][key]['value'],
+                           rtol=rtol)
+                for key in keys):
+        n_close += 1
+    else:
+        others.append((
+            res['temperature']['value'][i], res['pressure']['value'][i],
+            s[phase]['compressibility_coefficient']['value'],
+            res['compressibility_coefficient']['value'][i]
+        ))
+marked = res['points'] - sum(res['matches_single_point'])
+
+print(
+    f"{res['points']} points | single calls {1e3 * t_single:8.1f} ms | "
+    f"batch {1e3 * t_batch:6.2f} ms ({t_single / t_batch:.0f}x) | "
+    f"batch point by point {1e3 * t_points:8.1f} ms | flat columns {flat}"
+)
+print(
+    f"close values (rtol {rtol}) {n_close}/{res['points']} | "
+    f"marked not matching {marked} (others {len(others)}) | "
+    f"others (T, P, Z single, Z batch): {others}"
+)
+print(f"phases: {res['phase']}")
+
+# SECTION: batch throughput (large grid)
+res, t_large = run_batch(
+    np.linspace(230.0, 330.0, n_large).tolist(),
+    np.linspace(5.0, 85.0, n_large).tolist()
+)
+print(
+    f"{res['points']} points | batch {1e3 * t_large:.1f} ms | "
+    f"{1e6 * t_large / res['points']:.2f} us per point"
+)
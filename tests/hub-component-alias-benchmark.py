@@ -0,0 +1,71 @@
+# import libs
+import sys
+import time
+import statistics
+from pythermodb_settings.models import Component
+from mozichem_hub.references import ReferenceMapper
+from mozichem_hub.resources.hub import Hub
+# log
+from rich.console import Console
+
+# NOTE: no line wrapping
+print = Console(soft_wrap=True).print
+
+# SECTION: settings
+n_runs = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+
+# SECTION: 10-component mixture
+components = [
+    Component(name="carbon dioxide", formula="CO2", state="g"),
+    Component(name="carbon monoxide", formula="CO", state="g"),
+    Component(name="hydrogen", formula="H2", state="g"),
+    Component(name="methanol", formula="CH3OH", state="g"),
+    Component(name="methane", formula="CH4", state="g"),
+    Component(name="propane", formula="C3H8", state="g"),
+    Component(name="nitrogen", formula="N2", state="g"),
+    Component(name="ethane", formula="C2H6", state="g"),
+    Component(name="water", formula="H2O", state="g"),
+    Component(name="n-butane", formula="C4H10", state="g"),
+]
+
+# SECTION: hub
+reference_thermodb = ReferenceMapper().generate_reference_thermodb()
+hub = Hub(reference_thermodb)
+
+# NOTE: keep components which can be built with the default reference
+available = []
+for component in components:
+    try:
+        hub.build_component_thermodb(component)
+        available.append(component)
+    except Exception:
+        print(f"skip {component.name}")
+
+components_thermodb = hub.build_component_thermodb(available)
+
+# SECTION: benchmark (model source cache cleared, thermodbs cached)
+timings = []
+for _ in range(n_runs):
+    hub.clear_model_source_cache()
+    t0 = time.perf_counter()
+    model_source = hub.assemble_model_source(components_thermodb)
+    timings.append(time.perf_counter() - t0)
+
+# NOTE: thermodbs registered in a ThermoHub
+thermo_hub = hub._new_thermo_hub()
+hub.register_components_thermodb(components_thermodb, thermo_hub=thermo_hub)
+
+# NOTE: both ids resolvable
+resolvable = all(
+    f"{c.name}-{c.state}" in model_source['datasource'] and
+    f"{c.formula}-{c.state}" in model_source['datasource']
+    for c in available
+)
+
+print(
+    f"{len(available)} components | model source build "
+    f"{1e3 * statistics.median(timings):.1f} ms (median of {n_runs}) | "
+    f"thermodbs registered {len(thermo_hub.thermodb)} | "
+    f"datasource ids {len(model_source['datasource'])} | "
+    f"both ids resolvable {resolvable}"
+)
@@ -0,0 +1,84 @@
+# import libs
+import sys
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from pythermodb_settings.models import (
+    Component,
+    Temperature,
+    Pressure
+)
+from mozichem_hub.references import ReferenceMapper
+from mozichem_hub.resources.hub import Hub
+from mozichem_hub.resources.thermodb_cache import ThermoDBCache
+from mozichem_hub.resources.ptmcore import PTMCore
+# log
+from rich import print
+
+logging.disable(logging.CRITICAL)
+
+# SECTION: settings
+n_threads = int(sys.argv[1]) if len(sys.argv) > 1 else 16
+n_calls = int(sys.argv[2]) if len(sys.argv) > 2 else 400
+
+# SECTION: components and conditions (mixed over the calls)
+components = [
+    Component(name="carbon dioxide", formula="CO2", state="g"),
+    Component(name="methane", formula="CH4", state="g"),
+    Component(name="propane", formula="C3H8", state="g"),
+    Component(name="nitrogen", formula="N2", state="g"),
+    Component(name="ethane", formula="C2H6", state="g"),
+]
+temperatures = [280.0, 300.1, 350.0]
+cases = [
+    (component, temperature)
+    for component in components
+    for temperature in temperatures
+]
+
+
+def run(core: PTMCore, case):
+    component, temperature = case
+    res = core.calc_gas_component_fugacity(
+        component=component,
+        temperature=Temperature(value=temperature, unit="K"),
+        pressure=Pressure(value=10.0, unit="bar"),
+        eos_model="SRK",
+    )
+    # NOTE: compare the whole result
+    return str(res)
+
+
+# SECTION: reference thermodb
+reference_thermodb = ReferenceMapper().generate_reference_thermodb()
+
+# SECTION: serial reference results
+serial_core = PTMCore(Hub(reference_thermodb, thermodb_cache=ThermoDBCache()))
+expected = {i: run(serial_core, case) for i, case in enumerate(cases)}
+print(f"serial results: {len(expected)} cases")
+
+# SECTION: concurrent calls on one shared hub (cold caches)
+shared_core = PTMCore(Hub(reference_thermodb, thermodb_cache=ThermoDBCache()))
+jobs = [i % len(cases) for i in range(n_calls)]
+
+start = time.perf_counter()
+with ThreadPoolExecutor(max_workers=n_threads) as executor:
+    results = list(executor.map(
+        lambda i: (i, run(shared_core, cases[i])),
+        jobs
+    ))
+elapsed = time.perf_counter() - start
+
+# SECTION: check
+mismatches = [i for i, res in results if res != expected[i]]
+print(
+    f"threads: {n_threads}, calls: {n_calls}, time: {elapsed:.2f} s, "
+    f"mismatches: {len(mismatches)}"
+)
+print(f"thermodb cache: {shared_core.hub.thermodb_cache.stats()}")
+print(f"hub ThermoHub items: {len(shared_core.hub.thermo_hub.items())}")
+
+if mismatches:
+    print("[bold red]concurrent results differ from serial results[/bold red]")
+    sys.exit(1)
+print("[bold green]ok[/bold green]")
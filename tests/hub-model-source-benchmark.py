@@ -0,0 +1,63 @@
+# import libs
+import sys
+import time
+from pythermodb_settings.models import Component
+from mozichem_hub.references import ReferenceMapper
+from mozichem_hub.resources.hub import Hub
+# log
+from rich import print
+
+# SECTION: settings
+# NOTE: number of calls (default 10k)
+n_calls = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+# NOTE: report window
+window = max(n_calls // 10, 1)
+
+# SECTION: components (cycled over the calls)
+components = [
+    Component(name="carbon dioxide", formula="CO2", state="g"),
+    Component(name="carbon monoxide", formula="CO", state="g"),
+    Component(name="hydrogen", formula="H2", state="g"),
+    Component(name="methanol", formula="CH3OH", state="g"),
+    Component(name="methane", formula="CH4", state="g"),
+    Component(name="propane", formula="C3H8", state="g"),
+    Component(name="nitrogen", formula="N2", state="g"),
+    Component(name="ethane", formula="C2H6", state="g"),
+]
+
+# SECTION: hub
+reference_thermodb = ReferenceMapper().generate_reference_thermodb()
+hub = Hub(reference_thermodb)
+
+# NOTE: keep components which can be built with the default reference
+available = []
+for component in components:
+    try:
+        hub.build_component_model_source(component)
+        available.append(component)
+    except Exception as e:
+        print(f"[yellow]skip {component.name}: {e}[/yellow]")
+
+print(f"components: {[c.name for c in available]}")
+
+# SECTION: benchmark
+timings = []
+start = time.perf_counter()
+for i in range(n_calls):
+    component = available[i % len(available)]
+
+    t0 = time.perf_counter()
+    model_source = hub.build_component_model_source(component)
+    timings.append(time.perf_counter() - t0)
+
+    # NOTE: report
+    if (i + 1) % window == 0:
+        chunk = timings[-window:]
+        print(
+            f"calls {i + 1 - window + 1:>6}-{i + 1:>6} | "
+            f"mean {1e3 * sum(chunk) / len(chunk):8.3f} ms | "
+            f"datasource items {len(model_source['datasource']):>3} | "
+            f"hub items {len(hub.thermo_hub.items()):>3}"
+        )
+
+print(f"total: {time.perf_counter() - start:.2f} s for {n_calls} calls")
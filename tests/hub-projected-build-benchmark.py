@@ -0,0 +1,80 @@
+# import libs
+import sys
+import time
+import statistics
+from pythermodb_settings.models import Component
+from mozichem_hub.descriptors import MCPDescriptor
+from mozichem_hub.references import ReferenceMapper
+from mozichem_hub.resources.hub import Hub
+from mozichem_hub.resources.thermodb_cache import ThermoDBCache
+# log
+from rich.console import Console
+
+# NOTE: no line wrapping
+print = Console(soft_wrap=True).print
+
+# SECTION: settings
+n_runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+
+# NOTE: properties required by the gas fugacity tool (descriptor)
+required_props = MCPDescriptor.mcp_method_required_props(
+    mcp_id='PTMCore',
+    method_name='calc_gas_component_fugacity'
+)
+
+components = [
+    Component(name="carbon dioxide", formula="CO2", state="g"),
+    Component(name="methane", formula="CH4", state="g"),
+    Component(name="propane", formula="C3H8", state="g"),
+]
+
+reference_thermodb = ReferenceMapper().generate_reference_thermodb()
+
+
+def run(required_props):
+    """
+    Build the model source of each component with an empty thermodb cache.
+    """
+    timings, sizes = [], []
+    for _ in range(n_runs):
+        for component in components:
+            hub = Hub(reference_thermodb, thermodb_cache=ThermoDBCache())
+            t0 = time.perf_counter()
+            model_source = hub.build_component_model_source(
+                component,
+                required_props=required_props
+            )
+            timings.append(time.perf_counter() - t0)
+
+            component_id = f"{component.name}-{component.state}"
+            sizes.append(
+                len(model_source['datasource'][component_id]) +
+                len(model_source['equationsource'][component_id])
+            )
+    return statistics.median(timings), statistics.median(sizes), model_source
+
+
+t_all, n_all, ms_all = run(None)
+t_req, n_req, ms_req = run(required_props)
+
+# NOTE: the required properties are the same (equations at 298.15 K)
+component_id = f"{components[-1].name}-{components[-1].state}"
+same = all(
+    str(ms_all['datasource'][component_id][symbol]) ==
+    str(ms_req['datasource'][component_id][symbol])
+    for symbol in ms_req['datasource'][component_id]
+) and all(
+    str(ms_all['equationsource'][component_id][symbol].cal(T=298.15)) ==
+    str(ms_req['equationsource'][component_id][symbol].cal(T=298.15))
+    for symbol in ms_req['equationsource'][component_id]
+)
+
+print(f"required props: {required_props}")
+print(
+    f"all tables      | build {1e3 * t_all:7.1f} ms | "
+    f"model source items {n_all}"
+)
+print(
+    f"required tables | build {1e3 * t_req:7.1f} ms | "
+    f"model source items {n_req} | same values {same}"
+)
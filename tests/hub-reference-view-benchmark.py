@@ -0,0 +1,52 @@
+# import libs
+import sys
+import time
+import logging
+from pythermodb_settings.models import Component
+from mozichem_hub.references import ReferenceMapper
+from mozichem_hub.resources.hub import Hub
+# log
+from rich import print
+
+# NOTE: default log level (debug calls are not emitted)
+logging.getLogger().setLevel(logging.WARNING)
+
+# SECTION: settings
+n_calls = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000
+
+# SECTION: components (known ids and an unknown id resolved by ALL)
+components = [
+    Component(name="carbon dioxide", formula="CO2", state="g"),
+    Component(name="methane", formula="CH4", state="g"),
+    Component(name="propane", formula="C3H8", state="g"),
+    Component(name="nitrogen", formula="N2", state="g"),
+    Component(name="ethane", formula="C2H6", state="g"),
+]
+
+# SECTION: hub
+reference_thermodb = ReferenceMapper().generate_reference_thermodb()
+hub = Hub(reference_thermodb)
+
+# NOTE: warm the component thermodb cache (not measured)
+hub.build_component_thermodb(components)
+
+# SECTION: benchmark (cached thermodbs, reference resolution per component)
+t0 = time.perf_counter()
+for _ in range(n_calls):
+    hub.build_component_thermodb(components)
+t1 = time.perf_counter()
+
+print(
+    f"{len(components)} components | build_component_thermodb (cached) "
+    f"{1e6 * (t1 - t0) / n_calls:.1f} us/call (mean of {n_calls})"
+)
+
+# SECTION: unknown ids share the 'ALL' view (not stored per id)
+n_views = len(hub.component_reference_views)
+views = {
+    id(hub.component_reference_view(f"unknown-{i}-g")) for i in range(1_000)
+}
+print(
+    f"unknown ids 1000 | distinct views {len(views)} | "
+    f"stored views {n_views} -> {len(hub.component_reference_views)}"
+)
@@ -0,0 +1,74 @@
+# import libs
+import os
+import sys
+import subprocess
+from mozichem_hub.config import MCP_MODULES
+# log
+from rich.console import Console
+
+# NOTE: no line wrapping
+print = Console(soft_wrap=True).print
+
+# SECTION: settings
+# NOTE: calculation backends reported separately
+backends = [
+    'pyThermoDB',
+    'pyThermoLinkDB',
+    'pyThermoModels',
+    'pyThermoFlash',
+]
+
+# NOTE: import the package, then create the mcp (if any)
+script = """
+import sys
+import mozichem_hub
+from mozichem_hub.prebuilt import create_mozichem_mcp
+mcp_name = sys.argv[1]
+if mcp_name:
+    create_mozichem_mcp(name=mcp_name)
+"""
+
+
+def import_times(mcp_name: str):
+    """
+    Run a new interpreter with -X importtime and collect the cumulative
+    import time (us) of the top-level packages.
+    """
+    res = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', script, mcp_name],
+        env=dict(os.environ),
+        capture_output=True,
+        text=True,
+        check=True
+    )
+
+    times = {}
+    total = 0
+    for line in res.stderr.splitlines():
+        if not line.startswith('import time:') or '|' not in line:
+            continue
+        _, cumulative, name = line.split('|')
+        if not cumulative.strip().isdigit():
+            continue  # header
+        # NOTE: top-level imports (one space) add up to the total
+        if not name.startswith('  '):
+            total += int(cumulative)
+        # NOTE: each module is imported once (at any depth)
+        if name.strip() in backends:
+            times[name.strip()] = int(cumulative)
+
+    return total, times
+
+
+# SECTION: benchmark
+cases = [''] + [mcp['name'] for mcp in MCP_MODULES]
+for mcp_name in cases:
+    total, times = import_times(mcp_name)
+    backends_ = ', '.join(
+        f"{name} {times[name] / 1e3:.0f} ms"
+        for name in backends if name in times
+    ) or '-'
+    print(
+        f"{mcp_name or 'import mozichem_hub':>28} | "
+        f"total {total / 1e3:5.0f} ms | {backends_}"
+    )
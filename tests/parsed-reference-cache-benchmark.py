@@ -0,0 +1,93 @@
+# import libs
+import sys
+import time
+import threading
+from pythermodb_settings.models import Component
+from mozichem_hub.references.default_reference import default_reference
+from mozichem_hub.references.parsed_reference import parsed_references
+from mozichem_hub.references.reference_compiler import compiled_references
+from mozichem_hub.references.referencethermodb_controller import (
+    ReferenceThermoDBController
+)
+from mozichem_hub.resources.reference_utils import is_str_reference_valid
+# log
+from rich import print
+
+# NOTE: text path only (no compiled reference)
+compiled_references.enabled = False
+
+# SECTION: settings
+n_runs = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+content = default_reference.content
+components = [
+    Component(name='carbon dioxide', formula='CO2', state='g'),
+    Component(name='methane', formula='CH4', state='g'),
+]
+
+
+def run() -> float:
+    """
+    Validate the reference and build configs/links with a new controller.
+    """
+    t0 = time.perf_counter()
+    is_str_reference_valid(content)
+    controller = ReferenceThermoDBController(content)
+    controller.generate_components_reference_config(components)
+    controller.generate_components_reference_link(components)
+    return time.perf_counter() - t0
+
+
+# SECTION: first call (parse)
+parsed_references.clear()
+t_first = run()
+
+# SECTION: repeated calls (shared parsed reference)
+t_repeated = sum(run() for _ in range(n_runs)) / n_runs
+
+print(
+    f"first call {1e3 * t_first:.1f} ms | "
+    f"repeated calls {1e3 * t_repeated:.1f} ms (mean of {n_runs}) | "
+    f"cache {parsed_references.stats()}"
+)
+
+# SECTION: memo bound (least recently used dropped)
+parsed_reference = parsed_references.get(content)
+for i in range(2 * parsed_reference.memo_max_entries):
+    parsed_reference.memoize(f"key-{i}", dict)
+    parsed_reference.memoize('components_index', dict)
+print(
+    f"memo entries {len(parsed_reference.memo)} "
+    f"(max {parsed_reference.memo_max_entries}) | "
+    f"recently used kept {'components_index' in parsed_reference.memo} | "
+    f"oldest dropped {'key-0' not in parsed_reference.memo}"
+)
+
+# SECTION: memo factory outside the reference lock
+calls = []
+
+
+def slow_factory():
+    calls.append(1)
+    time.sleep(0.2)
+    return {'slow': True}
+
+
+threads = [
+    threading.Thread(
+        target=parsed_reference.memoize, args=('slow', slow_factory))
+    for _ in range(4)
+]
+for thread in threads:
+    thread.start()
+time.sleep(0.05)
+# NOTE: other keys and the parsers are not held up by the running factory
+t0 = time.perf_counter()
+parsed_reference.memoize('other', dict)
+parsed_reference.checker
+t_other = time.perf_counter() - t0
+for thread in threads:
+    thread.join()
+print(
+    f"other key during a slow factory {1e3 * t_other:.1f} ms | "
+    f"slow factory calls {len(calls)} (4 concurrent misses)"
+)
@@ -0,0 +1,168 @@
+# import libs
+import re
+import sys
+import time
+import logging
+import numpy as np
+import pyThermoFlash as ptf
+from pythermodb_settings.models import Component
+from mozichem_hub.references import ReferenceMapper
+from mozichem_hub.resources.hub import Hub
+from mozichem_hub.resources.utils import get_components_formulas
+from mozichem_hub.resources.raoult_engine import RaoultEngine
+# log
+from rich.console import Console
+
+# NOTE: no line wrapping
+print = Console(soft_wrap=True).print
+
+logging.disable(logging.CRITICAL)
+
+# SECTION: settings
+# NOTE: number of points (random feeds and temperatures)
+n_points = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+# NOTE: tolerance of the flash results (pyThermoFlash solves the flash by
+# least squares, default tolerances)
+flash_rtol = 1e-4
+
+components = [
+    Component(name="benzene", formula="C6H6", state="l"),
+    Component(name="toluene", formula="C7H8", state="l"),
+    Component(name="ethanol", formula="C2H6O", state="l"),
+]
+rng = np.random.default_rng(0)
+feeds = rng.dirichlet(np.ones(len(components)), n_points)
+temperatures = rng.uniform(330.0, 410.0, n_points)
+
+# SECTION: model source, pyThermoFlash vle and the engine
+hub = Hub(ReferenceMapper().generate_reference_thermodb())
+model_source = hub.build_components_model_source(components=components)
+component_formulas = get_components_formulas(components)
+vle = ptf.vle(components=component_formulas, model_source=model_source)
+engine = RaoultEngine(
+    components=component_formulas,
+    model_source=model_source
+)
+
+
+def strip_time(res) -> str:
+    """
+    Result as a string without the computation time.
+    """
+    return re.sub(r"'computation_time': \{[^}]*\}", '', str(res))
+
+
+def inputs(j: int, pressure: bool = False):
+    """
+    pyThermoFlash inputs of a point (feed, temperature and pressure).
+    """
+    return {
+        "mole_fraction": dict(zip(component_formulas, feeds[j].tolist())),
+        "temperature": [float(temperatures[j]), "K"],
+        **({"pressure": [float(pressures[j]), "Pa"]} if pressure else {})
+    }
+
+
+def close(a, b) -> bool:
+    """
+    Numeric items of two results are close (flash_rtol).
+    """
+    if isinstance(a, dict):
+        return all(close(a[k], b[k]) for k in a if k not in (
+            'computation_time', 'solver_message', 'solver_method'))
+    if isinstance(a, (float, np.ndarray)):
+        return bool(np.allclose(a, b, rtol=flash_rtol, atol=flash_rtol))
+    return a == b
+
+
+# SECTION: bubble/dew pressure (same results)
+saturation = {}
+for calc_name in ('bubble_pressure', 'dew_pressure'):
+    t0 = time.perf_counter()
+    expected = [
+        getattr(vle, calc_name)(inputs=inputs(j), equilibrium_model='raoult')
+        for j in range(n_points)
+    ]
+    t1 = time.perf_counter()
+    results = getattr(engine, calc_name)(feeds, temperatures)
+    t2 = time.perf_counter()
+    saturation[calc_name] = np.array(
+        [r[calc_name]['value'] for r in results])
+
+    same = sum(
+        strip_time(r) == strip_time(e) for r, e in zip(results, expected)
+    )
+    print(
+        f"{calc_name:>16} | {n_points} points | same results {same}/{n_points} | "
+        f"pyThermoFlash {1e3 * (t1 - t0):8.1f} ms | engine {1e3 * (t2 - t1):6.2f} ms | "
+        f"{(t1 - t0) / (t2 - t1):7.1f}x"
+    )
+
+# NOTE: flash pressures between the dew and bubble pressures (two-phase)
+bubble_pressures = saturation['bubble_pressure']
+dew_pressures = saturation['dew_pressure']
+pressures = dew_pressures + rng.uniform(0.02, 0.98, n_points) * (
+    bubble_pressures - dew_pressures)
+
+# SECTION: isothermal flash (two-phase points, within flash_rtol)
+t0 = time.perf_counter()
+results = engine.flash_isothermal(feeds, temperatures, pressures)
+t1 = time.perf_counter()
+flashed = [j for j, res in enumerate(results) if res is not None]
+
+t2 = time.perf_counter()
+expected = [
+    vle.flash_isothermal(
+        inputs=inputs(j, pressure=True),
+        equilibrium_model='raoult'
+    )
+    for j in flashed
+]
+t3 = time.perf_counter()
+
+
+def residual(res) -> float:
+    """
+    Rachford-Rice residual of a flash result.
+    """
+    z, K = res['feed_mole_fraction'], res['K_ratio']['value']
+    V = res['V_F_ratio']['value']
+    return float(np.sum(z * (K - 1) / (1 + V * (K - 1))))
+
+
+# NOTE: close, pyThermoFlash not at a root (|residual| > 1e-6, least squares
+# stopped), others
+n_close = n_off_root = 0
+for j, e in zip(flashed, expected):
+    if close(results[j], e) and list(results[j]) == list(e):
+        n_close += 1
+    elif abs(residual(e)) > 1e-6:
+        n_off_root += 1
+
+max_residual = max((abs(residual(results[j])) for j in flashed), default=0.0)
+print(
+    f"{'flash_isothermal':>16} | {len(flashed)} two-phase of {n_points} points | "
+    f"close results {n_close}/{len(flashed)} | pyThermoFlash off-root {n_off_root} | "
+    f"others {len(flashed) - n_close - n_off_root} | engine max residual {max_residual:.1e} | "
+    f"pyThermoFlash {1e3 * (t3 - t2):8.1f} ms | engine {1e3 * (t1 - t0):6.2f} ms"
+)
+
+# SECTION: single-phase points (no flash result)
+# NOTE: above the bubble pressure (liquid), below the dew pressure (vapor)
+above_bubble = engine.flash_isothermal(
+    feeds, temperatures, 1.05 * bubble_pressures)
+below_dew = engine.flash_isothermal(
+    feeds, temperatures, 0.95 * dew_pressures)
+liquid_fallback = all(res is None for res in above_bubble)
+vapor_fallback = all(res is None for res in below_dew)
+print(
+    f"{'single phase':>16} | above bubble pressure no flash {liquid_fallback} | "
+    f"below dew pressure no flash {vapor_fallback}"
+)
+
+if not (
+    len(flashed) == n_points and
+    n_close + n_off_root == len(flashed) and
+    liquid_fallback and vapor_fallback
+):
+    sys.exit(1)
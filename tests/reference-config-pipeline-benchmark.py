@@ -0,0 +1,81 @@
+# import libs
+import sys
+import time
+import pickle
+import statistics
+from mozichem_hub.references import ReferenceMapper
+from mozichem_hub.references.default_reference import default_reference
+# log
+from rich.console import Console
+
+# NOTE: no line wrapping
+print = Console(soft_wrap=True).print
+
+# SECTION: settings
+# NOTE: number of components in the reference config
+config_sizes = [10, 100, 500]
+n_runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+# NOTE: optional pickle file to compare the outputs of two revisions
+output_file = sys.argv[2] if len(sys.argv) > 2 else None
+
+
+def reference_config(n: int) -> dict:
+    """
+    Reference config (dict) with n components.
+    """
+    component_config = {
+        'heat-capacity': {
+            'databook': 'CUSTOM-REF-1',
+            'table': 'ideal-gas-molar-heat-capacity',
+            'mode': 'EQUATIONS',
+            'label': 'Cp_IG'
+        },
+        'vapor-pressure': {
+            'databook': 'CUSTOM-REF-1',
+            'table': 'vapor-pressure',
+            'mode': 'EQUATIONS',
+            'label': 'VaPr'
+        },
+        'general': {
+            'databook': 'CUSTOM-REF-1',
+            'table': 'general-data',
+            'mode': 'DATA',
+            'labels': {
+                'critical-pressure': 'Pc',
+                'critical-temperature': 'Tc',
+                'acentric-factor': 'AcFa',
+            }
+        }
+    }
+    return {f"component-{i}-g": component_config for i in range(n)}
+
+
+# SECTION: benchmark
+outputs = {}
+for n in config_sizes:
+    config = reference_config(n)
+    timings = []
+    for _ in range(n_runs):
+        t0 = time.perf_counter()
+        references_thermodb = ReferenceMapper().generate_reference_thermodb(
+            reference_content=default_reference.content,
+            reference_config=config
+        )
+        timings.append(time.perf_counter() - t0)
+
+    outputs[n] = references_thermodb.model_dump()
+    print(
+        f"{n:4d} components | generate_reference_thermodb "
+        f"{1e3 * statistics.median(timings):8.1f} ms "
+        f"(median of {n_runs}) | rules {len(references_thermodb.rules)}"
+    )
+
+# SECTION: compare with a previous run (same outputs)
+if output_file:
+    try:
+        with open(output_file, 'rb') as f:
+            print(f"same outputs as {output_file}: {pickle.load(f) == outputs}")
+    except FileNotFoundError:
+        with open(output_file, 'wb') as f:
+            pickle.dump(outputs, f)
+        print(f"outputs saved to {output_file}")
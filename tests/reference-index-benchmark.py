@@ -0,0 +1,85 @@
+# import libs
+import re
+import sys
+import time
+from pythermodb_settings.models import Component
+from mozichem_hub.references.default_reference import default_reference
+from mozichem_hub.references.reference_compiler import compiled_references
+from mozichem_hub.references.referencethermodb_controller import (
+    ReferenceThermoDBController
+)
+# log
+from rich import print
+
+# NOTE: text path only (no compiled reference)
+compiled_references.enabled = False
+
+# SECTION: settings
+# NOTE: synthetic components added to each table of the default reference
+n_components = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+# NOTE: mixture size
+n_mixture = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+
+def synthetic_reference(content: str, n: int) -> str:
+    """
+    Add n synthetic components (copies of the first row) to each table.
+    """
+    def add_rows(match: re.Match) -> str:
+        row = match.group(2)
+        values = row[3:-1].split(',')
+        rows = []
+        for i in range(n):
+            values[1] = f"'synthetic-{i}'"
+            values[2] = f"'SYN{i}'"
+            rows.append(f"- [{','.join(values)}]")
+        return match.group(1) + row + '\n' + '\n'.join(rows)
+
+    return re.sub(r"(VALUES:\n\n)(- \[[^\n]*\])", add_rows, content)
+
+
+content = synthetic_reference(default_reference.content, n_components)
+components = [
+    Component(name='carbon dioxide', formula='CO2', state='g'),
+    Component(name='methane', formula='CH4', state='g'),
+] + [
+    Component(name=f'synthetic-{i}', formula=f'SYN{i}', state='g')
+    for i in range(n_mixture - 2)
+]
+
+# SECTION: text path (ReferenceChecker per component)
+controller = ReferenceThermoDBController(content)
+controller._component_availability = lambda *args, **kwargs: None
+t0 = time.perf_counter()
+configs_ = controller.generate_components_reference_config(components)
+links_ = controller.generate_components_reference_link(components)
+t1 = time.perf_counter()
+
+# SECTION: component index
+controller = ReferenceThermoDBController(content)
+t2 = time.perf_counter()
+configs = controller.generate_components_reference_config(components)
+links = controller.generate_components_reference_link(components)
+t3 = time.perf_counter()
+
+# SECTION: parity (both component keys)
+for component_key in ('Name-State', 'Formula-State'):
+    text_controller = ReferenceThermoDBController(content)
+    text_controller._component_availability = lambda *args, **kwargs: None
+    assert controller.generate_components_reference_config(
+        components, component_key=component_key
+    ) == text_controller.generate_components_reference_config(
+        components, component_key=component_key
+    )
+    assert controller.generate_components_reference_link(
+        components, component_key=component_key
+    ) == text_controller.generate_components_reference_link(
+        components, component_key=component_key
+    )
+
+print(f"parity: {configs == configs_ and links == links_}")
+print(
+    f"{len(components)} components x {n_components + 13} rows/table | "
+    f"text path {1e3 * (t1 - t0):.1f} ms | "
+    f"component index {1e3 * (t3 - t2):.1f} ms"
+)
@@ -0,0 +1,74 @@
+# import libs
+import re
+import time
+import tracemalloc
+from pythermodb_settings.models import Component
+from mozichem_hub.references.default_reference import default_reference
+from mozichem_hub.references.referencethermodb_controller import (
+    ReferenceThermoDBController
+)
+from mozichem_hub.resources.reference_utils import to_references_thermodb
+# log
+from rich import print
+
+# SECTION: settings
+# NOTE: mixture sizes
+mixture_sizes = [2, 10, 50]
+
+
+def synthetic_reference(content: str, n: int) -> str:
+    """
+    Add n synthetic components (copies of the first row) to each table.
+    """
+    def add_rows(match: re.Match) -> str:
+        row = match.group(2)
+        values = row[3:-1].split(',')
+        rows = []
+        for i in range(n):
+            values[1] = f"'synthetic-{i}'"
+            values[2] = f"'SYN{i}'"
+            rows.append(f"- [{','.join(values)}]")
+        return match.group(1) + row + '\n' + '\n'.join(rows)
+
+    return re.sub(r"(VALUES:\n\n)(- \[[^\n]*\])", add_rows, content)
+
+
+# NOTE: custom reference (not compiled)
+content = synthetic_reference(default_reference.content, max(mixture_sizes))
+
+# SECTION: benchmark
+for n in mixture_sizes:
+    components = [
+        Component(name=f'synthetic-{i}', formula=f'SYN{i}', state='g')
+        for i in range(n)
+    ]
+    controller = ReferenceThermoDBController(content)
+    # NOTE: parse once (not measured)
+    controller.generate_component_reference_config(
+        component_name='carbon dioxide',
+        component_formula='CO2',
+        component_state='g'
+    )
+
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    components_reference_thermodb = \
+        controller.generate_components_reference_thermodb(components)
+    references_thermodb = to_references_thermodb(
+        components_reference_thermodb
+    )
+    t1 = time.perf_counter()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # NOTE: configs attached to the component reference thermodbs
+    n_configs = sum(
+        len(c.reference_thermodb.configs)
+        for c in components_reference_thermodb
+    )
+    print(
+        f"{n:3d} components | {1e3 * (t1 - t0):7.1f} ms | "
+        f"peak {peak / 1024:8.1f} KiB | "
+        f"table configs attached {n_configs:4d} | "
+        f"component ids {len(references_thermodb.configs)}"
+    )
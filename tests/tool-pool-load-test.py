@@ -0,0 +1,87 @@
+# import libs
+import os
+import re
+import sys
+import time
+import asyncio
+import logging
+from mozichem_hub.references import ReferenceMapper
+from mozichem_hub.tools import ToolManager, ToolPool
+# log
+from rich.console import Console
+
+# NOTE: no line wrapping
+print = Console(soft_wrap=True).print
+
+logging.disable(logging.CRITICAL)
+
+# SECTION: settings
+# NOTE: concurrent calls per run
+n_calls = int(sys.argv[1]) if len(sys.argv) > 1 else 32
+# NOTE: executors to compare
+executors = sys.argv[2].split(',') if len(sys.argv) > 2 else [
+    'inline', 'thread', 'process'
+]
+n_cores = os.cpu_count() or 1
+# NOTE: worker counts (default: up to the number of cores)
+worker_counts = [int(w) for w in sys.argv[3].split(',')] if len(
+    sys.argv) > 3 else sorted({1, 2, 4, n_cores} & set(range(1, n_cores + 1)))
+
+mcp_name = "flash-calculations-mcp"
+tool_name = "calc_bubble_temperature_ideal_vapor_ideal_liquid"
+arguments = {
+    "components": [
+        {"name": "benzene", "formula": "C6H6", "state": "l",
+         "mole_fraction": 0.26},
+        {"name": "toluene", "formula": "C7H8", "state": "l",
+         "mole_fraction": 0.74},
+    ],
+    "pressure": {"value": 101.3, "unit": "kPa"},
+}
+
+# SECTION: tool manager (default references)
+reference_thermodb = ReferenceMapper().generate_reference_thermodb()
+tool_manager = ToolManager(references_thermodb=reference_thermodb)
+
+
+async def load(tool):
+    """
+    Run n_calls concurrent calls of the tool, return the wall time and the
+    distinct results.
+    """
+    t0 = time.perf_counter()
+    results = await asyncio.gather(
+        *(tool.run(arguments) for _ in range(n_calls))
+    )
+    elapsed = time.perf_counter() - t0
+    # NOTE: without the computation time
+    return elapsed, {
+        re.sub(r"'computation_time': \{[^}]*\}", '', str(r.content))
+        for r in results
+    }
+
+
+print(f"cores: {n_cores} | {n_calls} concurrent calls of {tool_name}")
+expected = None
+for executor in executors:
+    for workers in (worker_counts if executor != 'inline' else [1]):
+        tool_manager.ToolPool_ = ToolPool(
+            references_thermodb=reference_thermodb,
+            mcp_name=mcp_name,
+            executor=executor,
+            workers=workers
+        )
+        tools = tool_manager._build_local_tools(mcp_name)
+        tool = next(t for t in tools if t.name == tool_name)
+
+        # NOTE: warm up (pool, hub caches of the workers)
+        asyncio.run(load(tool))
+        elapsed, results = asyncio.run(load(tool))
+        expected = expected or results
+
+        print(
+            f"{executor:>7} | workers {workers:>2} | "
+            f"{n_calls / elapsed:8.1f} calls/s | {1e3 * elapsed:8.1f} ms | "
+            f"same results {results == expected}"
+        )
+        tool_manager.ToolPool_.shutdown()
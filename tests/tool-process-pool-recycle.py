@@ -0,0 +1,92 @@
+# import libs
+import re
+import sys
+import time
+import asyncio
+import logging
+from mozichem_hub.references import ReferenceMapper
+from mozichem_hub.tools import ToolManager, ToolPool
+# log
+from rich.console import Console
+
+# NOTE: no line wrapping
+print = Console(soft_wrap=True).print
+
+logging.disable(logging.CRITICAL)
+
+# SECTION: settings
+# NOTE: calls (in batches of the number of workers)
+n_calls = int(sys.argv[1]) if len(sys.argv) > 1 else 30
+# NOTE: tasks of a worker before the workers are recycled
+max_tasks = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+workers = int(sys.argv[3]) if len(sys.argv) > 3 else 2
+
+mcp_name = "flash-calculations-mcp"
+tool_name = "calc_bubble_temperature_ideal_vapor_ideal_liquid"
+arguments = {
+    "components": [
+        {"name": "benzene", "formula": "C6H6", "state": "l",
+         "mole_fraction": 0.26},
+        {"name": "toluene", "formula": "C7H8", "state": "l",
+         "mole_fraction": 0.74},
+    ],
+    "pressure": {"value": 101.3, "unit": "kPa"},
+}
+
+# SECTION: tool manager (default references)
+reference_thermodb = ReferenceMapper().generate_reference_thermodb()
+tool_manager = ToolManager(references_thermodb=reference_thermodb)
+
+
+def result_of(r) -> str:
+    """
+    Tool result without the computation time.
+    """
+    return re.sub(r"'computation_time': \{[^}]*\}", '', str(r.content))
+
+
+async def run(tool, pool):
+    """
+    Run the calls in batches, return the first call time, the call times
+    (ms), the distinct results and the worker pids.
+    """
+    times, results, pids = [], set(), set()
+    for _ in range(0, n_calls, workers):
+        t0 = time.perf_counter()
+        batch = await asyncio.gather(
+            *(tool.run(arguments) for _ in range(workers))
+        )
+        times.append(1e3 * (time.perf_counter() - t0) / workers)
+        results |= {result_of(r) for r in batch}
+        # NOTE: workers of the current pool
+        pids |= {p.pid for p in pool.executor._processes.values()}
+    return times, results, pids
+
+
+for warm_up in (False, True):
+    for max_tasks_ in (0, max_tasks):
+        pool = ToolPool(
+            references_thermodb=reference_thermodb,
+            mcp_name=mcp_name,
+            executor='process',
+            workers=workers,
+            max_tasks=max_tasks_,
+            warm_up=warm_up
+        )
+        tool_manager.ToolPool_ = pool
+        tools = tool_manager._build_local_tools(mcp_name)
+        tool = next(t for t in tools if t.name == tool_name)
+
+        # NOTE: pool started (warmed up) before the first call
+        pool.executor
+        time.sleep(2.0)
+        times, results, pids = asyncio.run(run(tool, pool))
+
+        print(
+            f"warm up {warm_up!s:>5} | max tasks {max_tasks_:>2} | "
+            f"first batch {times[0]:7.1f} ms/call | "
+            f"rest {sum(times[1:]) / max(1, len(times) - 1):6.1f} ms/call | "
+            f"recycled {pool.recycled:>2} | worker pids {len(pids):>2} | "
+            f"same results {len(results) == 1}"
+        )
+        pool.shutdown()
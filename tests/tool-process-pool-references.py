@@ -0,0 +1,102 @@
+# import libs
+import os
+import re
+import ast
+import asyncio
+import logging
+from mozichem_hub.references import ReferenceMapper
+from mozichem_hub.resources.reference_registry import reference_registry
+from mozichem_hub.tools import ToolManager, ToolPool
+# log
+from rich.console import Console
+
+# NOTE: no line wrapping
+print = Console(soft_wrap=True).print
+
+logging.disable(logging.CRITICAL)
+
+# SECTION: settings
+workers = 2
+mcp_name = "eos-models-mcp"
+arguments = {
+    "component": {"name": "carbon dioxide", "formula": "CO2", "state": "g"},
+    "temperature": {"value": 300.1, "unit": "K"},
+    "pressure": {"value": 9.99, "unit": "bar"},
+    "eos_model": "SRK",
+}
+
+# NOTE: custom reference content of the example (its constants)
+with open("examples/execute/fugacity_with_external_reference_default.py") as f:
+    constants = {}
+    for node in ast.parse(f.read()).body:
+        if (
+            isinstance(node, ast.Assign) and
+            getattr(node.targets[0], 'id', '').isupper()
+        ):
+            exec(compile(ast.Module([node], []), '<example>', 'exec'),
+                 constants)
+REFERENCE_CONTENT = constants['REFERENCE_CONTENT']
+
+# SECTION: tool manager (default references), process pool
+reference_thermodb = ReferenceMapper().generate_reference_thermodb()
+tool_manager = ToolManager(references_thermodb=reference_thermodb)
+tool_manager.ToolPool_ = ToolPool(
+    references_thermodb=reference_thermodb,
+    mcp_name=mcp_name,
+    executor='process',
+    workers=workers
+)
+tools = {t.name: t for t in tool_manager._build_local_tools(mcp_name)}
+
+
+def result_of(r) -> str:
+    """
+    Tool result without the computation time.
+    """
+    return re.sub(r"'computation_time': \{[^}]*\}", '', str(r.content))
+
+
+async def fugacity(**reference):
+    """
+    Concurrent calls (all workers) of the fugacity tool.
+    """
+    return {
+        result_of(r)
+        for r in await asyncio.gather(*(
+            tools["calc_gas_component_fugacity"].run(
+                {**arguments, **reference})
+            for _ in range(2 * workers)
+        ))
+    }
+
+
+async def main():
+    # NOTE: reference content in the call
+    expected = await fugacity(custom_reference_content=REFERENCE_CONTENT)
+
+    # NOTE: registered by the tool (parent process)
+    res = await tools["register_custom_reference"].run(
+        {"custom_reference_content": REFERENCE_CONTENT}
+    )
+    reference_id = res.structured_content["reference_id"]
+    results = await fugacity(custom_reference_id=reference_id)
+    print(
+        f"tool registration     | in parent registry {reference_id in reference_registry} | "
+        f"same results {results == expected}"
+    )
+
+    # NOTE: registered in the parent process (as POST /references)
+    content = REFERENCE_CONTENT + "\n"
+    reference_id = reference_registry.register(content=content).reference_id
+    results = await fugacity(custom_reference_id=reference_id)
+    print(
+        f"parent registration   | same results {results == expected}"
+    )
+
+    # NOTE: tool without an mcp name (parent process thread)
+    pid = await tool_manager.ToolPool_.wrap(os.getpid, 'getpid')()
+    print(f"tool without mcp name | parent process {pid == os.getpid()}")
+
+
+asyncio.run(main())
+tool_manager.ToolPool_.shutdown()
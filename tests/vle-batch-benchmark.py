@@ -0,0 +1,123 @@
+# import libs
+import sys
+import time
+import logging
+import numpy as np
+from pythermodb_settings.models import (
+    Temperature,
+    Pressure,
+    Component
+)
+from mozichem_hub.references import ReferenceMapper
+from mozichem_hub.resources import FunctionDispatcher
+# log
+from rich.console import Console
+
+# NOTE: no line wrapping
+print = Console(soft_wrap=True).print
+
+logging.disable(logging.CRITICAL)
+
+# SECTION: settings
+# NOTE: number of feeds (benzene mole fraction from 0.1 to 0.9)
+n_feeds = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+
+components = [
+    Component(name="benzene", formula="C6H6", state="l"),
+    Component(name="toluene", formula="C7H8", state="l"),
+]
+feeds = [[x, 1.0 - x] for x in np.linspace(0.1, 0.9, n_feeds).tolist()]
+temperature = (370.0, "K")
+pressure = (101.3, "kPa")
+
+# SECTION: flash-calculations-mcp functions (default references)
+dispatcher = FunctionDispatcher(
+    references_thermodb=ReferenceMapper().generate_reference_thermodb()
+)
+
+
+def fn(name: str):
+    return dispatcher.get_local_function("flash-calculations-mcp", name)
+
+
+def feed_components(feed):
+    return [
+        c.model_copy(update={'mole_fraction': x})
+        for c, x in zip(components, feed)
+    ]
+
+
+# NOTE: (method, single call kwargs, batch kwargs, checked result)
+cases = [
+    (
+        'calc_bubble_pressure_ideal_vapor_ideal_liquid',
+        {'temperature': Temperature(value=temperature[0], unit=temperature[1])},
+        {'temperatures': [temperature[0]], 'temperature_unit': temperature[1]},
+        'bubble_pressure'
+    ),
+    (
+        'calc_dew_pressure_ideal_vapor_ideal_liquid',
+        {'temperature': Temperature(value=temperature[0], unit=temperature[1])},
+        {'temperatures': [temperature[0]], 'temperature_unit': temperature[1]},
+        'dew_pressure'
+    ),
+    (
+        'calc_bubble_temperature_ideal_vapor_ideal_liquid',
+        {'pressure': Pressure(value=pressure[0], unit=pressure[1])},
+        {'pressures': [pressure[0]], 'pressure_unit': pressure[1]},
+        'bubble_temperature'
+    ),
+    (
+        'calc_dew_temperature_ideal_vapor_ideal_liquid',
+        {'pressure': Pressure(value=pressure[0], unit=pressure[1])},
+        {'pressures': [pressure[0]], 'pressure_unit': pressure[1]},
+        'dew_temperature'
+    ),
+    (
+        'calc_flash_isothermal_ideal_vapor_ideal_liquid',
+        {
+            'temperature': Temperature(value=temperature[0], unit=temperature[1]),
+            'pressure': Pressure(value=pressure[0], unit=pressure[1])
+        },
+        {
+            'temperatures': [temperature[0]],
+            'temperature_unit': temperature[1],
+            'pressures': [pressure[0]],
+            'pressure_unit': pressure[1]
+        },
+        'V_F_ratio'
+    ),
+]
+
+for name, single_kwargs, batch_kwargs, key in cases:
+    # NOTE: warm up (model source)
+    fn(name)(components=feed_components(feeds[0]), **single_kwargs)
+
+    # SECTION: single calls
+    t0 = time.perf_counter()
+    singles = [
+        eval(
+            fn(name)(components=feed_components(feed), **single_kwargs),
+            {'array': np.array}
+        )
+        for feed in feeds
+    ]
+    t_single = time.perf_counter() - t0
+
+    # SECTION: batch
+    t0 = time.perf_counter()
+    res = fn(f"{name}_batch")(
+        components=components,
+        mole_fractions=feeds,
+        **batch_kwargs
+    )
+    t_batch = time.perf_counter() - t0
+
+    # NOTE: same values as the single calls (point by point)
+    same = [s[key]['value'] for s in singles] == res[key]['value']
+
+    print(
+        f"{key:>18} | {res['points']} points | single calls "
+        f"{1e3 * t_single:8.1f} ms | batch {1e3 * t_batch:8.1f} ms | "
+        f"same values {same}"
+    )